@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+"""
+Benchmark deriving a new metamodel version: deepcopy-and-edit versus ChangeApplier.
+"""
+
+import argparse
+import sys
+from copy import deepcopy
+
+from common import report, timed
+
+from metamodel_core.models import get_core_metamodel
+from metamodel_core.models.changes import ChangeApplier
+from metamodel_core.models.metamodel import ChangeType, MetamodelChange
+
+
+def main():
+    """Run the change application benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--versions",
+        "-n",
+        type=int,
+        default=2000,
+        help="Number of versions to derive (default: 2000)",
+    )
+    args = parser.parse_args()
+
+    metamodel = get_core_metamodel()
+    change = MetamodelChange(
+        change_type=ChangeType.CHANGE_REQUIREMENT,
+        target_path="KPI/ROI",
+        old_value=False,
+        new_value=True,
+        description="Make ROI required",
+    )
+    applier = ChangeApplier()
+
+    def with_deepcopy():
+        for _ in range(args.versions):
+            copied = deepcopy(metamodel)
+            copied.get_attribute_by_path("KPI/ROI")[1].required = True
+
+    def with_applier():
+        for _ in range(args.versions):
+            applier.apply_change(metamodel, change)
+
+    report("deepcopy + edit", args.versions, timed(with_deepcopy))
+    report("ChangeApplier.apply_change", args.versions, timed(with_applier))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
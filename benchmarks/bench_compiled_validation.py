@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""
+Benchmark record validation: RecordValidator versus generated per-metamodel validators.
+"""
+
+import argparse
+import sys
+import tempfile
+
+from common import build_records, report, timed
+
+from metamodel_core.models import get_core_metamodel, record_codegen
+from metamodel_core.models.record_codegen import CompiledRecordValidator
+from metamodel_core.models.records import RecordValidator
+
+
+def main():
+    """Run the compiled validation benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--records",
+        "-n",
+        type=int,
+        default=50000,
+        help="Number of records to validate (default: 50000)",
+    )
+    parser.add_argument(
+        "--invalid-every",
+        type=int,
+        default=10,
+        help="Make every n-th record invalid, 0 for none (default: 10)",
+    )
+    args = parser.parse_args()
+
+    metamodel = get_core_metamodel()
+    records = build_records(metamodel, args.records, args.invalid_every)
+    record_validator = RecordValidator(metamodel)
+    compiled = CompiledRecordValidator(metamodel)
+
+    report(
+        "RecordValidator.validate",
+        args.records,
+        timed(lambda: [record_validator.validate(r) for r in records]),
+    )
+    report(
+        "CompiledRecordValidator.validate",
+        args.records,
+        timed(lambda: [compiled.validate(r) for r in records]),
+    )
+    report(
+        "CompiledRecordValidator.is_valid",
+        args.records,
+        timed(lambda: [compiled.is_valid(r) for r in records]),
+    )
+    report(
+        "RecordValidator.validate_many",
+        args.records,
+        timed(lambda: list(record_validator.validate_many(records))),
+    )
+    report(
+        "CompiledRecordValidator.validate_many",
+        args.records,
+        timed(lambda: list(CompiledRecordValidator(metamodel).validate_many(records))),
+    )
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+
+        def build(use_disk):
+            record_codegen._code_cache.clear()
+            CompiledRecordValidator(
+                metamodel, cache_dir=cache_dir if use_disk else None
+            )
+
+        build(True)
+        report("generate and compile", 1, timed(lambda: build(False)))
+        report("load from disk cache", 1, timed(lambda: build(True)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
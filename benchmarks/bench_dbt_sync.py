@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+"""
+Benchmark generating and checking dbt schema files for many models sharing groups.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from copy import deepcopy
+
+from common import report, timed
+
+from metamodel_core.models import get_core_metamodel
+from metamodel_core.schema.cache import GenerationCache
+from metamodel_core.schema.dbt import DbtBackend, check_dbt_sync
+from metamodel_core.schema.generator import SchemaGenerator
+
+
+def main():
+    """Run the dbt generation and sync check benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--models",
+        "-n",
+        type=int,
+        default=200,
+        help="Number of dbt models (default: 200)",
+    )
+    args = parser.parse_args()
+
+    core = deepcopy(get_core_metamodel())
+    metamodels = {}
+    for i in range(args.models):
+        # Every model changes one group of the core metamodel
+        metamodel = deepcopy(core)
+        group = metamodel.groups[i % len(metamodel.groups)]
+        group.description = f"{group.description} (model {i})"
+        metamodels[f"model_{i}"] = metamodel
+
+    with tempfile.TemporaryDirectory() as tmp:
+
+        def generate():
+            SchemaGenerator([DbtBackend()], tmp).generate_all(metamodels)
+
+        report("generate (cold backend)", args.models, timed(generate, repeat=1))
+        generator = SchemaGenerator([DbtBackend()], tmp)
+        generator.generate_all(metamodels)
+        report(
+            "regenerate (cached)",
+            args.models,
+            timed(lambda: generator.generate_all(metamodels)),
+        )
+
+        paths = {name: os.path.join(tmp, f"{name}.yml") for name in metamodels}
+
+        def check(cache=None):
+            for name, metamodel in metamodels.items():
+                assert not check_dbt_sync(metamodel, paths[name], cache=cache)
+
+        report("check_dbt_sync (parse)", args.models, timed(check, repeat=1))
+        cache = GenerationCache(os.path.join(tmp, "sync-cache"))
+        check(cache)
+        report(
+            "check_dbt_sync (unchanged, cached)",
+            args.models,
+            timed(lambda: check(cache)),
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""
+Benchmark building descriptor sets: protoc subprocess versus in-process builder.
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+from copy import deepcopy
+
+from common import report, timed
+
+from metamodel_core.models import get_core_metamodel
+from metamodel_core.schema.protobuf_generator import ProtobufGenerator
+
+
+def main():
+    """Run the descriptor set benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--metamodels",
+        "-n",
+        type=int,
+        default=100,
+        help="Number of distinct metamodels (default: 100)",
+    )
+    args = parser.parse_args()
+
+    metamodels = []
+    for i in range(args.metamodels):
+        metamodel = deepcopy(get_core_metamodel())
+        metamodel.version = f"1.{i}"
+        metamodels.append(metamodel)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generator = ProtobufGenerator(tmp)
+
+        def in_process():
+            for i, metamodel in enumerate(metamodels):
+                generator.build_descriptor_set(
+                    metamodel, f"schema_{i}"
+                ).SerializeToString()
+
+        report("in-process build_descriptor_set", args.metamodels, timed(in_process))
+
+        if shutil.which("protoc") is None:
+            print("protoc not found; skipping the protoc comparison")
+            return 0
+        proto_files = [
+            generator.generate_schema(m, f"schema_{i}")
+            for i, m in enumerate(metamodels)
+        ]
+
+        def with_protoc():
+            # A fresh generator each run, so the descriptor set cache is cold
+            cold = ProtobufGenerator(tmp)
+            for proto_file in proto_files:
+                cold.generate_descriptor_set(proto_file)
+
+        report(
+            "protoc generate_descriptor_set",
+            args.metamodels,
+            timed(with_protoc, repeat=1),
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
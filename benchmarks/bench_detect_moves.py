@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""
+Benchmark move and rename detection on a large synthetic metamodel.
+"""
+
+import argparse
+import sys
+
+from common import report, timed
+
+from metamodel_core.models.metamodel import Metamodel
+from metamodel_core.models.validators import ChangeAnalyzer
+
+WORDS = [
+    "customer",
+    "order",
+    "invoice",
+    "payment",
+    "shipment",
+    "product",
+    "region",
+    "account",
+    "balance",
+    "status",
+    "channel",
+    "campaign",
+    "supplier",
+    "contract",
+    "ledger",
+    "device",
+]
+
+
+def build_metamodel(groups: int, attributes: int, rename_every: int = 0) -> Metamodel:
+    """Build a metamodel, renaming every n-th attribute and moving the next one."""
+    data = {
+        "name": "Synthetic",
+        "version": "1.0",
+        "description": "Synthetic metamodel",
+        "groups": [],
+    }
+    for g in range(groups):
+        data["groups"].append(
+            {"name": f"Group {g}", "description": f"Group {g}", "attributes": []}
+        )
+    for i in range(groups * attributes):
+        words = [WORDS[(i * k) % len(WORDS)] for k in (1, 3, 7)]
+        name = f"{' '.join(words)} {i}"
+        group = i // attributes
+        if rename_every and i % rename_every == 0:
+            name += " value"
+        elif rename_every and i % rename_every == 1:
+            group = (group + 1) % groups
+        data["groups"][group]["attributes"].append(
+            {
+                "name": name,
+                "description": f"The {' '.join(words)} of record {i}",
+                "type": "string",
+                "required": False,
+            }
+        )
+    return Metamodel.from_dict(data)
+
+
+def main():
+    """Run the move detection benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--groups", "-g", type=int, default=50, help="Number of groups (default: 50)"
+    )
+    parser.add_argument(
+        "--attributes",
+        "-a",
+        type=int,
+        default=100,
+        help="Attributes per group (default: 100)",
+    )
+    parser.add_argument(
+        "--rename-every",
+        type=int,
+        default=10,
+        help="Rename every n-th attribute and move the next (default: 10)",
+    )
+    args = parser.parse_args()
+
+    old = build_metamodel(args.groups, args.attributes)
+    new = build_metamodel(args.groups, args.attributes, args.rename_every)
+    total = args.groups * args.attributes
+    for label, analyzer in [
+        ("detect_changes (moves disabled)", ChangeAnalyzer(detect_moves=False)),
+        ("detect_changes (moves detected)", ChangeAnalyzer()),
+    ]:
+        changes = analyzer.detect_changes(old, new)
+        report(label, total, timed(lambda: analyzer.detect_changes(old, new)))
+        counts = {}
+        for change in changes:
+            counts[change.change_type.value] = (
+                counts.get(change.change_type.value, 0) + 1
+            )
+        print(f"    {counts}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+"""
+Benchmark schema generation for a large metamodel: one file versus a file per group.
+"""
+
+import argparse
+import sys
+import tempfile
+
+from common import report, timed
+
+from metamodel_core.models.metamodel import Metamodel
+from metamodel_core.schema.protobuf_generator import ProtobufGenerator
+
+TYPES = ["string", "boolean", "integer", "number", "array", "object", "datetime"]
+
+
+def build_metamodel(groups: int, attributes: int, edited_group: int = -1) -> Metamodel:
+    """Build a metamodel, changing one attribute description of ``edited_group``."""
+    data = {
+        "name": "Synthetic",
+        "version": "1.0",
+        "description": "Synthetic metamodel",
+        "groups": [],
+    }
+    for g in range(groups):
+        group = {"name": f"Group {g}", "description": f"Group {g}", "attributes": []}
+        for a in range(attributes):
+            attr = {
+                "name": f"Attribute {g} {a}",
+                "description": f"Attribute {a} of group {g}",
+                "type": TYPES[a % len(TYPES)],
+                "required": a % 3 == 0,
+            }
+            if a % 10 == 9:
+                attr["type"] = "string"
+                attr["enum"] = [f"Value {v}" for v in range(8)]
+            group["attributes"].append(attr)
+        if g == edited_group:
+            group["attributes"][0]["description"] = "Edited"
+        data["groups"].append(group)
+    return Metamodel.from_dict(data)
+
+
+def main():
+    """Run the per-group schema generation benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--groups", "-g", type=int, default=300, help="Number of groups (default: 300)"
+    )
+    parser.add_argument(
+        "--attributes",
+        "-a",
+        type=int,
+        default=40,
+        help="Attributes per group (default: 40)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for parallel rendering (default: CPU count)",
+    )
+    args = parser.parse_args()
+
+    metamodel = build_metamodel(args.groups, args.attributes)
+    edited = build_metamodel(
+        args.groups, args.attributes, edited_group=args.groups // 2
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Fresh generators, so every run starts with a cold cache
+        report(
+            "generate_schema (single file)",
+            args.groups,
+            timed(lambda: ProtobufGenerator(tmp).generate_schema(metamodel, "single")),
+        )
+        report(
+            "generate_group_schemas (1 worker)",
+            args.groups,
+            timed(
+                lambda: ProtobufGenerator(tmp).generate_group_schemas(
+                    metamodel, "split", workers=1
+                )
+            ),
+        )
+        report(
+            "generate_group_schemas (parallel)",
+            args.groups,
+            timed(
+                lambda: ProtobufGenerator(tmp).generate_group_schemas(
+                    metamodel, "split", workers=args.workers
+                )
+            ),
+        )
+
+        # Regenerate after a one-group edit, with the previous version cached
+        single = ProtobufGenerator(tmp)
+        single.generate_schema(metamodel, "single")
+        report(
+            "single file after a one-group edit",
+            1,
+            timed(lambda: single.generate_schema(edited, "single"), repeat=1),
+        )
+        split = ProtobufGenerator(tmp)
+        split.generate_group_schemas(metamodel, "split")
+        report(
+            "group files after a one-group edit",
+            1,
+            timed(lambda: split.generate_group_schemas(edited, "split"), repeat=1),
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
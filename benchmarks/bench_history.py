@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+"""
+Benchmark a synthetic version history: full JSON documents versus MetamodelHistory.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+from copy import deepcopy
+
+from common import report, timed
+
+from metamodel_core.models import get_core_metamodel
+from metamodel_core.models.history import MetamodelHistory
+from metamodel_core.models.metamodel import Metamodel, MetamodelAttribute
+from metamodel_core.models.validators import ChangeAnalyzer
+
+
+def build_versions(count: int, seed: int = 0):
+    """Yield ``count`` editable versions, each a small random edit of the previous."""
+    rng = random.Random(seed)
+    current = deepcopy(get_core_metamodel())
+    added = []
+    for i in range(count):
+        current.version = f"1.{i}"
+        group = rng.choice(current.groups)
+        action = rng.random()
+        if i and action < 0.3:
+            attr = rng.choice(group.attributes)
+            attr.required = not attr.required
+        elif i and action < 0.6:
+            group.description = f"{group.name} description {i}"
+        elif i and action < 0.8 or not added:
+            name = f"Custom {i}"
+            group.attributes.append(
+                MetamodelAttribute(
+                    name=name,
+                    description=f"Custom attribute {i}",
+                    type="string",
+                    required=False,
+                )
+            )
+            added.append((group.name, name))
+        else:
+            group_name, name = added.pop(rng.randrange(len(added)))
+            owner = current.get_group_by_name(group_name)
+            owner.attributes = [a for a in owner.attributes if a.name != name]
+        yield deepcopy(current)
+
+
+def main():
+    """Run the version history benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--versions",
+        "-n",
+        type=int,
+        default=1000,
+        help="Number of versions in the history (default: 1000)",
+    )
+    parser.add_argument(
+        "--snapshot-interval",
+        type=int,
+        default=50,
+        help="Versions between snapshots (default: 50)",
+    )
+    parser.add_argument(
+        "--lookups",
+        type=int,
+        default=200,
+        help="Number of random checkouts and diffs (default: 200)",
+    )
+    args = parser.parse_args()
+
+    versions = list(build_versions(args.versions))
+    documents = {v.version: json.dumps(v.model_dump()) for v in versions}
+    history = MetamodelHistory(snapshot_interval=args.snapshot_interval)
+
+    def commit_all():
+        history.__init__(snapshot_interval=args.snapshot_interval)
+        for version in versions:
+            history.commit(version)
+
+    report("MetamodelHistory.commit", args.versions, timed(commit_all, repeat=1))
+
+    rng = random.Random(1)
+    names = [v.version for v in versions]
+    pairs = [(rng.choice(names), rng.choice(names)) for _ in range(args.lookups)]
+    analyzer = ChangeAnalyzer()
+
+    def load_documents():
+        for name, _ in pairs:
+            Metamodel.from_dict(json.loads(documents[name]))
+
+    def checkout():
+        for name, _ in pairs:
+            history.checkout(name)
+
+    def diff_documents():
+        for old, new in pairs:
+            analyzer.detect_changes(
+                Metamodel.from_dict(json.loads(documents[old])),
+                Metamodel.from_dict(json.loads(documents[new])),
+            )
+
+    def diff_history():
+        for old, new in pairs:
+            history.diff(old, new)
+
+    report("full JSON: load version", args.lookups, timed(load_documents))
+    report("MetamodelHistory.checkout", args.lookups, timed(checkout))
+    report("full JSON: load and diff two versions", args.lookups, timed(diff_documents))
+    report("MetamodelHistory.diff", args.lookups, timed(diff_history))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "history.json")
+        history.save(path)
+        stored = os.path.getsize(path)
+    full = sum(len(document) for document in documents.values())
+    print(f"storage: full JSON documents {full:,} bytes, history {stored:,} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""
+Benchmark importing a large spreadsheet-style field catalog into a metamodel.
+"""
+
+import argparse
+import io
+import json
+import sys
+
+from common import report, timed
+
+from metamodel_core.models.ingest import import_ingest, iter_json_array
+
+TYPES = ["String", "Int", "DateTime", "UUID", "String"]
+
+
+def build_catalog(rows: int, groups: int) -> str:
+    """Build a catalog with ``rows`` fields spread over ``groups`` groupings."""
+    catalog = []
+    for i in range(rows):
+        row = {
+            "Field": f"Field {i}",
+            "Type": TYPES[i % len(TYPES)],
+            "Definition": f"  Definition of field {i}\n(wrapped in the spreadsheet) ",
+            "Groupings": f"Group {i % groups}",
+            "Gate Requirement": "Y" if i % 3 == 0 else "N",
+            "Actor": "Supplier",
+        }
+        if i % 5 == 4:
+            row["Type Detail"] = "LOV"
+            row["Value Limits"] = "Alpha, Beta, Gamma, Delta"
+        catalog.append(row)
+    return json.dumps(catalog, indent=1)
+
+
+def main():
+    """Run the catalog import benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rows",
+        "-n",
+        type=int,
+        default=20000,
+        help="Number of catalog rows (default: 20000)",
+    )
+    parser.add_argument(
+        "--groups", type=int, default=50, help="Number of groupings (default: 50)"
+    )
+    args = parser.parse_args()
+
+    text = build_catalog(args.rows, args.groups)
+
+    report("json.loads (parse only)", args.rows, timed(lambda: json.loads(text)))
+    report(
+        "iter_json_array (parse only)",
+        args.rows,
+        timed(lambda: list(iter_json_array(io.StringIO(text)))),
+    )
+    report("import_ingest", args.rows, timed(lambda: import_ingest(io.StringIO(text))))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
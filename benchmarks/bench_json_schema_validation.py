@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""
+Benchmark record validation: RecordValidator versus compiled JSON Schema validators.
+"""
+
+import argparse
+import sys
+
+from common import build_records, report, timed
+from jsonschema import Draft202012Validator
+
+from metamodel_core.models import get_core_metamodel
+from metamodel_core.models.records import RecordValidator
+from metamodel_core.schema.ir import compile_metamodel
+from metamodel_core.schema.json_schema import (
+    FORMAT_CHECKER,
+    JsonSchemaBackend,
+    JsonSchemaRecordValidator,
+    ValidatorCache,
+)
+
+
+def main():
+    """Run the JSON Schema validation benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--records",
+        "-n",
+        type=int,
+        default=20000,
+        help="Number of records to validate (default: 20000)",
+    )
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=200,
+        help="Number of requests for the per-request compilation case (default: 200)",
+    )
+    args = parser.parse_args()
+
+    metamodel = get_core_metamodel()
+    records = build_records(metamodel, args.records)
+    record_validator = RecordValidator(metamodel)
+    cache = ValidatorCache()
+    schema_validator = JsonSchemaRecordValidator(metamodel, cache=cache)
+    compiled = cache.get(metamodel)
+
+    report(
+        "RecordValidator.validate",
+        args.records,
+        timed(lambda: [record_validator.validate(r) for r in records]),
+    )
+    report(
+        "Draft202012Validator.is_valid",
+        args.records,
+        timed(lambda: [compiled.is_valid(r) for r in records]),
+    )
+    report(
+        "JsonSchemaRecordValidator.validate",
+        args.records,
+        timed(lambda: [schema_validator.validate(r) for r in records]),
+    )
+
+    def compile_per_request():
+        for record in records[: args.requests]:
+            schema = JsonSchemaBackend().schema(compile_metamodel(metamodel))
+            Draft202012Validator.check_schema(schema)
+            Draft202012Validator(schema, format_checker=FORMAT_CHECKER).is_valid(record)
+
+    report("compile per request", args.requests, timed(compile_per_request, repeat=1))
+    report(
+        "ValidatorCache per request",
+        args.requests,
+        timed(
+            lambda: [cache.get(metamodel).is_valid(r) for r in records[: args.requests]]
+        ),
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
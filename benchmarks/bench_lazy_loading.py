@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""
+Benchmark cold loading of a large metamodel file: full validation versus lazy groups.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+from bench_group_schemas import build_metamodel
+from common import report, timed
+
+from metamodel_core.models.metamodel import Metamodel
+
+
+def main():
+    """Run the lazy loading benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--groups", type=int, default=200, help="Number of groups (default: 200)"
+    )
+    parser.add_argument(
+        "--attributes",
+        type=int,
+        default=40,
+        help="Number of attributes per group (default: 40)",
+    )
+    parser.add_argument(
+        "--loads", type=int, default=20, help="Number of loads per case (default: 20)"
+    )
+    args = parser.parse_args()
+
+    metamodel = build_metamodel(args.groups, args.attributes)
+    middle = metamodel.groups[args.groups // 2].name
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "metamodel.json")
+        with open(path, "w") as f:
+            json.dump(metamodel.model_dump(), f)
+
+        def loads(func):
+            return timed(lambda: [func() for _ in range(args.loads)])
+
+        report("eager load", args.loads, loads(lambda: Metamodel.from_json_file(path)))
+        report(
+            "lazy load (header and index)",
+            args.loads,
+            loads(lambda: Metamodel.from_json_file(path, lazy=True)),
+        )
+        report(
+            "lazy load, one group",
+            args.loads,
+            loads(
+                lambda: Metamodel.from_json_file(path, lazy=True).get_group_by_name(
+                    middle
+                )
+            ),
+        )
+        report(
+            "lazy load, required attributes",
+            args.loads,
+            loads(
+                lambda: Metamodel.from_json_file(
+                    path, lazy=True
+                ).get_required_attributes()
+            ),
+        )
+        report(
+            "lazy load, materialize",
+            args.loads,
+            loads(lambda: Metamodel.from_json_file(path, lazy=True).materialize()),
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""
+Benchmark streaming record migration of an NDJSON file, with and without checkpoints.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from copy import deepcopy
+
+from common import build_records, report, timed
+
+from metamodel_core.models import get_core_metamodel
+from metamodel_core.models.metamodel import MetamodelAttribute
+from metamodel_core.models.migration import RecordMigration, migrate_ndjson
+from metamodel_core.models.record_codegen import CompiledRecordValidator
+from metamodel_core.models.validators import ChangeAnalyzer
+
+
+def evolve(metamodel):
+    """Return a version adding, removing and re-typing attributes, and its defaults."""
+    new = deepcopy(metamodel)
+    new.version = "99.0.0"
+    first, last = new.groups[0], new.groups[-1]
+    first.attributes.append(
+        MetamodelAttribute(
+            name="Migration Owner",
+            description="Team owning the migration",
+            type="string",
+            required=True,
+        )
+    )
+    del last.attributes[-1]
+    for attr in new.groups[1].attributes:
+        if attr.type != "string" and not attr.enum:
+            attr.type = "string"
+            break
+    return new, {f"{first.name}/Migration Owner": "platform"}
+
+
+def main():
+    """Run the record migration benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--records",
+        "-n",
+        type=int,
+        default=50000,
+        help="Number of records to migrate (default: 50000)",
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=10000,
+        help="Records between checkpoints (default: 10000)",
+    )
+    args = parser.parse_args()
+
+    metamodel = get_core_metamodel()
+    new, defaults = evolve(metamodel)
+    migration = RecordMigration(
+        ChangeAnalyzer().detect_changes(metamodel, new), defaults=defaults
+    )
+    validator = CompiledRecordValidator(new)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "records.ndjson")
+        with open(source, "w") as f:
+            for record in build_records(metamodel, args.records, invalid_every=0):
+                f.write(json.dumps(record) + "\n")
+        output = os.path.join(tmp, "migrated.ndjson")
+        checkpoint = os.path.join(tmp, "checkpoint.json")
+
+        report(
+            "migrate_ndjson",
+            args.records,
+            timed(lambda: migrate_ndjson(source, output, migration), repeat=1),
+        )
+        report(
+            "migrate_ndjson + validate",
+            args.records,
+            timed(
+                lambda: migrate_ndjson(source, output, migration, validator=validator),
+                repeat=1,
+            ),
+        )
+        report(
+            "migrate_ndjson + checkpoints",
+            args.records,
+            timed(
+                lambda: migrate_ndjson(
+                    source,
+                    output,
+                    migration,
+                    checkpoint_path=checkpoint,
+                    checkpoint_every=args.checkpoint_every,
+                ),
+                repeat=1,
+            ),
+        )
+        print(migrate_ndjson(source, output, migration, validator=validator).summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+"""
+Benchmark chunked record migration with worker processes against streaming migration.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+from bench_migration import evolve
+from common import build_records, report, timed
+
+from metamodel_core.models import get_core_metamodel
+from metamodel_core.models.migration import RecordMigration, migrate_ndjson
+from metamodel_core.models.migration_runner import MigrationRunner
+from metamodel_core.models.record_codegen import CompiledRecordValidator
+from metamodel_core.models.validators import ChangeAnalyzer
+
+
+def main():
+    """Run the migration runner benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--records",
+        "-n",
+        type=int,
+        default=50000,
+        help="Number of records to migrate (default: 50000)",
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--chunk-kb",
+        type=int,
+        default=1024,
+        help="Approximate chunk size in KiB (default: 1024)",
+    )
+    args = parser.parse_args()
+
+    metamodel = get_core_metamodel()
+    new, defaults = evolve(metamodel)
+    migration = RecordMigration(
+        ChangeAnalyzer().detect_changes(metamodel, new), defaults=defaults
+    )
+    validator = CompiledRecordValidator(new)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "records.ndjson")
+        with open(source, "w") as f:
+            for record in build_records(metamodel, args.records, invalid_every=0):
+                f.write(json.dumps(record) + "\n")
+        output = os.path.join(tmp, "migrated.ndjson")
+        parts = os.path.join(tmp, "parts")
+
+        def run(workers):
+            shutil.rmtree(parts, ignore_errors=True)
+            runner = MigrationRunner(
+                migration,
+                validator=validator,
+                workers=workers,
+                chunk_bytes=args.chunk_kb * 1024,
+            )
+            return runner.run(source, parts, output_path=output)
+
+        report(
+            "migrate_ndjson",
+            args.records,
+            timed(
+                lambda: migrate_ndjson(source, output, migration, validator=validator),
+                repeat=1,
+            ),
+        )
+        report(
+            "MigrationRunner, 1 worker", args.records, timed(lambda: run(1), repeat=1)
+        )
+        report(
+            f"MigrationRunner, {args.workers} workers",
+            args.records,
+            timed(lambda: run(args.workers), repeat=1),
+        )
+
+        runner = MigrationRunner(migration, validator=validator, workers=args.workers)
+        report(
+            "dry run (1000 records sampled)",
+            args.records,
+            timed(lambda: runner.dry_run(source), repeat=1),
+        )
+        print(runner.dry_run(source).summary())
+        print(run(args.workers).summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""
+Benchmark NDJSON validation throughput against the number of worker processes.
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import tempfile
+
+from common import build_record
+
+from metamodel_core.models import get_core_metamodel
+from metamodel_core.models.records import RecordValidator
+from metamodel_core.models.streaming import validate_ndjson, validate_ndjson_parallel
+
+
+def main():
+    """Run the parallel validation benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--records",
+        "-n",
+        type=int,
+        default=100000,
+        help="Number of records in the generated file (default: 100000)",
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+        help="Worker counts to measure",
+    )
+    parser.add_argument(
+        "--chunk-mb", type=int, default=4, help="Chunk size in MiB (default: 4)"
+    )
+    args = parser.parse_args()
+
+    metamodel = get_core_metamodel()
+    validator = RecordValidator(metamodel)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "records.ndjson")
+        with open(path, "w") as f:
+            for i in range(args.records):
+                f.write(
+                    json.dumps(build_record(metamodel, i, invalid=i % 10 == 0)) + "\n"
+                )
+        print(
+            f"{args.records} records, {os.path.getsize(path) / 2 ** 20:.1f} MiB, "
+            f"{os.cpu_count()} CPUs"
+        )
+
+        with open(path, "rb") as f:
+            baseline = validate_ndjson(f, io.StringIO(), validator)
+        print(f"{'sequential':<12} {baseline.summary()}")
+
+        for workers in args.workers:
+            stats = validate_ndjson_parallel(
+                path,
+                io.StringIO(),
+                validator,
+                workers=workers,
+                chunk_bytes=args.chunk_mb * 2**20,
+            )
+            speedup = baseline.seconds / stats.seconds
+            print(f"{workers:>2} workers   {stats.summary()}  speedup x{speedup:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
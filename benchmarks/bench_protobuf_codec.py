@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""
+Benchmark encoding metadata records: json versus ProtobufCodec.
+"""
+
+import argparse
+import json
+import sys
+
+from common import build_records, report, timed
+
+from metamodel_core.models import get_core_metamodel
+from metamodel_core.schema.protobuf_codec import ProtobufCodec
+
+
+def main():
+    """Run the record encoding benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--records",
+        "-n",
+        type=int,
+        default=20000,
+        help="Number of records to encode (default: 20000)",
+    )
+    args = parser.parse_args()
+
+    metamodel = get_core_metamodel()
+    records = build_records(metamodel, args.records, invalid_every=0)
+    codec = ProtobufCodec(metamodel)
+
+    json_encoded = [json.dumps(record).encode("utf-8") for record in records]
+    proto_encoded = [codec.encode(record) for record in records]
+    json_size = sum(len(data) for data in json_encoded)
+    proto_size = sum(len(data) for data in proto_encoded)
+    print(
+        f"encoded size: json {json_size / args.records:,.0f} B/record, "
+        f"protobuf {proto_size / args.records:,.0f} B/record "
+        f"({proto_size / json_size:.0%})"
+    )
+
+    report(
+        "json encode",
+        args.records,
+        timed(lambda: [json.dumps(r).encode("utf-8") for r in records]),
+    )
+    report(
+        "ProtobufCodec.encode",
+        args.records,
+        timed(lambda: [codec.encode(r) for r in records]),
+    )
+    report(
+        "json decode",
+        args.records,
+        timed(lambda: [json.loads(d) for d in json_encoded]),
+    )
+    report(
+        "ProtobufCodec.decode",
+        args.records,
+        timed(lambda: [codec.decode(d) for d in proto_encoded]),
+    )
+    report(
+        "protobuf parse only",
+        args.records,
+        timed(lambda: [codec.message_class.FromString(d) for d in proto_encoded]),
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
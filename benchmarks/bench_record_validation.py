@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""
+Benchmark record validation against the bundled core metamodel.
+
+Compares the compiled ``RecordValidator`` with a loop that walks the pydantic
+metamodel for every record.
+"""
+
+import argparse
+import sys
+from typing import Any, Dict, List
+
+from common import build_records, report, timed
+
+from metamodel_core.models import get_core_metamodel
+from metamodel_core.models.metamodel import Metamodel
+from metamodel_core.models.records import TYPE_CHECKS, RecordValidator
+
+
+def naive_validate(metamodel: Metamodel, record: Dict[str, Any]) -> List[str]:
+    """Validate a record by walking the metamodel groups and attributes."""
+    errors = []
+    for group in metamodel.groups:
+        values = record.get(group.name) or {}
+        for attr in group.attributes:
+            value = values.get(attr.name)
+            if value is None:
+                if attr.required:
+                    errors.append(f"{group.name}/{attr.name}: missing")
+                continue
+            if not TYPE_CHECKS[attr.type](value):
+                errors.append(f"{group.name}/{attr.name}: type")
+            elif attr.enum and value not in attr.enum:
+                errors.append(f"{group.name}/{attr.name}: enum")
+    return errors
+
+
+def main():
+    """Run the record validation benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--records",
+        "-n",
+        type=int,
+        default=20000,
+        help="Number of records to validate (default: 20000)",
+    )
+    args = parser.parse_args()
+
+    metamodel = get_core_metamodel()
+    records = build_records(metamodel, args.records)
+    print(
+        f"Core metamodel {metamodel.version}: {len(metamodel.groups)} groups, "
+        f"{sum(len(g.attributes) for g in metamodel.groups)} attributes"
+    )
+
+    validator = RecordValidator(metamodel)
+    report(
+        "RecordValidator.validate",
+        len(records),
+        timed(lambda: [validator.validate(r) for r in records]),
+    )
+    report(
+        "naive metamodel walk",
+        len(records),
+        timed(lambda: [naive_validate(metamodel, r) for r in records]),
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
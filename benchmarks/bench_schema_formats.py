@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""
+Benchmark generating every schema format for many related metamodels.
+"""
+
+import argparse
+import sys
+import tempfile
+from copy import deepcopy
+
+from common import report, timed
+
+from metamodel_core.models import get_core_metamodel
+from metamodel_core.schema import ir
+from metamodel_core.schema.generator import SchemaGenerator, default_backends
+from metamodel_core.schema.protobuf_generator import ProtobufGenerator
+
+
+def build_metamodels(count: int):
+    """Build ``count`` variants of the core metamodel, each with one group changed."""
+    metamodels = {}
+    for i in range(count):
+        metamodel = deepcopy(get_core_metamodel())
+        metamodel.version = f"1.{i}"
+        metamodel.groups[i % len(metamodel.groups)].description = f"Variant {i}"
+        metamodels[f"schema_{i}"] = metamodel
+    return metamodels
+
+
+def main():
+    """Run the multi-format schema generation benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--metamodels",
+        "-n",
+        type=int,
+        default=200,
+        help="Number of metamodels (default: 200)",
+    )
+    args = parser.parse_args()
+
+    metamodels = build_metamodels(args.metamodels)
+    with tempfile.TemporaryDirectory() as tmp:
+
+        def protobuf_only():
+            generator = ProtobufGenerator(tmp)
+            for filename, metamodel in metamodels.items():
+                generator.render_schema(metamodel, filename)
+
+        def one_backend(backend):
+            def run():
+                ir._metamodels.clear()
+                ir._groups.clear()
+                generator = SchemaGenerator([type(backend)()], tmp)
+                for filename, metamodel in metamodels.items():
+                    generator.render(metamodel, filename)
+
+            return run
+
+        def all_formats():
+            ir._metamodels.clear()
+            ir._groups.clear()
+            generator = SchemaGenerator(None, tmp)
+            for filename, metamodel in metamodels.items():
+                generator.render(metamodel, filename)
+
+        report("protobuf render_schema", args.metamodels, timed(protobuf_only))
+        for backend in default_backends():
+            report(
+                f"SchemaGenerator ({backend.name} only)",
+                args.metamodels,
+                timed(one_backend(backend)),
+            )
+        names = ", ".join(backend.name for backend in default_backends())
+        report(f"SchemaGenerator ({names})", args.metamodels, timed(all_formats))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""
+Benchmark loading historic versions: validated models versus trusted construction.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+from bench_history import build_versions
+from common import report, timed
+
+from metamodel_core.models.history import MetamodelHistory
+from metamodel_core.models.metamodel import FrozenMetamodel
+from metamodel_core.models.trusted import construct_metamodel
+
+
+def main():
+    """Run the trusted loading benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--versions",
+        "-n",
+        type=int,
+        default=1000,
+        help="Number of versions to load (default: 1000)",
+    )
+    parser.add_argument(
+        "--snapshot-interval",
+        type=int,
+        default=10,
+        help="Versions between snapshots of the history (default: 10)",
+    )
+    args = parser.parse_args()
+
+    versions = list(build_versions(args.versions))
+    documents = [json.loads(json.dumps(v.model_dump())) for v in versions]
+
+    report(
+        "FrozenMetamodel.model_validate",
+        args.versions,
+        timed(lambda: [FrozenMetamodel.model_validate(d) for d in documents]),
+    )
+    report(
+        "construct_metamodel",
+        args.versions,
+        timed(lambda: [construct_metamodel(d) for d in documents]),
+    )
+
+    history = MetamodelHistory(snapshot_interval=args.snapshot_interval)
+    for version in versions:
+        history.commit(version)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "history.json")
+        history.save(path)
+        report(
+            "MetamodelHistory.load",
+            args.versions,
+            timed(lambda: MetamodelHistory.load(path), repeat=1),
+        )
+        report(
+            "MetamodelHistory.load (trusted)",
+            args.versions,
+            timed(lambda: MetamodelHistory.load(path, trusted=True), repeat=1),
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
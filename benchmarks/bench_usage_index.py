@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""
+Benchmark building the field-usage index and answering impact questions from it.
+"""
+
+import argparse
+import sys
+
+from common import build_records, report, timed
+
+from metamodel_core.models import get_core_metamodel
+from metamodel_core.models.metamodel import ChangeType, MetamodelChange
+from metamodel_core.models.usage import FieldUsageIndex
+from metamodel_core.models.validators import MigrationPlanner
+
+
+def main():
+    """Run the field-usage index benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--records",
+        "-n",
+        type=int,
+        default=50000,
+        help="Number of records to index (default: 50000)",
+    )
+    args = parser.parse_args()
+
+    metamodel = get_core_metamodel()
+    records = build_records(metamodel, args.records)
+    optional = [
+        f"{group.name}/{attr.name}"
+        for group in metamodel.groups
+        for attr in group.attributes
+        if not attr.required
+    ]
+
+    def build():
+        index = FieldUsageIndex()
+        index.add_many(records, version=metamodel.version)
+        return index
+
+    report("FieldUsageIndex.add_many", args.records, timed(build, repeat=1))
+    index = build()
+
+    def scan():
+        # What the index replaces: a pass over every record per question
+        for path in optional:
+            group_name, attr_name = path.split("/")
+            sum(
+                1
+                for record in records
+                if (record.get(group_name) or {}).get(attr_name) is None
+            )
+
+    def lookup():
+        for path in optional:
+            index.unpopulated_by_version(path)
+
+    report(
+        f"'becomes required' by scan x{len(optional)}",
+        len(optional),
+        timed(scan, repeat=1),
+    )
+    report(
+        f"'becomes required' by lookup x{len(optional)}", len(optional), timed(lookup)
+    )
+
+    planner = MigrationPlanner(usage=index)
+    changes = [
+        MetamodelChange(
+            change_type=ChangeType.CHANGE_REQUIREMENT,
+            target_path=path,
+            old_value=False,
+            new_value=True,
+            description=f"Make {path} required",
+        )
+        for path in optional
+    ]
+    report(
+        "plan with affected records",
+        len(changes),
+        timed(lambda: planner.generate_migration_plan(changes)),
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""
+Shared helpers for the benchmark scripts.
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Add the source directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from metamodel_core.models.metamodel import (  # noqa: E402
+    AttributeType,
+    Metamodel,
+    MetamodelAttribute,
+)
+
+
+def sample_value(attr: MetamodelAttribute, seed: int) -> Any:
+    """Build a deterministic value that conforms to an attribute."""
+    if attr.enum:
+        return attr.enum[seed % len(attr.enum)]
+    attr_type = AttributeType(attr.type)
+    if attr_type == AttributeType.BOOLEAN:
+        return seed % 2 == 0
+    if attr_type == AttributeType.INTEGER:
+        return seed
+    if attr_type == AttributeType.NUMBER:
+        return seed / 7
+    if attr_type == AttributeType.ARRAY:
+        return [f"item-{seed}", f"item-{seed + 1}"]
+    if attr_type == AttributeType.OBJECT:
+        return {"id": seed, "label": f"object-{seed}"}
+    if attr_type == AttributeType.DATETIME:
+        return f"2025-05-{seed % 28 + 1:02d}T12:00:00+00:00"
+    return f"{attr.name} value {seed}"
+
+
+def build_record(
+    metamodel: Metamodel, seed: int, invalid: bool = False
+) -> Dict[str, Any]:
+    """
+    Build a metadata record populating every attribute of a metamodel.
+
+    Invalid records drop the first required attribute and give the first
+    non-string attribute a value of the wrong type.
+    """
+    record: Dict[str, Any] = {}
+    for group in metamodel.groups:
+        record[group.name] = {
+            attr.name: sample_value(attr, seed) for attr in group.attributes
+        }
+    if invalid:
+        dropped = retyped = False
+        for group in metamodel.groups:
+            for attr in group.attributes:
+                if not dropped and attr.required:
+                    del record[group.name][attr.name]
+                    dropped = True
+                elif not retyped and attr.type != AttributeType.STRING:
+                    record[group.name][attr.name] = "not the right type"
+                    retyped = True
+    return record
+
+
+def build_records(
+    metamodel: Metamodel, count: int, invalid_every: int = 10
+) -> List[Dict[str, Any]]:
+    """Build ``count`` records, making every ``invalid_every``-th one invalid."""
+    return [
+        build_record(metamodel, i, invalid=invalid_every > 0 and i % invalid_every == 0)
+        for i in range(count)
+    ]
+
+
+def timed(func: Callable[[], Any], repeat: int = 3) -> float:
+    """Return the best wall-clock time in seconds over ``repeat`` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(label: str, count: int, seconds: float) -> None:
+    """Print a throughput line for a benchmark."""
+    rate = count / seconds if seconds else float("inf")
+    print(f"{label:<40} {count:>9} in {seconds:8.3f}s  {rate:>12,.0f}/s")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""
+Script to check that dbt schema.yml files match a metamodel, e.g. from a pre-commit hook.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from metamodel_core.models import Metamodel, get_core_metamodel
+from metamodel_core.schema.cache import GenerationCache
+from metamodel_core.schema.dbt import check_dbt_sync
+
+
+def main():
+    """Check dbt schema files against a metamodel and report the differences."""
+    parser = argparse.ArgumentParser(
+        description="Check that dbt schema.yml files match a metamodel.",
+        epilog="Generate matching files with 'generate_schema.py --formats dbt'."
+    )
+    parser.add_argument(
+        "yaml_files",
+        nargs="+",
+        help="Paths of the dbt schema files to check"
+    )
+    parser.add_argument(
+        "--metamodel",
+        "-m",
+        help="Path to the metamodel JSON file (default: the core metamodel)"
+    )
+    parser.add_argument(
+        "--model",
+        help="Name of the model to check in each file (default: the file's only model)"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory remembering files found in sync, so unchanged files are not parsed again"
+    )
+    args = parser.parse_args()
+
+    try:
+        metamodel = Metamodel.from_json_file(args.metamodel) if args.metamodel else get_core_metamodel()
+        cache = GenerationCache(args.cache_dir) if args.cache_dir else None
+
+        out_of_sync = 0
+        for yaml_file in args.yaml_files:
+            drifts = check_dbt_sync(metamodel, yaml_file, model_name=args.model, cache=cache)
+            if drifts:
+                out_of_sync += 1
+                print(f"{yaml_file} is out of sync with metamodel version {metamodel.version}:", file=sys.stderr)
+                for drift in drifts:
+                    print(f"  - {drift}", file=sys.stderr)
+
+        if out_of_sync:
+            print(f"{out_of_sync} of {len(args.yaml_files)} files out of sync", file=sys.stderr)
+            return 1
+        print(f"{len(args.yaml_files)} files in sync")
+        return 0
+
+    except FileNotFoundError as e:
+        print(f"Error: File not found: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from metamodel_core.models import get_core_metamodel
+from metamodel_core.schema.cache import GenerationCache
+from metamodel_core.schema.field_numbers import FieldNumberRegistry
+from metamodel_core.schema.generator import SchemaGenerator, default_backends
 from metamodel_core.schema.protobuf_generator import ProtobufGenerator
 
 
@@ -31,13 +34,60 @@ def main():
         default="metamodel",
         help="Base filename for the generated schema files (default: metamodel)"
     )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory for cached generated files (default: OUTPUT_DIR/.cache)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not reuse generated files from previous runs"
+    )
+    parser.add_argument(
+        "--field-numbers",
+        default=None,
+        help="JSON file keeping field numbers stable across metamodel versions "
+             "(created if it does not exist, updated after generating)"
+    )
+    parser.add_argument(
+        "--formats",
+        default="protobuf",
+        help="Comma-separated schema formats to generate: protobuf, json_schema, avro, "
+             "dbt, arrow or all (default: protobuf)"
+    )
+    parser.add_argument(
+        "--split",
+        action="store_true",
+        help="Write one .proto file per group, imported by FILENAME.proto"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes rendering groups with --split (default: CPU count)"
+    )
     parser.add_argument(
         "--descriptor-set", 
         "-d", 
         action="store_true",
         help="Generate a Protocol Buffer FileDescriptorSet (.pb) file"
     )
+    parser.add_argument(
+        "--protoc",
+        action="store_true",
+        help="Build the descriptor set with protoc instead of in-process"
+    )
     args = parser.parse_args()
+    if args.split and args.descriptor_set:
+        parser.error("--split cannot be combined with --descriptor-set")
+    backends = {backend.name: backend for backend in default_backends()}
+    formats = args.formats.split(",")
+    if formats == ["all"]:
+        formats = ["protobuf"] + list(backends)
+    unknown = [name for name in formats if name != "protobuf" and name not in backends]
+    if unknown:
+        parser.error(f"unknown or unavailable format(s): {', '.join(unknown)}")
     
     # Create the output directory if it doesn't exist
     os.makedirs(args.output_dir, exist_ok=True)
@@ -49,23 +99,52 @@ def main():
         print(f"Loaded core metamodel version {metamodel.version}")
         
         # Create a Protocol Buffer generator
-        generator = ProtobufGenerator(args.output_dir)
+        cache = None
+        if not args.no_cache:
+            cache = GenerationCache(args.cache_dir or os.path.join(args.output_dir, ".cache"))
+        field_numbers = None
+        if args.field_numbers:
+            field_numbers = FieldNumberRegistry.load(args.field_numbers)
+        generator = ProtobufGenerator(args.output_dir, cache=cache, field_numbers=field_numbers)
+        
+        # Generate the other formats from one compiled pass
+        other_formats = [backends[name] for name in formats if name != "protobuf"]
+        if other_formats:
+            print(f"Generating {', '.join(b.name for b in other_formats)} schemas in {args.output_dir}...")
+            schema_generator = SchemaGenerator(other_formats, args.output_dir, cache=cache)
+            for path in schema_generator.generate(metamodel, args.filename).values():
+                print(f"Generated schema file: {path}")
+        if "protobuf" not in formats:
+            print("Done!")
+            return 0
         
         # Generate the schema
         print(f"Generating Protocol Buffer schema in {args.output_dir}...")
-        proto_file = generator.generate_schema(metamodel, args.filename)
-        print(f"Generated schema file: {proto_file}")
+        if args.split:
+            proto_files = generator.generate_group_schemas(metamodel, args.filename, workers=args.workers)
+            print(f"Generated schema file: {proto_files[0]} ({len(proto_files) - 1} group files)")
+        else:
+            proto_file = generator.generate_schema(metamodel, args.filename)
+            print(f"Generated schema file: {proto_file}")
         
         # Generate a descriptor set if requested
         if args.descriptor_set:
             print("Generating Protocol Buffer descriptor set...")
-            try:
-                descriptor_file = generator.generate_descriptor_set(proto_file)
+            if not args.protoc:
+                descriptor_file = generator.generate_metamodel_descriptor_set(metamodel, args.filename)
                 print(f"Generated descriptor set: {descriptor_file}")
-            except RuntimeError as e:
-                print(f"Failed to generate descriptor set: {e}", file=sys.stderr)
-                print("Make sure protoc (Protocol Buffer Compiler) is installed and in your PATH.", file=sys.stderr)
-                return 1
+            else:
+                try:
+                    descriptor_file = generator.generate_descriptor_set(proto_file)
+                    print(f"Generated descriptor set: {descriptor_file}")
+                except (RuntimeError, FileNotFoundError) as e:
+                    print(f"Failed to generate descriptor set: {e}", file=sys.stderr)
+                    print("Make sure protoc (Protocol Buffer Compiler) is installed and in your PATH.", file=sys.stderr)
+                    return 1
+        
+        if field_numbers is not None:
+            field_numbers.save(args.field_numbers)
+            print(f"Saved field numbers: {args.field_numbers}")
         
         print("Done!")
         return 0
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+Script to import a spreadsheet-style field catalog (such as data/ingest.json) into a metamodel.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from metamodel_core.models import Metamodel
+from metamodel_core.models.ingest import MetamodelImporter, diff_against_core, import_ingest_file
+
+
+def main():
+    """Import a field catalog into a metamodel and compare it with the core metamodel."""
+    parser = argparse.ArgumentParser(
+        description="Import a spreadsheet-style field catalog into a metamodel."
+    )
+    parser.add_argument(
+        "catalog_file",
+        help="Path to the catalog JSON file (an array of rows)"
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        help="Path for the imported metamodel JSON file"
+    )
+    parser.add_argument(
+        "--name",
+        default="Ingest Catalog",
+        help="Name of the imported metamodel (default: Ingest Catalog)"
+    )
+    parser.add_argument(
+        "--version",
+        default="1.0.0",
+        help="Version of the imported metamodel (default: 1.0.0)"
+    )
+    parser.add_argument(
+        "--detect-changes",
+        "-c",
+        action="store_true",
+        help="Detect changes from the core metamodel (or --base) to the imported one"
+    )
+    parser.add_argument(
+        "--base",
+        help="Path to the metamodel JSON file to compare with (default: the core metamodel)"
+    )
+    args = parser.parse_args()
+
+    try:
+        importer = MetamodelImporter(name=args.name, version=args.version)
+        result = import_ingest_file(args.catalog_file, importer)
+        attributes = sum(len(group.attributes) for group in result.metamodel.groups)
+        print(f"Imported {attributes} attributes in {len(result.metamodel.groups)} groups "
+              f"from {result.rows} rows")
+        for issue in result.issues:
+            print(f"  - {issue}", file=sys.stderr)
+
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(result.metamodel.model_dump(mode="json", exclude_none=True), f, indent=2)
+            print(f"Metamodel written to {args.output}")
+
+        if args.detect_changes:
+            base = Metamodel.from_json_file(args.base) if args.base else None
+            changes = diff_against_core(result.metamodel, base)
+            if changes:
+                print(f"Detected {len(changes)} changes:")
+                for i, change in enumerate(changes, 1):
+                    print(f"  {i}. {change.change_type}: {change.target_path}")
+                    print(f"     {change.description}")
+            else:
+                print("No changes detected.")
+        return 0
+
+    except FileNotFoundError as e:
+        print(f"Error: File not found: {e}", file=sys.stderr)
+        return 1
+    except json.JSONDecodeError as e:
+        print(f"Error: Invalid JSON: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+"""
+Script to migrate NDJSON metadata records from one metamodel version to another.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add the parent directory to the Python path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from metamodel_core.models import Metamodel
+from metamodel_core.models.migration import RecordMigration
+from metamodel_core.models.migration_runner import DEFAULT_SAMPLE_SIZE, MigrationRunner
+from metamodel_core.models.records import RecordValidator
+from metamodel_core.models.validators import ChangeAnalyzer
+
+
+def _load_json_option(path):
+    if path is None:
+        return None
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def main():
+    """Migrate NDJSON metadata records to a new metamodel version."""
+    parser = argparse.ArgumentParser(
+        description="Migrate NDJSON metadata records from one metamodel version to another.",
+        epilog="Interrupted runs resume with the chunks that are not complete in OUTPUT_DIR."
+    )
+    parser.add_argument(
+        "old_metamodel",
+        help="Path to the metamodel JSON file the records conform to"
+    )
+    parser.add_argument(
+        "new_metamodel",
+        help="Path to the metamodel JSON file to migrate the records to"
+    )
+    parser.add_argument(
+        "records_file",
+        help="Path to the NDJSON records file to migrate"
+    )
+    parser.add_argument(
+        "output_dir",
+        nargs="?",
+        help="Directory for the migrated part files (not needed with --dry-run)"
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        help="Also concatenate the migrated records into this file"
+    )
+    parser.add_argument(
+        "--rejects",
+        "-r",
+        help="Also write the report of rejected records to this file"
+    )
+    parser.add_argument(
+        "--defaults",
+        help="JSON file of default values by 'group/attribute' path"
+    )
+    parser.add_argument(
+        "--enum-maps",
+        help="JSON file mapping old to new enum values by 'group/attribute' path"
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=0,
+        help="Number of worker processes; 0 uses every CPU (default: 0)"
+    )
+    parser.add_argument(
+        "--chunk-mb",
+        type=float,
+        default=8,
+        help="Approximate size of each chunk in MiB (default: 8)"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Estimate affected records and runtime from a sample without writing anything"
+    )
+    parser.add_argument(
+        "--sample",
+        type=int,
+        default=DEFAULT_SAMPLE_SIZE,
+        help=f"Number of records sampled by --dry-run (default: {DEFAULT_SAMPLE_SIZE})"
+    )
+    args = parser.parse_args()
+
+    if not args.dry_run and args.output_dir is None:
+        parser.error("output_dir is required unless --dry-run is given")
+
+    try:
+        old = Metamodel.from_json_file(args.old_metamodel)
+        new = Metamodel.from_json_file(args.new_metamodel)
+        changes = ChangeAnalyzer().detect_changes(old, new)
+        migration = RecordMigration(
+            changes, defaults=_load_json_option(args.defaults), enum_maps=_load_json_option(args.enum_maps)
+        )
+        runner = MigrationRunner(
+            migration,
+            validator=RecordValidator(new),
+            workers=args.workers or None,
+            chunk_bytes=int(args.chunk_mb * 1024 * 1024),
+        )
+        print(f"Migrating records from version {old.version} to {new.version} ({len(changes)} changes)")
+
+        if args.dry_run:
+            print(runner.dry_run(args.records_file, sample_size=args.sample).summary())
+            return 0
+
+        stats = runner.run(args.records_file, args.output_dir, output_path=args.output, reject_path=args.rejects)
+        print(stats.summary())
+        return 0 if stats.rejected == 0 else 1
+
+    except FileNotFoundError as e:
+        print(f"Error: File not found: {e}", file=sys.stderr)
+        return 1
+    except json.JSONDecodeError as e:
+        print(f"Error: Invalid JSON: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,13 +11,92 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from metamodel_core.models import get_core_metamodel, Metamodel
+from metamodel_core.models.records import RecordValidator
+from metamodel_core.models.streaming import validate_ndjson, validate_ndjson_parallel
 from metamodel_core.models.validators import MetamodelValidator, ChangeAnalyzer
 
 
+def validate_records(argv):
+    """Validate NDJSON metadata records against a metamodel."""
+    parser = argparse.ArgumentParser(
+        prog="validate_metamodel.py records",
+        description="Validate newline-delimited JSON metadata records against a metamodel."
+    )
+    parser.add_argument(
+        "records_file",
+        help="Path to the NDJSON records file to validate ('-' for stdin)"
+    )
+    parser.add_argument(
+        "--metamodel",
+        "-m",
+        help="Path to the metamodel JSON file (default: the core metamodel)"
+    )
+    parser.add_argument(
+        "--report",
+        "-r",
+        default="-",
+        help="Path for the NDJSON error report (default: stdout)"
+    )
+    parser.add_argument(
+        "--allow-unknown",
+        action="store_true",
+        help="Accept groups and attributes that are not defined in the metamodel"
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=1,
+        help="Number of worker processes; 0 uses every CPU (default: 1)"
+    )
+    args = parser.parse_args(argv)
+    
+    if args.workers != 1 and args.records_file == "-":
+        parser.error("--workers requires a records file, not stdin")
+    
+    try:
+        if args.metamodel:
+            metamodel = Metamodel.from_json_file(args.metamodel)
+        else:
+            metamodel = get_core_metamodel()
+        validator = RecordValidator(metamodel, allow_unknown=args.allow_unknown)
+        
+        report_stream = sys.stdout if args.report == "-" else open(args.report, "w")
+        try:
+            if args.workers != 1:
+                stats = validate_ndjson_parallel(
+                    args.records_file, report_stream, validator, workers=args.workers or None
+                )
+            elif args.records_file == "-":
+                # Read bytes, so lines are split and decoded as with --workers
+                stats = validate_ndjson(sys.stdin.buffer, report_stream, validator)
+            else:
+                with open(args.records_file, "rb") as input_stream:
+                    stats = validate_ndjson(input_stream, report_stream, validator)
+        finally:
+            if report_stream is not sys.stdout:
+                report_stream.close()
+        
+        # Keep stdout free for the report
+        print(stats.summary(), file=sys.stderr)
+        return 0 if stats.invalid_records == 0 and stats.malformed_lines == 0 else 1
+    
+    except FileNotFoundError as e:
+        print(f"Error: File not found: {e}", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
 def main():
     """Validate a metamodel JSON file against the core metamodel structure."""
+    if len(sys.argv) > 1 and sys.argv[1] == "records":
+        return validate_records(sys.argv[2:])
+    
     parser = argparse.ArgumentParser(
-        description="Validate a metamodel JSON file against the core metamodel structure."
+        description="Validate a metamodel JSON file against the core metamodel structure.",
+        epilog="Use 'validate_metamodel.py records FILE' to validate NDJSON metadata records."
     )
     parser.add_argument(
         "metamodel_file", 
@@ -3,36 +3,66 @@ Models for the metamodel-core package.
 """
 import json
 import os
-from typing import Optional
+from typing import Literal, Union, overload
 
-from .metamodel import Metamodel
+from .cache import invalidate_metamodel_cache, load_metamodel
+from .lazy import LazyMetamodel
+from .metamodel import FrozenMetamodel, Metamodel
+
+__all__ = [
+    "CORE_METAMODEL_PATH",
+    "FrozenMetamodel",
+    "LazyMetamodel",
+    "Metamodel",
+    "get_core_metamodel",
+    "invalidate_metamodel_cache",
+    "load_metamodel",
+]
 
 # Path to the core metamodel JSON file
 CORE_METAMODEL_PATH = os.path.join(
-    os.path.dirname(os.path.dirname(__file__)), 
-    "data", 
+    os.path.dirname(os.path.dirname(__file__)),
+    "data",
     "metamodel.json"
 )
 
 
-def get_core_metamodel() -> Metamodel:
+@overload
+def get_core_metamodel(lazy: Literal[False] = False) -> FrozenMetamodel: ...
+
+
+@overload
+def get_core_metamodel(lazy: Literal[True]) -> LazyMetamodel: ...
+
+
+@overload
+def get_core_metamodel(lazy: bool) -> Union[FrozenMetamodel, LazyMetamodel]: ...
+
+
+def get_core_metamodel(lazy: bool = False) -> Union[FrozenMetamodel, LazyMetamodel]:
     """
     Load and return the core metamodel from the package's data directory.
-    
+
+    The metamodel is cached for the whole process and reloaded only when the
+    file changes, so repeated calls are cheap. The returned instance is shared
+    and therefore frozen; use ``copy.deepcopy`` to obtain an editable copy.
+
+    Args:
+        lazy: Return a LazyMetamodel, which validates each group on first
+            access, for callers that only need some groups
+
     Returns:
-        The core metamodel as a Metamodel instance
-    
+        The core metamodel as a FrozenMetamodel (or LazyMetamodel) instance
+
     Raises:
         FileNotFoundError: If the core metamodel JSON file is not found
         ValueError: If the core metamodel JSON is invalid
     """
     try:
-        with open(CORE_METAMODEL_PATH, "r") as f:
-            data = json.load(f)
-        return Metamodel.from_dict(data)
+        return load_metamodel(CORE_METAMODEL_PATH, lazy)
     except FileNotFoundError:
         raise FileNotFoundError(f"Core metamodel JSON file not found at {CORE_METAMODEL_PATH}")
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in core metamodel file: {e}")
     except Exception as e:
-        raise ValueError(f"Failed to load core metamodel: {e}")
\ No newline at end of file
+        raise ValueError(f"Failed to load core metamodel: {e}")
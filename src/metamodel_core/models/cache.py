@@ -0,0 +1,110 @@
+"""
+Process-wide cache of metamodels loaded from JSON files.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Literal, NamedTuple, Optional, Tuple, Union, overload
+
+from .lazy import LazyMetamodel
+from .metamodel import FrozenMetamodel
+
+
+class _CacheEntry(NamedTuple):
+    mtime_ns: int
+    size: int
+    digest: str
+    metamodel: Union[FrozenMetamodel, LazyMetamodel]
+
+
+# Keyed by (absolute path, lazy)
+_cache: Dict[Tuple[str, bool], _CacheEntry] = {}
+_lock = threading.Lock()
+
+
+@overload
+def load_metamodel(file_path: str, lazy: Literal[False] = False) -> FrozenMetamodel: ...
+
+
+@overload
+def load_metamodel(file_path: str, lazy: Literal[True]) -> LazyMetamodel: ...
+
+
+@overload
+def load_metamodel(
+    file_path: str, lazy: bool
+) -> Union[FrozenMetamodel, LazyMetamodel]: ...
+
+
+def load_metamodel(
+    file_path: str, lazy: bool = False
+) -> Union[FrozenMetamodel, LazyMetamodel]:
+    """
+    Load a metamodel from a JSON file, reusing the cached instance when possible.
+
+    A cached metamodel is reused while the file's modification time and size
+    are unchanged. When either changes, the file is re-read and only parsed
+    again if its SHA-256 digest differs from the cached one. The returned
+    metamodel is frozen because it is shared by every caller; use
+    ``copy.deepcopy`` to obtain an editable copy.
+
+    With ``lazy=True`` a LazyMetamodel is cached instead, which validates
+    only the header when loaded and each group on first access.
+
+    Args:
+        file_path: Path to the metamodel JSON file
+        lazy: Whether to defer validating the groups
+
+    Returns:
+        The (shared, immutable) metamodel
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    path = os.path.abspath(file_path)
+    key = (path, lazy)
+    stat = os.stat(path)
+
+    entry = _cache.get(key)
+    if (
+        entry is not None
+        and entry.mtime_ns == stat.st_mtime_ns
+        and entry.size == stat.st_size
+    ):
+        return entry.metamodel
+
+    with _lock:
+        with open(path, "rb") as f:
+            content = f.read()
+        digest = hashlib.sha256(content).hexdigest()
+
+        entry = _cache.get(key)
+        if entry is not None and entry.digest == digest:
+            # The file was touched or rewritten with identical content
+            metamodel = entry.metamodel
+        elif lazy:
+            metamodel = LazyMetamodel(json.loads(content))
+        else:
+            metamodel = FrozenMetamodel.model_validate(json.loads(content))
+
+        _cache[key] = _CacheEntry(stat.st_mtime_ns, len(content), digest, metamodel)
+        return metamodel
+
+
+def invalidate_metamodel_cache(file_path: Optional[str] = None) -> None:
+    """
+    Drop cached metamodels so the next load re-reads them from disk.
+
+    Args:
+        file_path: Path of the metamodel to drop, or None to clear the whole cache
+    """
+    with _lock:
+        if file_path is None:
+            _cache.clear()
+        else:
+            path = os.path.abspath(file_path)
+            for lazy in (False, True):
+                _cache.pop((path, lazy), None)
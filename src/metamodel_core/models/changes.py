@@ -0,0 +1,248 @@
+"""
+Application of metamodel changes to produce new metamodel versions.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from .metamodel import (
+    ChangeType,
+    FrozenMetamodel,
+    FrozenMetamodelAttribute,
+    FrozenMetamodelGroup,
+    Metamodel,
+    MetamodelAttribute,
+    MetamodelChange,
+    MetamodelGroup,
+    _FrozenList,
+    _TrackedList,
+)
+
+
+class ChangeApplier:
+    """
+    Applies metamodel changes to produce new metamodel versions.
+
+    New versions share every unchanged group and attribute with the version
+    they were derived from, so applying a change only copies the group it
+    touches. Frozen metamodels produce frozen versions, which makes the
+    sharing safe; when applying changes to an editable metamodel, treat the
+    result as read-only or ``copy.deepcopy`` it before editing in place.
+    """
+
+    def apply_change(self, metamodel: Metamodel, change: MetamodelChange) -> Metamodel:
+        """
+        Apply a single change to a metamodel.
+
+        Args:
+            metamodel: The metamodel to derive the new version from (not modified)
+            change: The change to apply
+
+        Returns:
+            The new metamodel version
+
+        Raises:
+            ValueError: If the change cannot be applied to the metamodel
+        """
+        return self.apply_changes(metamodel, [change])
+
+    def apply_changes(
+        self,
+        metamodel: Metamodel,
+        changes: Sequence[MetamodelChange],
+        version: Optional[str] = None,
+    ) -> Metamodel:
+        """
+        Apply a sequence of changes to a metamodel.
+
+        Changes are applied in order, so later changes may refer to groups and
+        attributes added by earlier ones. Added groups and attributes, and
+        attributes moved to another group, are appended in the order of the
+        changes. Changes produced by ``ChangeAnalyzer.detect_changes(old, new)``
+        list additions in the order of ``new`` and turn ``old`` into ``new``,
+        with the same order wherever ``new`` adds at the end.
+
+        Args:
+            metamodel: The metamodel to derive the new version from (not modified)
+            changes: The changes to apply
+            version: Version of the new metamodel (defaults to the current version)
+
+        Returns:
+            The new metamodel version
+
+        Raises:
+            ValueError: If a change cannot be applied to the metamodel
+        """
+        classes: Tuple[
+            Type[Metamodel], Type[MetamodelGroup], Type[MetamodelAttribute], Type[list]
+        ]
+        if isinstance(metamodel, FrozenMetamodel):
+            classes = (
+                FrozenMetamodel,
+                FrozenMetamodelGroup,
+                FrozenMetamodelAttribute,
+                _FrozenList,
+            )
+        else:
+            classes = (Metamodel, MetamodelGroup, MetamodelAttribute, _TrackedList)
+        model_cls, group_cls, attr_cls, list_cls = classes
+
+        # Copy only the list of groups; the groups themselves are shared
+        groups: List[Optional[MetamodelGroup]] = list(metamodel.groups)
+        positions = {
+            group.name: i for i, group in reversed(list(enumerate(metamodel.groups)))
+        }
+
+        for change in changes:
+            self._apply(change, groups, positions, group_cls, attr_cls, list_cls)
+
+        if version is not None:
+            Metamodel.version_must_be_valid(version)
+        return model_cls.model_construct(
+            name=metamodel.name,
+            version=metamodel.version if version is None else version,
+            description=metamodel.description,
+            groups=list_cls(group for group in groups if group is not None),
+        )
+
+    def _apply(
+        self,
+        change: MetamodelChange,
+        groups: List[Optional[MetamodelGroup]],
+        positions: Dict[str, int],
+        group_cls: Type[MetamodelGroup],
+        attr_cls: Type[MetamodelAttribute],
+        list_cls: Type[list],
+    ) -> None:
+        """Apply one change to the working list of groups."""
+        if change.change_type == ChangeType.ADD_GROUP:
+            group = group_cls.model_validate(change.new_value)
+            if group.name in positions:
+                raise ValueError(f"Group '{group.name}' already exists")
+            positions[group.name] = len(groups)
+            groups.append(group)
+            return
+
+        if change.change_type == ChangeType.REMOVE_GROUP:
+            position, _ = self._locate(change.target_path, groups, positions)
+            groups[position] = None
+            del positions[change.target_path]
+            return
+
+        if change.change_type == ChangeType.MODIFY_GROUP:
+            position, group = self._locate(change.target_path, groups, positions)
+            updates: Dict[str, Any] = change.new_value or {}
+            # Validate the new properties; the shared attributes are already valid
+            description = group_cls.description_must_be_valid(
+                updates.get("description", group.description)
+            )
+            groups[position] = group_cls.model_construct(
+                name=group.name, description=description, attributes=group.attributes
+            )
+            return
+
+        group_name, attr_name = self._split_path(change)
+        position, group = self._locate(group_name, groups, positions)
+        attributes = list(group.attributes)
+        index = next(
+            (i for i, attr in enumerate(attributes) if attr.name == attr_name), None
+        )
+
+        if change.change_type == ChangeType.ADD_ATTRIBUTE:
+            if index is not None:
+                raise ValueError(
+                    f"Attribute '{attr_name}' already exists in group '{group_name}'"
+                )
+            data = {"name": attr_name}
+            data.update(change.new_value or {})
+            attributes.append(attr_cls.model_validate(data))
+
+        elif index is None:
+            raise ValueError(
+                f"Attribute '{attr_name}' does not exist in group '{group_name}'"
+            )
+
+        elif change.change_type == ChangeType.REMOVE_ATTRIBUTE:
+            del attributes[index]
+            if not attributes:
+                raise ValueError(
+                    f"Cannot remove the last attribute of group '{group_name}'"
+                )
+
+        elif change.change_type in (
+            ChangeType.MODIFY_ATTRIBUTE,
+            ChangeType.CHANGE_REQUIREMENT,
+        ):
+            if change.change_type == ChangeType.CHANGE_REQUIREMENT:
+                updates = {"required": change.new_value}
+            else:
+                updates = dict(change.new_value or {})
+            attributes[index] = attr_cls.model_validate(
+                {**attributes[index].model_dump(), **updates}
+            )
+
+        elif change.change_type in (
+            ChangeType.MOVE_ATTRIBUTE,
+            ChangeType.RENAME_ATTRIBUTE,
+        ):
+            data = {**attributes[index].model_dump(), **(change.new_value or {})}
+            target_name = data.pop("group", group_name)
+            moved = attr_cls.model_validate(data)
+            if target_name == group_name:
+                if any(
+                    attr.name == moved.name
+                    for i, attr in enumerate(attributes)
+                    if i != index
+                ):
+                    raise ValueError(
+                        f"Attribute '{moved.name}' already exists "
+                        f"in group '{group_name}'"
+                    )
+                attributes[index] = moved
+            else:
+                del attributes[index]
+                if not attributes:
+                    raise ValueError(
+                        f"Cannot remove the last attribute of group '{group_name}'"
+                    )
+                target_position, target = self._locate(target_name, groups, positions)
+                if any(attr.name == moved.name for attr in target.attributes):
+                    raise ValueError(
+                        f"Attribute '{moved.name}' already exists "
+                        f"in group '{target_name}'"
+                    )
+                groups[target_position] = group_cls.model_construct(
+                    name=target.name,
+                    description=target.description,
+                    attributes=list_cls([*target.attributes, moved]),
+                )
+
+        else:
+            raise ValueError(f"Unsupported change type '{change.change_type}'")
+
+        groups[position] = group_cls.model_construct(
+            name=group.name,
+            description=group.description,
+            attributes=list_cls(attributes),
+        )
+
+    def _locate(
+        self,
+        group_name: str,
+        groups: List[Optional[MetamodelGroup]],
+        positions: Dict[str, int],
+    ) -> Tuple[int, MetamodelGroup]:
+        """Return the position and the group of a group name."""
+        position = positions.get(group_name)
+        group = None if position is None else groups[position]
+        if position is None or group is None:
+            raise ValueError(f"Group '{group_name}' does not exist")
+        return position, group
+
+    def _split_path(self, change: MetamodelChange) -> Tuple[str, str]:
+        parts = change.target_path.split("/")
+        if len(parts) != 2:
+            raise ValueError(
+                f"Target path for {change.change_type.value} must be in format "
+                "'group_name/attribute_name'"
+            )
+        return parts[0], parts[1]
@@ -0,0 +1,331 @@
+"""
+Version history of a metamodel stored as periodic snapshots plus change deltas.
+"""
+
+import bisect
+import json
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from .changes import ChangeApplier
+from .metamodel import FrozenMetamodel, Metamodel, MetamodelChange
+from .trusted import construct_change, construct_metamodel
+from .validators import ChangeAnalyzer
+
+
+class _Version(NamedTuple):
+    version: str
+    name: str
+    description: str
+    # Changes from the previous version, and the names of the groups they touch
+    changes: Tuple[MetamodelChange, ...]
+    touched: FrozenSet[str]
+    snapshot: Optional[FrozenMetamodel]
+
+
+class MetamodelHistory:
+    """
+    An append-only history of metamodel versions.
+
+    Each committed version is stored as the changes detected against the
+    previous one, with a full snapshot every ``snapshot_interval`` versions.
+    Checking out a version replays the deltas from the nearest snapshot at or
+    before it with ChangeApplier, so versions share unchanged groups and
+    attributes. A version whose delta would not reproduce it exactly (e.g.
+    because attributes were reordered) is stored as a snapshot instead.
+    """
+
+    def __init__(
+        self, snapshot_interval: int = 50, analyzer: Optional[ChangeAnalyzer] = None
+    ):
+        """
+        Initialize an empty history.
+
+        Args:
+            snapshot_interval: Maximum number of versions between snapshots
+            analyzer: Analyzer used to compute the deltas (defaults to ChangeAnalyzer())
+        """
+        if snapshot_interval < 1:
+            raise ValueError("Snapshot interval must be at least 1")
+        self.snapshot_interval = snapshot_interval
+        self.analyzer = analyzer or ChangeAnalyzer()
+        self._applier = ChangeApplier()
+        self._entries: List[_Version] = []
+        self._positions: Dict[str, int] = {}
+        self._snapshots: List[int] = []
+        self._head: Optional[FrozenMetamodel] = None
+        # The most recent checkout, reused as a replay starting point
+        self._last: Optional[Tuple[int, FrozenMetamodel]] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, version: str) -> bool:
+        return version in self._positions
+
+    @property
+    def versions(self) -> List[str]:
+        """The committed versions, oldest first."""
+        return [entry.version for entry in self._entries]
+
+    def commit(self, metamodel: Metamodel) -> List[MetamodelChange]:
+        """
+        Append a new version to the history.
+
+        Args:
+            metamodel: The new version (not modified)
+
+        Returns:
+            The changes from the previous version
+
+        Raises:
+            ValueError: If the version is already in the history
+        """
+        if metamodel.version in self._positions:
+            raise ValueError(f"Version '{metamodel.version}' already exists")
+        frozen = metamodel.freeze()
+
+        changes: List[MetamodelChange] = []
+        state = None
+        if self._head is not None:
+            changes = self.analyzer.detect_changes(self._head, frozen)
+            try:
+                state = self._replay(self._head, changes, frozen)
+            except ValueError:
+                state = None
+            if state is not None and state.content_hash() != frozen.content_hash():
+                state = None
+
+        position = len(self._entries)
+        snapshot = None
+        if state is None or position - self._snapshots[-1] >= self.snapshot_interval:
+            snapshot = state or frozen
+            self._snapshots.append(position)
+        self._append(
+            _Version(
+                version=frozen.version,
+                name=frozen.name,
+                description=frozen.description,
+                changes=tuple(changes),
+                touched=self._touched_groups(changes),
+                snapshot=snapshot,
+            ),
+            state or frozen,
+        )
+        return changes
+
+    def changes(self, version: str) -> List[MetamodelChange]:
+        """
+        Return the changes that produced a version from the previous one.
+
+        Args:
+            version: The version to look up
+
+        Returns:
+            List of changes (empty for the first version)
+
+        Raises:
+            ValueError: If the version is not in the history
+        """
+        return list(self._entries[self._position(version)].changes)
+
+    def checkout(self, version: str) -> FrozenMetamodel:
+        """
+        Return the metamodel as it was at a version.
+
+        Args:
+            version: The version to check out
+
+        Returns:
+            The (shared, immutable) metamodel of that version
+
+        Raises:
+            ValueError: If the version is not in the history
+        """
+        position = self._position(version)
+        if position == len(self._entries) - 1:
+            return cast(FrozenMetamodel, self._head)
+
+        start = self._snapshots[bisect.bisect_right(self._snapshots, position) - 1]
+        # Entries at snapshot positions always have a snapshot
+        metamodel = cast(FrozenMetamodel, self._entries[start].snapshot)
+        if self._last is not None and start <= self._last[0] <= position:
+            start, metamodel = self._last
+        if start != position:
+            changes = [
+                c
+                for entry in self._entries[start + 1 : position + 1]
+                for c in entry.changes
+            ]
+            metamodel = self._replay(metamodel, changes, self._entries[position])
+        self._last = (position, metamodel)
+        return metamodel
+
+    def diff(self, from_version: str, to_version: str) -> List[MetamodelChange]:
+        """
+        Compute the changes between any two versions.
+
+        The deltas between the versions are composed to find the groups they
+        touched, and only those groups of the two versions are compared; all
+        other groups are known to be identical. Either version may be the
+        older one.
+
+        Args:
+            from_version: The version to compare from
+            to_version: The version to compare to
+
+        Returns:
+            List of changes turning ``from_version`` into ``to_version``
+
+        Raises:
+            ValueError: If either version is not in the history
+        """
+        start, end = self._position(from_version), self._position(to_version)
+        if start == end:
+            return []
+        low, high = min(start, end), max(start, end)
+        touched = frozenset().union(
+            *(entry.touched for entry in self._entries[low + 1 : high + 1])
+        )
+
+        old, new = self.checkout(from_version), self.checkout(to_version)
+        return self.analyzer.detect_changes(
+            self._restrict(old, touched), self._restrict(new, touched)
+        )
+
+    def save(self, file_path: str) -> None:
+        """
+        Write the history to a JSON file.
+
+        Args:
+            file_path: Path of the file to write
+        """
+        data = {
+            "snapshot_interval": self.snapshot_interval,
+            "versions": [
+                {
+                    "version": entry.version,
+                    "name": entry.name,
+                    "description": entry.description,
+                    "changes": [
+                        change.model_dump(mode="json") for change in entry.changes
+                    ],
+                    "snapshot": entry.snapshot.model_dump() if entry.snapshot else None,
+                }
+                for entry in self._entries
+            ],
+        }
+        with open(file_path, "w") as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(
+        cls,
+        file_path: str,
+        analyzer: Optional[ChangeAnalyzer] = None,
+        trusted: bool = False,
+    ) -> "MetamodelHistory":
+        """
+        Read a history written by save().
+
+        Args:
+            file_path: Path of the file to read
+            analyzer: Analyzer used for later commits and diffs
+            trusted: Build snapshots and changes without running the field
+                validators, for files written by save() that have not been
+                edited since (see metamodel_core.models.trusted)
+
+        Returns:
+            The loaded history
+        """
+        with open(file_path, "r") as f:
+            data = json.load(f)
+
+        history = cls(snapshot_interval=data["snapshot_interval"], analyzer=analyzer)
+        for item in data["versions"]:
+            changes = tuple(
+                (
+                    construct_change(change)
+                    if trusted
+                    else MetamodelChange.model_validate(change)
+                )
+                for change in item["changes"]
+            )
+            snapshot: Optional[FrozenMetamodel] = None
+            if item["snapshot"] is not None and trusted:
+                snapshot = construct_metamodel(item["snapshot"])
+            elif item["snapshot"] is not None:
+                snapshot = Metamodel.from_dict(item["snapshot"]).freeze()
+            entry = _Version(
+                version=item["version"],
+                name=item["name"],
+                description=item["description"],
+                changes=changes,
+                touched=history._touched_groups(changes),
+                snapshot=snapshot,
+            )
+            if snapshot is not None:
+                history._snapshots.append(len(history._entries))
+                state = snapshot
+            else:
+                state = history._replay(
+                    cast(FrozenMetamodel, history._head), changes, entry
+                )
+            history._append(entry, state)
+        return history
+
+    def _append(self, entry: _Version, state: FrozenMetamodel) -> None:
+        self._positions[entry.version] = len(self._entries)
+        self._entries.append(entry)
+        self._head = state
+
+    def _position(self, version: str) -> int:
+        if version not in self._positions:
+            raise ValueError(f"Version '{version}' does not exist")
+        return self._positions[version]
+
+    def _replay(
+        self,
+        metamodel: FrozenMetamodel,
+        changes: Sequence[MetamodelChange],
+        header: Union[Metamodel, _Version],
+    ) -> FrozenMetamodel:
+        """Apply changes and take the name, version and description from ``header``."""
+        groups = (
+            self._applier.apply_changes(metamodel, changes).groups
+            if changes
+            else metamodel.groups
+        )
+        return FrozenMetamodel.model_construct(
+            name=header.name,
+            version=header.version,
+            description=header.description,
+            groups=groups,
+        )
+
+    def _touched_groups(self, changes: Iterable[MetamodelChange]) -> FrozenSet[str]:
+        touched = set()
+        for change in changes:
+            touched.add(change.target_path.split("/")[0])
+            if isinstance(change.new_value, dict) and "group" in change.new_value:
+                touched.add(change.new_value["group"])
+        return frozenset(touched)
+
+    def _restrict(self, metamodel: Metamodel, group_names: FrozenSet[str]) -> Metamodel:
+        """Return a metamodel view containing only the named groups."""
+        return type(metamodel).model_construct(
+            name=metamodel.name,
+            version=metamodel.version,
+            description=metamodel.description,
+            groups=[group for group in metamodel.groups if group.name in group_names],
+        )
@@ -0,0 +1,363 @@
+"""
+Import of spreadsheet-style field catalogs, such as ``data/ingest.json``, as metamodels.
+
+A catalog is a JSON array with one object per field, exported from a
+spreadsheet: ``Field``, ``Type``, ``Definition``, ``Groupings``,
+``Gate Requirement``, ``Type Detail`` and ``Value Limits`` columns, plus
+columns the metamodel does not use. Rows are read one at a time from the
+file and normalized into plain dictionaries grouped by ``Groupings``; the
+metamodel is validated once when all rows are read. Rows that cannot be
+mapped exactly are imported as closely as possible and reported as issues.
+"""
+
+import json
+import re
+from typing import IO, Any, Dict, Iterator, List, Optional
+
+from pydantic import BaseModel
+
+from .metamodel import AttributeType, Metamodel, MetamodelChange
+from .validators import ChangeAnalyzer
+
+# Read size of the catalog stream
+DEFAULT_READ_SIZE = 64 * 1024
+
+# Characters that can continue a JSON number
+_NUMBER_CHARS = frozenset("0123456789+-.eE")
+
+# Group of rows with an empty Groupings column
+DEFAULT_GROUP = "Ungrouped"
+
+# Normalized Type column -> attribute type
+TYPE_MAP: Dict[str, AttributeType] = {
+    "string": AttributeType.STRING,
+    "text": AttributeType.STRING,
+    "uuid": AttributeType.STRING,
+    "int": AttributeType.INTEGER,
+    "integer": AttributeType.INTEGER,
+    "float": AttributeType.NUMBER,
+    "decimal": AttributeType.NUMBER,
+    "number": AttributeType.NUMBER,
+    "bool": AttributeType.BOOLEAN,
+    "boolean": AttributeType.BOOLEAN,
+    "date": AttributeType.DATETIME,
+    "datetime": AttributeType.DATETIME,
+    "timestamp": AttributeType.DATETIME,
+    "array": AttributeType.ARRAY,
+    "list": AttributeType.ARRAY,
+    "object": AttributeType.OBJECT,
+    "json": AttributeType.OBJECT,
+}
+
+# Normalized Type Detail values whose Value Limits list the allowed values
+ENUM_DETAILS = frozenset({"lov", "decision box", "single-choice"})
+
+# Normalized Type Detail values of fields holding several of the listed values
+MULTIPLE_CHOICE_DETAILS = frozenset({"multiple-choice", "multi-select"})
+
+# Normalized Gate Requirement values of required fields
+REQUIRED_VALUES = frozenset({"y", "yes", "true", "1", "required"})
+
+# Longest group and attribute name a metamodel accepts
+MAX_NAME_LENGTH = 100
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class IngestIssue(BaseModel):
+    """A catalog row that could not be imported exactly."""
+
+    row: int
+    field: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"Row {self.row} ({self.field or 'no field name'}): {self.message}"
+
+
+class IngestResult(BaseModel):
+    """The metamodel imported from a catalog, and the rows that needed attention."""
+
+    metamodel: Metamodel
+    rows: int = 0
+    issues: List[IngestIssue] = []
+
+
+def iter_json_array(
+    stream: IO[str], read_size: int = DEFAULT_READ_SIZE
+) -> Iterator[Any]:
+    """
+    Parse the items of a JSON array one at a time, without reading the whole stream.
+
+    Args:
+        stream: Text stream holding a JSON array
+        read_size: Number of characters read at a time
+
+    Yields:
+        The items of the array
+
+    Raises:
+        ValueError: If the stream does not hold a JSON array
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buffer, pos, eof
+        data = stream.read(read_size)
+        if not data:
+            eof = True
+            return False
+        buffer = buffer[pos:] + data
+        pos = 0
+        return True
+
+    def next_char() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if not fill():
+                raise ValueError("Unexpected end of JSON array")
+
+    if next_char() != "[":
+        raise ValueError("Catalog must be a JSON array")
+    pos += 1
+    if next_char() == "]":
+        return
+    while True:
+        next_char()
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+            # A number may continue in the next read, also when its start
+            # parses as a number by itself (12|.75, 1|e5)
+            number = isinstance(item, (int, float))
+            complete = eof or (
+                end < len(buffer) and not (number and buffer[end] in _NUMBER_CHARS)
+            )
+        except json.JSONDecodeError:
+            complete = False
+        if not complete:
+            if not fill():
+                raise ValueError("Malformed JSON array item")
+            continue
+        yield item
+        pos = end
+        separator = next_char()
+        pos += 1
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"Expected ',' or ']' in JSON array, found {separator!r}")
+
+
+def _text(value: Any) -> str:
+    """Cell value with whitespace collapsed, as spreadsheet exports pad and wrap it."""
+    if value is None:
+        return ""
+    return _WHITESPACE_RE.sub(" ", str(value)).strip()
+
+
+def _split_values(value_limits: str) -> List[str]:
+    values: Dict[str, None] = {}
+    for value in value_limits.split(","):
+        value = value.strip()
+        if value:
+            values.setdefault(value)
+    return list(values)
+
+
+class MetamodelImporter:
+    """
+    Builds a metamodel from catalog rows.
+
+    Rows are added one at a time with ``add_row`` and kept as plain
+    dictionaries; ``build`` validates the metamodel once at the end.
+    """
+
+    def __init__(
+        self,
+        name: str = "Ingest Catalog",
+        version: str = "1.0.0",
+        description: str = "Metamodel imported from the ingest field catalog",
+        group_descriptions: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize the importer.
+
+        Args:
+            name: Name of the imported metamodel
+            version: Version of the imported metamodel
+            description: Description of the imported metamodel
+            group_descriptions: Descriptions by group name; other groups get a
+                generated description
+        """
+        self.name = name
+        self.version = version
+        self.description = description
+        self.group_descriptions = dict(group_descriptions or {})
+        self.rows = 0
+        self.issues: List[IngestIssue] = []
+        # Group name -> attribute name -> attribute dictionary, in catalog order
+        self._groups: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    def _issue(self, field: str, message: str) -> None:
+        self.issues.append(IngestIssue(row=self.rows, field=field, message=message))
+
+    def add_row(self, row: Any) -> None:
+        """
+        Normalize a catalog row and add it as an attribute.
+
+        Rows without a field name are skipped, and so are later rows repeating
+        a field of the same group; both are reported as issues.
+        """
+        self.rows += 1
+        if not isinstance(row, dict):
+            self._issue("", "row is not an object; skipped")
+            return
+        name = _text(row.get("Field"))
+        if not name:
+            self._issue("", "row has no Field; skipped")
+            return
+        group_name = _text(row.get("Groupings")) or DEFAULT_GROUP
+        if len(name) > MAX_NAME_LENGTH or len(group_name) > MAX_NAME_LENGTH:
+            self._issue(
+                name,
+                f"field or group name longer than {MAX_NAME_LENGTH} characters; "
+                "skipped",
+            )
+            return
+        attributes = self._groups.setdefault(group_name, {})
+        if name in attributes:
+            self._issue(name, f"duplicate field in group '{group_name}'; skipped")
+            return
+
+        description = _text(row.get("Definition"))
+        if not description:
+            self._issue(name, "no Definition; the field name is used as description")
+            description = name
+
+        type_name = _text(row.get("Type")).lower()
+        attr_type = TYPE_MAP.get(type_name)
+        if attr_type is None:
+            self._issue(name, f"unknown Type {row.get('Type')!r}; imported as string")
+            attr_type = AttributeType.STRING
+
+        detail = _text(row.get("Type Detail")).lower()
+        value_limits = _text(row.get("Value Limits"))
+        enum = None
+        if detail in MULTIPLE_CHOICE_DETAILS:
+            # Enums constrain single values, so the choices cannot be enforced on
+            # the array
+            attr_type = AttributeType.ARRAY
+            if value_limits:
+                description = (
+                    f"{description} (choices: {', '.join(_split_values(value_limits))})"
+                )
+        elif detail in ENUM_DETAILS:
+            values = _split_values(value_limits)
+            if attr_type != AttributeType.STRING:
+                self._issue(
+                    name, f"list of values on a {attr_type.value} field; not enforced"
+                )
+            elif len(values) < 2:
+                self._issue(
+                    name,
+                    f"Value Limits {value_limits!r} does not list the values; "
+                    "not enforced",
+                )
+            else:
+                enum = values
+
+        attributes[name] = {
+            "name": name,
+            "description": description,
+            "type": attr_type.value,
+            "required": _text(row.get("Gate Requirement")).lower() in REQUIRED_VALUES,
+            "enum": enum,
+        }
+
+    def build(self) -> Metamodel:
+        """
+        Validate and return the metamodel of the rows added so far.
+
+        Raises:
+            ValueError: If no rows were imported or the result is not a valid metamodel
+        """
+        if not self._groups:
+            raise ValueError("No catalog rows to import")
+        return Metamodel.from_dict(
+            {
+                "name": self.name,
+                "version": self.version,
+                "description": self.description,
+                "groups": [
+                    {
+                        "name": group_name,
+                        "description": self.group_descriptions.get(group_name)
+                        or f"Fields grouped as '{group_name}' in the field catalog",
+                        "attributes": list(attributes.values()),
+                    }
+                    for group_name, attributes in self._groups.items()
+                    if attributes
+                ],
+            }
+        )
+
+
+def import_ingest(
+    stream: IO[str], importer: Optional[MetamodelImporter] = None
+) -> IngestResult:
+    """
+    Import a catalog stream in a single pass.
+
+    Args:
+        stream: Text stream holding the catalog's JSON array
+        importer: Importer with the metamodel name, version and group
+            descriptions to use (defaults to a new MetamodelImporter)
+
+    Returns:
+        The imported metamodel with the number of rows and the issues found
+
+    Raises:
+        ValueError: If the stream is not a JSON array or yields no valid metamodel
+    """
+    importer = importer or MetamodelImporter()
+    for row in iter_json_array(stream):
+        importer.add_row(row)
+    return IngestResult(
+        metamodel=importer.build(), rows=importer.rows, issues=importer.issues
+    )
+
+
+def import_ingest_file(
+    file_path: str, importer: Optional[MetamodelImporter] = None
+) -> IngestResult:
+    """Import a catalog file in a single pass; see import_ingest."""
+    with open(file_path, "r", encoding="utf-8") as f:
+        return import_ingest(f, importer)
+
+
+def diff_against_core(
+    imported: Metamodel, base: Optional[Metamodel] = None
+) -> List[MetamodelChange]:
+    """
+    Detect the changes from a metamodel (by default the core one) to an imported one.
+
+    Args:
+        imported: The imported metamodel
+        base: The metamodel to compare with (defaults to the core metamodel)
+
+    Returns:
+        The changes, as detected by ChangeAnalyzer
+    """
+    # Imported here, as the package __init__ may not have finished importing yet
+    from . import get_core_metamodel
+
+    return ChangeAnalyzer().detect_changes(
+        base if base is not None else get_core_metamodel(), imported
+    )
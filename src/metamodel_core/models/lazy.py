@@ -0,0 +1,183 @@
+"""
+Metamodels whose groups are validated on first access.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict, field_validator
+
+from .metamodel import (
+    FrozenMetamodel,
+    FrozenMetamodelAttribute,
+    FrozenMetamodelGroup,
+    Metamodel,
+)
+
+
+class MetamodelHeader(BaseModel):
+    """The name, version and description of a metamodel, validated like Metamodel's."""
+
+    model_config = ConfigDict(frozen=True)
+    name: str
+    version: str
+    description: str
+
+    @field_validator("name")
+    @classmethod
+    def name_must_be_valid(cls, v: str) -> str:
+        """Validate that the metamodel name is properly formatted."""
+        return Metamodel.name_must_be_valid(v)
+
+    @field_validator("version")
+    @classmethod
+    def version_must_be_valid(cls, v: str) -> str:
+        """Validate that the metamodel version follows semantic versioning."""
+        return Metamodel.version_must_be_valid(v)
+
+
+class LazyMetamodel:
+    """
+    A metamodel that validates and instantiates its groups on first access.
+
+    Loading only validates the header and indexes the group names, so a
+    caller that needs one group, or the list of required attributes, does
+    not pay for validating every group and attribute. Groups are returned as
+    FrozenMetamodelGroup instances, shared by every caller, and each one is
+    validated at most once. ``materialize()`` returns the complete
+    FrozenMetamodel, reusing the groups validated so far.
+
+    Validation errors of a group are raised when the group is first accessed
+    rather than when the metamodel is loaded.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        """
+        Validate the header of a metamodel dictionary and index its groups.
+
+        Args:
+            data: The metamodel, as parsed from JSON
+
+        Raises:
+            ValueError: If the header is invalid or the groups cannot be indexed
+        """
+        self.header = MetamodelHeader.model_validate(data)
+        raw_groups = data.get("groups")
+        if not isinstance(raw_groups, list) or not raw_groups:
+            raise ValueError("Metamodel must contain at least one group")
+
+        self._raw_groups: List[Dict[str, Any]] = raw_groups
+        self._positions: Dict[str, int] = {}
+        for position, raw_group in enumerate(raw_groups):
+            if not isinstance(raw_group, dict) or not isinstance(
+                raw_group.get("name"), str
+            ):
+                raise ValueError(f"Group {position} of the metamodel has no name")
+            # The first occurrence of a duplicated name wins, as in Metamodel
+            self._positions.setdefault(raw_group["name"], position)
+
+        self._groups: Dict[int, FrozenMetamodelGroup] = {}
+        self._metamodel: Optional[FrozenMetamodel] = None
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        """The metamodel name."""
+        return self.header.name
+
+    @property
+    def version(self) -> str:
+        """The metamodel version."""
+        return self.header.version
+
+    @property
+    def description(self) -> str:
+        """The metamodel description."""
+        return self.header.description
+
+    @property
+    def group_names(self) -> List[str]:
+        """The names of all groups, in metamodel order, without validating them."""
+        return [raw_group["name"] for raw_group in self._raw_groups]
+
+    @property
+    def groups(self) -> List[FrozenMetamodelGroup]:
+        """All groups, validating those not accessed yet."""
+        return [self._group(position) for position in range(len(self._raw_groups))]
+
+    def _group(self, position: int) -> FrozenMetamodelGroup:
+        group = self._groups.get(position)
+        if group is None:
+            group = FrozenMetamodelGroup.model_validate(self._raw_groups[position])
+            with self._lock:
+                # Keep the instance another thread may have stored meanwhile
+                group = self._groups.setdefault(position, group)
+        return group
+
+    def is_loaded(self, group_name: str) -> bool:
+        """Return whether a group has been validated already."""
+        position = self._positions.get(group_name)
+        return position is not None and position in self._groups
+
+    def get_group_by_name(self, name: str) -> Optional[FrozenMetamodelGroup]:
+        """Find a group by its name, validating only that group."""
+        position = self._positions.get(name)
+        return None if position is None else self._group(position)
+
+    def get_attribute_by_path(
+        self, path: str
+    ) -> Optional[Tuple[FrozenMetamodelGroup, FrozenMetamodelAttribute]]:
+        """Find a group and attribute by a 'group_name/attribute_name' path."""
+        group_name, _, attr_name = path.partition("/")
+        group = self.get_group_by_name(group_name)
+        if group is None:
+            return None
+        for attr in group.attributes:
+            if attr.name == attr_name:
+                return group, attr
+        return None
+
+    def get_required_attributes(self) -> List[Dict[str, Any]]:
+        """
+        Get all required attributes from all groups.
+
+        Only the required attributes of groups that were not accessed yet are
+        validated, not the groups themselves.
+        """
+        required: List[Dict[str, Any]] = []
+        for position, raw_group in enumerate(self._raw_groups):
+            group = self._groups.get(position)
+            if group is not None:
+                attributes = [attr for attr in group.attributes if attr.required]
+            else:
+                attributes = [
+                    FrozenMetamodelAttribute.model_validate(raw_attr)
+                    for raw_attr in raw_group.get("attributes") or ()
+                    if isinstance(raw_attr, dict) and raw_attr.get("required") is True
+                ]
+            required.extend(
+                {"name": attr.name, "type": attr.type, "group": raw_group["name"]}
+                for attr in attributes
+            )
+        return required
+
+    def materialize(self) -> FrozenMetamodel:
+        """
+        Return the complete metamodel, validating the groups not accessed yet.
+
+        Returns:
+            The FrozenMetamodel, the same instance on every call
+        """
+        if self._metamodel is None:
+            metamodel = FrozenMetamodel.model_validate(
+                {
+                    "name": self.name,
+                    "version": self.version,
+                    "description": self.description,
+                    "groups": self.groups,
+                }
+            )
+            with self._lock:
+                if self._metamodel is None:
+                    self._metamodel = metamodel
+        return self._metamodel
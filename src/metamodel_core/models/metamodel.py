@@ -1,12 +1,19 @@
 """
 Core models for representing and validating metamodel structures.
 """
+import copy
+import hashlib
+import json
 import re
+import weakref
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
+
+if TYPE_CHECKING:
+    from .lazy import LazyMetamodel
 
 
 class AttributeType(str, Enum):
@@ -20,7 +27,190 @@ class AttributeType(str, Enum):
     DATETIME = "datetime"
 
 
-class MetamodelAttribute(BaseModel):
+_VERSION_RE = re.compile(r"^\d+\.\d+(\.\d+)?$")
+
+# Editable metamodel objects have a revision, advanced when the object or
+# anything it contains is modified. Cached indexes and content hashes
+# remember the revision they were computed at and are rebuilt when it moves,
+# so editing one metamodel leaves the caches of other metamodels intact.
+# Objects remember which objects hold them (weakly, as unchanged groups and
+# attributes may be shared between versions) to advance their revisions too.
+# These links are made when an object caches something about its contents,
+# so building metamodels does not pay for them.
+
+
+def _private(model: BaseModel) -> Dict[str, Any]:
+    # Set for every instance, as the tracked models declare private attributes
+    return cast(Dict[str, Any], model.__pydantic_private__)
+
+
+def _parents_of(item: Any) -> Dict[int, "weakref.ref[Any]"]:
+    state = (
+        item.__dict__ if isinstance(item, _TrackedList) else item.__pydantic_private__
+    )
+    parents = state.get("_parents")
+    if parents is None:
+        parents = state["_parents"] = {}
+    return parents
+
+
+def _link(child: Any, parent: "_TrackedModel") -> None:
+    """Record that ``parent`` holds ``child``, so modifying the child advances it."""
+    if isinstance(child, _TrackedList) or (
+        isinstance(child, _TrackedModel) and not child.model_config.get("frozen")
+    ):
+        _parents_of(child)[id(parent)] = weakref.ref(parent)
+
+
+def _touch(item: Any) -> None:
+    """Advance the revision of a modified object and of every object holding it."""
+    pending = [item]
+    while pending:
+        item = pending.pop()
+        if isinstance(item, _TrackedModel):
+            _private(item)["_revision"] += 1
+        parents = _parents_of(item)
+        for key, ref in list(parents.items()):
+            parent = ref()
+            if parent is None:
+                del parents[key]
+            else:
+                pending.append(parent)
+
+
+def _tracked(method: Any) -> Any:
+    def mutate(self: "_TrackedList", *args: Any, **kwargs: Any) -> Any:
+        result = method(self, *args, **kwargs)
+        self._changed()
+        return result
+
+    return mutate
+
+
+class _TrackedList(list):
+    """A list that advances the revision of the objects holding it when modified."""
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # Copies and unpickled lists are linked by the objects holding them
+        return (type(self), (list(self),))
+
+    def _changed(self) -> None:
+        # Items added to the list are held by the objects holding it
+        for ref in list(_parents_of(self).values()):
+            parent = ref()
+            if parent is not None:
+                for item in self:
+                    _link(item, parent)
+        _touch(self)
+
+    append = _tracked(list.append)
+    extend = _tracked(list.extend)
+    insert = _tracked(list.insert)
+    remove = _tracked(list.remove)
+    pop = _tracked(list.pop)
+    clear = _tracked(list.clear)
+    sort = _tracked(list.sort)
+    reverse = _tracked(list.reverse)
+    __setitem__ = _tracked(list.__setitem__)
+    __delitem__ = _tracked(list.__delitem__)
+    __iadd__ = _tracked(list.__iadd__)
+    __imul__ = _tracked(list.__imul__)
+
+
+def _digest(content: Any) -> str:
+    encoded = json.dumps(content, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class _TrackedModel(BaseModel):
+    """Base for metamodel objects whose modification invalidates cached indexes."""
+
+    # Advanced when the object or anything it contains is modified
+    _revision: int = PrivateAttr(default=0)
+    # Objects holding this one, by id
+    _parents: Optional[Dict[int, "weakref.ref[Any]"]] = PrivateAttr(default=None)
+    # (revision, digest) of the last content_hash() computation
+    _content_hash: Optional[Tuple[int, str]] = PrivateAttr(default=None)
+
+    def _adopt_children(self) -> None:
+        """Link the lists and objects in this object's fields to it."""
+        if self.model_config.get("frozen"):
+            return
+        for value in self.__dict__.values():
+            if isinstance(value, _TrackedList):
+                _link(value, self)
+                for item in value:
+                    _link(item, self)
+            elif isinstance(value, _TrackedModel):
+                _link(value, self)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_"):
+            super().__setattr__(name, value)
+            return
+        if type(value) is list:
+            value = _TrackedList(value)
+        super().__setattr__(name, value)
+        self._adopt_children()
+        _touch(self)
+
+    def __eq__(self, other: Any) -> bool:
+        # Unlike BaseModel's, ignores private attributes, which only hold caches
+        # and links
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+    def __copy__(self) -> Any:
+        copied = super().__copy__()
+        _private(copied)["_parents"] = None
+        copied._adopt_children()
+        return copied
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> Any:
+        # The copied fields were linked to their copy (this object's) when copied
+        copied = super().__deepcopy__(memo)
+        _private(copied)["_parents"] = None
+        copied._adopt_children()
+        return copied
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        state = super().__getstate__()
+        private = state.get("__pydantic_private__")
+        if private and private.get("_parents"):
+            state["__pydantic_private__"] = {**private, "_parents": None}
+        return state
+
+    def __setstate__(self, state: Dict[Any, Any]) -> None:
+        super().__setstate__(state)
+        self._adopt_children()
+
+    def _hash_content(self) -> Any:
+        """Return the JSON-serializable content that content_hash() digests."""
+        raise NotImplementedError
+
+    def content_hash(self) -> str:
+        """
+        Return a SHA-256 digest of this object's content.
+
+        Hashes are Merkle-style: a group hashes the hashes of its attributes and
+        a metamodel those of its groups, so equal hashes mean equal subtrees.
+        The digest is cached until the object or anything it contains is
+        modified, and forever for frozen objects.
+        """
+        cached = self._content_hash
+        revision = self._revision
+        if cached is not None and (
+            cached[0] == revision or self.model_config.get("frozen")
+        ):
+            return cached[1]
+        self._adopt_children()
+        digest = _digest(self._hash_content())
+        self._content_hash = (revision, digest)
+        return digest
+
+
+class MetamodelAttribute(_TrackedModel):
     """Represents a single attribute in the metamodel."""
     name: str
     description: str
@@ -46,8 +236,17 @@ class MetamodelAttribute(BaseModel):
             raise ValueError("Attribute description cannot be empty")
         return v
 
+    @field_validator("enum")
+    @classmethod
+    def store_enum(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        """Store enum values in a list that tracks modification."""
+        return None if v is None else _TrackedList(v)
+
+    def _hash_content(self) -> Any:
+        return [self.name, self.description, self.type, self.required, self.enum]
+
 
-class MetamodelGroup(BaseModel):
+class MetamodelGroup(_TrackedModel):
     """Represents a group of related attributes in the metamodel."""
     name: str
     description: str
@@ -79,14 +278,59 @@ class MetamodelGroup(BaseModel):
             raise ValueError("Group must contain at least one attribute")
         return v
 
+    @field_validator("attributes")
+    @classmethod
+    def store_attributes(cls, v: List[MetamodelAttribute]) -> List[MetamodelAttribute]:
+        """Store attributes in a list that tracks modification."""
+        return _TrackedList(v)
+
+    def _hash_content(self) -> Any:
+        return [
+            self.name,
+            self.description,
+            [attr.content_hash() for attr in self.attributes],
+        ]
+
+
+class _MetamodelIndex:
+    """Lookup tables over a metamodel, built on first use."""
+
+    def __init__(self, metamodel: "Metamodel", revision: int):
+        self.revision = revision
+        self.groups: Dict[str, MetamodelGroup] = {}
+        self.attributes: Dict[str, MetamodelAttribute] = {}
+        self.attribute_groups: Dict[str, List[MetamodelGroup]] = {}
+        self.paths: Dict[str, Tuple[MetamodelGroup, MetamodelAttribute]] = {}
+        self.by_type: Dict[str, List[Tuple[MetamodelGroup, MetamodelAttribute]]] = {}
+        self.required: List[Dict[str, Any]] = []
+
+        # The first occurrence of a duplicated name wins, as with a linear scan
+        for group in metamodel.groups:
+            self.groups.setdefault(group.name, group)
+            for attr in group.attributes:
+                self.attributes.setdefault(attr.name, attr)
+                self.attribute_groups.setdefault(attr.name, []).append(group)
+                self.paths.setdefault(f"{group.name}/{attr.name}", (group, attr))
+                self.by_type.setdefault(attr.type, []).append((group, attr))
+                if attr.required:
+                    self.required.append(
+                        {"name": attr.name, "type": attr.type, "group": group.name}
+                    )
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> None:
+        # Copies rebuild their own index on first use
+        return None
+
 
-class Metamodel(BaseModel):
+class Metamodel(_TrackedModel):
     """Represents the complete metamodel structure."""
     name: str
     version: str
     description: str
     groups: List[MetamodelGroup]
     
+    _index: Optional[_MetamodelIndex] = PrivateAttr(default=None)
+
     @field_validator("name")
     @classmethod
     def name_must_be_valid(cls, v: str) -> str:
@@ -99,7 +343,7 @@ class Metamodel(BaseModel):
     @classmethod
     def version_must_be_valid(cls, v: str) -> str:
         """Validate that the metamodel version follows semantic versioning."""
-        if not re.match(r"^\d+\.\d+(\.\d+)?$", v):
+        if not _VERSION_RE.match(v):
             raise ValueError("Version must follow semantic versioning (e.g., 1.0.0)")
         return v
     
@@ -111,44 +355,188 @@ class Metamodel(BaseModel):
             raise ValueError("Metamodel must contain at least one group")
         return v
     
+    @field_validator("groups")
+    @classmethod
+    def store_groups(cls, v: List[MetamodelGroup]) -> List[MetamodelGroup]:
+        """Store groups in a list that tracks modification."""
+        return _TrackedList(v)
+
+    def _hash_content(self) -> Any:
+        return [
+            self.name,
+            self.version,
+            self.description,
+            [group.content_hash() for group in self.groups],
+        ]
+
+    def _get_index(self) -> _MetamodelIndex:
+        """Return the lookup index, rebuilding it if the metamodel was modified."""
+        index = self._index
+        if index is None or index.revision != self._revision:
+            self._adopt_children()
+            for group in self.groups:
+                group._adopt_children()
+            index = _MetamodelIndex(self, self._revision)
+            self._index = index
+        return index
+
     def get_required_attributes(self) -> List[Dict[str, Any]]:
         """Get all required attributes from all groups."""
-        required_attributes = []
-        for group in self.groups:
-            for attr in group.attributes:
-                if attr.required:
-                    required_attributes.append({
-                        "name": attr.name,
-                        "type": attr.type,
-                        "group": group.name
-                    })
-        return required_attributes
+        return [dict(attr) for attr in self._get_index().required]
     
     def get_attribute_by_name(self, name: str) -> Optional[MetamodelAttribute]:
         """Find an attribute by its name."""
-        for group in self.groups:
-            for attr in group.attributes:
-                if attr.name == name:
-                    return attr
-        return None
-    
-    def model_dump(self) -> Dict[str, Any]:
-        """Convert the metamodel to a dictionary representation."""
-        return super().model_dump()
+        return self._get_index().attributes.get(name)
+
+    def get_group_by_name(self, name: str) -> Optional[MetamodelGroup]:
+        """Find a group by its name."""
+        return self._get_index().groups.get(name)
+
+    def get_attribute_by_path(
+        self, path: str
+    ) -> Optional[Tuple[MetamodelGroup, MetamodelAttribute]]:
+        """Find a group and attribute by a 'group_name/attribute_name' path."""
+        return self._get_index().paths.get(path)
+
+    def get_attribute_groups(self, name: str) -> List[MetamodelGroup]:
+        """Get every group that contains an attribute with the given name."""
+        return list(self._get_index().attribute_groups.get(name, ()))
+
+    def get_attributes_by_type(
+        self, attr_type: AttributeType
+    ) -> List[Tuple[MetamodelGroup, MetamodelAttribute]]:
+        """Get (group, attribute) pairs for every attribute of the given type."""
+        return list(self._get_index().by_type.get(attr_type, ()))
     
     @classmethod
-    def model_validate(cls, data: Dict[str, Any]) -> "Metamodel":
+    def from_dict(cls, data: Dict[str, Any]) -> "Metamodel":
         """Create a Metamodel instance from a dictionary."""
-        return super().model_validate(data)
-    
+        return cls.model_validate(data)
+
     @classmethod
-    def from_json_file(cls, file_path: str) -> "Metamodel":
-        """Load a Metamodel from a JSON file."""
+    def from_json_file(
+        cls, file_path: str, lazy: bool = False
+    ) -> Union["Metamodel", "LazyMetamodel"]:
+        """
+        Load a Metamodel from a JSON file.
+
+        With ``lazy=True`` only the header is validated and a LazyMetamodel is
+        returned, whose groups are validated on first access.
+        """
         import json
         with open(file_path, "r") as f:
             data = json.load(f)
+        if lazy:
+            from .lazy import LazyMetamodel
+
+            return LazyMetamodel(data)
         return cls.model_validate(data)
 
+    def freeze(self) -> "FrozenMetamodel":
+        """Return an immutable copy of this metamodel."""
+        return FrozenMetamodel.model_validate(self.model_dump())
+
+
+class _FrozenList(list):
+    """A list that rejects mutation, used for the containers of frozen models."""
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError(
+            "Frozen metamodels cannot be modified; "
+            "use copy.deepcopy() for an editable copy"
+        )
+
+    append = extend = insert = remove = pop = _immutable  # type: ignore[assignment]
+    clear = sort = reverse = _immutable  # type: ignore[assignment]
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable  # type: ignore
+
+    def __reduce__(self) -> Any:
+        return (_FrozenList, (list(self),))
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> List[Any]:
+        return [copy.deepcopy(item, memo) for item in self]
+
+
+def _freeze_list(v: Optional[List[Any]]) -> Optional[List[Any]]:
+    return None if v is None else _FrozenList(v)
+
+
+class FrozenMetamodelAttribute(MetamodelAttribute):
+    """An immutable metamodel attribute."""
+
+    model_config = ConfigDict(frozen=True)
+
+    @field_validator("enum")
+    @classmethod
+    def store_enum(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        """Store enum values in an immutable list."""
+        return _freeze_list(v)
+
+    def __deepcopy__(  # type: ignore[override]
+        self, memo: Optional[Dict[int, Any]] = None
+    ) -> MetamodelAttribute:
+        """Deep copies of frozen attributes are ordinary, editable attributes."""
+        return MetamodelAttribute.model_validate(self.model_dump())
+
+
+class FrozenMetamodelGroup(MetamodelGroup):
+    """An immutable metamodel group."""
+
+    model_config = ConfigDict(frozen=True)
+    attributes: List[FrozenMetamodelAttribute]  # type: ignore[assignment]
+
+    @field_validator("attributes")
+    @classmethod
+    def store_attributes(  # type: ignore[override]
+        cls, v: List[FrozenMetamodelAttribute]
+    ) -> List[FrozenMetamodelAttribute]:
+        """Store attributes in an immutable list."""
+        return _FrozenList(v)
+
+    def __deepcopy__(  # type: ignore[override]
+        self, memo: Optional[Dict[int, Any]] = None
+    ) -> MetamodelGroup:
+        """Deep copies of frozen groups are ordinary, editable groups."""
+        return MetamodelGroup.model_validate(self.model_dump())
+
+
+class FrozenMetamodel(Metamodel):
+    """
+    An immutable metamodel, safe to share between callers.
+
+    Deep copies (``copy.deepcopy``) are ordinary, editable Metamodel instances,
+    which is how callers derive modified versions from a shared metamodel.
+    """
+
+    model_config = ConfigDict(frozen=True)
+    groups: List[FrozenMetamodelGroup]  # type: ignore[assignment]
+
+    @field_validator("groups")
+    @classmethod
+    def store_groups(  # type: ignore[override]
+        cls, v: List[FrozenMetamodelGroup]
+    ) -> List[FrozenMetamodelGroup]:
+        """Store groups in an immutable list."""
+        return _FrozenList(v)
+
+    def freeze(self) -> "FrozenMetamodel":
+        """Return this metamodel, which is already immutable."""
+        return self
+
+    def _get_index(self) -> _MetamodelIndex:
+        """Return the lookup index, which never goes stale for a frozen metamodel."""
+        index = self._index
+        if index is None:
+            index = _MetamodelIndex(self, self._revision)
+            self._index = index
+        return index
+
+    def __deepcopy__(  # type: ignore[override]
+        self, memo: Optional[Dict[int, Any]] = None
+    ) -> Metamodel:
+        """Deep copies of frozen metamodels are ordinary, editable metamodels."""
+        return Metamodel.model_validate(self.model_dump())
+
 
 class ChangeType(str, Enum):
     """Types of changes that can be made to a metamodel."""
@@ -159,14 +547,16 @@ class ChangeType(str, Enum):
     REMOVE_ATTRIBUTE = "remove_attribute"
     MODIFY_ATTRIBUTE = "modify_attribute"
     CHANGE_REQUIREMENT = "change_requirement"
+    MOVE_ATTRIBUTE = "move_attribute"  # Same name, different group
+    RENAME_ATTRIBUTE = "rename_attribute"  # New name, possibly in a different group
 
 
 class MetamodelChange(BaseModel):
     """Represents a change to the metamodel."""
     change_type: ChangeType
     target_path: str  # E.g., "group_name/attribute_name" or "group_name"
-    old_value: Optional[Any] = None
-    new_value: Optional[Any] = None
+    old_value: Any = None
+    new_value: Any = None
     timestamp: datetime = Field(default_factory=datetime.now)
     description: str
     
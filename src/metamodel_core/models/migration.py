@@ -0,0 +1,820 @@
+"""
+Migration of stored metadata records to a new metamodel version.
+
+``RecordMigration`` compiles the changes detected between two metamodel
+versions (see ``ChangeAnalyzer.detect_changes``) into a flat list of record
+operations: fill defaults, drop fields and groups, coerce types, remap enum
+values and move or rename attributes. ``migrate_ndjson`` and
+``migrate_protobuf`` stream record files through a migration in constant
+memory, writing periodic checkpoints so that an interrupted run resumes
+where it stopped instead of starting over.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import time
+from datetime import datetime, timezone
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from .metamodel import AttributeType, ChangeType, MetamodelChange
+from .records import TYPE_CHECKS, RecordError, RecordErrorCode, parse_datetime
+from .streaming import format_report_line, peak_rss_bytes
+
+# Default number of records between checkpoints
+DEFAULT_CHECKPOINT_EVERY = 10000
+
+_TRUE_STRINGS = frozenset({"true", "yes", "1"})
+_FALSE_STRINGS = frozenset({"false", "no", "0"})
+
+
+class RecordMigrationError(ValueError):
+    """Raised when a record cannot be migrated."""
+
+    def __init__(self, error: RecordError):
+        super().__init__(error.message)
+        self.error = error
+
+
+class MigrationStats(BaseModel):
+    """Summary of a record migration run."""
+
+    records: int = 0
+    migrated: int = 0
+    rejected: int = 0
+    malformed: int = 0
+    # Records already processed by earlier runs when this one resumed
+    resumed_records: int = 0
+    seconds: float = 0.0
+    peak_rss_bytes: Optional[int] = None
+
+    @property
+    def records_per_second(self) -> float:
+        """Migration throughput of the run, not counting resumed records."""
+        processed = self.records - self.resumed_records
+        return processed / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> str:
+        """Human-readable one-line summary of the run."""
+        text = (
+            f"Migrated {self.migrated} of {self.records} records "
+            f"({self.rejected} rejected, "
+            f"{self.malformed} malformed) in {self.seconds:.2f}s "
+            f"({self.records_per_second:,.0f} records/s)"
+        )
+        if self.resumed_records:
+            text += f", resumed after {self.resumed_records} records"
+        return text
+
+
+def _to_string(value: Any) -> str:
+    if type(value) is int or type(value) is float:
+        # Same text as json.dumps for finite numbers, without its overhead
+        return repr(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _to_integer(value: Any) -> int:
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, str):
+        return int(value.strip())
+    raise ValueError(f"cannot convert {type(value).__name__} to integer")
+
+
+def _to_number(value: Any) -> float:
+    if isinstance(value, (bool, str)):
+        return float(value)
+    raise ValueError(f"cannot convert {type(value).__name__} to number")
+
+
+def _to_boolean(value: Any) -> bool:
+    if (
+        isinstance(value, str)
+        and value.strip().lower() in _TRUE_STRINGS | _FALSE_STRINGS
+    ):
+        return value.strip().lower() in _TRUE_STRINGS
+    if isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    raise ValueError(f"cannot convert {value!r} to boolean")
+
+
+def _to_array(value: Any) -> List[Any]:
+    return [value]
+
+
+def _to_object(value: Any) -> Dict[str, Any]:
+    if isinstance(value, str):
+        parsed = json.loads(value)
+        if isinstance(parsed, dict):
+            return parsed
+    raise ValueError(f"cannot convert {type(value).__name__} to object")
+
+
+def _to_datetime(value: Any) -> str:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        # Epoch seconds
+        return datetime.fromtimestamp(value, timezone.utc).isoformat()
+    if isinstance(value, str):
+        return parse_datetime(value.strip()).isoformat()
+    raise ValueError(f"cannot convert {type(value).__name__} to datetime")
+
+
+# Conversions of values that do not have the new type of an attribute
+COERCIONS: Dict[AttributeType, Callable[[Any], Any]] = {
+    AttributeType.STRING: _to_string,
+    AttributeType.BOOLEAN: _to_boolean,
+    AttributeType.INTEGER: _to_integer,
+    AttributeType.NUMBER: _to_number,
+    AttributeType.ARRAY: _to_array,
+    AttributeType.OBJECT: _to_object,
+    AttributeType.DATETIME: _to_datetime,
+}
+
+# A compiled operation modifies a record in place
+_Operation = Callable[[Dict[str, Any]], None]
+
+
+def _copy_value(value: Any) -> Any:
+    # Defaults are copied so records never share mutable values
+    return copy.deepcopy(value) if isinstance(value, (list, dict)) else value
+
+
+def _group_error(group_name: str) -> RecordMigrationError:
+    return RecordMigrationError(
+        RecordError(
+            path=group_name,
+            code=RecordErrorCode.NOT_AN_OBJECT,
+            message=f"Group '{group_name}' must be an object keyed by attribute name",
+        )
+    )
+
+
+class RecordMigration:
+    """
+    Transforms metadata records by applying a list of metamodel changes.
+
+    Changes are compiled once into record operations, applied in order:
+
+    - ADD_GROUP and ADD_ATTRIBUTE fill the defaults of the new attributes
+      (required attributes must have one)
+    - REMOVE_GROUP and REMOVE_ATTRIBUTE drop the data
+    - MODIFY_ATTRIBUTE coerces values to a new type and maps values to a
+      new enum, using ``enum_maps`` for values that are not in it
+    - CHANGE_REQUIREMENT to required fills the default into records
+      without a value
+    - MOVE_ATTRIBUTE and RENAME_ATTRIBUTE re-key the value
+
+    Values that cannot be coerced or mapped, and groups that are not
+    objects where a value must be written, raise RecordMigrationError.
+    Defaults and enum maps are keyed by the 'group_name/attribute_name'
+    path of the change.
+    """
+
+    def __init__(
+        self,
+        changes: List[MetamodelChange],
+        defaults: Optional[Dict[str, Any]] = None,
+        enum_maps: Optional[Dict[str, Dict[str, str]]] = None,
+    ):
+        """
+        Compile the changes into record operations.
+
+        Args:
+            changes: The changes turning the old metamodel into the new one
+            defaults: Values for attributes that are added or become required
+            enum_maps: Old to new values of attributes whose enum changed
+
+        Raises:
+            ValueError: If a required attribute has no default
+        """
+        self.changes = list(changes)
+        self.defaults = dict(defaults or {})
+        self.enum_maps = {
+            path: dict(mapping) for path, mapping in (enum_maps or {}).items()
+        }
+
+        missing: List[str] = []
+        self._operations: List[_Operation] = []
+        for change in self.changes:
+            self._operations.extend(self._compile(change, missing))
+        if missing:
+            raise ValueError(
+                f"No default for required attributes: {', '.join(missing)}"
+            )
+
+    @property
+    def fingerprint(self) -> str:
+        """A digest of the changes and options, identifying the transformation."""
+        content = [
+            [
+                [
+                    change.change_type,
+                    change.target_path,
+                    change.old_value,
+                    change.new_value,
+                ]
+                for change in self.changes
+            ],
+            self.defaults,
+            self.enum_maps,
+        ]
+        encoded = json.dumps(
+            content, sort_keys=True, default=str, separators=(",", ":")
+        )
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Compiled operations are closures; worker processes compile the changes again
+        return {
+            "changes": self.changes,
+            "defaults": self.defaults,
+            "enum_maps": self.enum_maps,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        RecordMigration.__init__(
+            self, state["changes"], state["defaults"], state["enum_maps"]
+        )
+
+    def apply(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Migrate a record in place.
+
+        Args:
+            record: The record, keyed by group name
+
+        Returns:
+            The same record, migrated
+
+        Raises:
+            RecordMigrationError: If a value cannot be converted, or the record
+                is malformed in a way the operations do not anticipate
+        """
+        try:
+            for operation in self._operations:
+                operation(record)
+        except RecordMigrationError:
+            raise
+        except Exception as e:
+            # One malformed record must not abort a whole migration run
+            raise RecordMigrationError(
+                RecordError(
+                    path="",
+                    code=RecordErrorCode.MIGRATION_FAILED,
+                    message=f"Cannot migrate record: {type(e).__name__}: {e}",
+                )
+            ) from e
+        return record
+
+    def _compile(self, change: MetamodelChange, missing: List[str]) -> List[_Operation]:
+        change_type = change.change_type
+        path = change.target_path
+        # Dicts, or bools for CHANGE_REQUIREMENT
+        old_value: Any = change.old_value
+        new_value: Any = change.new_value
+
+        if change_type == ChangeType.ADD_GROUP:
+            operations = []
+            for attr in new_value["attributes"]:
+                attr_path = f"{path}/{attr['name']}"
+                operations.extend(self._fill(attr_path, attr["required"], missing))
+            return operations
+        if change_type == ChangeType.REMOVE_GROUP:
+            return [self._drop_group(path)]
+        if change_type == ChangeType.ADD_ATTRIBUTE:
+            return self._fill(path, new_value["required"], missing)
+        if change_type == ChangeType.REMOVE_ATTRIBUTE:
+            return [self._drop_attribute(*path.split("/", 1))]
+        if change_type == ChangeType.CHANGE_REQUIREMENT:
+            return self._fill(path, True, missing) if new_value else []
+        if change_type == ChangeType.MODIFY_ATTRIBUTE:
+            operations = []
+            if "type" in new_value:
+                operations.append(self._coerce(path, AttributeType(new_value["type"])))
+            if "enum" in new_value and new_value["enum"]:
+                operations.append(self._remap(path, new_value["enum"]))
+            return operations
+        if change_type in (ChangeType.MOVE_ATTRIBUTE, ChangeType.RENAME_ATTRIBUTE):
+            operations = [
+                self._move(
+                    old_value["group"],
+                    old_value["name"],
+                    new_value["group"],
+                    new_value["name"],
+                )
+            ]
+            # A rename may come with a new type, which is applied to the moved value
+            old_type, new_type = old_value.get("type"), new_value.get("type")
+            new_path = f"{new_value['group']}/{new_value['name']}"
+            if new_type is not None and old_type != new_type:
+                operations.append(self._coerce(new_path, AttributeType(new_type)))
+            if new_value.get("enum") and old_value.get("enum") != new_value["enum"]:
+                operations.append(self._remap(new_path, new_value["enum"]))
+            if new_value.get("required") and not old_value.get("required"):
+                operations.extend(self._fill(new_path, True, missing))
+            return operations
+        # MODIFY_GROUP only changes descriptions
+        return []
+
+    def _fill(self, path: str, required: bool, missing: List[str]) -> List[_Operation]:
+        """Set the default of an attribute in records without a value."""
+        if path not in self.defaults:
+            if required:
+                missing.append(path)
+            return []
+        group_name, attr_name = path.split("/", 1)
+        default = self.defaults[path]
+
+        def fill(record: Dict[str, Any]) -> None:
+            values = record.get(group_name)
+            if values is None:
+                values = record[group_name] = {}
+            elif not isinstance(values, dict):
+                raise _group_error(group_name)
+            if values.get(attr_name) is None:
+                values[attr_name] = _copy_value(default)
+
+        return [fill]
+
+    def _drop_group(self, group_name: str) -> _Operation:
+        def drop_group(record: Dict[str, Any]) -> None:
+            record.pop(group_name, None)
+
+        return drop_group
+
+    def _drop_attribute(self, group_name: str, attr_name: str) -> _Operation:
+        def drop_attribute(record: Dict[str, Any]) -> None:
+            values = record.get(group_name)
+            if isinstance(values, dict):
+                values.pop(attr_name, None)
+
+        return drop_attribute
+
+    def _move(
+        self, old_group: str, old_name: str, new_group: str, new_name: str
+    ) -> _Operation:
+        def move(record: Dict[str, Any]) -> None:
+            values = record.get(old_group)
+            if not isinstance(values, dict) or old_name not in values:
+                return
+            target = record.get(new_group)
+            if target is not None and not isinstance(target, dict):
+                raise _group_error(new_group)
+            value = values.pop(old_name)
+            if value is None:
+                return
+            if target is None:
+                target = record[new_group] = {}
+            target[new_name] = value
+
+        return move
+
+    def _coerce(self, path: str, attr_type: AttributeType) -> _Operation:
+        group_name, attr_name = path.split("/", 1)
+        is_type = TYPE_CHECKS[attr_type]
+        convert = COERCIONS[attr_type]
+
+        def coerce(record: Dict[str, Any]) -> None:
+            values = record.get(group_name)
+            if not isinstance(values, dict):
+                return
+            value = values.get(attr_name)
+            if value is None or is_type(value):
+                return
+            try:
+                values[attr_name] = convert(value)
+            except (ValueError, TypeError, OverflowError) as e:
+                raise RecordMigrationError(
+                    RecordError(
+                        path=path,
+                        code=RecordErrorCode.INVALID_TYPE,
+                        message=(
+                            f"Cannot convert value {value!r} of attribute '{path}' "
+                            f"to {attr_type.value}: {e}"
+                        ),
+                    )
+                )
+
+        return coerce
+
+    def _remap(self, path: str, enum: List[str]) -> _Operation:
+        group_name, attr_name = path.split("/", 1)
+        allowed = frozenset(enum)
+        mapping = self.enum_maps.get(path, {})
+
+        def remap(record: Dict[str, Any]) -> None:
+            values = record.get(group_name)
+            if not isinstance(values, dict):
+                return
+            value = values.get(attr_name)
+            # Enum values are strings; other values may be unhashable
+            if value is None or (isinstance(value, str) and value in allowed):
+                return
+            if isinstance(value, str) and value in mapping:
+                values[attr_name] = mapping[value]
+                return
+            raise RecordMigrationError(
+                RecordError(
+                    path=path,
+                    code=RecordErrorCode.INVALID_ENUM,
+                    message=(
+                        f"Value {value!r} of attribute '{path}' has no mapping "
+                        f"to one of: {', '.join(enum)}"
+                    ),
+                )
+            )
+
+        return remap
+
+
+class _Checkpoint(BaseModel):
+    """Progress of a migration run, written atomically next to the output."""
+
+    fingerprint: str
+    input_offset: int
+    output_offset: int
+    reject_offset: int
+    frames: int
+    stats: MigrationStats
+
+
+def _write_checkpoint(path: str, checkpoint: _Checkpoint) -> None:
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as f:
+        f.write(checkpoint.model_dump_json())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def _open_output(path: str, offset: int) -> IO[bytes]:
+    """Open an output file, truncated to what the last checkpoint covered."""
+    if offset == 0 or not os.path.exists(path):
+        return open(path, "wb")
+    f = open(path, "r+b")
+    f.truncate(offset)
+    f.seek(offset)
+    return f
+
+
+def _sync(stream: IO[bytes]) -> None:
+    stream.flush()
+    os.fsync(stream.fileno())
+
+
+# A frame reader yields (end offset, payload) for each frame from the current
+# position; the payload is None for frames without a record, like blank lines
+_FrameReader = Callable[[IO[bytes], int], Iterator[Tuple[int, Optional[bytes]]]]
+
+
+def _iter_lines(
+    stream: IO[bytes], offset: int
+) -> Iterator[Tuple[int, Optional[bytes]]]:
+    for line in stream:
+        offset += len(line)
+        yield offset, line if line.strip() else None
+
+
+def _read_varint(stream: IO[bytes]) -> Optional[Tuple[int, int]]:
+    """Read a base-128 varint as (value, size), or None at the end of the stream."""
+    value = shift = size = 0
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            if size:
+                raise ValueError("Truncated length prefix")
+            return None
+        size += 1
+        value |= (byte[0] & 0x7F) << shift
+        if not byte[0] & 0x80:
+            return value, size
+        shift += 7
+
+
+def encode_varint(value: int) -> bytes:
+    """Encode a non-negative integer as a base-128 varint."""
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _iter_delimited(stream: IO[bytes], offset: int) -> Iterator[Tuple[int, bytes]]:
+    while True:
+        prefix = _read_varint(stream)
+        if prefix is None:
+            return
+        length, size = prefix
+        data = stream.read(length)
+        if len(data) != length:
+            raise ValueError(f"Truncated message at byte {offset}")
+        offset += size + length
+        yield offset, data
+
+
+def iter_delimited(stream: IO[bytes]) -> Iterator[bytes]:
+    """
+    Read length-delimited messages, each preceded by its size as a varint.
+
+    This is the framing of protobuf's ``writeDelimitedTo`` and
+    ``parseDelimitedFrom``.
+
+    Args:
+        stream: Binary stream to read from
+
+    Yields:
+        The serialized messages
+    """
+    for _, data in _iter_delimited(stream, 0):
+        yield data
+
+
+def migrate_payload(
+    payload: bytes,
+    decode: Callable[[bytes], Any],
+    apply: Callable[[Dict[str, Any]], Dict[str, Any]],
+    validate: Optional[Callable[[Any], Tuple[bool, List[RecordError]]]] = None,
+) -> Tuple[Optional[Dict[str, Any]], List[RecordError]]:
+    """
+    Decode, migrate and optionally validate one serialized record.
+
+    Args:
+        payload: The serialized record
+        decode: Function parsing the payload, raising ValueError if it is malformed
+        apply: The migration's apply method
+        validate: Validation function of the new metamodel, if any
+
+    Returns:
+        Tuple of (migrated_record, []) or (None, errors) if the record is rejected;
+        malformed payloads are reported with the INVALID_JSON code
+    """
+    try:
+        record = decode(payload)
+    except ValueError as e:
+        return None, [
+            RecordError(
+                path="",
+                code=RecordErrorCode.INVALID_JSON,
+                message=f"Invalid record: {e}",
+            )
+        ]
+    if not isinstance(record, dict):
+        return None, [
+            RecordError(
+                path="",
+                code=RecordErrorCode.NOT_AN_OBJECT,
+                message="Record must be an object",
+            )
+        ]
+    try:
+        record = apply(record)
+    except RecordMigrationError as e:
+        return None, [e.error]
+    if validate is not None:
+        is_valid, errors = validate(record)
+        if not is_valid:
+            return None, errors
+    return record, []
+
+
+def _migrate(
+    input_path: str,
+    output_path: str,
+    migration: RecordMigration,
+    read_frames: _FrameReader,
+    decode: Callable[[bytes], Any],
+    encode: Callable[[Dict[str, Any]], bytes],
+    reject_path: Optional[str],
+    validator: Optional[Any],
+    checkpoint_path: Optional[str],
+    checkpoint_every: int,
+) -> MigrationStats:
+    """Stream frames through a migration, resuming from and writing checkpoints."""
+    start = time.perf_counter()
+    checkpoint = None
+    if checkpoint_path is not None and os.path.exists(checkpoint_path):
+        with open(checkpoint_path, "r") as f:
+            checkpoint = _Checkpoint.model_validate_json(f.read())
+        if checkpoint.fingerprint != migration.fingerprint:
+            raise ValueError(
+                f"Checkpoint {checkpoint_path} belongs to a different migration"
+            )
+
+    if checkpoint is not None:
+        stats = checkpoint.stats.model_copy()
+        stats.resumed_records = stats.records
+        input_offset, frames = checkpoint.input_offset, checkpoint.frames
+        output_offset, reject_offset = (
+            checkpoint.output_offset,
+            checkpoint.reject_offset,
+        )
+    else:
+        stats = MigrationStats()
+        input_offset = frames = output_offset = reject_offset = 0
+
+    apply = migration.apply
+    validate = validator.validate if validator is not None else None
+    output = _open_output(output_path, output_offset)
+    rejects = (
+        _open_output(reject_path, reject_offset) if reject_path is not None else None
+    )
+
+    def reject(errors: List[RecordError]) -> None:
+        stats.rejected += 1
+        if rejects is not None:
+            rejects.write(format_report_line(frames, errors).encode("utf-8"))
+
+    def save_checkpoint(path: str) -> None:
+        _sync(output)
+        if rejects is not None:
+            _sync(rejects)
+        _write_checkpoint(
+            path,
+            _Checkpoint(
+                fingerprint=migration.fingerprint,
+                input_offset=input_offset,
+                output_offset=output.tell(),
+                reject_offset=rejects.tell() if rejects is not None else 0,
+                frames=frames,
+                stats=stats,
+            ),
+        )
+
+    def process(payload: bytes) -> None:
+        stats.records += 1
+        record, errors = migrate_payload(payload, decode, apply, validate)
+        if record is None:
+            if errors[0].code == RecordErrorCode.INVALID_JSON:
+                stats.malformed += 1
+            reject(errors)
+            return
+        output.write(encode(record))
+        stats.migrated += 1
+
+    try:
+        with open(input_path, "rb") as source:
+            source.seek(input_offset)
+            since_checkpoint = 0
+            for end_offset, payload in read_frames(source, input_offset):
+                frames += 1
+                if payload is not None:
+                    process(payload)
+                    since_checkpoint += 1
+                input_offset = end_offset
+                if checkpoint_path is not None and since_checkpoint >= checkpoint_every:
+                    save_checkpoint(checkpoint_path)
+                    since_checkpoint = 0
+    finally:
+        output.close()
+        if rejects is not None:
+            rejects.close()
+
+    # The run is complete, so a new run starts from the beginning
+    if checkpoint_path is not None and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    stats.seconds = (
+        (checkpoint.stats.seconds if checkpoint is not None else 0.0)
+        + time.perf_counter()
+        - start
+    )
+    stats.peak_rss_bytes = peak_rss_bytes()
+    return stats
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_ndjson(record: Dict[str, Any]) -> bytes:
+    """Serialize a record as an NDJSON line, including the trailing newline."""
+    return (
+        json.dumps(record, ensure_ascii=False, default=_json_default) + "\n"
+    ).encode("utf-8")
+
+
+def migrate_ndjson(
+    input_path: str,
+    output_path: str,
+    migration: RecordMigration,
+    reject_path: Optional[str] = None,
+    validator: Optional[Any] = None,
+    checkpoint_path: Optional[str] = None,
+    checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+) -> MigrationStats:
+    """
+    Migrate the records of an NDJSON file, one line at a time.
+
+    Records that cannot be parsed, migrated or (with a validator) are
+    invalid afterwards are left out of the output and reported in the reject
+    file, in the ``{"line": n, "errors": [...]}`` format of validate_ndjson.
+
+    With a checkpoint path, progress is saved every ``checkpoint_every``
+    records after flushing the output, and a run that finds a checkpoint
+    resumes from it: outputs are truncated to the checkpointed size and
+    reading continues at the checkpointed input offset. The checkpoint is
+    removed when the run completes.
+
+    Args:
+        input_path: Path to the NDJSON records file
+        output_path: Path of the migrated NDJSON file
+        migration: The migration to apply
+        reject_path: Path of the reject report (rejects are only counted if None)
+        validator: Validator of the new metamodel, e.g. a RecordValidator,
+            that migrated records must pass
+        checkpoint_path: Path of the checkpoint file (no checkpoints if None)
+        checkpoint_every: Number of records between checkpoints
+
+    Returns:
+        Statistics about the run, including records processed before a resume
+
+    Raises:
+        ValueError: If the checkpoint was written by a different migration
+    """
+    return _migrate(
+        input_path,
+        output_path,
+        migration,
+        _iter_lines,
+        json.loads,
+        encode_ndjson,
+        reject_path,
+        validator,
+        checkpoint_path,
+        checkpoint_every,
+    )
+
+
+def migrate_protobuf(
+    input_path: str,
+    output_path: str,
+    migration: RecordMigration,
+    source_codec: Any,
+    target_codec: Any,
+    reject_path: Optional[str] = None,
+    validator: Optional[Any] = None,
+    checkpoint_path: Optional[str] = None,
+    checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+) -> MigrationStats:
+    """
+    Migrate a file of length-delimited Protocol Buffer records.
+
+    Records are decoded with the codec of the old metamodel, migrated, and
+    encoded with the codec of the new one (see
+    ``metamodel_core.schema.protobuf_codec.ProtobufCodec``). Line numbers
+    in the reject report are 1-based message positions. Otherwise this
+    works like migrate_ndjson.
+
+    Args:
+        input_path: Path to the records file
+        output_path: Path of the migrated records file
+        migration: The migration to apply
+        source_codec: Codec decoding records of the old metamodel
+        target_codec: Codec encoding records of the new metamodel
+        reject_path: Path of the reject report (rejects are only counted if None)
+        validator: Validator of the new metamodel that migrated records must pass
+        checkpoint_path: Path of the checkpoint file (no checkpoints if None)
+        checkpoint_every: Number of records between checkpoints
+
+    Returns:
+        Statistics about the run, including records processed before a resume
+
+    Raises:
+        ValueError: If the checkpoint was written by a different migration
+    """
+    target_encode = target_codec.encode
+
+    def decode(data: bytes) -> Dict[str, Any]:
+        try:
+            record: Dict[str, Any] = source_codec.decode(data)
+        except Exception as e:  # DecodeError does not derive from ValueError
+            raise ValueError(str(e)) from e
+        return record
+
+    def encode(record: Dict[str, Any]) -> bytes:
+        data: bytes = target_encode(record)
+        return encode_varint(len(data)) + data
+
+    return _migrate(
+        input_path,
+        output_path,
+        migration,
+        _iter_delimited,
+        decode,
+        encode,
+        reject_path,
+        validator,
+        checkpoint_path,
+        checkpoint_every,
+    )
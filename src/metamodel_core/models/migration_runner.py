@@ -0,0 +1,470 @@
+"""
+Parallel, chunked migration of NDJSON record files, with dry-run estimates.
+
+``MigrationRunner`` splits an input file into byte-range chunks on line
+boundaries and migrates them with a pool of worker processes. Each chunk's
+output is written to a temporary file and renamed into place, so a chunk
+either is complete or is redone; a run interrupted for any reason resumes
+with the chunks that are not complete yet. ``MigrationRunner.dry_run``
+migrates a sample of records without writing anything and extrapolates the
+number of affected records and the runtime per ``MigrationPlanner`` impact
+category, for sizing maintenance windows.
+"""
+
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import IO, Any, Deque, Dict, List, Optional, Tuple, cast
+
+from pydantic import BaseModel
+
+from .metamodel import MetamodelChange
+from .migration import (
+    MigrationStats,
+    RecordMigration,
+    RecordMigrationError,
+    encode_ndjson,
+    migrate_payload,
+)
+from .records import RecordError, RecordErrorCode
+from .streaming import (
+    DEFAULT_CHUNK_BYTES,
+    chunk_offsets,
+    format_report_line,
+    peak_rss_bytes,
+)
+from .validators import MigrationPlanner
+
+# Default number of records sampled by a dry run
+DEFAULT_SAMPLE_SIZE = 1000
+
+MANIFEST_FILE = "manifest.json"
+
+
+class ChunkStats(BaseModel):
+    """Result of migrating one chunk, stored next to its output."""
+
+    lines: int = 0
+    records: int = 0
+    migrated: int = 0
+    rejected: int = 0
+    malformed: int = 0
+
+
+class _Manifest(BaseModel):
+    """The migration and chunks an output directory belongs to."""
+
+    fingerprint: str
+    input_size: int
+    input_mtime_ns: int
+    chunks: List[Tuple[int, int]]
+
+
+class ImpactEstimate(BaseModel):
+    """Estimated effect of the changes of one impact category."""
+
+    changes: int = 0
+    sampled_affected: int = 0
+    sampled_rejected: int = 0
+    estimated_affected: int = 0
+    estimated_rejected: int = 0
+    estimated_seconds: float = 0.0
+
+
+class MigrationEstimate(BaseModel):
+    """Dry-run estimate of a migration, extrapolated from a sample of records."""
+
+    sampled_records: int = 0
+    estimated_records: int = 0
+    seconds_per_record: float = 0.0
+    workers: int = 1
+    estimated_seconds: float = 0.0
+    # MigrationPlanner category ("high_impact", ...) -> estimate
+    impact: Dict[str, ImpactEstimate] = {}
+
+    def summary(self) -> str:
+        """Human-readable summary of the estimate, one line per impact category."""
+        lines = [
+            f"Estimated {self.estimated_records} records "
+            f"from a sample of {self.sampled_records}; "
+            f"about {self.estimated_seconds:.1f}s with {self.workers} workers"
+        ]
+        for category, estimate in self.impact.items():
+            lines.append(
+                f"  {category}: {estimate.changes} changes, "
+                f"~{estimate.estimated_affected} records affected, "
+                f"~{estimate.estimated_rejected} rejected, "
+                f"~{estimate.estimated_seconds:.1f}s"
+            )
+        return "\n".join(lines)
+
+
+def _part_path(output_dir: str, index: int, suffix: str) -> str:
+    return os.path.join(output_dir, f"part-{index:05d}{suffix}")
+
+
+def _replace_with(path: str, data: bytes) -> None:
+    """Write a file atomically: readers see the old content or the complete new one."""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+# Migration and validator of the current worker process, installed once by _init_worker
+_worker_migration: Optional[RecordMigration] = None
+_worker_validator: Optional[Any] = None
+
+
+def _init_worker(migration: RecordMigration, validator: Optional[Any]) -> None:
+    global _worker_migration, _worker_validator
+    _worker_migration = migration
+    _worker_validator = validator
+
+
+def _migrate_chunk(
+    input_path: str, start: int, end: int, output_dir: str, index: int
+) -> ChunkStats:
+    """Migrate the lines in a byte range of an NDJSON file into the chunk's parts."""
+    if _worker_migration is None:
+        raise RuntimeError("The worker process was not initialized")
+    apply = _worker_migration.apply
+    validate = _worker_validator.validate if _worker_validator is not None else None
+    loads = json.loads
+    with open(input_path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    lines = data.split(b"\n")
+    if lines and not lines[-1]:
+        lines.pop()
+
+    stats = ChunkStats(lines=len(lines))
+    output: List[bytes] = []
+    rejects: List[str] = []
+    for local_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        stats.records += 1
+        record, errors = migrate_payload(line, loads, apply, validate)
+        if record is None:
+            stats.rejected += 1
+            if errors[0].code == RecordErrorCode.INVALID_JSON:
+                stats.malformed += 1
+            rejects.append(format_report_line(local_number, errors))
+            continue
+        output.append(encode_ndjson(record))
+        stats.migrated += 1
+
+    # The stats file is written last and marks the chunk as complete
+    _replace_with(_part_path(output_dir, index, ".ndjson"), b"".join(output))
+    _replace_with(
+        _part_path(output_dir, index, ".rejects.ndjson"),
+        "".join(rejects).encode("utf-8"),
+    )
+    _replace_with(
+        _part_path(output_dir, index, ".json"), stats.model_dump_json().encode("utf-8")
+    )
+    return stats
+
+
+class MigrationRunner:
+    """
+    Migrates NDJSON record files chunk by chunk with a pool of worker processes.
+
+    The migration (and validator, if any) is sent to each worker once when
+    the pool starts; workers then read their own byte ranges of the input.
+    """
+
+    def __init__(
+        self,
+        migration: RecordMigration,
+        validator: Optional[Any] = None,
+        workers: Optional[int] = None,
+        chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+        planner: Optional[MigrationPlanner] = None,
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            migration: The migration to apply, e.g. compiled from
+                ``ChangeAnalyzer.detect_changes`` output
+            validator: Validator of the new metamodel (e.g. a RecordValidator)
+                that migrated records must pass
+            workers: Number of worker processes (defaults to the CPU count);
+                with 1, chunks are migrated in this process
+            chunk_bytes: Approximate size of each chunk
+            planner: Planner classifying changes by impact for dry runs
+        """
+        self.migration = migration
+        self.validator = validator
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_bytes = chunk_bytes
+        self.planner = planner or MigrationPlanner()
+
+    def run(
+        self,
+        input_path: str,
+        output_dir: str,
+        output_path: Optional[str] = None,
+        reject_path: Optional[str] = None,
+    ) -> MigrationStats:
+        """
+        Migrate an NDJSON file into per-chunk part files.
+
+        ``output_dir`` receives a manifest and, for each chunk, the migrated
+        records (``part-NNNNN.ndjson``), the reject report with line numbers
+        relative to the chunk (``part-NNNNN.rejects.ndjson``) and its stats
+        (``part-NNNNN.json``). Chunks that are complete from an earlier run
+        with the same migration and input are skipped.
+
+        Args:
+            input_path: Path to the NDJSON records file
+            output_dir: Directory for the part files (created if needed)
+            output_path: If given, the parts are concatenated into this file
+            reject_path: If given, the reject reports are concatenated into
+                this file, with line numbers of the input file
+
+        Returns:
+            Statistics about the run, with records of skipped chunks counted
+            as resumed
+
+        Raises:
+            ValueError: If output_dir holds parts of a different migration or input
+        """
+        start = time.perf_counter()
+        os.makedirs(output_dir, exist_ok=True)
+        manifest = self._manifest(input_path, output_dir)
+
+        results: List[Optional[ChunkStats]] = []
+        for index in range(len(manifest.chunks)):
+            stats_path = _part_path(output_dir, index, ".json")
+            if os.path.exists(stats_path):
+                with open(stats_path, "r") as f:
+                    results.append(ChunkStats.model_validate_json(f.read()))
+            else:
+                results.append(None)
+        resumed = sum(result.records for result in results if result is not None)
+        todo = [index for index, result in enumerate(results) if result is None]
+
+        if self.workers == 1:
+            _init_worker(self.migration, self.validator)
+            for index in todo:
+                results[index] = _migrate_chunk(
+                    input_path, *manifest.chunks[index], output_dir, index
+                )
+        elif todo:
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.migration, self.validator),
+            ) as executor:
+                # Bound the number of chunks in flight so memory stays flat
+                pending: Deque[Tuple[int, Future]] = deque()
+                for index in todo:
+                    if len(pending) >= self.workers * 2:
+                        done_index, future = pending.popleft()
+                        results[done_index] = future.result()
+                    pending.append(
+                        (
+                            index,
+                            executor.submit(
+                                _migrate_chunk,
+                                input_path,
+                                *manifest.chunks[index],
+                                output_dir,
+                                index,
+                            ),
+                        )
+                    )
+                while pending:
+                    done_index, future = pending.popleft()
+                    results[done_index] = future.result()
+
+        # Every chunk has its stats now
+        completed = cast(List[ChunkStats], results)
+        if output_path is not None:
+            self._concatenate(output_dir, len(completed), output_path)
+        if reject_path is not None:
+            self._merge_rejects(output_dir, completed, reject_path)
+
+        stats = MigrationStats(resumed_records=resumed)
+        for result in completed:
+            stats.records += result.records
+            stats.migrated += result.migrated
+            stats.rejected += result.rejected
+            stats.malformed += result.malformed
+        stats.seconds = time.perf_counter() - start
+        stats.peak_rss_bytes = peak_rss_bytes(include_children=True)
+        return stats
+
+    def _manifest(self, input_path: str, output_dir: str) -> _Manifest:
+        """Load the manifest of an earlier run, or split the input and write one."""
+        stat = os.stat(input_path)
+        path = os.path.join(output_dir, MANIFEST_FILE)
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                manifest = _Manifest.model_validate_json(f.read())
+            if manifest.fingerprint != self.migration.fingerprint:
+                raise ValueError(
+                    f"{output_dir} holds the output of a different migration"
+                )
+            if (manifest.input_size, manifest.input_mtime_ns) != (
+                stat.st_size,
+                stat.st_mtime_ns,
+            ):
+                raise ValueError(
+                    f"{input_path} changed since the migration into {output_dir} "
+                    "started"
+                )
+            return manifest
+
+        manifest = _Manifest(
+            fingerprint=self.migration.fingerprint,
+            input_size=stat.st_size,
+            input_mtime_ns=stat.st_mtime_ns,
+            chunks=chunk_offsets(input_path, self.chunk_bytes),
+        )
+        _replace_with(path, manifest.model_dump_json().encode("utf-8"))
+        return manifest
+
+    def _concatenate(self, output_dir: str, chunks: int, output_path: str) -> None:
+        temp_path = f"{output_path}.tmp"
+        with open(temp_path, "wb") as output:
+            for index in range(chunks):
+                with open(_part_path(output_dir, index, ".ndjson"), "rb") as part:
+                    while True:
+                        block = part.read(1024 * 1024)
+                        if not block:
+                            break
+                        output.write(block)
+        os.replace(temp_path, output_path)
+
+    def _merge_rejects(
+        self, output_dir: str, results: List[ChunkStats], reject_path: str
+    ) -> None:
+        temp_path = f"{reject_path}.tmp"
+        line_offset = 0
+        with open(temp_path, "w") as output:
+            for index, result in enumerate(results):
+                with open(
+                    _part_path(output_dir, index, ".rejects.ndjson"), "r"
+                ) as part:
+                    for line in part:
+                        report = json.loads(line)
+                        errors = [
+                            RecordError.model_validate(error)
+                            for error in report["errors"]
+                        ]
+                        output.write(
+                            format_report_line(line_offset + report["line"], errors)
+                        )
+                line_offset += result.lines
+        os.replace(temp_path, reject_path)
+
+    def dry_run(
+        self, input_path: str, sample_size: int = DEFAULT_SAMPLE_SIZE
+    ) -> MigrationEstimate:
+        """
+        Estimate the effect and runtime of a migration without writing anything.
+
+        Records are sampled at evenly spaced offsets of the file. Each sampled
+        record is migrated (and validated) to measure the time per record, and
+        the changes of each MigrationPlanner impact category are applied on
+        their own to count the records they modify or reject. Counts are
+        extrapolated to the number of records estimated from the file size
+        and the average size of the sampled lines.
+
+        Args:
+            input_path: Path to the NDJSON records file
+            sample_size: Maximum number of records to sample
+
+        Returns:
+            The estimate
+        """
+        size = os.path.getsize(input_path)
+        with open(input_path, "rb") as f:
+            sample = self._sample_lines(f, size, sample_size)
+        estimate = MigrationEstimate(sampled_records=len(sample), workers=self.workers)
+        if not sample:
+            return estimate
+        estimate.estimated_records = round(
+            size / (sum(len(line) for line in sample) / len(sample))
+        )
+        scale = estimate.estimated_records / len(sample)
+
+        loads = json.loads
+        validate = self.validator.validate if self.validator is not None else None
+        start = time.perf_counter()
+        for line in sample:
+            record, _ = migrate_payload(line, loads, self.migration.apply, validate)
+            if record is not None:
+                encode_ndjson(record)
+        estimate.seconds_per_record = (time.perf_counter() - start) / len(sample)
+        estimate.estimated_seconds = (
+            estimate.seconds_per_record * estimate.estimated_records / self.workers
+        )
+
+        for category, changes in self._categories().items():
+            impact = estimate.impact[category] = ImpactEstimate(changes=len(changes))
+            partial = RecordMigration(
+                changes, self.migration.defaults, self.migration.enum_maps
+            )
+            seconds = 0.0
+            for line in sample:
+                try:
+                    original, record = loads(line), loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(record, dict):
+                    continue
+                start = time.perf_counter()
+                try:
+                    migrated = partial.apply(record)
+                except RecordMigrationError:
+                    migrated = None
+                seconds += time.perf_counter() - start
+                if migrated is None:
+                    impact.sampled_rejected += 1
+                elif migrated != original:
+                    impact.sampled_affected += 1
+            impact.estimated_affected = round(impact.sampled_affected * scale)
+            impact.estimated_rejected = round(impact.sampled_rejected * scale)
+            impact.estimated_seconds = seconds * scale / self.workers
+        return estimate
+
+    def _categories(self) -> Dict[str, List[MetamodelChange]]:
+        """Group the migration's changes by MigrationPlanner impact category."""
+        categories: Dict[str, List[MetamodelChange]] = {}
+        for change in self.migration.changes:
+            plan = self.planner.generate_migration_plan([change])
+            for category, steps in plan.items():
+                categories.setdefault(category, [])
+                if steps:
+                    categories[category].append(change)
+        return {
+            category: changes for category, changes in categories.items() if changes
+        }
+
+    def _sample_lines(self, f: IO[bytes], size: int, sample_size: int) -> List[bytes]:
+        """Read up to sample_size non-blank lines starting at evenly spaced offsets."""
+        sample: List[bytes] = []
+        seen = set()
+        for i in range(sample_size):
+            offset = size * i // sample_size
+            f.seek(offset)
+            if offset:
+                # Skip the rest of the line the offset falls into
+                f.readline()
+            position = f.tell()
+            line = f.readline()
+            if position in seen or not line.strip():
+                continue
+            seen.add(position)
+            sample.append(line)
+        return sample
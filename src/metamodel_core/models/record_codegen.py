@@ -0,0 +1,291 @@
+"""
+Specialized record validators generated as Python source per metamodel version.
+
+``generate_validator_source`` turns a metamodel into a module with one
+straight-line function per group: required checks, ``isinstance`` checks and
+enum lookups are written out for each attribute, so checking a record runs
+no loops over the metamodel and no table lookups. The source is compiled
+once per metamodel content hash and the bytecode can be cached on disk, so
+later processes skip code generation and compilation.
+"""
+
+import importlib.util
+import marshal
+import os
+import threading
+from types import CodeType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .metamodel import AttributeType, Metamodel
+from .records import RecordError, RecordValidator, _is_datetime
+
+# Part of every cache key; bump whenever the generated source changes
+CODEGEN_VERSION = 2
+
+# Expressions that are true when ``v`` does NOT have the attribute type
+_TYPE_MISMATCH: Dict[AttributeType, str] = {
+    AttributeType.STRING: "v.__class__ is not str and not isinstance(v, str)",
+    AttributeType.BOOLEAN: "v.__class__ is not bool",
+    AttributeType.INTEGER: (
+        "v.__class__ is not int"
+        " and (v.__class__ is bool or not isinstance(v, int))"
+    ),
+    AttributeType.NUMBER: (
+        "v.__class__ is not float and v.__class__ is not int"
+        " and (v.__class__ is bool or not isinstance(v, (int, float)))"
+    ),
+    AttributeType.ARRAY: "not isinstance(v, list)",
+    AttributeType.OBJECT: "not isinstance(v, dict)",
+    AttributeType.DATETIME: "not _is_datetime(v)",
+}
+
+_code_cache: Dict[str, CodeType] = {}
+_lock = threading.Lock()
+
+
+def generate_validator_source(metamodel: Metamodel, allow_unknown: bool = False) -> str:
+    """
+    Generate the source of a module checking records against a metamodel.
+
+    The module defines ``is_valid(record) -> bool``, which accepts exactly
+    the records ``RecordValidator`` accepts, and one ``_group_<n>`` function
+    per group.
+
+    Args:
+        metamodel: The metamodel records must conform to
+        allow_unknown: Whether groups and attributes not defined in the
+            metamodel are accepted
+
+    Returns:
+        The Python source
+    """
+    lines = [
+        f'"""Record checks of metamodel {metamodel.name!r} '
+        f'version {metamodel.version!r}."""',
+        "",
+        f"_GROUPS = frozenset({tuple(group.name for group in metamodel.groups)!r})",
+    ]
+    functions: List[str] = []
+    body = [
+        "",
+        "",
+        "def is_valid(record):",
+        "    if not isinstance(record, dict):",
+        "        return False",
+    ]
+    if not allow_unknown:
+        body += [
+            "    if not _GROUPS.issuperset(record):",
+            "        return False",
+        ]
+
+    for index, group in enumerate(metamodel.groups):
+        name = f"_group_{index}"
+        required = any(attr.required for attr in group.attributes)
+        body += [
+            f"    values = record.get({group.name!r})",
+            "    if values is None:",
+            "        " + ("return False" if required else "pass"),
+            f"    elif not {name}(values):",
+            "        return False",
+        ]
+
+        lines.append(
+            f"_ATTRIBUTES_{index} = "
+            f"frozenset({tuple(attr.name for attr in group.attributes)!r})"
+        )
+        function = [
+            "",
+            "",
+            f"def {name}(values):",
+            f"    # Group {group.name!r}",
+            "    if not isinstance(values, dict):",
+            "        return False",
+        ]
+        if not allow_unknown:
+            function += [
+                f"    if not _ATTRIBUTES_{index}.issuperset(values):",
+                "        return False",
+            ]
+        for attr_index, attr in enumerate(group.attributes):
+            mismatch = _TYPE_MISMATCH[AttributeType(attr.type)]
+            if attr.enum:
+                enum_name = f"_ENUM_{index}_{attr_index}"
+                lines.append(f"{enum_name} = frozenset({tuple(attr.enum)!r})")
+                # Enum values are strings, so other values never match (and may be
+                # unhashable)
+                guard = (
+                    ""
+                    if attr.type == AttributeType.STRING
+                    else "not isinstance(v, str) or "
+                )
+                mismatch = f"{mismatch} or {guard}v not in {enum_name}"
+            function.append(f"    v = values.get({attr.name!r})")
+            if attr.required:
+                function += [
+                    "    if v is None:",
+                    "        return False",
+                    f"    if {mismatch}:",
+                    "        return False",
+                ]
+            else:
+                function += [
+                    f"    if v is not None and ({mismatch}):",
+                    "        return False",
+                ]
+        function.append("    return True")
+        functions.extend(function)
+
+    body.append("    return True")
+    return "\n".join(lines + functions + body) + "\n"
+
+
+def _cache_key(metamodel: Metamodel, allow_unknown: bool) -> str:
+    # The bytecode format depends on the interpreter version
+    magic = importlib.util.MAGIC_NUMBER.hex()
+    return f"{metamodel.content_hash()}-{int(allow_unknown)}-{CODEGEN_VERSION}-{magic}"
+
+
+def compile_validator(
+    metamodel: Metamodel, allow_unknown: bool = False, cache_dir: Optional[str] = None
+) -> Callable[[Any], bool]:
+    """
+    Return the generated ``is_valid`` function of a metamodel.
+
+    Code objects are kept for the whole process, and written to
+    ``cache_dir`` if given, keyed by the metamodel's content hash, the
+    options, CODEGEN_VERSION and the interpreter's bytecode version.
+
+    Args:
+        metamodel: The metamodel records must conform to
+        allow_unknown: Whether undefined groups and attributes are accepted
+        cache_dir: Directory for cached bytecode (no disk cache if None)
+
+    Returns:
+        Function returning whether a record is valid
+    """
+    key = _cache_key(metamodel, allow_unknown)
+    code = _code_cache.get(key)
+    path = (
+        os.path.join(cache_dir, f"validator-{key}.bin")
+        if cache_dir is not None
+        else None
+    )
+
+    stored = False
+    if path is not None:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            if code is None:
+                code = marshal.loads(data)
+            stored = True
+        except (OSError, EOFError, ValueError, TypeError):
+            # A missing, truncated or foreign file is regenerated
+            pass
+
+    if code is None:
+        source = generate_validator_source(metamodel, allow_unknown)
+        code = compile(
+            source, f"<record validator {metamodel.name} {metamodel.version}>", "exec"
+        )
+    if path is not None and not stored:
+        # Imported here, because the schema package depends on this one
+        from metamodel_core.schema.cache import write_if_changed
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_if_changed(path, marshal.dumps(code))
+
+    with _lock:
+        _code_cache[key] = code
+    namespace: Dict[str, Any] = {"_is_datetime": _is_datetime}
+    exec(code, namespace)
+    is_valid: Callable[[Any], bool] = namespace["is_valid"]
+    return is_valid
+
+
+class CompiledRecordValidator:
+    """
+    Validates metadata records with code generated for the metamodel.
+
+    Has the same interface and results as ``RecordValidator``. Records are
+    first checked by the generated straight-line ``is_valid`` function;
+    only records it rejects go through ``RecordValidator`` to produce the
+    detailed error list, so valid records, the common case, never touch
+    the generic validation loop.
+    """
+
+    def __init__(
+        self,
+        metamodel: Metamodel,
+        allow_unknown: bool = False,
+        cache_dir: Optional[str] = None,
+    ):
+        """
+        Generate, or load from the cache, the checks of a metamodel.
+
+        Args:
+            metamodel: The metamodel records must conform to
+            allow_unknown: Whether groups and attributes not defined in the
+                metamodel are accepted instead of reported as errors
+            cache_dir: Directory for cached bytecode (no disk cache if None)
+        """
+        self.metamodel = metamodel
+        self.allow_unknown = allow_unknown
+        self.cache_dir = cache_dir
+        self._is_valid = compile_validator(metamodel, allow_unknown, cache_dir)
+        self._reporter: Optional[RecordValidator] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Generated functions cannot be pickled; worker processes rebuild them
+        # from the cache
+        return {
+            "metamodel": self.metamodel,
+            "allow_unknown": self.allow_unknown,
+            "cache_dir": self.cache_dir,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        CompiledRecordValidator.__init__(
+            self, state["metamodel"], state["allow_unknown"], state["cache_dir"]
+        )
+
+    def is_valid(self, record: Any) -> bool:
+        """Return whether a record is valid, without building error details."""
+        return self._is_valid(record)
+
+    def validate(self, record: Any) -> Tuple[bool, List[RecordError]]:
+        """
+        Validate a single metadata record.
+
+        Args:
+            record: The record to validate, keyed by group name
+
+        Returns:
+            Tuple of (is_valid, list_of_record_errors)
+        """
+        if self._is_valid(record):
+            return True, []
+        return self._report(record)
+
+    def _report(self, record: Any) -> Tuple[bool, List[RecordError]]:
+        if self._reporter is None:
+            self._reporter = RecordValidator(self.metamodel, self.allow_unknown)
+        return self._reporter.validate(record)
+
+    def validate_many(
+        self, records: Iterable[Any]
+    ) -> Iterator[Tuple[int, List[RecordError]]]:
+        """
+        Validate a sequence of records, yielding only the invalid ones.
+
+        Args:
+            records: The records to validate
+
+        Yields:
+            Tuple of (record_index, list_of_record_errors) for each invalid record
+        """
+        is_valid = self._is_valid
+        for index, record in enumerate(records):
+            if not is_valid(record):
+                yield index, self._report(record)[1]
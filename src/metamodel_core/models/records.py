@@ -0,0 +1,302 @@
+"""
+Validation of metadata records against a compiled metamodel.
+
+A metadata record is a dictionary keyed by group name, where each group maps
+attribute names to values, e.g.::
+
+    {"Access": {"Access Roles": "analyst", "Access Enabled": True}, ...}
+
+``RecordValidator`` compiles a ``Metamodel`` once into a flat plan of required
+field sets, type checks and enum lookup sets, so validating a record never
+walks the pydantic model tree.
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from pydantic import BaseModel
+
+from .metamodel import AttributeType, Metamodel
+
+
+class RecordErrorCode(str, Enum):
+    """Kinds of problems found in a metadata record."""
+
+    INVALID_JSON = "invalid_json"
+    NOT_AN_OBJECT = "not_an_object"
+    UNKNOWN_GROUP = "unknown_group"
+    UNKNOWN_ATTRIBUTE = "unknown_attribute"
+    MISSING_REQUIRED = "missing_required"
+    INVALID_TYPE = "invalid_type"
+    INVALID_ENUM = "invalid_enum"
+    MIGRATION_FAILED = "migration_failed"
+
+
+class RecordError(BaseModel):
+    """A single validation error found in a metadata record."""
+
+    path: str  # E.g., "group_name/attribute_name" or "group_name"
+    code: RecordErrorCode
+    message: str
+
+
+def _is_string(value: Any) -> bool:
+    return isinstance(value, str)
+
+
+def _is_boolean(value: Any) -> bool:
+    return isinstance(value, bool)
+
+
+def _is_integer(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_array(value: Any) -> bool:
+    return isinstance(value, list)
+
+
+def _is_object(value: Any) -> bool:
+    return isinstance(value, dict)
+
+
+def parse_datetime(value: str) -> datetime:
+    """
+    Parse an ISO 8601 datetime string, accepting a trailing "Z" for UTC.
+
+    Raises:
+        ValueError: If the string is not a valid ISO 8601 datetime
+    """
+    # datetime.fromisoformat only accepts a trailing "Z" from Python 3.11
+    if value.endswith(("Z", "z")):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def _is_datetime(value: Any) -> bool:
+    if isinstance(value, datetime):
+        return True
+    if not isinstance(value, str):
+        return False
+    try:
+        parse_datetime(value)
+    except ValueError:
+        return False
+    return True
+
+
+TYPE_CHECKS: Dict[AttributeType, Callable[[Any], bool]] = {
+    AttributeType.STRING: _is_string,
+    AttributeType.BOOLEAN: _is_boolean,
+    AttributeType.INTEGER: _is_integer,
+    AttributeType.NUMBER: _is_number,
+    AttributeType.ARRAY: _is_array,
+    AttributeType.OBJECT: _is_object,
+    AttributeType.DATETIME: _is_datetime,
+}
+
+# (type check, attribute type, enum lookup set or None)
+_FieldPlan = Tuple[Callable[[Any], bool], AttributeType, Optional[FrozenSet[str]]]
+# (required attribute names, field plans by attribute name)
+_GroupPlan = Tuple[Tuple[str, ...], Dict[str, _FieldPlan]]
+
+
+def compile_plan(metamodel: Metamodel) -> Dict[str, _GroupPlan]:
+    """
+    Compile a metamodel into a flat validation plan.
+
+    Args:
+        metamodel: The metamodel to compile
+
+    Returns:
+        Dictionary mapping group names to (required_names, field_plans)
+    """
+    plan: Dict[str, _GroupPlan] = {}
+    for group in metamodel.groups:
+        required = tuple(attr.name for attr in group.attributes if attr.required)
+        fields: Dict[str, _FieldPlan] = {}
+        for attr in group.attributes:
+            attr_type = AttributeType(attr.type)
+            enum_values = frozenset(attr.enum) if attr.enum else None
+            fields[attr.name] = (TYPE_CHECKS[attr_type], attr_type, enum_values)
+        plan[group.name] = (required, fields)
+    return plan
+
+
+class RecordValidator:
+    """Validates metadata records against a compiled metamodel."""
+
+    def __init__(self, metamodel: Metamodel, allow_unknown: bool = False):
+        """
+        Compile the metamodel into a validation plan.
+
+        Args:
+            metamodel: The metamodel records must conform to
+            allow_unknown: Whether groups and attributes not defined in the
+                metamodel are accepted instead of reported as errors
+        """
+        self.metamodel = metamodel
+        self.allow_unknown = allow_unknown
+        self._plan = compile_plan(metamodel)
+
+    def validate(self, record: Any) -> Tuple[bool, List[RecordError]]:
+        """
+        Validate a single metadata record.
+
+        Args:
+            record: The record to validate, keyed by group name
+
+        Returns:
+            Tuple of (is_valid, list_of_record_errors)
+        """
+        errors: List[RecordError] = []
+
+        if not isinstance(record, dict):
+            errors.append(
+                RecordError(
+                    path="",
+                    code=RecordErrorCode.NOT_AN_OBJECT,
+                    message="Record must be an object keyed by group name",
+                )
+            )
+            return False, errors
+
+        for group_name, (required, fields) in self._plan.items():
+            values = record.get(group_name)
+
+            if values is None:
+                for attr_name in required:
+                    errors.append(
+                        RecordError(
+                            path=f"{group_name}/{attr_name}",
+                            code=RecordErrorCode.MISSING_REQUIRED,
+                            message=(
+                                f"Attribute '{attr_name}' in group '{group_name}' "
+                                "is required"
+                            ),
+                        )
+                    )
+                continue
+
+            if not isinstance(values, dict):
+                errors.append(
+                    RecordError(
+                        path=group_name,
+                        code=RecordErrorCode.NOT_AN_OBJECT,
+                        message=(
+                            f"Group '{group_name}' must be an object "
+                            "keyed by attribute name"
+                        ),
+                    )
+                )
+                continue
+
+            # Check that required attributes are present and not null
+            for attr_name in required:
+                if values.get(attr_name) is None:
+                    errors.append(
+                        RecordError(
+                            path=f"{group_name}/{attr_name}",
+                            code=RecordErrorCode.MISSING_REQUIRED,
+                            message=(
+                                f"Attribute '{attr_name}' in group '{group_name}' "
+                                "is required"
+                            ),
+                        )
+                    )
+
+            # Check the type and allowed values of every supplied attribute
+            for attr_name, value in values.items():
+                field = fields.get(attr_name)
+                if field is None:
+                    if not self.allow_unknown:
+                        errors.append(
+                            RecordError(
+                                path=f"{group_name}/{attr_name}",
+                                code=RecordErrorCode.UNKNOWN_ATTRIBUTE,
+                                message=(
+                                    f"Attribute '{attr_name}' is not defined "
+                                    f"in group '{group_name}'"
+                                ),
+                            )
+                        )
+                    continue
+                if value is None:
+                    continue
+
+                check, attr_type, enum_values = field
+                if not check(value):
+                    errors.append(
+                        RecordError(
+                            path=f"{group_name}/{attr_name}",
+                            code=RecordErrorCode.INVALID_TYPE,
+                            message=(
+                                f"Attribute '{attr_name}' in group '{group_name}' "
+                                "must be of type "
+                                f"'{attr_type.value}', got '{type(value).__name__}'"
+                            ),
+                        )
+                    )
+                # Enum values are strings; arrays and objects never match, and are
+                # unhashable
+                elif enum_values is not None and (
+                    not isinstance(value, str) or value not in enum_values
+                ):
+                    errors.append(
+                        RecordError(
+                            path=f"{group_name}/{attr_name}",
+                            code=RecordErrorCode.INVALID_ENUM,
+                            message=(
+                                f"Value {value!r} is not allowed for attribute "
+                                f"'{attr_name}' in group '{group_name}'"
+                            ),
+                        )
+                    )
+
+        if not self.allow_unknown:
+            for group_name in record:
+                if group_name not in self._plan:
+                    errors.append(
+                        RecordError(
+                            path=group_name,
+                            code=RecordErrorCode.UNKNOWN_GROUP,
+                            message=(
+                                f"Group '{group_name}' is not defined in the metamodel"
+                            ),
+                        )
+                    )
+
+        return len(errors) == 0, errors
+
+    def validate_many(
+        self, records: Iterable[Any]
+    ) -> Iterator[Tuple[int, List[RecordError]]]:
+        """
+        Validate a sequence of records, yielding only the invalid ones.
+
+        Args:
+            records: The records to validate
+
+        Yields:
+            Tuple of (record_index, list_of_record_errors) for each invalid record
+        """
+        validate = self.validate
+        for index, record in enumerate(records):
+            is_valid, errors = validate(record)
+            if not is_valid:
+                yield index, errors
@@ -0,0 +1,114 @@
+"""
+Similarity indexing used to pair removed and added metamodel attributes.
+
+Attributes are reduced to token sets, MinHash signatures approximate the
+Jaccard similarity of those sets, and locality-sensitive hashing (LSH) over
+signature bands finds likely matches without comparing every pair.
+"""
+
+import re
+import zlib
+from typing import Dict, Hashable, Iterable, List, Set, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Large prime for the universal hash family used by MinHash
+_PRIME = (1 << 61) - 1
+
+
+def tokenize(*texts: str) -> Set[str]:
+    """
+    Split texts into lowercase word tokens and adjacent word pairs.
+
+    Args:
+        texts: The texts to tokenize
+
+    Returns:
+        Set of word unigrams and bigrams
+    """
+    tokens: Set[str] = set()
+    for text in texts:
+        words = _TOKEN_RE.findall(text.lower())
+        tokens.update(words)
+        tokens.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+    return tokens
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    """Return the Jaccard similarity of two sets."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class MinHashIndex:
+    """An LSH index of MinHash signatures for finding similar token sets."""
+
+    def __init__(self, bands: int = 16, rows: int = 2):
+        """
+        Initialize the index.
+
+        With ``b`` bands of ``r`` rows, two sets with Jaccard similarity ``s``
+        become candidates with probability ``1 - (1 - s**r)**b``; the defaults
+        find pairs with ``s >= 0.5`` about 99% of the time.
+
+        Args:
+            bands: Number of signature bands
+            rows: Number of MinHash values per band
+        """
+        self.bands = bands
+        self.rows = rows
+        size = bands * rows
+        # Deterministic hash coefficients, so results do not vary between runs
+        self._coefficients = [
+            (zlib.crc32(f"a{i}".encode()) | 1, zlib.crc32(f"b{i}".encode()))
+            for i in range(size)
+        ]
+        self._buckets: List[Dict[Tuple[int, ...], List[Hashable]]] = [
+            {} for _ in range(bands)
+        ]
+
+    def signature(self, tokens: Iterable[str]) -> List[int]:
+        """
+        Compute the MinHash signature of a token set.
+
+        Args:
+            tokens: The tokens to sign
+
+        Returns:
+            List of ``bands * rows`` minimum hash values
+        """
+        hashes = [zlib.crc32(token.encode("utf-8")) for token in tokens] or [0]
+        return [
+            min((a * h + b) % _PRIME for h in hashes) for a, b in self._coefficients
+        ]
+
+    def _bands(self, signature: List[int]) -> Iterable[Tuple[int, Tuple[int, ...]]]:
+        for band in range(self.bands):
+            yield band, tuple(signature[band * self.rows : (band + 1) * self.rows])
+
+    def add(self, key: Hashable, tokens: Iterable[str]) -> None:
+        """
+        Add a token set to the index.
+
+        Args:
+            key: Identifier returned by query()
+            tokens: The tokens of the entry
+        """
+        for band, values in self._bands(self.signature(tokens)):
+            self._buckets[band].setdefault(values, []).append(key)
+
+    def query(self, tokens: Iterable[str]) -> Set[Hashable]:
+        """
+        Find the keys of entries likely to be similar to a token set.
+
+        Args:
+            tokens: The tokens to look up
+
+        Returns:
+            Set of candidate keys sharing at least one band with the tokens
+        """
+        candidates: Set[Hashable] = set()
+        for band, values in self._bands(self.signature(tokens)):
+            candidates.update(self._buckets[band].get(values, ()))
+        return candidates
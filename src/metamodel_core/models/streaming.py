@@ -0,0 +1,329 @@
+"""
+Streaming validation of newline-delimited JSON (NDJSON) metadata records.
+
+Records are read one line at a time and each invalid record is written to the
+report as soon as it is found, so memory use does not grow with input size.
+Files can also be split into byte-range chunks validated by a process pool,
+with the per-chunk reports merged back in input order.
+"""
+
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import IO, Any, Deque, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pydantic import BaseModel
+
+from .records import RecordError, RecordErrorCode, RecordValidator
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+
+class ValidationStats(BaseModel):
+    """Summary of a bulk record validation run."""
+
+    records: int = 0
+    invalid_records: int = 0
+    malformed_lines: int = 0
+    seconds: float = 0.0
+    peak_rss_bytes: Optional[int] = None
+
+    @property
+    def records_per_second(self) -> float:
+        """Validation throughput of the run."""
+        return self.records / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> str:
+        """Human-readable one-line summary of the run."""
+        text = (
+            f"Validated {self.records} records ({self.invalid_records} invalid, "
+            f"{self.malformed_lines} malformed) in {self.seconds:.2f}s "
+            f"({self.records_per_second:,.0f} records/s)"
+        )
+        if self.peak_rss_bytes is not None:
+            text += f", peak RSS {self.peak_rss_bytes / (1024 * 1024):.1f} MiB"
+        return text
+
+
+# Default size of the byte ranges handed to worker processes
+DEFAULT_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+def peak_rss_bytes(include_children: bool = False) -> Optional[int]:
+    """
+    Return the peak resident set size of the current process.
+
+    Args:
+        include_children: Whether to report the larger of this process and
+            its largest terminated child process
+
+    Returns:
+        Peak RSS in bytes, or None where the platform does not report it
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if include_children:
+        peak = max(peak, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+# JSON's whitespace. Lines holding other characters str.strip() removes,
+# such as U+2028 or form feeds, are malformed rather than blank.
+_JSON_WHITESPACE = " \t\r\n"
+_JSON_WHITESPACE_BYTES = _JSON_WHITESPACE.encode("ascii")
+
+
+def _parse_line(line: Union[str, bytes]) -> Tuple[bool, Any, Optional[str]]:
+    """
+    Parse one NDJSON line the same way in the sequential and parallel paths.
+
+    Returns:
+        Tuple of (is_blank, record, parse_error)
+    """
+    if isinstance(line, bytes):
+        is_blank = not line.strip(_JSON_WHITESPACE_BYTES)
+    else:
+        is_blank = not line.strip(_JSON_WHITESPACE)
+    if is_blank:
+        return True, None, None
+    try:
+        return False, json.loads(line), None
+    except ValueError as e:  # Includes UnicodeDecodeError for lines that are not UTF-8
+        return False, None, str(e)
+
+
+def iter_ndjson(
+    stream: Union[IO[str], IO[bytes]],
+) -> Iterator[Tuple[int, Any, Optional[str]]]:
+    """
+    Parse an NDJSON stream one line at a time.
+
+    Blank lines are skipped but still counted, so line numbers match the input.
+    Binary streams are split at "\n" only and a line that is not valid UTF-8
+    is reported as malformed, as in validate_ndjson_parallel. Text streams
+    are split and decoded by the stream, so a file opened in text mode with
+    the default ``newline=None`` also breaks lines at "\r", and fails to
+    read input that is not valid in its encoding.
+
+    Args:
+        stream: Binary or text stream to read from
+
+    Yields:
+        Tuple of (line_number, record, parse_error); record is None when the
+        line is not valid JSON and parse_error describes the problem
+    """
+    lines: Iterable[Union[str, bytes]] = stream
+    for line_number, line in enumerate(lines, 1):
+        is_blank, record, parse_error = _parse_line(line)
+        if not is_blank:
+            yield line_number, record, parse_error
+
+
+def format_report_line(line_number: int, errors: List[RecordError]) -> str:
+    """
+    Render the errors of one record as an NDJSON report line.
+
+    Args:
+        line_number: 1-based line number of the record in the input
+        errors: The errors found in the record
+
+    Returns:
+        The report line, including the trailing newline
+    """
+    return _report_line(line_number, _encode_errors(errors))
+
+
+def _encode_errors(errors: List[RecordError]) -> str:
+    return json.dumps([error.model_dump(mode="json") for error in errors])
+
+
+def _report_line(line_number: int, encoded_errors: str) -> str:
+    # Matches json.dumps({"line": ..., "errors": ...}) byte for byte
+    return f'{{"line": {line_number}, "errors": {encoded_errors}}}\n'
+
+
+def _malformed_errors(parse_error: str) -> List[RecordError]:
+    return [
+        RecordError(
+            path="",
+            code=RecordErrorCode.INVALID_JSON,
+            message=f"Invalid JSON: {parse_error}",
+        )
+    ]
+
+
+def validate_ndjson(
+    input_stream: Union[IO[str], IO[bytes]],
+    report_stream: IO[str],
+    validator: RecordValidator,
+) -> ValidationStats:
+    """
+    Validate every record of an NDJSON stream and write an NDJSON error report.
+
+    Each report line has the form ``{"line": n, "errors": [...]}`` and is only
+    written for records that failed validation or could not be parsed. For a
+    file opened in binary mode, the report is the one validate_ndjson_parallel
+    produces (see iter_ndjson for text streams).
+
+    Args:
+        input_stream: Binary or text stream of newline-delimited JSON records
+        report_stream: Text stream the error report is written to
+        validator: The compiled validator to check records with
+
+    Returns:
+        Statistics about the run
+    """
+    stats = ValidationStats()
+    start = time.perf_counter()
+    validate = validator.validate
+    write = report_stream.write
+
+    for line_number, record, parse_error in iter_ndjson(input_stream):
+        stats.records += 1
+        if parse_error is not None:
+            stats.malformed_lines += 1
+            write(format_report_line(line_number, _malformed_errors(parse_error)))
+            continue
+        is_valid, errors = validate(record)
+        if not is_valid:
+            stats.invalid_records += 1
+            write(format_report_line(line_number, errors))
+
+    stats.seconds = time.perf_counter() - start
+    stats.peak_rss_bytes = peak_rss_bytes()
+    return stats
+
+
+# Validator of the current worker process, installed once by _init_worker
+_worker_validator: Optional[RecordValidator] = None
+
+# (lines, records, invalid_records, malformed_lines, [(line, encoded_errors)])
+_ChunkResult = Tuple[int, int, int, int, List[Tuple[int, str]]]
+
+
+def _init_worker(validator: RecordValidator) -> None:
+    global _worker_validator
+    _worker_validator = validator
+
+
+def _validate_chunk(path: str, start: int, end: int) -> _ChunkResult:
+    """Validate the lines in a byte range of an NDJSON file."""
+    if _worker_validator is None:
+        raise RuntimeError("The worker process was not initialized")
+    validate = _worker_validator.validate
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    lines = data.split(b"\n")
+    if lines and not lines[-1]:
+        lines.pop()
+
+    records = invalid = malformed = 0
+    reports: List[Tuple[int, str]] = []
+    for local_number, line in enumerate(lines, 1):
+        is_blank, record, parse_error = _parse_line(line)
+        if is_blank:
+            continue
+        records += 1
+        if parse_error is not None:
+            malformed += 1
+            reports.append(
+                (local_number, _encode_errors(_malformed_errors(parse_error)))
+            )
+            continue
+        is_valid, errors = validate(record)
+        if not is_valid:
+            invalid += 1
+            reports.append((local_number, _encode_errors(errors)))
+    return len(lines), records, invalid, malformed, reports
+
+
+def chunk_offsets(
+    path: str, chunk_bytes: int = DEFAULT_CHUNK_BYTES
+) -> List[Tuple[int, int]]:
+    """
+    Split a file into byte ranges that start and end on line boundaries.
+
+    Args:
+        path: Path to the file to split
+        chunk_bytes: Approximate size of each range
+
+    Returns:
+        List of (start, end) byte offsets covering the whole file in order
+    """
+    size = os.path.getsize(path)
+    boundaries = [0]
+    with open(path, "rb") as f:
+        while boundaries[-1] < size:
+            f.seek(boundaries[-1] + chunk_bytes)
+            f.readline()
+            boundaries.append(min(f.tell(), size))
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def validate_ndjson_parallel(
+    path: str,
+    report_stream: IO[str],
+    validator: RecordValidator,
+    workers: Optional[int] = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> ValidationStats:
+    """
+    Validate an NDJSON file with a pool of worker processes.
+
+    The compiled validator is sent to each worker once when the pool starts;
+    workers then read their own byte ranges of the file. Chunk reports are
+    written in input order and produce the same report as validate_ndjson.
+
+    Args:
+        path: Path to the NDJSON records file
+        report_stream: Text stream the error report is written to
+        validator: The compiled validator to check records with
+        workers: Number of worker processes (defaults to the CPU count)
+        chunk_bytes: Approximate size of the byte range given to each task
+
+    Returns:
+        Statistics about the run
+    """
+    workers = workers or os.cpu_count() or 1
+    stats = ValidationStats()
+    start = time.perf_counter()
+    write = report_stream.write
+    line_offset = 0
+
+    def merge(result: _ChunkResult) -> None:
+        nonlocal line_offset
+        lines, records, invalid, malformed, reports = result
+        for local_number, encoded_errors in reports:
+            write(_report_line(line_offset + local_number, encoded_errors))
+        line_offset += lines
+        stats.records += records
+        stats.invalid_records += invalid
+        stats.malformed_lines += malformed
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(validator,)
+    ) as executor:
+        # Bound the number of chunks in flight so memory stays flat
+        pending: Deque[Future] = deque()
+        for chunk_start, chunk_end in chunk_offsets(path, chunk_bytes):
+            if len(pending) >= workers * 2:
+                merge(pending.popleft().result())
+            pending.append(
+                executor.submit(_validate_chunk, path, chunk_start, chunk_end)
+            )
+        while pending:
+            merge(pending.popleft().result())
+
+    stats.seconds = time.perf_counter() - start
+    stats.peak_rss_bytes = peak_rss_bytes(include_children=True)
+    return stats
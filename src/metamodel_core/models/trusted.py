@@ -0,0 +1,311 @@
+"""
+Construction of metamodels and changes from trusted data without validation.
+
+Data read back from our own registry or history files was validated when it
+was written. Loading thousands of such versions through the pydantic
+validators is dominated by the Python-level field validators, so these
+loaders build the model instances directly and replace the per-field
+validators with a single structural check of the whole document, plus an
+optional SHA-256 digest of the file content to detect tampering or
+corruption.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Literal, Optional, Type, TypeVar, overload
+
+from pydantic import BaseModel
+
+from .metamodel import (
+    _VERSION_RE,
+    AttributeType,
+    ChangeType,
+    FrozenMetamodel,
+    FrozenMetamodelAttribute,
+    FrozenMetamodelGroup,
+    Metamodel,
+    MetamodelAttribute,
+    MetamodelChange,
+    MetamodelGroup,
+    _FrozenList,
+    _TrackedList,
+)
+
+M = TypeVar("M", bound=BaseModel)
+
+# Maximum number of problems listed in the error of a malformed document
+MAX_REPORTED_PROBLEMS = 10
+
+# Keyed by value and by member, as model_dump() without mode="json" keeps the members
+_ATTRIBUTE_TYPES = {
+    key: attr_type
+    for attr_type in AttributeType
+    for key in (attr_type.value, attr_type)
+}
+_CHANGE_TYPES = {
+    key: change_type
+    for change_type in ChangeType
+    for key in (change_type.value, change_type)
+}
+_private_defaults: Dict[type, Optional[Dict[str, Any]]] = {}
+_object_setattr = object.__setattr__
+
+
+def construct(cls: Type[M], fields: Dict[str, Any]) -> M:
+    """
+    Create a model instance from field values that are known to be valid.
+
+    Unlike ``model_construct``, which applies defaults and tracks the set
+    fields in Python and is slower than validation for these small models,
+    this sets the instance state directly. ``fields`` must hold every field
+    of the model, with values of the declared types. The state set here is
+    pydantic 2's; tests/test_trusted.py compares it with the state of
+    validated instances, so a pydantic release that changes it fails them.
+
+    Args:
+        cls: The model class
+        fields: Value of every field, taken over as the instance's ``__dict__``
+
+    Returns:
+        The instance
+    """
+    private = _private_defaults.get(cls, ...)
+    if private is ...:
+        private = _private_defaults[cls] = {
+            name: attr.get_default()
+            for name, attr in cls.__private_attributes__.items()
+        } or None
+    instance = cls.__new__(cls)
+    _object_setattr(instance, "__dict__", fields)
+    _object_setattr(instance, "__pydantic_fields_set__", set(fields))
+    _object_setattr(instance, "__pydantic_extra__", None)
+    _object_setattr(
+        instance, "__pydantic_private__", None if private is None else dict(private)
+    )
+    return instance
+
+
+def _is_text(value: Any) -> bool:
+    return type(value) is str and bool(value)
+
+
+def check_metamodel_data(data: Any) -> List[str]:
+    """
+    Check that a metamodel dictionary has the structure the models require.
+
+    This is the integrity check of the trusted loaders: it checks the types
+    of all fields in one pass, but not the rules that only matter when data
+    is created (such as name lengths), which were checked when it was stored.
+
+    Args:
+        data: The metamodel, as parsed from JSON
+
+    Returns:
+        List of problems, empty if the data can be constructed
+    """
+    problems = []
+    if not isinstance(data, dict):
+        return ["metamodel is not an object"]
+    for key in ("name", "description"):
+        if not _is_text(data.get(key)):
+            problems.append(f"metamodel {key} is not a non-empty string")
+    version = data.get("version")
+    if type(version) is not str or not _VERSION_RE.match(version):
+        problems.append(f"metamodel version {version!r} is not a semantic version")
+    groups = data.get("groups")
+    if not isinstance(groups, list) or not groups:
+        problems.append("metamodel has no list of groups")
+        return problems
+
+    for g, group in enumerate(groups):
+        if (
+            not isinstance(group, dict)
+            or not _is_text(group.get("name"))
+            or not _is_text(group.get("description"))
+        ):
+            problems.append(f"group {g} has no name or description")
+            continue
+        attributes = group.get("attributes")
+        if not isinstance(attributes, list) or not attributes:
+            problems.append(f"group '{group['name']}' has no list of attributes")
+            continue
+        for a, attr in enumerate(attributes):
+            if (
+                not isinstance(attr, dict)
+                or not _is_text(attr.get("name"))
+                or not _is_text(attr.get("description"))
+                or attr.get("type") not in _ATTRIBUTE_TYPES
+                or type(attr.get("required")) is not bool
+            ):
+                problems.append(
+                    f"attribute {a} of group '{group['name']}' is malformed"
+                )
+                continue
+            enum = attr.get("enum")
+            if enum is not None and (
+                type(enum) is not list or not all(type(value) is str for value in enum)
+            ):
+                problems.append(
+                    f"enum of attribute '{group['name']}/{attr['name']}' "
+                    "is not a list of strings"
+                )
+    return problems
+
+
+@overload
+def construct_metamodel(
+    data: Dict[str, Any], frozen: Literal[True] = True
+) -> FrozenMetamodel: ...
+
+
+@overload
+def construct_metamodel(data: Dict[str, Any], frozen: bool) -> Metamodel: ...
+
+
+def construct_metamodel(data: Dict[str, Any], frozen: bool = True) -> Metamodel:
+    """
+    Build a metamodel from trusted data, skipping the field validators.
+
+    Args:
+        data: The metamodel, as parsed from JSON
+        frozen: Build a FrozenMetamodel (shareable) rather than an editable Metamodel
+
+    Returns:
+        The metamodel, equal to ``Metamodel.from_dict(data)`` (frozen if requested)
+
+    Raises:
+        ValueError: If the data does not have the structure of a metamodel
+    """
+    problems = check_metamodel_data(data)
+    if problems:
+        listed = "; ".join(problems[:MAX_REPORTED_PROBLEMS])
+        more = len(problems) - MAX_REPORTED_PROBLEMS
+        raise ValueError(
+            f"Malformed metamodel data: {listed}"
+            + (f" (and {more} more)" if more > 0 else "")
+        )
+
+    model_cls: Type[Metamodel]
+    group_cls: Type[MetamodelGroup]
+    attr_cls: Type[MetamodelAttribute]
+    list_cls: Type[list]
+    if frozen:
+        model_cls, group_cls, attr_cls, list_cls = (
+            FrozenMetamodel,
+            FrozenMetamodelGroup,
+            FrozenMetamodelAttribute,
+            _FrozenList,
+        )
+    else:
+        model_cls, group_cls, attr_cls, list_cls = (
+            Metamodel,
+            MetamodelGroup,
+            MetamodelAttribute,
+            _TrackedList,
+        )
+
+    groups = list_cls(
+        construct(
+            group_cls,
+            {
+                "name": group["name"],
+                "description": group["description"],
+                "attributes": list_cls(
+                    construct(
+                        attr_cls,
+                        {
+                            "name": attr["name"],
+                            "description": attr["description"],
+                            "type": _ATTRIBUTE_TYPES[attr["type"]],
+                            "required": attr["required"],
+                            "enum": (
+                                None
+                                if attr.get("enum") is None
+                                else (
+                                    _FrozenList(attr["enum"])
+                                    if frozen
+                                    else _TrackedList(attr["enum"])
+                                )
+                            ),
+                        },
+                    )
+                    for attr in group["attributes"]
+                ),
+            },
+        )
+        for group in data["groups"]
+    )
+    return construct(
+        model_cls,
+        {
+            "name": data["name"],
+            "version": data["version"],
+            "description": data["description"],
+            "groups": groups,
+        },
+    )
+
+
+def load_trusted_metamodel(
+    file_path: str, sha256: Optional[str] = None, frozen: bool = True
+) -> Metamodel:
+    """
+    Load a metamodel JSON file from a trusted registry.
+
+    Args:
+        file_path: Path to the metamodel JSON file
+        sha256: Expected hex digest of the file content, as recorded by the
+            registry (not checked if None)
+        frozen: Build a FrozenMetamodel rather than an editable Metamodel
+
+    Returns:
+        The metamodel
+
+    Raises:
+        ValueError: If the digest does not match or the data is malformed
+    """
+    with open(file_path, "rb") as f:
+        content = f.read()
+    if sha256 is not None and hashlib.sha256(content).hexdigest() != sha256.lower():
+        raise ValueError(f"Digest of {file_path} does not match the registry")
+    return construct_metamodel(json.loads(content), frozen=frozen)
+
+
+def construct_change(data: Dict[str, Any]) -> MetamodelChange:
+    """
+    Build a change from trusted data, such as ``model_dump(mode="json")`` output.
+
+    Args:
+        data: The change fields; the timestamp may be a datetime or an ISO 8601 string
+
+    Returns:
+        The change
+
+    Raises:
+        ValueError: If the change type, timestamp or paths are invalid
+    """
+    try:
+        timestamp = data["timestamp"]
+        return construct(
+            MetamodelChange,
+            {
+                "change_type": _CHANGE_TYPES[data["change_type"]],
+                "target_path": data["target_path"],
+                "old_value": data.get("old_value"),
+                "new_value": data.get("new_value"),
+                "timestamp": (
+                    timestamp
+                    if isinstance(timestamp, datetime)
+                    else datetime.fromisoformat(timestamp)
+                ),
+                "description": data["description"],
+            },
+        )
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Malformed change data: {e!r}")
+
+
+def construct_changes(items: Iterable[Dict[str, Any]]) -> List[MetamodelChange]:
+    """Build changes from trusted data with construct_change."""
+    return [construct_change(item) for item in items]
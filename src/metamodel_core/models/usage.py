@@ -0,0 +1,431 @@
+"""
+Field-usage index over a corpus of stored metadata records.
+
+The index keeps, per attribute path, how many records populate it, hold
+null in it, which string values occur and the JSON types of the values,
+all broken down by the metamodel version the records were stored under.
+Records are counted as they arrive (and uncounted when they are replaced
+or deleted), so questions such as "how many records break if this
+attribute becomes required" are answered from the counters without
+scanning the corpus.
+"""
+
+import json
+import os
+from typing import IO, Any, Dict, Iterable, List, Optional, Set, Union
+
+from pydantic import BaseModel
+
+from .metamodel import AttributeType, ChangeType, MetamodelChange
+from .streaming import iter_ndjson
+
+# Distinct string values tracked per attribute; rarer values beyond this are not
+MAX_DISTINCT_VALUES = 1000
+
+# Version key of records stored without a metamodel version
+UNVERSIONED = ""
+
+INDEX_FORMAT = 1
+
+_JSON_TYPES = {
+    str: "string",
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    list: "array",
+    dict: "object",
+}
+
+# JSON types of stored values that an attribute type accepts without conversion
+_COMPATIBLE_TYPES: Dict[AttributeType, Set[str]] = {
+    AttributeType.STRING: {"string"},
+    AttributeType.BOOLEAN: {"boolean"},
+    AttributeType.INTEGER: {"integer"},
+    AttributeType.NUMBER: {"integer", "number"},
+    AttributeType.ARRAY: {"array"},
+    AttributeType.OBJECT: {"object"},
+    # Datetimes are stored as strings; unparseable ones are not told apart
+    AttributeType.DATETIME: {"string"},
+}
+
+
+class VersionUsage(BaseModel):
+    """Usage of an attribute by the records of one metamodel version."""
+
+    records: int = 0
+    populated: int = 0
+    null: int = 0
+
+    @property
+    def unpopulated(self) -> int:
+        """Records without a value: attribute or group missing, or null."""
+        return self.records - self.populated
+
+
+class AttributeUsage(BaseModel):
+    """Usage of one attribute across the indexed records."""
+
+    path: str
+    records: int = 0
+    populated: int = 0
+    null: int = 0
+    # String value -> number of records holding it
+    values: Dict[str, int] = {}
+    # Whether more than MAX_DISTINCT_VALUES distinct values occurred
+    values_truncated: bool = False
+    # JSON type name ("string", "integer", ...) -> number of values
+    types: Dict[str, int] = {}
+    versions: Dict[str, VersionUsage] = {}
+
+    @property
+    def unpopulated(self) -> int:
+        """Records without a value: attribute or group missing, or null."""
+        return self.records - self.populated
+
+
+class _Counts:
+    """Mutable counters of one attribute."""
+
+    __slots__ = ("populated", "null", "values", "truncated", "types")
+
+    def __init__(self) -> None:
+        self.populated: Dict[str, int] = {}
+        self.null: Dict[str, int] = {}
+        self.values: Dict[str, int] = {}
+        self.truncated = False
+        self.types: Dict[str, int] = {}
+
+
+def _bump(counts: Dict[str, int], key: str, delta: int) -> None:
+    value = counts.get(key, 0) + delta
+    if value:
+        counts[key] = value
+    else:
+        del counts[key]
+
+
+class FieldUsageIndex:
+    """
+    Counts how the attributes of stored metadata records are used.
+
+    Records are keyed by group name, as validated by ``RecordValidator``.
+    Attributes that are not defined in any metamodel are counted like the
+    others, so the index also shows data that a new attribute would collide
+    with.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self._records: Dict[str, int] = {}
+        self._groups: Dict[str, Dict[str, int]] = {}
+        self._attributes: Dict[str, _Counts] = {}
+        # The same counters by group and attribute name, to count records
+        # without building paths
+        self._group_attributes: Dict[str, Dict[str, _Counts]] = {}
+
+    def _counts(self, path: str) -> _Counts:
+        counts = self._attributes.get(path)
+        if counts is None:
+            counts = self._attributes[path] = _Counts()
+        return counts
+
+    def add(self, record: Dict[str, Any], version: str = UNVERSIONED) -> None:
+        """
+        Count a record.
+
+        Args:
+            record: The record, keyed by group name
+            version: Version of the metamodel the record was stored under
+        """
+        self._count(record, version, 1)
+
+    def remove(self, record: Dict[str, Any], version: str = UNVERSIONED) -> None:
+        """
+        Uncount a record that was added before, e.g. when it is replaced or deleted.
+
+        Args:
+            record: The record as it was added
+            version: The version it was added with
+        """
+        self._count(record, version, -1)
+
+    def add_many(
+        self, records: Iterable[Dict[str, Any]], version: str = UNVERSIONED
+    ) -> int:
+        """Count records of one version and return how many were added."""
+        count = 0
+        for record in records:
+            self._count(record, version, 1)
+            count += 1
+        return count
+
+    def add_ndjson(
+        self, stream: Union[IO[str], IO[bytes]], version: str = UNVERSIONED
+    ) -> int:
+        """
+        Count the records of an NDJSON stream, skipping lines that are not JSON objects.
+
+        Returns:
+            Number of records added
+        """
+        return self.add_many(
+            (
+                record
+                for _, record, _ in iter_ndjson(stream)
+                if isinstance(record, dict)
+            ),
+            version,
+        )
+
+    def _count(self, record: Dict[str, Any], version: str, delta: int) -> None:
+        if not isinstance(record, dict):
+            raise ValueError("Record must be an object")
+        _bump(self._records, version, delta)
+        for group_name, values in record.items():
+            if not isinstance(values, dict):
+                continue
+            _bump(self._groups.setdefault(group_name, {}), version, delta)
+            attributes = self._group_attributes.get(group_name)
+            if attributes is None:
+                attributes = self._group_attributes[group_name] = {}
+            for attr_name, value in values.items():
+                counts = attributes.get(attr_name)
+                if counts is None:
+                    counts = self._counts(f"{group_name}/{attr_name}")
+                    attributes[attr_name] = counts
+                if value is None:
+                    _bump(counts.null, version, delta)
+                    continue
+                _bump(counts.populated, version, delta)
+                _bump(
+                    counts.types,
+                    _JSON_TYPES.get(value.__class__, value.__class__.__name__),
+                    delta,
+                )
+                if value.__class__ is str:
+                    if value in counts.values:
+                        _bump(counts.values, value, delta)
+                    elif delta > 0:
+                        if len(counts.values) < MAX_DISTINCT_VALUES:
+                            counts.values[value] = delta
+                        else:
+                            counts.truncated = True
+
+    def merge(self, other: "FieldUsageIndex") -> None:
+        """Add the counts of another index, e.g. one of another part of the corpus."""
+        for version, count in other._records.items():
+            _bump(self._records, version, count)
+        for group_name, group_records in other._groups.items():
+            records = self._groups.setdefault(group_name, {})
+            for version, count in group_records.items():
+                _bump(records, version, count)
+        for path, counts in other._attributes.items():
+            mine = self._counts(path)
+            for field in ("populated", "null", "types"):
+                target = getattr(mine, field)
+                for key, count in getattr(counts, field).items():
+                    _bump(target, key, count)
+            for value, count in counts.values.items():
+                if value in mine.values or len(mine.values) < MAX_DISTINCT_VALUES:
+                    _bump(mine.values, value, count)
+                else:
+                    mine.truncated = True
+            mine.truncated = mine.truncated or counts.truncated
+
+    @property
+    def versions(self) -> List[str]:
+        """The versions of the indexed records."""
+        return sorted(self._records)
+
+    @property
+    def paths(self) -> List[str]:
+        """The attribute paths that occur in the indexed records."""
+        return sorted(self._attributes)
+
+    def records(self, version: Optional[str] = None) -> int:
+        """Number of indexed records, of one version or of all."""
+        if version is not None:
+            return self._records.get(version, 0)
+        return sum(self._records.values())
+
+    def group_records(self, group_name: str, version: Optional[str] = None) -> int:
+        """Number of records that contain a group."""
+        counts = self._groups.get(group_name, {})
+        return counts.get(version, 0) if version is not None else sum(counts.values())
+
+    def populated(self, path: str, version: Optional[str] = None) -> int:
+        """Number of records with a non-null value for a 'group/attribute' path."""
+        counts = self._attributes.get(path)
+        if counts is None:
+            return 0
+        return (
+            counts.populated.get(version, 0)
+            if version is not None
+            else sum(counts.populated.values())
+        )
+
+    def unpopulated(self, path: str, version: Optional[str] = None) -> int:
+        """
+        Number of records without a value for a path, i.e. that would break
+        if the attribute became required.
+        """
+        return self.records(version) - self.populated(path, version)
+
+    def unpopulated_by_version(self, path: str) -> Dict[str, int]:
+        """Records without a value for a path, per version that has any."""
+        counts = {version: self.unpopulated(path, version) for version in self._records}
+        return {version: count for version, count in sorted(counts.items()) if count}
+
+    def usage(self, path: str) -> AttributeUsage:
+        """Return a snapshot of the counters of a 'group/attribute' path."""
+        usage = AttributeUsage(path=path, records=self.records())
+        counts = self._attributes.get(path)
+        if counts is None:
+            usage.versions = {
+                version: VersionUsage(records=count)
+                for version, count in sorted(self._records.items())
+            }
+            return usage
+        usage.populated = sum(counts.populated.values())
+        usage.null = sum(counts.null.values())
+        usage.values = dict(
+            sorted(counts.values.items(), key=lambda item: (-item[1], item[0]))
+        )
+        usage.values_truncated = counts.truncated
+        usage.types = dict(sorted(counts.types.items()))
+        usage.versions = {
+            version: VersionUsage(
+                records=count,
+                populated=counts.populated.get(version, 0),
+                null=counts.null.get(version, 0),
+            )
+            for version, count in sorted(self._records.items())
+        }
+        return usage
+
+    def affected_records(self, change: MetamodelChange) -> int:
+        """
+        Number of indexed records whose data a change affects.
+
+        That is the records that hold data of a removed, moved or renamed
+        attribute or group, values that a type or enum change makes invalid,
+        or no value for an attribute that becomes required. Where several
+        attributes are involved (a new group with several required
+        attributes, a change of type and enum), only per-attribute counts are
+        known and the largest is returned, which is a lower bound.
+
+        Args:
+            change: The change, e.g. from ``ChangeAnalyzer.detect_changes``
+
+        Returns:
+            The number of affected records
+        """
+        change_type = ChangeType(change.change_type)
+        path = change.target_path
+        # A dict or a bool, depending on the change type
+        new_value: Any = change.new_value
+        if change_type == ChangeType.ADD_GROUP:
+            return max(
+                (
+                    self.unpopulated(f"{path}/{attr['name']}")
+                    for attr in new_value.get("attributes", [])
+                    if attr.get("required")
+                ),
+                default=0,
+            )
+        if change_type == ChangeType.REMOVE_GROUP:
+            return self.group_records(path)
+        if change_type == ChangeType.ADD_ATTRIBUTE:
+            return self.unpopulated(path) if new_value.get("required") else 0
+        if change_type == ChangeType.CHANGE_REQUIREMENT:
+            return self.unpopulated(path) if new_value else 0
+        if change_type in (
+            ChangeType.REMOVE_ATTRIBUTE,
+            ChangeType.MOVE_ATTRIBUTE,
+            ChangeType.RENAME_ATTRIBUTE,
+        ):
+            return self.populated(path)
+        if change_type == ChangeType.MODIFY_ATTRIBUTE:
+            return self._invalidated(path, new_value)
+        return 0
+
+    def _invalidated(self, path: str, new_value: Dict[str, Any]) -> int:
+        """Number of stored values of a path that a new type or enum makes invalid."""
+        counts = self._attributes.get(path)
+        if counts is None:
+            return 0
+        affected = 0
+        if new_value.get("type") is not None:
+            compatible = _COMPATIBLE_TYPES[AttributeType(new_value["type"])]
+            kept = sum(
+                count
+                for type_name, count in counts.types.items()
+                if type_name in compatible
+            )
+            affected = sum(counts.populated.values()) - kept
+        if new_value.get("enum"):
+            allowed = set(new_value["enum"])
+            affected = max(
+                affected,
+                sum(
+                    count
+                    for value, count in counts.values.items()
+                    if value not in allowed
+                ),
+            )
+        return affected
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the index to a JSON-compatible dictionary."""
+        return {
+            "format": INDEX_FORMAT,
+            "records": self._records,
+            "groups": self._groups,
+            "attributes": {
+                path: {
+                    "populated": counts.populated,
+                    "null": counts.null,
+                    "values": counts.values,
+                    "truncated": counts.truncated,
+                    "types": counts.types,
+                }
+                for path, counts in self._attributes.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FieldUsageIndex":
+        """
+        Restore an index serialized with to_dict.
+
+        Raises:
+            ValueError: If the data is of another index format
+        """
+        if data.get("format") != INDEX_FORMAT:
+            raise ValueError(
+                f"Unsupported field usage index format: {data.get('format')!r}"
+            )
+        index = cls()
+        index._records = dict(data["records"])
+        index._groups = {name: dict(counts) for name, counts in data["groups"].items()}
+        for path, item in data["attributes"].items():
+            counts = index._counts(path)
+            counts.populated = dict(item["populated"])
+            counts.null = dict(item["null"])
+            counts.values = dict(item["values"])
+            counts.truncated = item["truncated"]
+            counts.types = dict(item["types"])
+        return index
+
+    def save(self, file_path: str) -> None:
+        """Write the index to a JSON file, replacing it atomically."""
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+        os.replace(temp_path, file_path)
+
+    @classmethod
+    def load(cls, file_path: str) -> "FieldUsageIndex":
+        """Read an index written by save."""
+        with open(file_path, "r") as f:
+            return cls.from_dict(json.load(f))
@@ -1,9 +1,123 @@
 """
 Validation logic for metamodel structures and changes.
 """
-from typing import Dict, List, Optional, Tuple, Any, Set
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple, Any, Set, cast
 
 from .metamodel import Metamodel, MetamodelChange, ChangeType, MetamodelAttribute, MetamodelGroup
+from .similarity import MinHashIndex, jaccard, tokenize
+from .usage import FieldUsageIndex
+
+
+class _ChangeState:
+    """
+    A copy-on-write view of a metamodel's groups and attribute requirements.
+
+    Lookups fall through to the metamodel's indexes until a change touches a
+    group, at which point only that group is copied into the overlay.
+    """
+
+    def __init__(self, metamodel: Metamodel):
+        self.metamodel = metamodel
+        # Group name -> {attribute name: required}, or None if the group was removed
+        self._groups: Dict[str, Optional[Dict[str, bool]]] = {}
+        # Attribute name -> names of the groups containing it
+        self._attribute_groups: Dict[str, List[str]] = {}
+
+    def _group(self, group_name: str) -> Optional[Dict[str, bool]]:
+        """Return the overlay entry for a group, copied from the metamodel if needed."""
+        if group_name not in self._groups:
+            group = self.metamodel.get_group_by_name(group_name)
+            self._groups[group_name] = (
+                {attr.name: attr.required for attr in group.attributes}
+                if group
+                else None
+            )
+        return self._groups[group_name]
+
+    def _attributes(self, group_name: str) -> Dict[str, bool]:
+        """Return the overlay entry for a group that exists."""
+        attributes = self._group(group_name)
+        if attributes is None:
+            raise ValueError(f"Group '{group_name}' does not exist")
+        return attributes
+
+    def _groups_of(self, attr_name: str) -> List[str]:
+        """Return the mutable list of groups containing an attribute."""
+        if attr_name not in self._attribute_groups:
+            self._attribute_groups[attr_name] = [
+                group.name for group in self.metamodel.get_attribute_groups(attr_name)
+            ]
+        return self._attribute_groups[attr_name]
+
+    def has_group(self, group_name: Optional[str]) -> bool:
+        if group_name in self._groups:
+            return self._groups[group_name] is not None
+        return (
+            group_name is not None
+            and self.metamodel.get_group_by_name(group_name) is not None
+        )
+
+    def has_required_attributes(self, group_name: str) -> bool:
+        return any(self._attributes(group_name).values())
+
+    def get_requirement(self, group_name: str, attr_name: str) -> Optional[bool]:
+        """Return whether an attribute is required, or None if it does not exist."""
+        if group_name in self._groups:
+            return (self._groups[group_name] or {}).get(attr_name)
+        found = self.metamodel.get_attribute_by_path(f"{group_name}/{attr_name}")
+        return found[1].required if found else None
+
+    def attribute_groups(self, attr_name: str) -> List[str]:
+        return list(self._groups_of(attr_name))
+
+    def apply(self, change: MetamodelChange) -> None:
+        """Apply a change that has already been validated."""
+        if change.change_type == ChangeType.ADD_GROUP:
+            group_name = change.new_value.get("name")
+            attributes = {
+                attr.get("name"): bool(attr.get("required", False))
+                for attr in change.new_value.get("attributes") or []
+            }
+            self._groups[group_name] = attributes
+            for attr_name in attributes:
+                self._groups_of(attr_name).append(group_name)
+
+        elif change.change_type == ChangeType.REMOVE_GROUP:
+            for attr_name in self._attributes(change.target_path):
+                self._groups_of(attr_name).remove(change.target_path)
+            self._groups[change.target_path] = None
+
+        elif change.change_type == ChangeType.ADD_ATTRIBUTE:
+            group_name, attr_name = change.target_path.split("/")
+            required = isinstance(change.new_value, dict) and bool(
+                change.new_value.get("required", False)
+            )
+            self._attributes(group_name)[attr_name] = required
+            self._groups_of(attr_name).append(group_name)
+
+        elif change.change_type == ChangeType.REMOVE_ATTRIBUTE:
+            group_name, attr_name = change.target_path.split("/")
+            del self._attributes(group_name)[attr_name]
+            self._groups_of(attr_name).remove(group_name)
+
+        elif change.change_type == ChangeType.CHANGE_REQUIREMENT:
+            group_name, attr_name = change.target_path.split("/")
+            self._attributes(group_name)[attr_name] = change.new_value
+
+        elif change.change_type in (
+            ChangeType.MOVE_ATTRIBUTE,
+            ChangeType.RENAME_ATTRIBUTE,
+        ):
+            group_name, attr_name = change.target_path.split("/")
+            required = self._attributes(group_name).pop(attr_name)
+            self._groups_of(attr_name).remove(group_name)
+            new_group = change.new_value.get("group", group_name)
+            new_name = change.new_value.get("name", attr_name)
+            self._attributes(new_group)[new_name] = bool(
+                change.new_value.get("required", required)
+            )
+            self._groups_of(new_name).append(new_group)
 
 
 class MetamodelValidator:
@@ -64,6 +178,42 @@ class MetamodelValidator:
         Returns:
             Tuple of (is_valid, list_of_validation_errors)
         """
+        errors = self._check_change(_ChangeState(current_metamodel), change)
+        return len(errors) == 0, errors
+
+    def validate_changes(
+        self, current_metamodel: Metamodel, changes: List[MetamodelChange]
+    ) -> List[Tuple[bool, List[str]]]:
+        """
+        Validate a sequence of proposed changes, each against the result of the
+        ones before it.
+
+        Valid changes are applied to an overlay of the metamodel as they are
+        validated, so e.g. adding an attribute and then removing it is judged
+        correctly. Invalid changes are not applied. The metamodel itself is
+        not modified, and the cost grows with the number of changes and the
+        size of the groups they touch rather than with the whole model.
+
+        Args:
+            current_metamodel: The current state of the metamodel
+            changes: The proposed changes, in the order they would be applied
+
+        Returns:
+            List of (is_valid, list_of_validation_errors), one per change
+        """
+        state = _ChangeState(current_metamodel)
+        results = []
+        for change in changes:
+            errors = self._check_change(state, change)
+            if not errors:
+                state.apply(change)
+            results.append((len(errors) == 0, errors))
+        return results
+
+    def _check_change(
+        self, state: "_ChangeState", change: MetamodelChange
+    ) -> List[str]:
+        """Return the validation errors of a change against the current state."""
         errors = []
         
         # Validate based on change type
@@ -72,22 +222,20 @@ class MetamodelValidator:
                 errors.append("New group value must be a dictionary")
             else:
                 # Check if group name already exists
-                if any(group.name == change.new_value.get("name") for group in current_metamodel.groups):
+                if state.has_group(change.new_value.get("name")):
                     errors.append(f"Group '{change.new_value.get('name')}' already exists")
         
         elif change.change_type == ChangeType.REMOVE_GROUP:
             # Check if group exists
-            if not any(group.name == change.target_path for group in current_metamodel.groups):
+            if not state.has_group(change.target_path):
                 errors.append(f"Group '{change.target_path}' does not exist")
                 
             # Check if group contains required attributes
-            for group in current_metamodel.groups:
-                if group.name == change.target_path:
-                    required_attrs = [attr for attr in group.attributes if attr.required]
-                    if required_attrs:
-                        errors.append(
-                            f"Cannot remove group '{change.target_path}' because it contains required attributes"
-                        )
+            elif state.has_required_attributes(change.target_path):
+                errors.append(
+                    f"Cannot remove group '{change.target_path}' because it contains "
+                    "required attributes"
+                )
         
         elif change.change_type == ChangeType.ADD_ATTRIBUTE:
             parts = change.target_path.split("/")
@@ -97,21 +245,20 @@ class MetamodelValidator:
                 group_name, attr_name = parts
                 
                 # Check if group exists
-                group = next((g for g in current_metamodel.groups if g.name == group_name), None)
-                if not group:
+                if not state.has_group(group_name):
                     errors.append(f"Group '{group_name}' does not exist")
                 else:
                     # Check if attribute already exists in the group
-                    if any(attr.name == attr_name for attr in group.attributes):
+                    if state.get_requirement(group_name, attr_name) is not None:
                         errors.append(f"Attribute '{attr_name}' already exists in group '{group_name}'")
                         
                     # Check if attribute exists in any other group
-                    for other_group in current_metamodel.groups:
-                        if other_group.name != group_name:
-                            if any(attr.name == attr_name for attr in other_group.attributes):
-                                errors.append(
-                                    f"Attribute '{attr_name}' already exists in group '{other_group.name}'"
-                                )
+                    for other_group in state.attribute_groups(attr_name):
+                        if other_group != group_name:
+                            errors.append(
+                                f"Attribute '{attr_name}' already exists "
+                                f"in group '{other_group}'"
+                            )
         
         elif change.change_type == ChangeType.REMOVE_ATTRIBUTE:
             parts = change.target_path.split("/")
@@ -121,15 +268,14 @@ class MetamodelValidator:
                 group_name, attr_name = parts
                 
                 # Check if group exists
-                group = next((g for g in current_metamodel.groups if g.name == group_name), None)
-                if not group:
+                if not state.has_group(group_name):
                     errors.append(f"Group '{group_name}' does not exist")
                 else:
                     # Check if attribute exists in the group
-                    attr = next((a for a in group.attributes if a.name == attr_name), None)
-                    if not attr:
+                    required = state.get_requirement(group_name, attr_name)
+                    if required is None:
                         errors.append(f"Attribute '{attr_name}' does not exist in group '{group_name}'")
-                    elif attr.required:
+                    elif required:
                         errors.append(f"Cannot remove required attribute '{attr_name}' from group '{group_name}'")
         
         elif change.change_type == ChangeType.CHANGE_REQUIREMENT:
@@ -144,22 +290,65 @@ class MetamodelValidator:
                     errors.append("New value for change_requirement must be a boolean")
                     
                 # Check if group exists
-                group = next((g for g in current_metamodel.groups if g.name == group_name), None)
-                if not group:
+                if not state.has_group(group_name):
                     errors.append(f"Group '{group_name}' does not exist")
                 else:
                     # Check if attribute exists in the group
-                    attr = next((a for a in group.attributes if a.name == attr_name), None)
-                    if not attr:
+                    required = state.get_requirement(group_name, attr_name)
+                    if required is None:
                         errors.append(f"Attribute '{attr_name}' does not exist in group '{group_name}'")
                     # If changing from required to not required, the attribute must be currently required
-                    elif not change.new_value and not attr.required:
+                    elif not change.new_value and not required:
                         errors.append(f"Attribute '{attr_name}' is already not required")
                     # If changing from not required to required, the attribute must be currently not required
-                    elif change.new_value and attr.required:
+                    elif change.new_value and required:
                         errors.append(f"Attribute '{attr_name}' is already required")
-        
-        return len(errors) == 0, errors
+
+        elif change.change_type in (
+            ChangeType.MOVE_ATTRIBUTE,
+            ChangeType.RENAME_ATTRIBUTE,
+        ):
+            parts = change.target_path.split("/")
+            if len(parts) != 2:
+                errors.append(
+                    f"Target path for {change.change_type.value} must be in format "
+                    "'group_name/attribute_name'"
+                )
+            elif not isinstance(change.new_value, dict):
+                errors.append(
+                    f"New value for {change.change_type.value} must be a dictionary"
+                )
+            else:
+                group_name, attr_name = parts
+                new_group = change.new_value.get("group", group_name)
+                new_name = change.new_value.get("name", attr_name)
+
+                # Check that the source attribute exists
+                if not state.has_group(group_name):
+                    errors.append(f"Group '{group_name}' does not exist")
+                elif state.get_requirement(group_name, attr_name) is None:
+                    errors.append(
+                        f"Attribute '{attr_name}' does not exist "
+                        f"in group '{group_name}'"
+                    )
+
+                # Check that the destination is free
+                if (new_group, new_name) == (group_name, attr_name):
+                    errors.append(
+                        f"Attribute '{attr_name}' in group '{group_name}' "
+                        "would not change"
+                    )
+                elif not state.has_group(new_group):
+                    errors.append(f"Group '{new_group}' does not exist")
+                else:
+                    for other_group in state.attribute_groups(new_name):
+                        if new_name != attr_name or other_group != group_name:
+                            errors.append(
+                                f"Attribute '{new_name}' already exists "
+                                f"in group '{other_group}'"
+                            )
+
+        return errors
     
     def validate_backward_compatibility(
         self, old_metamodel: Metamodel, new_metamodel: Metamodel
@@ -193,23 +382,26 @@ class MetamodelValidator:
         for group_name, attr_name in old_required:
             if (group_name, attr_name) not in new_required:
                 # Check if the group still exists
-                new_group = next((g for g in new_metamodel.groups if g.name == group_name), None)
+                new_group = new_metamodel.get_group_by_name(group_name)
                 if not new_group:
                     errors.append(f"Required group '{group_name}' was removed")
                 else:
                     # Check if the attribute still exists in the group
-                    new_attr = next((a for a in new_group.attributes if a.name == attr_name), None)
-                    if not new_attr:
+                    if not new_metamodel.get_attribute_by_path(
+                        f"{group_name}/{attr_name}"
+                    ):
                         errors.append(f"Required attribute '{attr_name}' was removed from group '{group_name}'")
                     else:
                         errors.append(f"Required attribute '{attr_name}' in group '{group_name}' was made optional")
         
         # Check for type changes in existing attributes
         for old_group in old_metamodel.groups:
-            new_group = next((g for g in new_metamodel.groups if g.name == old_group.name), None)
-            if new_group:
+            if new_metamodel.get_group_by_name(old_group.name):
                 for old_attr in old_group.attributes:
-                    new_attr = next((a for a in new_group.attributes if a.name == old_attr.name), None)
+                    found = new_metamodel.get_attribute_by_path(
+                        f"{old_group.name}/{old_attr.name}"
+                    )
+                    new_attr = found[1] if found else None
                     if new_attr and old_attr.type != new_attr.type:
                         errors.append(
                             f"Type of attribute '{old_attr.name}' in group '{old_group.name}' "
@@ -222,12 +414,38 @@ class MetamodelValidator:
 class ChangeAnalyzer:
     """Analyzes changes between metamodel versions."""
     
+    def __init__(self, detect_moves: bool = True, similarity_threshold: float = 0.5):
+        """
+        Initialize the analyzer.
+
+        Args:
+            detect_moves: Whether to pair removed and added attributes into
+                move and rename changes
+            similarity_threshold: Minimum Jaccard similarity of the name,
+                description and enum tokens for a removed and an added
+                attribute of the same type to be reported as a rename
+        """
+        self.detect_moves = detect_moves
+        self.similarity_threshold = similarity_threshold
+
     def detect_changes(
         self, old_metamodel: Metamodel, new_metamodel: Metamodel
     ) -> List[MetamodelChange]:
         """
         Detect changes between two metamodel versions.
         
+        Groups and attributes whose content hashes match are skipped without
+        comparing their fields, so identical versions and versions that differ
+        in a few places are compared in time proportional to the differences.
+
+        Unless move detection is disabled, an attribute removed from one group
+        and added to another under the same name is reported as a single
+        MOVE_ATTRIBUTE change, and a removed attribute paired with a similar
+        added attribute of the same type as a RENAME_ATTRIBUTE change.
+
+        Changes are listed in metamodel order: additions in the order of the
+        new version, other changes in the order of the old one.
+
         Args:
             old_metamodel: The previous metamodel version
             new_metamodel: The new metamodel version
@@ -235,17 +453,28 @@ class ChangeAnalyzer:
         Returns:
             List of detected changes
         """
-        changes = []
+        changes: List[MetamodelChange] = []
         
+        # Identical versions have no changes
+        if (
+            old_metamodel is new_metamodel
+            or old_metamodel.content_hash() == new_metamodel.content_hash()
+        ):
+            return changes
+
+        # All changes of one comparison share a timestamp
+        timestamp = datetime.now()
+
         # Track groups in old and new metamodels
         old_groups = {group.name: group for group in old_metamodel.groups}
         new_groups = {group.name: group for group in new_metamodel.groups}
         
         # Detect added and removed groups
-        for group_name in set(new_groups.keys()) - set(old_groups.keys()):
+        for group_name in [name for name in new_groups if name not in old_groups]:
             group = new_groups[group_name]
             changes.append(
                 MetamodelChange(
+                    timestamp=timestamp,
                     change_type=ChangeType.ADD_GROUP,
                     target_path=group_name,
                     new_value=group.model_dump(),
@@ -253,10 +482,11 @@ class ChangeAnalyzer:
                 )
             )
         
-        for group_name in set(old_groups.keys()) - set(new_groups.keys()):
+        for group_name in [name for name in old_groups if name not in new_groups]:
             group = old_groups[group_name]
             changes.append(
                 MetamodelChange(
+                    timestamp=timestamp,
                     change_type=ChangeType.REMOVE_GROUP,
                     target_path=group_name,
                     old_value=group.model_dump(),
@@ -265,14 +495,19 @@ class ChangeAnalyzer:
             )
         
         # Detect changes within groups that exist in both versions
-        for group_name in set(old_groups.keys()) & set(new_groups.keys()):
+        for group_name in [name for name in old_groups if name in new_groups]:
             old_group = old_groups[group_name]
             new_group = new_groups[group_name]
             
+            # Skip groups whose content is identical
+            if old_group.content_hash() == new_group.content_hash():
+                continue
+
             # Check for changes in group description
             if old_group.description != new_group.description:
                 changes.append(
                     MetamodelChange(
+                        timestamp=timestamp,
                         change_type=ChangeType.MODIFY_GROUP,
                         target_path=group_name,
                         old_value={"description": old_group.description},
@@ -286,10 +521,11 @@ class ChangeAnalyzer:
             new_attrs = {attr.name: attr for attr in new_group.attributes}
             
             # Detect added and removed attributes
-            for attr_name in set(new_attrs.keys()) - set(old_attrs.keys()):
+            for attr_name in [name for name in new_attrs if name not in old_attrs]:
                 attr = new_attrs[attr_name]
                 changes.append(
                     MetamodelChange(
+                        timestamp=timestamp,
                         change_type=ChangeType.ADD_ATTRIBUTE,
                         target_path=f"{group_name}/{attr_name}",
                         new_value=attr.model_dump(),
@@ -297,10 +533,11 @@ class ChangeAnalyzer:
                     )
                 )
             
-            for attr_name in set(old_attrs.keys()) - set(new_attrs.keys()):
+            for attr_name in [name for name in old_attrs if name not in new_attrs]:
                 attr = old_attrs[attr_name]
                 changes.append(
                     MetamodelChange(
+                        timestamp=timestamp,
                         change_type=ChangeType.REMOVE_ATTRIBUTE,
                         target_path=f"{group_name}/{attr_name}",
                         old_value=attr.model_dump(),
@@ -309,10 +546,14 @@ class ChangeAnalyzer:
                 )
             
             # Detect changes within attributes that exist in both versions
-            for attr_name in set(old_attrs.keys()) & set(new_attrs.keys()):
+            for attr_name in [name for name in old_attrs if name in new_attrs]:
                 old_attr = old_attrs[attr_name]
                 new_attr = new_attrs[attr_name]
                 
+                # Skip attributes whose content is identical
+                if old_attr.content_hash() == new_attr.content_hash():
+                    continue
+
                 # Check for changes in attribute properties
                 changes_in_attr = {}
                 if old_attr.description != new_attr.description:
@@ -325,6 +566,7 @@ class ChangeAnalyzer:
                 if changes_in_attr:
                     changes.append(
                         MetamodelChange(
+                            timestamp=timestamp,
                             change_type=ChangeType.MODIFY_ATTRIBUTE,
                             target_path=f"{group_name}/{attr_name}",
                             old_value={k: v[0] for k, v in changes_in_attr.items()},
@@ -337,6 +579,7 @@ class ChangeAnalyzer:
                 if old_attr.required != new_attr.required:
                     changes.append(
                         MetamodelChange(
+                            timestamp=timestamp,
                             change_type=ChangeType.CHANGE_REQUIREMENT,
                             target_path=f"{group_name}/{attr_name}",
                             old_value=old_attr.required,
@@ -348,12 +591,142 @@ class ChangeAnalyzer:
                         )
                     )
         
+        if self.detect_moves:
+            changes = self._pair_moved_attributes(changes)
+
         return changes
 
+    def _pair_moved_attributes(
+        self, changes: List[MetamodelChange]
+    ) -> List[MetamodelChange]:
+        """
+        Replace matching REMOVE_ATTRIBUTE and ADD_ATTRIBUTE changes with moves and
+        renames.
+
+        Only attributes of the same type and requirement are paired, as
+        stored values cannot simply be carried over a change of either.
+        Attributes are first paired by name. The remaining ones are paired by
+        the similarity of their tokens, using a MinHash index of the added
+        attributes to find candidates instead of comparing every pair.
+        """
+        removed = [c for c in changes if c.change_type == ChangeType.REMOVE_ATTRIBUTE]
+        added = [c for c in changes if c.change_type == ChangeType.ADD_ATTRIBUTE]
+        if not removed or not added:
+            return changes
+
+        pairs: Dict[int, MetamodelChange] = {}
+        paired_added: Set[int] = set()
+
+        # Same name in a different group is a move
+        added_by_name: Dict[str, List[MetamodelChange]] = {}
+        for add in added:
+            added_by_name.setdefault(add.new_value["name"], []).append(add)
+        unmatched = []
+        for remove in removed:
+            candidates = [
+                a
+                for a in added_by_name.get(remove.old_value["name"], [])
+                if id(a) not in paired_added
+                and self._same_kind(remove.old_value, a.new_value)
+            ]
+            if candidates:
+                pairs[id(remove)] = candidates[0]
+                paired_added.add(id(candidates[0]))
+            else:
+                unmatched.append(remove)
+
+        # Similar attributes of the same kind are renames
+        remaining = [a for a in added if id(a) not in paired_added]
+        if unmatched and remaining:
+            index = MinHashIndex()
+            tokens = {}
+            for i, add in enumerate(remaining):
+                tokens[i] = self._attribute_tokens(add.new_value)
+                index.add(i, tokens[i])
+
+            scored = []
+            for remove in unmatched:
+                remove_tokens = self._attribute_tokens(remove.old_value)
+                for key in index.query(remove_tokens):
+                    i = cast(int, key)
+                    add = remaining[i]
+                    if not self._same_kind(remove.old_value, add.new_value):
+                        continue
+                    score = jaccard(remove_tokens, tokens[i])
+                    if score >= self.similarity_threshold:
+                        scored.append(
+                            (-score, remove.target_path, add.target_path, remove, add)
+                        )
+
+            # Pair the most similar attributes first
+            for _, _, _, remove, add in sorted(scored, key=lambda item: item[:3]):
+                if id(remove) not in pairs and id(add) not in paired_added:
+                    pairs[id(remove)] = add
+                    paired_added.add(id(add))
+
+        result = []
+        for change in changes:
+            if id(change) in pairs:
+                result.append(self._moved_attribute_change(change, pairs[id(change)]))
+            elif id(change) not in paired_added:
+                result.append(change)
+        return result
+
+    def _same_kind(self, old: Dict[str, Any], new: Dict[str, Any]) -> bool:
+        return (
+            old.get("type") == new.get("type")
+            and old.get("required") == new.get("required")
+        )
+
+    def _attribute_tokens(self, attr: Dict[str, Any]) -> Set[str]:
+        return tokenize(
+            attr.get("name", ""), attr.get("description", ""), *(attr.get("enum") or [])
+        )
+
+    def _moved_attribute_change(
+        self, remove: MetamodelChange, add: MetamodelChange
+    ) -> MetamodelChange:
+        """Build the MOVE_ATTRIBUTE or RENAME_ATTRIBUTE change of a pair."""
+        old_group, old_name = remove.target_path.split("/")
+        new_group, new_name = add.target_path.split("/")
+
+        if old_name == new_name:
+            change_type = ChangeType.MOVE_ATTRIBUTE
+            description = (
+                f"Moved attribute '{old_name}' from group '{old_group}' "
+                f"to group '{new_group}'"
+            )
+        else:
+            change_type = ChangeType.RENAME_ATTRIBUTE
+            description = (
+                f"Renamed attribute '{old_name}' in group '{old_group}' to '{new_name}'"
+            )
+            if new_group != old_group:
+                description += f" in group '{new_group}'"
+
+        return MetamodelChange(
+            timestamp=remove.timestamp,
+            change_type=change_type,
+            target_path=remove.target_path,
+            old_value={**remove.old_value, "group": old_group},
+            new_value={**add.new_value, "group": new_group},
+            description=description,
+        )
+
 
 class MigrationPlanner:
     """Plans migrations for metamodel changes."""
     
+    def __init__(self, usage: Optional[FieldUsageIndex] = None):
+        """
+        Initialize the planner.
+
+        Args:
+            usage: Index of the stored records; if given, every step of a plan
+                has an "affected_records" count of the records the change affects
+        """
+        self.usage = usage
+
     def generate_migration_plan(
         self, changes: List[MetamodelChange]
     ) -> Dict[str, List[Dict[str, Any]]]:
@@ -373,6 +746,9 @@ class MigrationPlanner:
         }
         
         for change in changes:
+            planned = {
+                category: len(steps) for category, steps in migration_plan.items()
+            }
             if change.change_type == ChangeType.ADD_ATTRIBUTE and change.new_value.get("required", False):
                 # Adding a required attribute is high impact
                 migration_plan["high_impact"].append({
@@ -468,6 +844,28 @@ class MigrationPlanner:
                         "Notify data product owners"
                     ]
                 })
+            elif change.change_type in (
+                ChangeType.MOVE_ATTRIBUTE,
+                ChangeType.RENAME_ATTRIBUTE,
+            ):
+                # Moving or renaming an attribute keeps its data, so it is medium impact
+                moved = change.change_type == ChangeType.MOVE_ATTRIBUTE
+                migration_plan["medium_impact"].append(
+                    {
+                        "change": change.model_dump(),
+                        "action": (
+                            "Move attribute to another group"
+                            if moved
+                            else "Rename attribute"
+                        ),
+                        "steps": [
+                            "Update schema definition",
+                            "Create migration script to re-key existing data",
+                            "Update all dependent applications",
+                            "Notify data product owners",
+                        ],
+                    }
+                )
             elif change.change_type == ChangeType.MODIFY_GROUP:
                 # Modifying group properties is low impact
                 migration_plan["low_impact"].append({
@@ -479,5 +877,12 @@ class MigrationPlanner:
                         "Notify data product owners"
                     ]
                 })
-        
-        return migration_plan
\ No newline at end of file
+
+            if self.usage is not None:
+                for category, steps in migration_plan.items():
+                    if len(steps) > planned[category]:
+                        steps[-1]["affected_records"] = self.usage.affected_records(
+                            change
+                        )
+
+        return migration_plan
@@ -0,0 +1,102 @@
+"""
+Apache Arrow schema of metadata records.
+
+Requires the optional ``pyarrow`` dependency (``pip install metamodel[arrow]``).
+"""
+
+from typing import Any, Callable, Dict
+
+from metamodel_core.models.metamodel import AttributeType
+from metamodel_core.schema.backend import SchemaBackend
+from metamodel_core.schema.ir import FieldIR, GroupIR, MetamodelIR
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+
+def _arrow_types() -> Dict[AttributeType, Callable[[], Any]]:
+    # OBJECT values are stored as JSON text, enums are dictionary-encoded strings
+    return {
+        AttributeType.STRING: pyarrow.string,
+        AttributeType.BOOLEAN: pyarrow.bool_,
+        AttributeType.INTEGER: pyarrow.int32,
+        AttributeType.NUMBER: pyarrow.float64,
+        AttributeType.ARRAY: lambda: pyarrow.list_(pyarrow.string()),
+        AttributeType.OBJECT: pyarrow.string,
+        AttributeType.DATETIME: lambda: pyarrow.timestamp("us", tz="UTC"),
+    }
+
+
+class ArrowBackend(SchemaBackend):
+    """
+    Renders an Arrow schema with one struct column per group.
+
+    Field names are snake_case as in the Protocol Buffer schema. Required
+    attributes and groups with required attributes are not nullable. Enum
+    attributes are dictionary-encoded strings, and descriptions are kept in
+    the field metadata. The rendered file is the schema serialized as an
+    Arrow IPC message, readable with ``pyarrow.ipc.read_schema``.
+    """
+
+    name = "arrow"
+    extension = ".arrow"
+
+    def __init__(self) -> None:
+        """
+        Initialize the backend.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if pyarrow is None:
+            raise ImportError(
+                "Arrow schemas require pyarrow; "
+                "install it with 'pip install metamodel[arrow]'"
+            )
+        super().__init__()
+        self._types = _arrow_types()
+
+    def schema(self, ir: MetamodelIR) -> "pyarrow.Schema":
+        """
+        Build the Arrow schema of a metamodel's records.
+
+        Args:
+            ir: The compiled metamodel
+
+        Returns:
+            The schema
+        """
+        return pyarrow.schema(
+            [self.group_fragment(group, "") for group in ir.groups],
+            metadata={
+                "name": ir.name,
+                "version": ir.version,
+                "description": ir.description,
+            },
+        )
+
+    def render(self, ir: MetamodelIR, filename: str) -> bytes:
+        data: bytes = self.schema(ir).serialize().to_pybytes()
+        return data
+
+    def _render_group(self, group: GroupIR, namespace: str) -> "pyarrow.Field":
+        return pyarrow.field(
+            group.field_name,
+            pyarrow.struct([self._field(field) for field in group.fields]),
+            nullable=not group.required,
+            metadata={"description": group.description},
+        )
+
+    def _field(self, field: FieldIR) -> "pyarrow.Field":
+        if field.enum:
+            arrow_type = pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+        else:
+            arrow_type = self._types[field.type]()
+        return pyarrow.field(
+            field.field_name,
+            arrow_type,
+            nullable=not field.required,
+            metadata={"description": field.description},
+        )
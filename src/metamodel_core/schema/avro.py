@@ -0,0 +1,101 @@
+"""
+Apache Avro schema of metadata records.
+"""
+
+from typing import Any, Dict, List, Union
+
+from metamodel_core.models.metamodel import AttributeType
+from metamodel_core.schema.backend import GroupRenderer, JsonDocumentBackend
+from metamodel_core.schema.ir import FieldIR, GroupIR, MetamodelIR
+
+# Avro types of each attribute type; OBJECT values are stored as JSON text
+_TYPES: Dict[AttributeType, Union[str, Dict[str, Any]]] = {
+    AttributeType.STRING: "string",
+    AttributeType.BOOLEAN: "boolean",
+    AttributeType.INTEGER: "int",
+    AttributeType.NUMBER: "double",
+    AttributeType.ARRAY: {"type": "array", "items": "string"},
+    AttributeType.OBJECT: "string",
+    AttributeType.DATETIME: {"type": "long", "logicalType": "timestamp-micros"},
+}
+
+
+class AvroBackend(JsonDocumentBackend):
+    """
+    Renders an Avro schema with a ``Metadata`` record containing one record per group.
+
+    Names follow the Protocol Buffer schema: fields are snake_case, group
+    records are named like ``GeneralGroup`` and enum symbols like
+    ``ON_HOLD``. Avro has no nested types, so enums are prefixed with their
+    group's record name (``GeneralGroupStatusEnum``), and all types are in
+    the ``<filename>`` namespace of the Metadata record. Group records
+    therefore do not depend on the filename, and are serialized once for
+    all schemas containing the group. Optional attributes and groups without
+    required attributes are unions with ``null`` and default to null.
+    """
+
+    name = "avro"
+    extension = ".avsc"
+
+    def schema(self, ir: MetamodelIR, filename: str) -> Dict[str, Any]:
+        """
+        Build the Avro schema of a metamodel's records.
+
+        Args:
+            ir: The compiled metamodel
+            filename: The filename of the schema, used as the namespace
+
+        Returns:
+            The schema as a JSON-serializable dictionary
+        """
+        return self._document(ir, filename, self.group_fragment)
+
+    def _document(
+        self, ir: MetamodelIR, filename: str, render_group: GroupRenderer
+    ) -> Dict[str, Any]:
+        fields = []
+        for group in ir.groups:
+            record = render_group(group, "")
+            field: Dict[str, Any] = {"name": group.field_name, "doc": group.description}
+            if group.required:
+                field["type"] = record
+            else:
+                field["type"] = ["null", record]
+                field["default"] = None
+            fields.append(field)
+        return {
+            "type": "record",
+            "name": "Metadata",
+            "namespace": filename,
+            "doc": f'{ir.description} (metamodel "{ir.name}" version {ir.version})',
+            "fields": fields,
+        }
+
+    def _render_group(self, group: GroupIR, namespace: str) -> Dict[str, Any]:
+        fields: List[Dict[str, Any]] = []
+        for field in group.fields:
+            avro_field: Dict[str, Any] = {
+                "name": field.field_name,
+                "doc": field.description,
+            }
+            if field.required:
+                avro_field["type"] = self._type(group, field)
+            else:
+                avro_field["type"] = ["null", self._type(group, field)]
+                avro_field["default"] = None
+            fields.append(avro_field)
+        return {
+            "type": "record",
+            "name": group.type_name,
+            "doc": group.description,
+            "fields": fields,
+        }
+
+    def _type(self, group: GroupIR, field: FieldIR) -> Union[str, Dict[str, Any]]:
+        if field.enum:
+            return {
+                "type": "enum",
+                "name": f"{group.type_name}{field.enum_type_name}",
+                "symbols": list(field.enum_symbols),
+            }
+        return _TYPES[field.type]
@@ -0,0 +1,130 @@
+"""
+Base class of the schema backends rendering a metamodel's intermediate representation.
+"""
+
+import json
+import re
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Tuple
+
+from metamodel_core.schema.ir import MAX_CACHED_GROUPS, GroupIR, MetamodelIR
+
+
+class SchemaBackend:
+    """
+    Renders one schema format from a ``MetamodelIR``.
+
+    Subclasses set ``name`` (used in cache keys and as the key of generated
+    files), ``extension`` and ``version``, which must be bumped whenever the
+    output changes, and implement ``render()``. Backends that build the
+    schema from per-group parts implement ``_render_group()`` and use
+    ``group_fragment()``, which reuses the part of every group already
+    rendered with the same content, e.g. groups shared by several
+    metamodels or unchanged between versions.
+    """
+
+    name = ""
+    extension = ""
+    version = 1
+
+    def __init__(self) -> None:
+        self._fragments: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+
+    def render(self, ir: MetamodelIR, filename: str) -> bytes:
+        """
+        Render the schema of a metamodel.
+
+        Args:
+            ir: The compiled metamodel
+            filename: The filename of the schema (without extension), used as
+                the namespace where the format has one
+
+        Returns:
+            The contents of the schema file
+        """
+        raise NotImplementedError
+
+    def group_fragment(self, group: GroupIR, namespace: str) -> Any:
+        """
+        Return the rendered part of a group, rendering it on first use.
+
+        Fragments are shared between schemas and must not be modified.
+
+        Args:
+            group: The compiled group
+            namespace: The namespace the group is rendered in
+
+        Returns:
+            The value returned by _render_group()
+        """
+        key = (group.content_hash, namespace)
+        fragment = self._fragments.get(key)
+        if fragment is None:
+            fragment = self._fragments[key] = self._render_group(group, namespace)
+            if len(self._fragments) > MAX_CACHED_GROUPS:
+                self._fragments.popitem(last=False)
+        else:
+            self._fragments.move_to_end(key)
+        return fragment
+
+    def _render_group(self, group: GroupIR, namespace: str) -> Any:
+        raise NotImplementedError
+
+
+# A group placeholder in a serialized document: the line's indentation, the
+# text before it and its index
+_PLACEHOLDER_RE = re.compile(r'^( *)(.*)"\\u0000(\d+)"', re.MULTILINE)
+
+GroupRenderer = Callable[[GroupIR, str], Any]
+
+
+class JsonDocumentBackend(SchemaBackend):
+    """
+    Base class of backends whose schemas are JSON documents.
+
+    Subclasses implement ``_document()``, which builds the document using a
+    callback for the value of each group. Rendering serializes the document
+    with placeholders for the groups and splices in each group's cached
+    serialized fragment, so the (slow, indented) serialization of a group
+    happens once however many schemas contain it. The output is identical
+    to ``json.dumps(document, indent=2)``.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._texts: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+
+    def _document(
+        self, ir: MetamodelIR, filename: str, render_group: GroupRenderer
+    ) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def render(self, ir: MetamodelIR, filename: str) -> bytes:
+        fragments: List[str] = []
+
+        def placeholder(group: GroupIR, namespace: str) -> str:
+            fragments.append(self._fragment_text(group, namespace))
+            return f"\x00{len(fragments) - 1}"
+
+        text = json.dumps(self._document(ir, filename, placeholder), indent=2)
+
+        def splice(match: "re.Match[str]") -> str:
+            indent: str = match.group(1)
+            return (
+                indent
+                + match.group(2)
+                + fragments[int(match.group(3))].replace("\n", "\n" + indent)
+            )
+
+        return (_PLACEHOLDER_RE.sub(splice, text) + "\n").encode("utf-8")
+
+    def _fragment_text(self, group: GroupIR, namespace: str) -> str:
+        key = (group.content_hash, namespace)
+        text = self._texts.get(key)
+        if text is None:
+            text = self._texts[key] = json.dumps(
+                self.group_fragment(group, namespace), indent=2
+            )
+            if len(self._texts) > MAX_CACHED_GROUPS:
+                self._texts.popitem(last=False)
+        return text
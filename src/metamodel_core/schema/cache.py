@@ -0,0 +1,141 @@
+"""
+Content-addressed cache of generated schema artifacts.
+"""
+
+import hashlib
+import os
+import secrets
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+
+def cache_key(*parts: Any) -> str:
+    """
+    Build a cache key from the inputs that determine an artifact.
+
+    Args:
+        parts: Content hashes, generator versions and options
+
+    Returns:
+        Hex SHA-256 digest of the parts
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part if isinstance(part, bytes) else str(part).encode("utf-8")
+        # Length-prefix each part so ("ab", "c") and ("a", "bc") differ
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def _create_temp(directory: str) -> Tuple[int, str]:
+    """
+    Create a new temporary file for writing, returning (fd, path).
+
+    Unlike ``tempfile.mkstemp``, which creates files readable only by their
+    owner, the file is created with mode 0o666 so the process umask gives it
+    the usual permissions, without reading the umask.
+    """
+    while True:
+        path = os.path.join(directory, f".tmp-{secrets.token_hex(8)}")
+        try:
+            return os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), path
+        except FileExistsError:
+            continue
+
+
+def write_if_changed(file_path: str, data: bytes) -> bool:
+    """
+    Write a file unless it already contains exactly these bytes.
+
+    Unchanged files keep their modification time, so tools that compare
+    timestamps see them as up to date. Changed files are replaced atomically.
+
+    Args:
+        file_path: Path of the file to write
+        data: The file contents
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    try:
+        if os.path.getsize(file_path) == len(data):
+            with open(file_path, "rb") as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp_path = _create_temp(directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return True
+
+
+class GenerationCache:
+    """
+    Generated artifacts stored by cache key, in memory and optionally on disk.
+
+    Because keys are derived from everything that determines an artifact,
+    entries never go stale and a directory can be shared between runs (e.g.
+    restored by CI) and between generators.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory for persistent entries (in-memory only if None)
+        """
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self._memory: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, directory: str, key: str, suffix: str) -> str:
+        return os.path.join(directory, f"{key}{suffix}")
+
+    def get(self, key: str, suffix: str = "") -> Optional[bytes]:
+        """
+        Look up an artifact.
+
+        Args:
+            key: The cache key
+            suffix: File suffix distinguishing kinds of artifacts (e.g. ".proto")
+
+        Returns:
+            The cached bytes, or None if the artifact is not cached
+        """
+        with self._lock:
+            data = self._memory.get(key + suffix)
+        if data is None and self.directory is not None:
+            try:
+                with open(self._path(self.directory, key, suffix), "rb") as f:
+                    data = f.read()
+            except FileNotFoundError:
+                return None
+            with self._lock:
+                self._memory[key + suffix] = data
+        return data
+
+    def put(self, key: str, data: bytes, suffix: str = "") -> None:
+        """
+        Store an artifact.
+
+        Args:
+            key: The cache key
+            data: The artifact contents
+            suffix: File suffix distinguishing kinds of artifacts (e.g. ".proto")
+        """
+        with self._lock:
+            self._memory[key + suffix] = data
+        if self.directory is not None:
+            write_if_changed(self._path(self.directory, key, suffix), data)
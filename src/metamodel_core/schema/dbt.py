@@ -0,0 +1,313 @@
+"""
+dbt ``schema.yml`` models of metadata records, and a check of existing files.
+
+A metamodel becomes one dbt model with a column per attribute: required
+attributes get a ``not_null`` test, and enums and booleans an
+``accepted_values`` test. ``check_dbt_sync`` compares the columns of an
+existing file with the ones the metamodel defines, without rendering the
+file, so hand-maintained or generated YAML can be checked in a pre-commit
+hook.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import yaml
+from pydantic import BaseModel
+
+from metamodel_core.models.metamodel import AttributeType, Metamodel
+from metamodel_core.schema.backend import SchemaBackend
+from metamodel_core.schema.cache import GenerationCache, cache_key
+from metamodel_core.schema.ir import FieldIR, GroupIR, MetamodelIR, compile_metamodel
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+_BOOLEAN_VALUES = ("true", "false")
+
+
+class DbtColumn(NamedTuple):
+    """The parts of a dbt column that the metamodel determines."""
+
+    name: str
+    description: str
+    not_null: bool
+    # Values of the accepted_values test, None without one
+    accepted_values: Optional[Tuple[str, ...]]
+
+
+def _accepted_values(field: FieldIR) -> Optional[Tuple[str, ...]]:
+    if field.enum:
+        return field.enum
+    if field.type == AttributeType.BOOLEAN:
+        return _BOOLEAN_VALUES
+    return None
+
+
+def dbt_columns(ir: MetamodelIR) -> List[Tuple[GroupIR, DbtColumn]]:
+    """
+    Return the dbt columns of a metamodel, in metamodel order.
+
+    Columns are named like the attributes' snake_case field names; an
+    attribute whose name was already used by an earlier group is prefixed
+    with its group's field name.
+
+    Args:
+        ir: The compiled metamodel
+
+    Returns:
+        List of (group, column)
+    """
+    columns = []
+    seen = set()
+    for group in ir.groups:
+        for field in group.fields:
+            name = field.field_name
+            if name in seen:
+                name = f"{group.field_name}_{name}"
+            seen.add(name)
+            columns.append(
+                (
+                    group,
+                    DbtColumn(
+                        name, field.description, field.required, _accepted_values(field)
+                    ),
+                )
+            )
+    return columns
+
+
+def _quote(value: str) -> str:
+    """YAML single-quoted scalar."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+class DbtBackend(SchemaBackend):
+    """
+    Renders a dbt ``schema.yml`` with one model per metamodel.
+
+    The model is named after the schema filename. The YAML is written as
+    text rather than through a YAML emitter, and the column lines of each
+    group are cached like the other backends' group fragments, so
+    regenerating many models that share groups mostly joins cached text.
+    """
+
+    name = "dbt"
+    extension = ".yml"
+
+    def render(self, ir: MetamodelIR, filename: str) -> bytes:
+        parts = [
+            f"# Generated from metamodel {json.dumps(ir.name)} version {ir.version}; "
+            "do not edit by hand\n",
+            "version: 2\n",
+            "\n",
+            "models:\n",
+            f"  - name: {filename}\n",
+            f"    description: {json.dumps(ir.description)}\n",
+            "    columns:\n",
+        ]
+        previous = None
+        for group, column in dbt_columns(ir):
+            if group is not previous:
+                parts.append(f"      # {group.name} group\n")
+                bodies = iter(self.group_fragment(group, ""))
+                previous = group
+            parts.append(f"      - name: {column.name}\n")
+            parts.append(next(bodies))
+            parts.append("\n")
+        return ("".join(parts).rstrip("\n") + "\n").encode("utf-8")
+
+    def _render_group(self, group: GroupIR, namespace: str) -> Tuple[str, ...]:
+        # The lines of each column after its name, which depends on the other groups
+        bodies = []
+        for field in group.fields:
+            lines = [f"        description: {json.dumps(field.description)}\n"]
+            values = _accepted_values(field)
+            if field.required or values:
+                lines.append("        tests:\n")
+            if field.required:
+                lines.append("          - not_null\n")
+            if values:
+                lines.append("          - accepted_values:\n")
+                lines.append(
+                    "              values: "
+                    f"[{', '.join(_quote(value) for value in values)}]\n"
+                )
+            bodies.append("".join(lines))
+        return tuple(bodies)
+
+
+class DbtDrift(BaseModel):
+    """A difference between a dbt model and the metamodel it should match."""
+
+    model: str
+    column: str
+    # "missing_column", "extra_column", "description", "not_null" or "accepted_values"
+    kind: str
+    expected: Optional[str] = None
+    actual: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self.kind == "missing_column":
+            return f"{self.model}.{self.column}: column missing"
+        if self.kind == "extra_column":
+            return f"{self.model}.{self.column}: column not in the metamodel"
+        return (
+            f"{self.model}.{self.column}: {self.kind} is {self.actual}, "
+            f"expected {self.expected}"
+        )
+
+
+def _existing_columns(column_specs: Any) -> Dict[str, DbtColumn]:
+    """The metamodel-determined parts of the columns of a parsed dbt model."""
+    columns = {}
+    for spec in column_specs or ():
+        if not isinstance(spec, dict) or "name" not in spec:
+            continue
+        not_null = False
+        values = None
+        # dbt 1.8 renamed "tests" to "data_tests"
+        for test in (spec.get("tests") or []) + (spec.get("data_tests") or []):
+            if test == "not_null":
+                not_null = True
+            elif isinstance(test, dict) and "accepted_values" in test:
+                values = tuple(
+                    str(value).lower() if isinstance(value, bool) else str(value)
+                    for value in (test["accepted_values"] or {}).get("values") or ()
+                )
+        name = str(spec["name"])
+        columns[name] = DbtColumn(name, spec.get("description") or "", not_null, values)
+    return columns
+
+
+def _format_values(values: Optional[Tuple[str, ...]]) -> str:
+    return "none" if values is None else "[" + ", ".join(values) + "]"
+
+
+def diff_dbt_model(ir: MetamodelIR, model: Dict[str, Any]) -> List[DbtDrift]:
+    """
+    Compare a parsed dbt model with the columns of a metamodel.
+
+    Tests and properties that the metamodel does not determine (other
+    tests, meta, tags) are ignored, so they can be maintained by hand.
+
+    Args:
+        ir: The compiled metamodel
+        model: The model, as parsed from a ``models:`` entry
+
+    Returns:
+        The differences, in metamodel column order followed by extra columns
+    """
+    model_name = str(model.get("name", ""))
+    existing = _existing_columns(model.get("columns"))
+    drifts = []
+    for _, column in dbt_columns(ir):
+        actual = existing.pop(column.name, None)
+        if actual is None:
+            drifts.append(
+                DbtDrift(model=model_name, column=column.name, kind="missing_column")
+            )
+            continue
+        if actual.description != column.description:
+            drifts.append(
+                DbtDrift(
+                    model=model_name,
+                    column=column.name,
+                    kind="description",
+                    expected=repr(column.description),
+                    actual=repr(actual.description),
+                )
+            )
+        if actual.not_null != column.not_null:
+            drifts.append(
+                DbtDrift(
+                    model=model_name,
+                    column=column.name,
+                    kind="not_null",
+                    expected=str(column.not_null).lower(),
+                    actual=str(actual.not_null).lower(),
+                )
+            )
+        if actual.accepted_values != column.accepted_values:
+            drifts.append(
+                DbtDrift(
+                    model=model_name,
+                    column=column.name,
+                    kind="accepted_values",
+                    expected=_format_values(column.accepted_values),
+                    actual=_format_values(actual.accepted_values),
+                )
+            )
+    drifts.extend(
+        DbtDrift(model=model_name, column=name, kind="extra_column")
+        for name in existing
+    )
+    return drifts
+
+
+def check_dbt_sync(
+    metamodel: Metamodel,
+    yaml_path: str,
+    model_name: Optional[str] = None,
+    cache: Optional[GenerationCache] = None,
+) -> List[DbtDrift]:
+    """
+    Check that a dbt schema file matches a metamodel.
+
+    With a persistent cache, a file found in sync is not parsed again until
+    it or the metamodel changes, so checking hundreds of unchanged files
+    costs one read and hash each.
+
+    Args:
+        metamodel: The metamodel the model should match
+        yaml_path: Path of the dbt schema file
+        model_name: Name of the model to check; may be omitted if the file
+            defines a single model
+        cache: Cache remembering files found in sync
+
+    Returns:
+        The differences, empty if the file is in sync
+
+    Raises:
+        ValueError: If the file has no models section or the model is not found
+    """
+    with open(yaml_path, "rb") as f:
+        content = f.read()
+    key = None
+    if cache is not None:
+        key = cache_key(
+            "dbt-sync",
+            DbtBackend.version,
+            metamodel.content_hash(),
+            hashlib.sha256(content).hexdigest(),
+            model_name,
+        )
+        if cache.get(key, ".sync") is not None:
+            return []
+
+    document = yaml.load(content, Loader=_SafeLoader)
+    models = document.get("models") if isinstance(document, dict) else None
+    if not isinstance(models, list):
+        raise ValueError(f"{yaml_path} has no dbt models section")
+    if model_name is None:
+        if len(models) != 1:
+            raise ValueError(
+                f"{yaml_path} defines {len(models)} models; "
+                "give the name of the one to check"
+            )
+        model = models[0]
+    else:
+        model = next(
+            (m for m in models if isinstance(m, dict) and m.get("name") == model_name),
+            None,
+        )
+        if model is None:
+            raise ValueError(f"{yaml_path} has no model named {model_name!r}")
+
+    drifts = diff_dbt_model(compile_metamodel(metamodel), model)
+    if cache is not None and key is not None and not drifts:
+        cache.put(key, b"", ".sync")
+    return drifts
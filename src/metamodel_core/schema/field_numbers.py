@@ -0,0 +1,280 @@
+"""
+Stable Protocol Buffer field numbers across metamodel versions.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from metamodel_core.models.metamodel import (
+    ChangeType,
+    Metamodel,
+    MetamodelAttribute,
+    MetamodelChange,
+)
+from metamodel_core.models.validators import ChangeAnalyzer
+from metamodel_core.schema.naming import format_field_name
+
+
+class AttributeNumbers(BaseModel):
+    """Field number of an attribute and the numbers of its enum values."""
+
+    number: int
+    enum_values: Dict[str, int] = {}
+    next_enum_value: int = 1
+    reserved_enum_values: List[int] = []
+
+
+class GroupNumbers(BaseModel):
+    """Field number of a group in the Metadata message and those of its attributes."""
+
+    number: int
+    field_name: str
+    attributes: Dict[str, AttributeNumbers] = {}
+    next_number: int = 1
+    reserved_numbers: List[int] = []
+    reserved_names: List[str] = []
+
+
+class FieldNumberRegistry:
+    """
+    Persistent assignment of field numbers to groups, attributes and enum values.
+
+    The first metamodel is numbered by position, which matches schemas
+    generated without a registry. Each later version keeps the numbers of
+    existing fields and gives new fields numbers that were never used before.
+    Numbers of removed fields, and of fields whose wire type changed, are
+    reserved so they are never reused, and previously encoded records stay
+    readable.
+
+    Renames within a group, as detected by ChangeAnalyzer, keep the field
+    number. Versions should be passed to update() in order.
+    """
+
+    def __init__(self, analyzer: Optional[ChangeAnalyzer] = None):
+        """
+        Initialize an empty registry.
+
+        Args:
+            analyzer: Analyzer used to detect renames and type changes
+                between versions (defaults to ChangeAnalyzer())
+        """
+        self.analyzer = analyzer or ChangeAnalyzer()
+        self.metamodel: Optional[Metamodel] = None
+        self.groups: Dict[str, GroupNumbers] = {}
+        self.next_group_number = 1
+        self.reserved_group_numbers: List[int] = []
+        self.reserved_group_names: List[str] = []
+
+    @classmethod
+    def positional(cls, metamodel: Metamodel) -> "FieldNumberRegistry":
+        """
+        Number the fields of a metamodel by position, without keeping it for updates.
+
+        Args:
+            metamodel: The metamodel to number
+
+        Returns:
+            A registry with the numbers of the metamodel's first version
+        """
+        registry = cls()
+        registry._reconcile(metamodel)
+        return registry
+
+    def update(self, metamodel: Metamodel) -> List[MetamodelChange]:
+        """
+        Assign numbers to the fields of a new metamodel version.
+
+        Args:
+            metamodel: The new version
+
+        Returns:
+            The changes from the previously registered version
+        """
+        changes: List[MetamodelChange] = []
+        if self.metamodel is not None:
+            if self.metamodel.content_hash() == metamodel.content_hash():
+                return changes
+            changes = self.analyzer.detect_changes(self.metamodel, metamodel)
+            self._apply_renames(changes)
+        self._reconcile(metamodel)
+        self.metamodel = metamodel.freeze()
+        return changes
+
+    def group(self, group_name: str) -> GroupNumbers:
+        """
+        Return the numbers of a group.
+
+        Raises:
+            KeyError: If the group is not in the registered metamodel
+        """
+        return self.groups[group_name]
+
+    def fingerprint(self) -> str:
+        """Return a digest of the assigned and reserved numbers."""
+        return hashlib.sha256(
+            json.dumps(self._numbers(), sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def save(self, file_path: str) -> None:
+        """
+        Write the registry, including the last registered metamodel, to a JSON file.
+
+        Args:
+            file_path: Path of the file to write
+        """
+        data = self._numbers()
+        data["metamodel"] = (
+            self.metamodel.model_dump() if self.metamodel is not None else None
+        )
+        with open(file_path, "w") as f:
+            json.dump(data, f, indent=2)
+
+    @classmethod
+    def load(
+        cls, file_path: str, analyzer: Optional[ChangeAnalyzer] = None
+    ) -> "FieldNumberRegistry":
+        """
+        Read a registry written by save(), or return an empty one if there is no file.
+
+        Args:
+            file_path: Path of the file to read
+            analyzer: Analyzer used for later updates
+
+        Returns:
+            The registry
+        """
+        registry = cls(analyzer)
+        if not os.path.exists(file_path):
+            return registry
+        with open(file_path, "r") as f:
+            data = json.load(f)
+        if data["metamodel"] is not None:
+            registry.metamodel = Metamodel.from_dict(data["metamodel"]).freeze()
+        registry.groups = {
+            name: GroupNumbers.model_validate(group)
+            for name, group in data["groups"].items()
+        }
+        registry.next_group_number = data["next_group_number"]
+        registry.reserved_group_numbers = data["reserved_group_numbers"]
+        registry.reserved_group_names = data["reserved_group_names"]
+        return registry
+
+    def _numbers(self) -> Dict:
+        return {
+            "groups": {name: group.model_dump() for name, group in self.groups.items()},
+            "next_group_number": self.next_group_number,
+            "reserved_group_numbers": self.reserved_group_numbers,
+            "reserved_group_names": self.reserved_group_names,
+        }
+
+    def _apply_renames(self, changes: List[MetamodelChange]) -> None:
+        """Carry numbers over renames and drop those whose wire type changed."""
+        renamed = []
+        for change in changes:
+            old_value: Dict[str, Any] = change.old_value or {}
+            new_value: Dict[str, Any] = change.new_value or {}
+            if change.change_type == ChangeType.RENAME_ATTRIBUTE:
+                group_name, attr_name = change.target_path.split("/")
+                new_group, new_name = new_value["group"], new_value["name"]
+                group = self.groups.get(group_name)
+                # Moves to another message get a new number when reconciling
+                if (
+                    group is None
+                    or new_group != group_name
+                    or attr_name not in group.attributes
+                ):
+                    continue
+                # A number is never carried over a change of wire type
+                if old_value.get("type") != new_value.get("type") or (
+                    bool(old_value.get("enum")) != bool(new_value.get("enum"))
+                ):
+                    continue
+                # Detach first, so renames that reuse each other's names do not collide
+                renamed.append(
+                    (group, attr_name, new_name, group.attributes.pop(attr_name))
+                )
+
+            elif change.change_type == ChangeType.MODIFY_ATTRIBUTE:
+                wire_type_changed = "type" in new_value or (
+                    "enum" in new_value
+                    and bool(old_value.get("enum")) != bool(new_value.get("enum"))
+                )
+                if wire_type_changed:
+                    group_name, attr_name = change.target_path.split("/")
+                    group = self.groups.get(group_name)
+                    if group is not None and attr_name in group.attributes:
+                        # Reserve the number only; the name stays in use
+                        group.reserved_numbers.append(
+                            group.attributes.pop(attr_name).number
+                        )
+
+        for group, attr_name, new_name, numbers in renamed:
+            group.attributes[new_name] = numbers
+            old_field_name = self._field_name(attr_name)
+            if old_field_name not in group.reserved_names:
+                group.reserved_names.append(old_field_name)
+
+    def _reconcile(self, metamodel: Metamodel) -> None:
+        """Reserve the numbers of removed fields and number new ones in order."""
+        names = {group.name for group in metamodel.groups}
+        for group_name in [name for name in self.groups if name not in names]:
+            removed = self.groups.pop(group_name)
+            self.reserved_group_numbers.append(removed.number)
+            if removed.field_name not in self.reserved_group_names:
+                self.reserved_group_names.append(removed.field_name)
+
+        for metamodel_group in metamodel.groups:
+            group = self.groups.get(metamodel_group.name)
+            if group is None:
+                group = self.groups[metamodel_group.name] = GroupNumbers(
+                    number=self.next_group_number,
+                    field_name=self._field_name(metamodel_group.name),
+                )
+                self.next_group_number += 1
+
+            attr_names = {attr.name for attr in metamodel_group.attributes}
+            for attr_name in [
+                name for name in group.attributes if name not in attr_names
+            ]:
+                group.reserved_numbers.append(group.attributes.pop(attr_name).number)
+                field_name = self._field_name(attr_name)
+                if field_name not in group.reserved_names:
+                    group.reserved_names.append(field_name)
+
+            for attr in metamodel_group.attributes:
+                numbers = group.attributes.get(attr.name)
+                if numbers is None:
+                    numbers = group.attributes[attr.name] = AttributeNumbers(
+                        number=group.next_number
+                    )
+                    group.next_number += 1
+                self._reconcile_enum(numbers, attr)
+
+            # A reserved name may be used again, only the numbers stay reserved
+            used = {self._field_name(attr.name) for attr in metamodel_group.attributes}
+            group.reserved_names = [
+                name for name in group.reserved_names if name not in used
+            ]
+
+        used = {group.field_name for group in self.groups.values()}
+        self.reserved_group_names = [
+            name for name in self.reserved_group_names if name not in used
+        ]
+
+    def _reconcile_enum(
+        self, numbers: AttributeNumbers, attr: MetamodelAttribute
+    ) -> None:
+        values = set(attr.enum or [])
+        for value in [value for value in numbers.enum_values if value not in values]:
+            numbers.reserved_enum_values.append(numbers.enum_values.pop(value))
+        for value in attr.enum or []:
+            if value not in numbers.enum_values:
+                numbers.enum_values[value] = numbers.next_enum_value
+                numbers.next_enum_value += 1
+
+    def _field_name(self, name: str) -> str:
+        return format_field_name(name)
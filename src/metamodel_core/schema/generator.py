@@ -0,0 +1,121 @@
+"""
+Generates schemas in several formats from one compiled pass over each metamodel.
+"""
+
+import os
+from typing import Dict, List, Mapping, Optional
+
+from metamodel_core.models.metamodel import Metamodel
+from metamodel_core.schema.arrow import ArrowBackend, pyarrow
+from metamodel_core.schema.avro import AvroBackend
+from metamodel_core.schema.backend import SchemaBackend
+from metamodel_core.schema.cache import GenerationCache, cache_key, write_if_changed
+from metamodel_core.schema.dbt import DbtBackend
+from metamodel_core.schema.ir import compile_metamodel
+from metamodel_core.schema.json_schema import JsonSchemaBackend
+
+
+def default_backends() -> List[SchemaBackend]:
+    """Return the JSON Schema, Avro, dbt and (with pyarrow installed) Arrow backends."""
+    backends: List[SchemaBackend] = [JsonSchemaBackend(), AvroBackend(), DbtBackend()]
+    if pyarrow is not None:
+        backends.append(ArrowBackend())
+    return backends
+
+
+class SchemaGenerator:
+    """
+    Generates schema files for several backends.
+
+    Each metamodel is compiled once into a ``MetamodelIR`` (shared by all
+    backends and cached by content hash), and every backend renders from it.
+    Backends reuse the parts of groups they already rendered, so generating
+    many metamodels that share groups costs little more than generating
+    one. Rendered schemas are cached like ProtobufGenerator's, and files are
+    not rewritten when their contents did not change.
+    """
+
+    def __init__(
+        self,
+        backends: Optional[List[SchemaBackend]] = None,
+        output_dir: str = "generated",
+        cache: Optional[GenerationCache] = None,
+    ):
+        """
+        Initialize the generator.
+
+        Args:
+            backends: The formats to generate (defaults to default_backends())
+            output_dir: Directory where generated files will be saved (created
+                when the first file is written)
+            cache: Cache of rendered schemas (defaults to an in-memory cache
+                owned by this generator)
+        """
+        self.backends = backends if backends is not None else default_backends()
+        self.output_dir = output_dir
+        self.cache = cache if cache is not None else GenerationCache()
+
+    def render(self, metamodel: Metamodel, filename: str) -> Dict[str, bytes]:
+        """
+        Render the schemas of a metamodel without writing them.
+
+        Args:
+            metamodel: The metamodel to convert
+            filename: The filename of the schemas (without extension)
+
+        Returns:
+            Dictionary mapping backend names to schema contents
+        """
+        content_hash = metamodel.content_hash()
+        ir = None
+        rendered = {}
+        for backend in self.backends:
+            key = cache_key(
+                "schema", backend.name, backend.version, content_hash, filename
+            )
+            content = self.cache.get(key, backend.extension)
+            if content is None:
+                if ir is None:
+                    ir = compile_metamodel(metamodel)
+                content = backend.render(ir, filename)
+                self.cache.put(key, content, backend.extension)
+            rendered[backend.name] = content
+        return rendered
+
+    def generate(self, metamodel: Metamodel, filename: str) -> Dict[str, str]:
+        """
+        Generate the schema files of a metamodel.
+
+        Args:
+            metamodel: The metamodel to convert
+            filename: The filename of the schemas (without extension)
+
+        Returns:
+            Dictionary mapping backend names to paths of the generated files
+        """
+        rendered = self.render(metamodel, filename)
+        os.makedirs(self.output_dir, exist_ok=True)
+        paths = {}
+        for backend in self.backends:
+            paths[backend.name] = os.path.join(
+                self.output_dir, f"{filename}{backend.extension}"
+            )
+            write_if_changed(paths[backend.name], rendered[backend.name])
+        return paths
+
+    def generate_all(
+        self, metamodels: Mapping[str, Metamodel]
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Generate the schema files of several metamodels.
+
+        Args:
+            metamodels: Dictionary mapping filenames (without extension) to metamodels
+
+        Returns:
+            Dictionary mapping filenames to the paths returned by generate()
+        """
+        return {
+            filename: self.generate(metamodel, filename)
+            for filename, metamodel in metamodels.items()
+        }
@@ -0,0 +1,158 @@
+"""
+Intermediate representation of a metamodel shared by the schema backends.
+
+``compile_metamodel`` normalizes a ``Metamodel`` once: names are converted to
+field and type names with the same rules as the Protocol Buffer schema,
+attribute types are resolved to ``AttributeType`` members and enum values
+get their symbols. Backends then render schemas from the plain tuples
+without touching the pydantic models again.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, NamedTuple, Optional, Tuple, TypeVar
+
+from metamodel_core.models.metamodel import (
+    AttributeType,
+    Metamodel,
+    MetamodelAttribute,
+    MetamodelGroup,
+)
+from metamodel_core.schema.naming import enum_name, format_field_name, message_name
+
+# Bounds of the process-wide compilation caches
+MAX_CACHED_METAMODELS = 64
+MAX_CACHED_GROUPS = 4096
+
+
+class FieldIR(NamedTuple):
+    """A normalized attribute."""
+
+    name: str
+    field_name: str
+    description: str
+    type: AttributeType
+    required: bool
+    # Allowed values and their symbols (e.g. "On Hold" -> "ON_HOLD"), empty
+    # without an enum
+    enum: Tuple[str, ...]
+    enum_symbols: Tuple[str, ...]
+    enum_type_name: Optional[str]
+
+
+class GroupIR(NamedTuple):
+    """A normalized group."""
+
+    name: str
+    field_name: str
+    type_name: str
+    description: str
+    fields: Tuple[FieldIR, ...]
+    content_hash: str
+
+    @property
+    def required(self) -> bool:
+        """Whether records must contain the group, i.e. it has required attributes."""
+        return any(field.required for field in self.fields)
+
+
+class MetamodelIR(NamedTuple):
+    """A normalized metamodel."""
+
+    name: str
+    version: str
+    description: str
+    groups: Tuple[GroupIR, ...]
+    content_hash: str
+
+
+_metamodels: "OrderedDict[str, MetamodelIR]" = OrderedDict()
+_groups: "OrderedDict[str, GroupIR]" = OrderedDict()
+_lock = threading.Lock()
+
+T = TypeVar("T")
+
+
+def _cached(
+    cache: "OrderedDict[str, T]", key: str, limit: int, build: Callable[[], T]
+) -> T:
+    with _lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+            return value
+    value = build()
+    with _lock:
+        cache[key] = value
+        while len(cache) > limit:
+            cache.popitem(last=False)
+    return value
+
+
+def _compile_field(attr: MetamodelAttribute) -> FieldIR:
+    field_name = format_field_name(attr.name)
+    enum = tuple(attr.enum or ())
+    return FieldIR(
+        name=attr.name,
+        field_name=field_name,
+        description=attr.description,
+        type=AttributeType(attr.type),
+        required=attr.required,
+        enum=enum,
+        enum_symbols=tuple(format_field_name(value).upper() for value in enum),
+        enum_type_name=enum_name(field_name) if enum else None,
+    )
+
+
+def compile_group(group: MetamodelGroup) -> GroupIR:
+    """
+    Normalize a group, reusing the result for groups with the same content.
+
+    Args:
+        group: The group to compile
+
+    Returns:
+        The group's intermediate representation
+    """
+    content_hash = group.content_hash()
+
+    def build() -> GroupIR:
+        field_name = format_field_name(group.name)
+        return GroupIR(
+            name=group.name,
+            field_name=field_name,
+            type_name=message_name(field_name),
+            description=group.description,
+            fields=tuple(_compile_field(attr) for attr in group.attributes),
+            content_hash=content_hash,
+        )
+
+    return _cached(_groups, content_hash, MAX_CACHED_GROUPS, build)
+
+
+def compile_metamodel(metamodel: Metamodel) -> MetamodelIR:
+    """
+    Normalize a metamodel, reusing the result for metamodels with the same content.
+
+    Groups are compiled and cached individually, so metamodels that share
+    groups (or versions that differ in a few groups) only compile the
+    groups that are new.
+
+    Args:
+        metamodel: The metamodel to compile
+
+    Returns:
+        The metamodel's intermediate representation
+    """
+    content_hash = metamodel.content_hash()
+
+    def build() -> MetamodelIR:
+        return MetamodelIR(
+            name=metamodel.name,
+            version=metamodel.version,
+            description=metamodel.description,
+            groups=tuple(compile_group(group) for group in metamodel.groups),
+            content_hash=content_hash,
+        )
+
+    return _cached(_metamodels, content_hash, MAX_CACHED_METAMODELS, build)
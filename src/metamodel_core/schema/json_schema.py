@@ -0,0 +1,398 @@
+"""
+JSON Schema (draft 2020-12) of metadata records, and validation of records with it.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple, cast
+
+from jsonschema import Draft202012Validator, FormatChecker, TypeChecker, ValidationError
+from jsonschema.protocols import Validator
+from jsonschema.validators import extend
+
+from metamodel_core.models.metamodel import (
+    AttributeType,
+    Metamodel,
+    MetamodelAttribute,
+    MetamodelGroup,
+)
+from metamodel_core.models.records import RecordError, RecordErrorCode, parse_datetime
+from metamodel_core.schema.backend import GroupRenderer, JsonDocumentBackend
+from metamodel_core.schema.ir import FieldIR, GroupIR, MetamodelIR, compile_metamodel
+
+JSON_SCHEMA_DIALECT = "https://json-schema.org/draft/2020-12/schema"
+
+# JSON Schema keywords of each attribute type
+_TYPES: Dict[AttributeType, Dict[str, str]] = {
+    AttributeType.STRING: {"type": "string"},
+    AttributeType.BOOLEAN: {"type": "boolean"},
+    AttributeType.INTEGER: {"type": "integer"},
+    AttributeType.NUMBER: {"type": "number"},
+    AttributeType.ARRAY: {"type": "array"},
+    AttributeType.OBJECT: {"type": "object"},
+    AttributeType.DATETIME: {"type": "string", "format": "date-time"},
+}
+
+
+class JsonSchemaBackend(JsonDocumentBackend):
+    """
+    Renders the JSON Schema of metadata records.
+
+    The schema describes records as ``RecordValidator`` checks them: objects
+    keyed by group and attribute name, where required attributes must be
+    present and not null, optional attributes may be null, and groups with
+    required attributes must be present. Datetimes are strings with the
+    ``date-time`` format, which is only checked when validating with a
+    format checker.
+    """
+
+    name = "json_schema"
+    extension = ".schema.json"
+
+    def __init__(self, allow_unknown: bool = False):
+        """
+        Initialize the backend.
+
+        Args:
+            allow_unknown: Whether records may contain groups and attributes
+                not defined in the metamodel
+        """
+        super().__init__()
+        self.allow_unknown = allow_unknown
+
+    def schema(self, ir: MetamodelIR) -> Dict[str, Any]:
+        """
+        Build the JSON Schema of a metamodel's records.
+
+        Args:
+            ir: The compiled metamodel
+
+        Returns:
+            The schema as a JSON-serializable dictionary
+        """
+        return self._document(ir, "", self.group_fragment)
+
+    def _document(
+        self, ir: MetamodelIR, filename: str, render_group: GroupRenderer
+    ) -> Dict[str, Any]:
+        return {
+            "$schema": JSON_SCHEMA_DIALECT,
+            "$comment": f'Generated from metamodel "{ir.name}" version {ir.version}',
+            "title": ir.name,
+            "description": ir.description,
+            "type": "object",
+            "properties": {group.name: render_group(group, "") for group in ir.groups},
+            "required": [group.name for group in ir.groups if group.required],
+            "additionalProperties": self.allow_unknown,
+        }
+
+    def _render_group(self, group: GroupIR, namespace: str) -> Dict[str, Any]:
+        return {
+            "type": "object" if group.required else ["object", "null"],
+            "description": group.description,
+            "properties": {field.name: self._property(field) for field in group.fields},
+            "required": [field.name for field in group.fields if field.required],
+            "additionalProperties": self.allow_unknown,
+        }
+
+    def _property(self, field: FieldIR) -> Dict[str, Any]:
+        schema: Dict[str, Any] = {
+            "description": field.description,
+            **_TYPES[field.type],
+        }
+        if field.enum:
+            schema["enum"] = list(field.enum)
+        if not field.required:
+            schema["type"] = [schema["type"], "null"]
+            if field.enum:
+                schema["enum"].append(None)
+        return schema
+
+
+# Checks the "date-time" format like RecordValidator, i.e. any ISO 8601 datetime
+FORMAT_CHECKER = FormatChecker(formats=())
+
+
+@FORMAT_CHECKER.checks("date-time", raises=ValueError)
+def _is_datetime(value: Any) -> bool:
+    if isinstance(value, str):
+        parse_datetime(value)
+    return True
+
+
+def _is_integer(checker: TypeChecker, instance: Any) -> bool:
+    return isinstance(instance, int) and not isinstance(instance, bool)
+
+
+# Draft 2020-12 accepts floats with a zero fractional part such as 1.0 as
+# integers; RecordValidator does not, so neither do the compiled validators
+RecordSchemaValidator = extend(
+    Draft202012Validator,
+    type_checker=Draft202012Validator.TYPE_CHECKER.redefine("integer", _is_integer),
+)
+
+
+class ValidatorCache:
+    """
+    Compiled JSON Schema validators of metamodels, bounded by least recent use.
+
+    Validators are keyed by the metamodel's content hash (which covers its
+    version), so each metamodel version is compiled once per cache, also
+    when several threads ask for it at the same time. Compiling generates
+    the schema from the metamodel and checks it against the draft 2020-12
+    metaschema. Validators are ``RecordSchemaValidator`` instances, which
+    unlike other draft 2020-12 validators reject 1.0 for integers.
+    """
+
+    def __init__(self, maxsize: int = 32):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of validators kept
+        """
+        self.maxsize = maxsize
+        self.compiles = 0
+        self._validators: "OrderedDict[Tuple[str, bool], Validator]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._compiling: Dict[Tuple[str, bool], threading.Lock] = {}
+
+    def get(self, metamodel: Metamodel, allow_unknown: bool = False) -> Validator:
+        """
+        Return the validator of a metamodel's records, compiling it on first use.
+
+        Args:
+            metamodel: The metamodel records must conform to
+            allow_unknown: Whether records may contain groups and attributes
+                not defined in the metamodel
+
+        Returns:
+            The validator, which checks the "date-time" format
+        """
+        key = (metamodel.content_hash(), allow_unknown)
+        with self._lock:
+            validator = self._validators.get(key)
+            if validator is not None:
+                self._validators.move_to_end(key)
+                return validator
+            compiling = self._compiling.setdefault(key, threading.Lock())
+
+        with compiling:
+            try:
+                with self._lock:
+                    validator = self._validators.get(key)
+                if validator is None:
+                    schema = JsonSchemaBackend(allow_unknown).schema(
+                        compile_metamodel(metamodel)
+                    )
+                    RecordSchemaValidator.check_schema(schema)
+                    validator = RecordSchemaValidator(
+                        schema, format_checker=FORMAT_CHECKER
+                    )
+                    with self._lock:
+                        self.compiles += 1
+                        self._validators[key] = validator
+                        while len(self._validators) > self.maxsize:
+                            self._validators.popitem(last=False)
+            finally:
+                # Also after a failed compilation, so the entry does not leak
+                with self._lock:
+                    self._compiling.pop(key, None)
+        return validator
+
+    def clear(self) -> None:
+        """Drop all cached validators."""
+        with self._lock:
+            self._validators.clear()
+
+    def __len__(self) -> int:
+        return len(self._validators)
+
+
+_default_cache = ValidatorCache()
+
+
+def get_validator(metamodel: Metamodel, allow_unknown: bool = False) -> Validator:
+    """
+    Return the validator of a metamodel's records from the process-wide cache.
+
+    Args:
+        metamodel: The metamodel records must conform to
+        allow_unknown: Whether records may contain undefined groups and attributes
+
+    Returns:
+        The compiled validator
+    """
+    return _default_cache.get(metamodel, allow_unknown)
+
+
+class JsonSchemaRecordValidator:
+    """
+    Validates metadata records with the metamodel's JSON Schema.
+
+    Accepts the same records as ``RecordValidator`` and reports errors with
+    the same paths, codes and messages, except that a missing or null group
+    with required attributes is reported once, for the group, instead of
+    once per required attribute. Other draft 2020-12 validators of the
+    generated schema also accept floats such as 1.0 for integer attributes.
+    """
+
+    def __init__(
+        self,
+        metamodel: Metamodel,
+        allow_unknown: bool = False,
+        cache: Optional[ValidatorCache] = None,
+    ):
+        """
+        Look up or compile the validator of a metamodel.
+
+        Args:
+            metamodel: The metamodel records must conform to
+            allow_unknown: Whether groups and attributes not defined in the
+                metamodel are accepted instead of reported as errors
+            cache: Cache to take the compiled validator from (defaults to the
+                process-wide cache)
+        """
+        self.metamodel = metamodel
+        self.allow_unknown = allow_unknown
+        self._validator = (cache or _default_cache).get(metamodel, allow_unknown)
+
+    def validate(self, record: Any) -> Tuple[bool, List[RecordError]]:
+        """
+        Validate a single metadata record.
+
+        Args:
+            record: The record to validate, keyed by group name
+
+        Returns:
+            Tuple of (is_valid, list_of_record_errors)
+        """
+        errors: List[RecordError] = []
+        # jsonschema reports each missing property of an object separately
+        required_checked: Set[Tuple[Any, ...]] = set()
+        for error in self._validator.iter_errors(record):
+            if error.validator == "required":
+                location = tuple(error.absolute_path)
+                if location in required_checked:
+                    continue
+                required_checked.add(location)
+            errors.extend(self._record_errors(error))
+        # RecordValidator only checks the enum of values of the right type
+        mistyped = {e.path for e in errors if e.code == RecordErrorCode.INVALID_TYPE}
+        errors = [
+            e
+            for e in errors
+            if e.code != RecordErrorCode.INVALID_ENUM or e.path not in mistyped
+        ]
+        return len(errors) == 0, errors
+
+    def _record_errors(self, error: ValidationError) -> List[RecordError]:
+        """Convert a jsonschema error to the errors RecordValidator reports."""
+        path = [str(part) for part in error.absolute_path]
+        instance: Any = error.instance
+
+        if error.validator == "required":
+            # All missing properties of the object, in schema order
+            missing = [
+                name
+                for name in cast(List[str], error.validator_value)
+                if name not in instance
+            ]
+            if not path:
+                return [
+                    RecordError(
+                        path=name,
+                        code=RecordErrorCode.MISSING_REQUIRED,
+                        message=f"Group '{name}' is required",
+                    )
+                    for name in missing
+                ]
+            return [_missing_required(path[0], name) for name in missing]
+
+        if error.validator == "additionalProperties":
+            properties = cast(Dict[str, Any], error.schema).get("properties", {})
+            unknown = [name for name in instance if name not in properties]
+            if not path:
+                return [
+                    RecordError(
+                        path=name,
+                        code=RecordErrorCode.UNKNOWN_GROUP,
+                        message=f"Group '{name}' is not defined in the metamodel",
+                    )
+                    for name in unknown
+                ]
+            return [
+                RecordError(
+                    path=f"{path[0]}/{name}",
+                    code=RecordErrorCode.UNKNOWN_ATTRIBUTE,
+                    message=f"Attribute '{name}' is not defined in group '{path[0]}'",
+                )
+                for name in unknown
+            ]
+
+        if not path:
+            return [
+                RecordError(
+                    path="",
+                    code=RecordErrorCode.NOT_AN_OBJECT,
+                    message="Record must be an object keyed by group name",
+                )
+            ]
+        if len(path) == 1:
+            if instance is None:
+                return [
+                    RecordError(
+                        path=path[0],
+                        code=RecordErrorCode.MISSING_REQUIRED,
+                        message=f"Group '{path[0]}' is required",
+                    )
+                ]
+            return [
+                RecordError(
+                    path=path[0],
+                    code=RecordErrorCode.NOT_AN_OBJECT,
+                    message=(
+                        f"Group '{path[0]}' must be an object keyed by attribute name"
+                    ),
+                )
+            ]
+
+        group_name, attr_name = path[:2]
+        if instance is None:
+            # Only required attributes may not be null
+            return [_missing_required(group_name, attr_name)]
+        if error.validator == "enum":
+            return [
+                RecordError(
+                    path=f"{group_name}/{attr_name}",
+                    code=RecordErrorCode.INVALID_ENUM,
+                    message=(
+                        f"Value {instance!r} is not allowed for attribute "
+                        f"'{attr_name}' in group '{group_name}'"
+                    ),
+                )
+            ]
+        # The schema only has properties for the attributes of the metamodel
+        _, attr = cast(
+            Tuple[MetamodelGroup, MetamodelAttribute],
+            self.metamodel.get_attribute_by_path(f"{group_name}/{attr_name}"),
+        )
+        return [
+            RecordError(
+                path=f"{group_name}/{attr_name}",
+                code=RecordErrorCode.INVALID_TYPE,
+                message=(
+                    f"Attribute '{attr_name}' in group '{group_name}' must be of type "
+                    f"'{AttributeType(attr.type).value}', "
+                    f"got '{type(instance).__name__}'"
+                ),
+            )
+        ]
+
+
+def _missing_required(group_name: str, attr_name: str) -> RecordError:
+    return RecordError(
+        path=f"{group_name}/{attr_name}",
+        code=RecordErrorCode.MISSING_REQUIRED,
+        message=f"Attribute '{attr_name}' in group '{group_name}' is required",
+    )
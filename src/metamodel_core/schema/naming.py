@@ -0,0 +1,38 @@
+"""
+Naming rules shared by the schema generators.
+"""
+
+import re
+from functools import lru_cache
+
+_CAMEL_WORD_RE = re.compile(r"(.)([A-Z][a-z]+)")
+_CAMEL_BOUNDARY_RE = re.compile(r"([a-z0-9])([A-Z])")
+_INVALID_CHARS_RE = re.compile(r"[^a-zA-Z0-9_]")
+_UNDERSCORES_RE = re.compile(r"_+")
+
+
+@lru_cache(maxsize=16384)
+def format_field_name(name: str) -> str:
+    """
+    Convert a metamodel group or attribute name to a snake_case field name.
+
+    Args:
+        name: The original name, e.g. "Last Refreshed" or "firstName"
+
+    Returns:
+        The field name, e.g. "last_refreshed" or "first_name"
+    """
+    s1 = _CAMEL_WORD_RE.sub(r"\1_\2", name)
+    s2 = _CAMEL_BOUNDARY_RE.sub(r"\1_\2", s1)
+    s3 = _INVALID_CHARS_RE.sub("_", s2)
+    return _UNDERSCORES_RE.sub("_", s3).strip("_").lower()
+
+
+def message_name(field_name: str) -> str:
+    """Return the message or record type name of a group, e.g. "GeneralGroup"."""
+    return f"{field_name.title().replace('_', '')}Group"
+
+
+def enum_name(field_name: str) -> str:
+    """Return the enum type name of an attribute, e.g. "StatusEnum"."""
+    return f"{field_name.title().replace('_', '')}Enum"
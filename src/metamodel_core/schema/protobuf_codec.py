@@ -0,0 +1,269 @@
+"""
+Binary encoding of metadata records with dynamic Protocol Buffer message classes.
+
+``ProtobufCodec`` builds the descriptors of a metamodel's schema in-process,
+turns them into message classes with the protobuf message factory, and
+converts between metadata records (dictionaries keyed by group and attribute
+name, see ``metamodel_core.models.records``) and those messages.
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type
+
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+from google.protobuf.descriptor import Descriptor
+from google.protobuf.message import Message
+
+from metamodel_core.models.metamodel import AttributeType, Metamodel
+from metamodel_core.models.records import parse_datetime
+from metamodel_core.schema.field_numbers import FieldNumberRegistry
+from metamodel_core.schema.naming import format_field_name
+from metamodel_core.schema.protobuf_generator import ProtobufGenerator
+
+_FieldDescriptorProto = descriptor_pb2.FieldDescriptorProto
+
+# How a field is converted: scalar, repeated, object (JSON bytes), datetime or enum
+_SCALAR, _REPEATED, _OBJECT, _DATETIME, _ENUM = range(5)
+
+
+class _Field:
+    """Conversion plan of one attribute."""
+
+    __slots__ = ("name", "field_name", "kind", "to_number", "to_value")
+
+    def __init__(
+        self,
+        name: str,
+        field_name: str,
+        kind: int,
+        enum_numbers: Optional[Dict[str, int]] = None,
+    ):
+        self.name = name
+        self.field_name = field_name
+        self.kind = kind
+        # 0 is the UNSPECIFIED value of every enum
+        self.to_number = dict(enum_numbers or {})
+        self.to_value = {i: value for value, i in self.to_number.items()}
+
+
+def _message_class(descriptor: Descriptor) -> Type[Message]:
+    # GetMessageClass replaced MessageFactory.GetPrototype in protobuf 4.22
+    get_message_class = getattr(message_factory, "GetMessageClass", None)
+    if get_message_class is None:
+        factory = message_factory.MessageFactory(descriptor.file.pool)
+        get_message_class = factory.GetPrototype  # type: ignore[attr-defined]
+    message_class: Type[Message] = get_message_class(descriptor)
+    return message_class
+
+
+class ProtobufCodec:
+    """
+    Encodes metadata records as Protocol Buffer messages and decodes them again.
+
+    Messages follow the schema ProtobufGenerator emits for the metamodel, so
+    encoded records can be read with code generated from that schema. In the
+    codec's own descriptors, scalar fields are declared ``optional``. This
+    does not change the wire format, but it keeps explicit ``False``, ``0``
+    and ``""`` values apart from missing ones when decoding.
+
+    Enum attributes are stored as enum numbers, DATETIME attributes as
+    ``google.protobuf.Timestamp`` and OBJECT attributes as JSON bytes.
+    Decoded datetimes are RFC 3339 strings in UTC (e.g. "2025-05-01T12:00:00Z").
+    """
+
+    def __init__(
+        self,
+        metamodel: Metamodel,
+        package: str = "metadata",
+        field_numbers: Optional[FieldNumberRegistry] = None,
+    ):
+        """
+        Build the message classes for a metamodel.
+
+        Args:
+            metamodel: The metamodel the records conform to
+            package: Protocol Buffer package of the messages
+            field_numbers: Registry of stable field numbers, updated with the
+                metamodel (defaults to numbering fields by position)
+        """
+        generator = ProtobufGenerator(field_numbers=field_numbers)
+        numbers = generator.get_field_numbers(metamodel)
+        descriptor_set = generator.build_descriptor_set(metamodel, package)
+        for message in descriptor_set.file[-1].message_type[1:]:
+            self._make_optional(message)
+
+        pool = descriptor_pool.DescriptorPool()
+        for file_proto in descriptor_set.file:
+            pool.Add(file_proto)
+        self.message_class = _message_class(
+            pool.FindMessageTypeByName(f"{package}.Metadata")
+        )
+
+        # Group name -> (field name of the group, attribute name -> field plan)
+        self._groups: Dict[str, Tuple[str, Dict[str, _Field]]] = {}
+        # Group field descriptor -> (group name, attribute field descriptor ->
+        # field plan),
+        # keyed by descriptor because ListFields() returns descriptors
+        self._fields: Dict[Any, Tuple[str, Dict[Any, _Field]]] = {}
+        metadata_fields: Mapping[str, Any] = (
+            self.message_class.DESCRIPTOR.fields_by_name
+        )
+        for group in metamodel.groups:
+            group_field = format_field_name(group.name)
+            group_descriptor = metadata_fields[group_field]
+            fields = {}
+            by_descriptor = {}
+            group_numbers = numbers.group(group.name)
+            for attr in group.attributes:
+                field = _Field(
+                    attr.name,
+                    format_field_name(attr.name),
+                    self._kind(attr.type, attr.enum),
+                    group_numbers.attributes[attr.name].enum_values,
+                )
+                fields[attr.name] = field
+                by_descriptor[
+                    group_descriptor.message_type.fields_by_name[field.field_name]
+                ] = field
+            self._groups[group.name] = (group_field, fields)
+            self._fields[group_descriptor] = (group.name, by_descriptor)
+
+    def _kind(self, attr_type: AttributeType, enum: Optional[List[str]]) -> int:
+        if enum:
+            return _ENUM
+        return {
+            AttributeType.ARRAY: _REPEATED,
+            AttributeType.OBJECT: _OBJECT,
+            AttributeType.DATETIME: _DATETIME,
+        }.get(attr_type, _SCALAR)
+
+    def _make_optional(self, message: descriptor_pb2.DescriptorProto) -> None:
+        """Declare the scalar and enum fields of a group message proto3 ``optional``."""
+        for field in message.field:
+            if (
+                field.label == _FieldDescriptorProto.LABEL_REPEATED
+                or field.type == _FieldDescriptorProto.TYPE_MESSAGE
+            ):
+                continue
+            field.proto3_optional = True
+            field.oneof_index = len(message.oneof_decl)
+            message.oneof_decl.add(name=f"_{field.name}")
+
+    def to_message(self, record: Dict[str, Dict[str, Any]]) -> Message:
+        """
+        Convert a metadata record to a Metadata message.
+
+        Args:
+            record: The record to convert
+
+        Returns:
+            The populated message
+
+        Raises:
+            ValueError: If the record has unknown groups, attributes or enum values
+            TypeError: If a value does not have the attribute's type
+        """
+        message = self.message_class()
+        for group_name, values in record.items():
+            if group_name not in self._groups:
+                raise ValueError(f"Unknown group '{group_name}'")
+            group_field, fields = self._groups[group_name]
+            group_message = getattr(message, group_field)
+            group_message.SetInParent()
+            for attr_name, value in values.items():
+                field = fields.get(attr_name)
+                if field is None:
+                    raise ValueError(
+                        f"Unknown attribute '{attr_name}' in group '{group_name}'"
+                    )
+                if value is None:
+                    continue
+                kind = field.kind
+                if kind == _SCALAR:
+                    setattr(group_message, field.field_name, value)
+                elif kind == _REPEATED:
+                    getattr(group_message, field.field_name).extend(value)
+                elif kind == _ENUM:
+                    if value not in field.to_number:
+                        raise ValueError(
+                            f"Invalid value '{value}' for attribute '{attr_name}' "
+                            f"in group '{group_name}'"
+                        )
+                    setattr(group_message, field.field_name, field.to_number[value])
+                elif kind == _OBJECT:
+                    setattr(
+                        group_message,
+                        field.field_name,
+                        json.dumps(value, separators=(",", ":")).encode("utf-8"),
+                    )
+                else:
+                    timestamp = getattr(group_message, field.field_name)
+                    timestamp.FromDatetime(
+                        value if isinstance(value, datetime) else parse_datetime(value)
+                    )
+        return message
+
+    def from_message(self, message: Message) -> Dict[str, Dict[str, Any]]:
+        """
+        Convert a Metadata message to a metadata record.
+
+        Args:
+            message: The message to convert
+
+        Returns:
+            The record, containing only the groups and attributes set in the message
+
+        Raises:
+            ValueError: If an enum field holds a number that is not a value of its enum
+        """
+        record: Dict[str, Dict[str, Any]] = {}
+        for group_descriptor, group_message in message.ListFields():
+            group_name, fields = self._fields[group_descriptor]
+            values = record[group_name] = {}
+            for descriptor, value in group_message.ListFields():
+                field = fields[descriptor]
+                kind = field.kind
+                if kind == _SCALAR:
+                    values[field.name] = value
+                elif kind == _REPEATED:
+                    values[field.name] = list(value)
+                elif kind == _ENUM:
+                    if value not in field.to_value:
+                        raise ValueError(
+                            f"Unknown enum number {value} for attribute '{field.name}' "
+                            f"in group '{group_name}'"
+                        )
+                    values[field.name] = field.to_value[value]
+                elif kind == _OBJECT:
+                    values[field.name] = json.loads(value)
+                else:
+                    values[field.name] = value.ToJsonString()
+        return record
+
+    def encode(self, record: Dict[str, Dict[str, Any]]) -> bytes:
+        """
+        Encode a metadata record in the Protocol Buffer binary format.
+
+        Args:
+            record: The record to encode
+
+        Returns:
+            The serialized Metadata message
+        """
+        return self.to_message(record).SerializeToString()
+
+    def decode(self, data: bytes) -> Dict[str, Dict[str, Any]]:
+        """
+        Decode a metadata record from the Protocol Buffer binary format.
+
+        Args:
+            data: A serialized Metadata message
+
+        Returns:
+            The decoded record
+
+        Raises:
+            ValueError: If an enum field holds a number that is not a value of its enum
+        """
+        return self.from_message(self.message_class.FromString(data))
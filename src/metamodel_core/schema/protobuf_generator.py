@@ -1,24 +1,113 @@
 """
 Generates Protocol Buffer schema files from metamodel definitions.
 """
+import json
 import os
-from typing import Dict, List, Optional, Set, Tuple
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple, Type
 
-from metamodel_core.models.metamodel import AttributeType, Metamodel, MetamodelAttribute
+from google.protobuf import descriptor_pb2, timestamp_pb2
+
+from metamodel_core.models.metamodel import (
+    AttributeType,
+    Metamodel,
+    MetamodelGroup,
+)
+from metamodel_core.schema.cache import GenerationCache, cache_key, write_if_changed
+from metamodel_core.schema.field_numbers import FieldNumberRegistry, GroupNumbers
+from metamodel_core.schema.naming import enum_name, format_field_name, message_name
+
+# Part of every cache key; bump whenever the generated output changes
+GENERATOR_VERSION = 1
+
+_FieldDescriptorProto = descriptor_pb2.FieldDescriptorProto
+
+# Descriptor field types of the attribute types, matching _type_to_protobuf
+_DESCRIPTOR_TYPES = {
+    AttributeType.STRING: _FieldDescriptorProto.TYPE_STRING,
+    AttributeType.BOOLEAN: _FieldDescriptorProto.TYPE_BOOL,
+    AttributeType.INTEGER: _FieldDescriptorProto.TYPE_INT32,
+    AttributeType.NUMBER: _FieldDescriptorProto.TYPE_DOUBLE,
+    AttributeType.ARRAY: _FieldDescriptorProto.TYPE_STRING,
+    AttributeType.OBJECT: _FieldDescriptorProto.TYPE_BYTES,
+    AttributeType.DATETIME: _FieldDescriptorProto.TYPE_MESSAGE,
+}
+
+TIMESTAMP_PROTO = "google/protobuf/timestamp.proto"
+
+_IMPORT_RE = re.compile(r'^import "([^"/]+)";$', re.MULTILINE)
+# Import statements of any .proto file, as protoc reads them
+_PROTO_IMPORT_RE = re.compile(
+    rb'^\s*import\s+(?:public\s+|weak\s+)?"([^"]+)"\s*;', re.MULTILINE
+)
+_JSON_NAME_RE = re.compile(r"_([a-z0-9])")
+
+# Fewer groups than this to render are not worth starting worker processes for
+PARALLEL_MIN_GROUPS = 32
+
+
+def _render_group_schema(
+    generator_class: Type["ProtobufGenerator"],
+    group: MetamodelGroup,
+    group_numbers: GroupNumbers,
+    filename: str,
+) -> str:
+    """Render one group's schema in a worker process."""
+    return generator_class().render_group_schema(group, group_numbers, filename)
+
+
+def _proto_sources(proto_file: str) -> List[Tuple[str, bytes]]:
+    """
+    Return the name and contents of a .proto file and of the files it imports.
+
+    Imports are followed transitively from the file's directory, which is the
+    proto path protoc is given. Imports not found there, such as the
+    well-known types, are built into protoc and left out.
+    """
+    proto_path = os.path.dirname(os.path.abspath(proto_file))
+    with open(proto_file, "rb") as f:
+        sources = [(os.path.basename(proto_file), f.read())]
+    seen = {sources[0][0]}
+    for _, content in sources:
+        for match in _PROTO_IMPORT_RE.findall(content):
+            name = match.decode("utf-8")
+            path = os.path.join(proto_path, name)
+            if name in seen or not os.path.isfile(path):
+                continue
+            seen.add(name)
+            with open(path, "rb") as f:
+                sources.append((name, f.read()))
+    return sources
 
 
 class ProtobufGenerator:
     """Generates Protocol Buffer schema files from metamodel definitions."""
     
-    def __init__(self, output_dir: str = "generated"):
+    def __init__(
+        self,
+        output_dir: str = "generated",
+        cache: Optional[GenerationCache] = None,
+        field_numbers: Optional[FieldNumberRegistry] = None,
+    ):
         """
         Initialize the generator.
         
         Args:
-            output_dir: Directory where generated files will be saved
+            output_dir: Directory where generated files will be saved (created
+                when the first file is written)
+            cache: Cache of rendered schemas and descriptor sets (defaults to
+                an in-memory cache owned by this generator)
+            field_numbers: Registry keeping field numbers stable across
+                metamodel versions; it is updated with every generated
+                metamodel (defaults to numbering fields by position)
         """
         self.output_dir = output_dir
-        os.makedirs(output_dir, exist_ok=True)
+        self.cache = cache if cache is not None else GenerationCache()
+        self.field_numbers = field_numbers
+        # Content hash and positional numbers of the last metamodel, used without
+        # a registry
+        self._positional: Optional[Tuple[str, FieldNumberRegistry]] = None
     
     def _type_to_protobuf(self, attr_type: AttributeType) -> str:
         """
@@ -51,12 +140,55 @@ class ProtobufGenerator:
         Returns:
             A Protocol Buffer compatible field name
         """
-        # Replace spaces with underscores and convert to snake_case
-        import re
-        s1 = re.sub(r'(.)([A-Z][a-z]+)', r'\1_\2', name)
-        s2 = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', s1)
-        return re.sub(r'[^a-zA-Z0-9_]', '_', s2).lower()
+        return format_field_name(name)
     
+    def _message_name(self, group_field_name: str) -> str:
+        """Return the message name of a group from its formatted field name."""
+        return message_name(group_field_name)
+
+    def _enum_name(self, field_name: str) -> str:
+        """Return the enum name of an attribute from its formatted field name."""
+        return enum_name(field_name)
+
+    def get_field_numbers(self, metamodel: Metamodel) -> FieldNumberRegistry:
+        """
+        Return the field numbers the schema of a metamodel uses.
+
+        Args:
+            metamodel: The metamodel
+
+        Returns:
+            The generator's registry, updated with the metamodel, or the
+            positional numbers of the metamodel if the generator has none
+        """
+        if self.field_numbers is not None:
+            self.field_numbers.update(metamodel)
+            return self.field_numbers
+        content_hash = metamodel.content_hash()
+        if self._positional is None or self._positional[0] != content_hash:
+            self._positional = (content_hash, FieldNumberRegistry.positional(metamodel))
+        return self._positional[1]
+
+    def _numbering_key(self, metamodel: Metamodel) -> Optional[str]:
+        """Return the part of cache keys that identifies the field numbering."""
+        if self.field_numbers is None:
+            return None
+        return self.get_field_numbers(metamodel).fingerprint()
+
+    def _reserved_statements(
+        self, numbers: List[int], names: List[str], indent: str
+    ) -> List[str]:
+        """Return the ``reserved`` statements for field numbers and names."""
+        statements = []
+        if numbers:
+            statements.append(
+                f'{indent}reserved {", ".join(str(n) for n in sorted(numbers))};'
+            )
+        if names:
+            quoted = ", ".join(f'"{name}"' for name in names)
+            statements.append(f"{indent}reserved {quoted};")
+        return statements
+
     def _get_imports(self, metamodel: Metamodel) -> Set[str]:
         """
         Determine the necessary Protocol Buffer imports based on the metamodel.
@@ -73,7 +205,7 @@ class ProtobufGenerator:
         for group in metamodel.groups:
             for attr in group.attributes:
                 if attr.type == AttributeType.DATETIME:
-                    imports.add('import "google/protobuf/timestamp.proto";')
+                    imports.add(f'import "{TIMESTAMP_PROTO}";')
         
         return imports
     
@@ -81,6 +213,10 @@ class ProtobufGenerator:
         """
         Generate a Protocol Buffer schema file from a metamodel.
         
+        The schema is looked up in the cache by the metamodel's content hash,
+        the generator version and the filename, and only rendered on a miss.
+        The file is not rewritten if it already has the same contents.
+
         Args:
             metamodel: The metamodel to convert
             filename: The filename for the generated schema (without extension)
@@ -88,98 +224,332 @@ class ProtobufGenerator:
         Returns:
             Path to the generated .proto file
         """
-        # Prepare the output
-        proto_content = [
-            'syntax = "proto3";',
-            f'package {filename};',
-            ''
+        key = cache_key(
+            "proto",
+            GENERATOR_VERSION,
+            metamodel.content_hash(),
+            filename,
+            self._numbering_key(metamodel),
+        )
+        content = self.cache.get(key, ".proto")
+        if content is None:
+            content = self.render_schema(metamodel, filename).encode("utf-8")
+            self.cache.put(key, content, ".proto")
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        output_path = os.path.join(self.output_dir, f"{filename}.proto")
+        write_if_changed(output_path, content)
+        return output_path
+
+    def generate_group_schemas(
+        self, metamodel: Metamodel, filename: str, workers: Optional[int] = None
+    ) -> List[str]:
+        """
+        Generate one Protocol Buffer schema file per group and an aggregating file.
+
+        Each group's message is written to ``<filename>_<group>.proto``, and
+        ``<filename>.proto`` imports them and defines the Metadata message. The
+        messages are the same as in generate_schema(), so both layouts encode
+        records identically.
+
+        Group files are cached by the group's content hash (and field
+        numbers), so after a change only the changed groups are rendered and
+        only their files rewritten. Groups that need rendering are rendered by
+        a pool of worker processes when there are at least
+        PARALLEL_MIN_GROUPS of them. Files of groups no longer in the
+        metamodel are removed.
+
+        Args:
+            metamodel: The metamodel to convert
+            filename: The filename of the aggregating schema (without extension)
+            workers: Number of worker processes (defaults to the CPU count)
+
+        Returns:
+            Paths to the generated .proto files, the aggregating file first
+        """
+        numbers = self.get_field_numbers(metamodel)
+
+        keys = []
+        contents: Dict[str, bytes] = {}
+        missing = []
+        for group in metamodel.groups:
+            group_numbers = numbers.group(group.name)
+            key = cache_key(
+                "group_proto",
+                GENERATOR_VERSION,
+                group.content_hash(),
+                filename,
+                json.dumps(group_numbers.model_dump(), sort_keys=True),
+            )
+            keys.append(key)
+            cached = self.cache.get(key, ".proto")
+            if cached is None:
+                missing.append((key, group, group_numbers))
+            else:
+                contents[key] = cached
+
+        workers = workers or os.cpu_count() or 1
+        if workers > 1 and len(missing) >= PARALLEL_MIN_GROUPS:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                rendered = list(
+                    executor.map(
+                        _render_group_schema,
+                        [type(self)] * len(missing),
+                        [group for _, group, _ in missing],
+                        [group_numbers for _, _, group_numbers in missing],
+                        [filename] * len(missing),
+                        chunksize=max(1, len(missing) // (workers * 4)),
+                    )
+                )
+        else:
+            rendered = [
+                self.render_group_schema(group, group_numbers, filename)
+                for _, group, group_numbers in missing
+            ]
+        for (key, _, _), content in zip(missing, rendered):
+            contents[key] = content.encode("utf-8")
+            self.cache.put(key, contents[key], ".proto")
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        output_path = os.path.join(self.output_dir, f"{filename}.proto")
+        group_files = [
+            self._group_filename(filename, group) for group in metamodel.groups
+        ]
+        group_paths = []
+        for group_file, key in zip(group_files, keys):
+            group_path = os.path.join(self.output_dir, group_file)
+            write_if_changed(group_path, contents[key])
+            group_paths.append(group_path)
+
+        self._remove_stale_group_files(output_path, set(group_files))
+        write_if_changed(
+            output_path,
+            self._render_metadata_schema(metamodel, filename, numbers).encode("utf-8"),
+        )
+        return [output_path] + group_paths
+
+    def render_group_schema(
+        self, group: MetamodelGroup, group_numbers: GroupNumbers, filename: str
+    ) -> str:
+        """
+        Render the schema file of one group, as written by generate_group_schemas().
+
+        Args:
+            group: The group to convert
+            group_numbers: The field numbers of the group
+            filename: The filename of the aggregating schema (used as the package name)
+
+        Returns:
+            The contents of the group's .proto file
+        """
+        imports = []
+        if any(attr.type == AttributeType.DATETIME for attr in group.attributes):
+            imports.append(f'import "{TIMESTAMP_PROTO}";')
+        proto_content = self._render_header(filename, imports)
+        proto_content.extend(self._render_group_message(group, group_numbers))
+        return "\n".join(proto_content)
+
+    def render_metadata_schema(self, metamodel: Metamodel, filename: str) -> str:
+        """
+        Render the aggregating schema file written by generate_group_schemas().
+
+        Args:
+            metamodel: The metamodel to convert
+            filename: The filename of the schema (used as the package name)
+
+        Returns:
+            The contents of the .proto file importing the group files
+        """
+        return self._render_metadata_schema(
+            metamodel, filename, self.get_field_numbers(metamodel)
+        )
+
+    def _render_metadata_schema(
+        self, metamodel: Metamodel, filename: str, numbers: FieldNumberRegistry
+    ) -> str:
+        imports = [
+            f'import "{self._group_filename(filename, group)}";'
+            for group in metamodel.groups
         ]
+        proto_content = self._render_header(filename, imports)
+        proto_content.extend(self._render_metadata_message(metamodel, numbers))
+        return "\n".join(proto_content)
+
+    def _group_filename(self, filename: str, group: MetamodelGroup) -> str:
+        """Return the name of a group's .proto file in the per-group layout."""
+        return f"{filename}_{self._format_field_name(group.name)}.proto"
+
+    def _remove_stale_group_files(
+        self, output_path: str, group_files: Set[str]
+    ) -> None:
+        """Remove the group files of a previous run that are no longer generated."""
+        try:
+            with open(output_path, "r") as f:
+                previous = _IMPORT_RE.findall(f.read())
+        except FileNotFoundError:
+            return
+        for group_file in previous:
+            if group_file not in group_files and group_file != TIMESTAMP_PROTO:
+                try:
+                    os.remove(os.path.join(self.output_dir, group_file))
+                except FileNotFoundError:
+                    pass
+
+    def _render_header(self, filename: str, imports: List[str]) -> List[str]:
+        """Return the syntax, package and import lines of a schema file."""
+        header = ['syntax = "proto3";', f"package {filename};", ""]
+        header.extend(imports)
+        if imports:
+            header.append("")
+        return header
+
+    def render_schema(self, metamodel: Metamodel, filename: str) -> str:
+        """
+        Render the Protocol Buffer schema of a metamodel without writing it.
+
+        Args:
+            metamodel: The metamodel to convert
+            filename: The filename for the schema (used as the package name)
+
+        Returns:
+            The contents of the .proto file
+        """
+        numbers = self.get_field_numbers(metamodel)
         
-        # Add necessary imports
-        imports = self._get_imports(metamodel)
-        for import_statement in sorted(imports):
-            proto_content.append(import_statement)
+        # Prepare the output, with the necessary imports
+        proto_content = self._render_header(
+            filename, sorted(self._get_imports(metamodel))
+        )
+        proto_content.extend(self._render_metadata_message(metamodel, numbers))
         
-        if imports:
-            proto_content.append('')
+        # Add all group messages
+        for group in metamodel.groups:
+            proto_content.extend(
+                self._render_group_message(group, numbers.group(group.name))
+            )
+
+        return "\n".join(proto_content)
+
+    def _render_metadata_message(
+        self, metamodel: Metamodel, numbers: FieldNumberRegistry
+    ) -> List[str]:
+        """
+        Render the file documentation and the Metadata message containing all groups.
+
+        Args:
+            metamodel: The metamodel to convert
+            numbers: The field numbers of the metamodel
+
+        Returns:
+            The lines of the message, followed by an empty line
+        """
+        proto_content = []
         
         # Add file-level documentation
         proto_content.append(f'// Generated from metamodel "{metamodel.name}" version {metamodel.version}')
         proto_content.append(f'// {metamodel.description}')
         proto_content.append('')
         
-        # Generate message types for each group
-        group_messages = []
-        
-        # First, create the main metadata message that will contain all groups
+        # Create the main metadata message that will contain all groups
         proto_content.append('// Main metadata message containing all groups')
         proto_content.append('message Metadata {')
-        
-        field_index = 1
+        proto_content.extend(
+            self._reserved_statements(
+                numbers.reserved_group_numbers, numbers.reserved_group_names, "  "
+            )
+        )
+
         for group in metamodel.groups:
+            group_numbers = numbers.group(group.name)
             group_name = self._format_field_name(group.name)
-            message_name = f"{group_name.title().replace('_', '')}Group"
+            message_name = self._message_name(group_name)
             proto_content.append(f'  // {group.description}')
-            proto_content.append(f'  {message_name} {group_name} = {field_index};')
-            field_index += 1
+            proto_content.append(
+                f"  {message_name} {group_name} = {group_numbers.number};"
+            )
+
+        proto_content.append("}")
+        proto_content.append("")
+        return proto_content
+
+    def _render_group_message(
+        self, group: MetamodelGroup, group_numbers: GroupNumbers
+    ) -> List[str]:
+        """
+        Render the message of a group.
+
+        Args:
+            group: The group to render
+            group_numbers: The field numbers of the group
+
+        Returns:
+            The lines of the message, followed by an empty line
+        """
+        group_name = self._format_field_name(group.name)
+        message_name = self._message_name(group_name)
+
+        group_message = []
+        group_message.append(f"// {group.description}")
+        group_message.append(f"message {message_name} {{")
+        group_message.extend(
+            self._reserved_statements(
+                group_numbers.reserved_numbers, group_numbers.reserved_names, "  "
+            )
+        )
+
+        # Add fields for each attribute in the group
+        for attr in group.attributes:
+            attr_numbers = group_numbers.attributes[attr.name]
+            proto_type = self._type_to_protobuf(attr.type)
+            field_name = self._format_field_name(attr.name)
             
-            # Prepare the group message
-            group_message = []
-            group_message.append(f'// {group.description}')
-            group_message.append(f'message {message_name} {{')
+            # Handle array type specially
+            if attr.type == AttributeType.ARRAY:
+                proto_type = "string"  # Base type
+                proto_type = f"repeated {proto_type}"
             
-            # Add fields for each attribute in the group
-            attr_index = 1
-            for attr in group.attributes:
-                proto_type = self._type_to_protobuf(attr.type)
-                field_name = self._format_field_name(attr.name)
-                
-                # Handle array type specially
-                if attr.type == AttributeType.ARRAY:
-                    proto_type = "string"  # Base type
-                    proto_type = f"repeated {proto_type}"
-                
-                # Add comment for the attribute
-                group_message.append(f'  // {attr.description}')
-                
-                # For enum types, create an enum definition
-                if attr.enum:
-                    enum_name = f"{field_name.title().replace('_', '')}Enum"
-                    group_message.append(f'  enum {enum_name} {{')
-                    group_message.append(f'    {enum_name.upper()}_UNSPECIFIED = 0;')
-                    
-                    for i, enum_value in enumerate(attr.enum, 1):
-                        enum_field = self._format_field_name(enum_value).upper()
-                        group_message.append(f'    {enum_name.upper()}_{enum_field} = {i};')
-                    
-                    group_message.append('  }')
-                    proto_type = enum_name
-                
-                # Add the field
-                group_message.append(f'  {proto_type} {field_name} = {attr_index};')
-                attr_index += 1
+            # Add comment for the attribute
+            group_message.append(f"  // {attr.description}")
+
+            # For enum types, create an enum definition
+            if attr.enum:
+                enum_name = self._enum_name(field_name)
+                enum_prefix = self._format_field_name(enum_name).upper()
+                group_message.append(f"  enum {enum_name} {{")
+                group_message.extend(
+                    self._reserved_statements(
+                        attr_numbers.reserved_enum_values, [], "    "
+                    )
+                )
+                group_message.append(f"    {enum_prefix}_UNSPECIFIED = 0;")
+
+                for enum_value in attr.enum:
+                    enum_field = self._format_field_name(enum_value).upper()
+                    enum_number = attr_numbers.enum_values[enum_value]
+                    group_message.append(
+                        f"    {enum_prefix}_{enum_field} = {enum_number};"
+                    )
+
+                group_message.append("  }")
+                proto_type = enum_name
             
-            group_message.append('}')
-            group_message.append('')
-            group_messages.extend(group_message)
-        
-        proto_content.append('}')
-        proto_content.append('')
-        
-        # Add all group messages
-        proto_content.extend(group_messages)
-        
-        # Write the schema to disk
-        output_path = os.path.join(self.output_dir, f"{filename}.proto")
-        with open(output_path, "w") as f:
-            f.write("\n".join(proto_content))
-        
-        return output_path
+            # Add the field
+            group_message.append(
+                f"  {proto_type} {field_name} = {attr_numbers.number};"
+            )
+
+        group_message.append("}")
+        group_message.append("")
+        return group_message
     
     def generate_descriptor_set(self, proto_file: str, output_file: Optional[str] = None) -> str:
         """
         Generate a Protocol Buffer FileDescriptorSet from a .proto file.
         
+        The descriptor set is cached by the contents of the .proto file and
+        of the files it imports, so protoc only runs when one of them changed.
+        The output file is not rewritten if it already has the same contents.
+
         Args:
             proto_file: Path to the .proto file
             output_file: Path for the output file (defaults to proto_file with .pb extension)
@@ -192,9 +562,22 @@ class ProtobufGenerator:
         if output_file is None:
             output_file = os.path.splitext(proto_file)[0] + ".pb"
         
+        # protoc records the file names in the descriptors, so they are part of
+        # the key, and --include_imports adds the imported files to the set
+        key = cache_key(
+            "descriptor_set",
+            GENERATOR_VERSION,
+            *(part for source in _proto_sources(proto_file) for part in source),
+        )
+        descriptor_set = self.cache.get(key, ".pb")
+        if descriptor_set is not None:
+            write_if_changed(output_file, descriptor_set)
+            return output_file
+
         # Run protoc to generate descriptor set
         cmd = [
             "protoc",
+            f"--proto_path={os.path.dirname(os.path.abspath(proto_file))}",
             f"--descriptor_set_out={output_file}",
             "--include_imports",
             proto_file
@@ -205,4 +588,185 @@ class ProtobufGenerator:
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"Failed to generate descriptor set: {e.stderr.decode()}")
         
-        return output_file
\ No newline at end of file
+        with open(output_file, "rb") as f:
+            self.cache.put(key, f.read(), ".pb")
+        return output_file
+
+    def generate_metamodel_descriptor_set(
+        self, metamodel: Metamodel, filename: str, output_file: Optional[str] = None
+    ) -> str:
+        """
+        Generate a Protocol Buffer FileDescriptorSet directly from a metamodel.
+
+        This builds the same descriptor set as generate_descriptor_set() on
+        the schema written by generate_schema(), but in-process and without
+        requiring protoc to be installed. The result is cached like
+        generate_schema().
+
+        Args:
+            metamodel: The metamodel to convert
+            filename: The filename of the schema (without extension)
+            output_file: Path for the output file (defaults to
+                ``<output_dir>/<filename>.pb``)
+
+        Returns:
+            Path to the generated descriptor set
+        """
+        if output_file is None:
+            os.makedirs(self.output_dir, exist_ok=True)
+            output_file = os.path.join(self.output_dir, f"{filename}.pb")
+
+        key = cache_key(
+            "descriptor_set",
+            GENERATOR_VERSION,
+            metamodel.content_hash(),
+            filename,
+            self._numbering_key(metamodel),
+        )
+        descriptor_set = self.cache.get(key, ".pb")
+        if descriptor_set is None:
+            descriptor_set = self.build_descriptor_set(
+                metamodel, filename
+            ).SerializeToString()
+            self.cache.put(key, descriptor_set, ".pb")
+
+        write_if_changed(output_file, descriptor_set)
+        return output_file
+
+    def build_descriptor_set(
+        self, metamodel: Metamodel, filename: str
+    ) -> descriptor_pb2.FileDescriptorSet:
+        """
+        Build the FileDescriptorSet of a metamodel's schema, including its imports.
+
+        Args:
+            metamodel: The metamodel to convert
+            filename: The filename of the schema (without extension)
+
+        Returns:
+            The descriptor set, with imported files before the schema itself
+        """
+        file_proto = self.build_file_descriptor(metamodel, filename)
+        descriptor_set = descriptor_pb2.FileDescriptorSet()
+        if TIMESTAMP_PROTO in file_proto.dependency:
+            timestamp_pb2.DESCRIPTOR.CopyToProto(descriptor_set.file.add())
+        descriptor_set.file.append(file_proto)
+        return descriptor_set
+
+    def build_file_descriptor(
+        self, metamodel: Metamodel, filename: str
+    ) -> descriptor_pb2.FileDescriptorProto:
+        """
+        Build the FileDescriptorProto of the schema render_schema() produces.
+
+        Args:
+            metamodel: The metamodel to convert
+            filename: The filename of the schema (used as the package name)
+
+        Returns:
+            The file descriptor
+        """
+        numbers = self.get_field_numbers(metamodel)
+        file_proto = descriptor_pb2.FileDescriptorProto(
+            name=f"{filename}.proto", package=filename, syntax="proto3"
+        )
+        if self._get_imports(metamodel):
+            file_proto.dependency.append(TIMESTAMP_PROTO)
+
+        metadata = file_proto.message_type.add(name="Metadata")
+        self._add_reserved(
+            metadata, numbers.reserved_group_numbers, numbers.reserved_group_names
+        )
+        for group in metamodel.groups:
+            group_numbers = numbers.group(group.name)
+            group_name = self._format_field_name(group.name)
+            message_name = self._message_name(group_name)
+            self._add_field(
+                metadata,
+                group_name,
+                group_numbers.number,
+                _FieldDescriptorProto.TYPE_MESSAGE,
+                type_name=f".{filename}.{message_name}",
+            )
+
+            message = file_proto.message_type.add(name=message_name)
+            self._add_reserved(
+                message, group_numbers.reserved_numbers, group_numbers.reserved_names
+            )
+            for attr in group.attributes:
+                attr_numbers = group_numbers.attributes[attr.name]
+                field_name = self._format_field_name(attr.name)
+                field_type = _DESCRIPTOR_TYPES.get(
+                    attr.type, _FieldDescriptorProto.TYPE_STRING
+                )
+                type_name = (
+                    ".google.protobuf.Timestamp"
+                    if attr.type == AttributeType.DATETIME
+                    else None
+                )
+                repeated = attr.type == AttributeType.ARRAY
+
+                if attr.enum:
+                    enum_name = self._enum_name(field_name)
+                    enum_prefix = self._format_field_name(enum_name).upper()
+                    enum = message.enum_type.add(name=enum_name)
+                    enum.value.add(name=f"{enum_prefix}_UNSPECIFIED", number=0)
+                    for enum_value in attr.enum:
+                        enum_field = self._format_field_name(enum_value).upper()
+                        enum.value.add(
+                            name=f"{enum_prefix}_{enum_field}",
+                            number=attr_numbers.enum_values[enum_value],
+                        )
+                    for number in sorted(attr_numbers.reserved_enum_values):
+                        # Enum reserved ranges are inclusive
+                        enum.reserved_range.add(start=number, end=number)
+                    field_type = _FieldDescriptorProto.TYPE_ENUM
+                    type_name = f".{filename}.{message_name}.{enum_name}"
+                    repeated = False
+
+                self._add_field(
+                    message,
+                    field_name,
+                    attr_numbers.number,
+                    field_type,
+                    type_name,
+                    repeated,
+                )
+
+        return file_proto
+
+    def _add_reserved(
+        self,
+        message: descriptor_pb2.DescriptorProto,
+        numbers: List[int],
+        names: List[str],
+    ) -> None:
+        """Add reserved field numbers and names to a message descriptor."""
+        for number in sorted(numbers):
+            # Message reserved ranges are exclusive
+            message.reserved_range.add(start=number, end=number + 1)
+        message.reserved_name.extend(names)
+
+    def _add_field(
+        self,
+        message: descriptor_pb2.DescriptorProto,
+        name: str,
+        number: int,
+        field_type: int,
+        type_name: Optional[str] = None,
+        repeated: bool = False,
+    ) -> None:
+        """Add a field to a message descriptor the way protoc would describe it."""
+        field = message.field.add(
+            name=name,
+            number=number,
+            type=field_type,
+            label=(
+                _FieldDescriptorProto.LABEL_REPEATED
+                if repeated
+                else _FieldDescriptorProto.LABEL_OPTIONAL
+            ),
+            json_name=_JSON_NAME_RE.sub(lambda m: m.group(1).upper(), name),
+        )
+        if type_name:
+            field.type_name = type_name
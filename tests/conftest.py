@@ -0,0 +1,91 @@
+"""
+Shared fixtures for the metamodel-core test suite.
+"""
+import pytest
+
+from metamodel_core.models import get_core_metamodel
+from metamodel_core.models.metamodel import Metamodel, MetamodelAttribute, MetamodelGroup
+
+
+@pytest.fixture
+def core_metamodel() -> Metamodel:
+    """The core metamodel bundled with the package."""
+    return get_core_metamodel()
+
+
+@pytest.fixture
+def sample_metamodel() -> Metamodel:
+    """A small metamodel covering every attribute type."""
+    return Metamodel(
+        name="Sample Metamodel",
+        version="1.0.0",
+        description="A small metamodel used in unit tests",
+        groups=[
+            MetamodelGroup(
+                name="General",
+                description="General information about the data product",
+                attributes=[
+                    MetamodelAttribute(
+                        name="Title",
+                        description="Title of the data product",
+                        type="string",
+                        required=True
+                    ),
+                    MetamodelAttribute(
+                        name="Status",
+                        description="Lifecycle status of the data product",
+                        type="string",
+                        required=True
+                    ),
+                    MetamodelAttribute(
+                        name="Active",
+                        description="Whether the data product is active",
+                        type="boolean",
+                        required=False
+                    ),
+                    MetamodelAttribute(
+                        name="Tags",
+                        description="Search tags",
+                        type="array",
+                        required=False
+                    ),
+                ]
+            ),
+            MetamodelGroup(
+                name="Metrics",
+                description="Usage metrics for the data product",
+                attributes=[
+                    MetamodelAttribute(
+                        name="User Count",
+                        description="Number of users",
+                        type="integer",
+                        required=True
+                    ),
+                    MetamodelAttribute(
+                        name="Score",
+                        description="Satisfaction score",
+                        type="number",
+                        required=False
+                    ),
+                    MetamodelAttribute(
+                        name="Last Refreshed",
+                        description="Time of the last refresh",
+                        type="datetime",
+                        required=False
+                    ),
+                    MetamodelAttribute(
+                        name="Details",
+                        description="Free-form details",
+                        type="object",
+                        required=False
+                    ),
+                ]
+            ),
+        ]
+    )
+
+
+@pytest.fixture
+def output_dir(tmp_path) -> str:
+    """A temporary directory for generated files."""
+    return str(tmp_path / "generated")
@@ -0,0 +1,184 @@
+"""
+Test suite for the metamodel cache and frozen metamodels.
+"""
+import json
+import os
+import pickle
+from copy import deepcopy
+
+import pytest
+from pydantic import ValidationError
+
+from metamodel_core.models import CORE_METAMODEL_PATH, get_core_metamodel
+from metamodel_core.models.cache import invalidate_metamodel_cache, load_metamodel
+from metamodel_core.models.lazy import LazyMetamodel
+from metamodel_core.models.metamodel import FrozenMetamodel, Metamodel
+
+
+@pytest.fixture
+def metamodel_file(tmp_path, sample_metamodel):
+    path = tmp_path / "metamodel.json"
+    path.write_text(json.dumps(sample_metamodel.model_dump()))
+    yield str(path)
+    invalidate_metamodel_cache(str(path))
+
+
+class TestMetamodelCache:
+    """Tests for load_metamodel and get_core_metamodel."""
+
+    def test_core_metamodel_is_cached(self):
+        """Test that repeated loads return the same shared instance."""
+        assert get_core_metamodel() is get_core_metamodel()
+        assert load_metamodel(CORE_METAMODEL_PATH) is get_core_metamodel()
+
+    def test_reload_on_file_change(self, metamodel_file):
+        """Test that editing the file produces a new metamodel."""
+        first = load_metamodel(metamodel_file)
+
+        data = json.loads(open(metamodel_file).read())
+        data["version"] = "2.0.0"
+        with open(metamodel_file, "w") as f:
+            json.dump(data, f)
+        stat = os.stat(metamodel_file)
+        os.utime(metamodel_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = load_metamodel(metamodel_file)
+        assert second is not first
+        assert second.version == "2.0.0"
+
+    def test_touch_without_change_reuses_instance(self, metamodel_file):
+        """Test that a new mtime with identical content keeps the cached instance."""
+        first = load_metamodel(metamodel_file)
+        stat = os.stat(metamodel_file)
+        os.utime(metamodel_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_metamodel(metamodel_file) is first
+
+    def test_invalidate(self, metamodel_file):
+        """Test that invalidation forces a fresh load."""
+        first = load_metamodel(metamodel_file)
+
+        invalidate_metamodel_cache(metamodel_file)
+        second = load_metamodel(metamodel_file)
+        assert second is not first
+        assert second == first
+
+        invalidate_metamodel_cache()
+        assert load_metamodel(metamodel_file) is not second
+
+
+class TestFrozenMetamodel:
+    """Tests for the immutable metamodel returned by the cache."""
+
+    def test_cannot_modify(self):
+        """Test that fields and containers of the shared metamodel are read-only."""
+        metamodel = get_core_metamodel()
+
+        with pytest.raises(ValidationError):
+            metamodel.version = "9.9"
+        with pytest.raises(ValidationError):
+            metamodel.groups[0].description = "changed"
+        with pytest.raises(ValidationError):
+            metamodel.groups[0].attributes[0].required = False
+        with pytest.raises(TypeError):
+            metamodel.groups.append(metamodel.groups[0])
+        with pytest.raises(TypeError):
+            metamodel.groups[0].attributes.pop()
+
+    def test_deepcopy_is_editable(self):
+        """Test that deep copies are ordinary metamodels that can be edited."""
+        metamodel = get_core_metamodel()
+
+        copied = deepcopy(metamodel)
+        copied.groups[0].attributes.pop()
+        copied.groups[0].description = "changed"
+
+        assert not isinstance(copied, FrozenMetamodel)
+        assert isinstance(copied, Metamodel)
+        assert get_core_metamodel().groups[0].description != "changed"
+        assert len(get_core_metamodel().groups[0].attributes) == len(copied.groups[0].attributes) + 1
+
+    def test_freeze_round_trip(self, sample_metamodel):
+        """Test freezing an editable metamodel and pickling the result."""
+        frozen = sample_metamodel.freeze()
+
+        assert isinstance(frozen, FrozenMetamodel)
+        assert frozen.freeze() is frozen
+        assert frozen.model_dump() == sample_metamodel.model_dump()
+        assert pickle.loads(pickle.dumps(frozen)).model_dump() == frozen.model_dump()
+
+    def test_dump_and_validate_accept_pydantic_arguments(self, sample_metamodel):
+        """Test that model_dump and model_validate keep the signatures of pydantic's."""
+        frozen = get_core_metamodel()
+
+        data = frozen.model_dump(mode="json", exclude={"description"})
+        assert "description" not in data
+        assert data["groups"][0]["attributes"][0]["type"] == frozen.groups[0].attributes[0].type.value
+        assert Metamodel.model_validate(sample_metamodel.model_dump(), strict=False) == sample_metamodel
+
+
+class TestLazyMetamodel:
+    """Tests for loading metamodels with lazily validated groups."""
+
+    def test_groups_are_validated_on_access(self, metamodel_file, sample_metamodel):
+        """Test that only the accessed group is validated and equals the eager one."""
+        lazy = load_metamodel(metamodel_file, lazy=True)
+
+        assert isinstance(lazy, LazyMetamodel)
+        assert (lazy.name, lazy.version) == ("Sample Metamodel", "1.0.0")
+        assert lazy.group_names == ["General", "Metrics"]
+        assert not lazy.is_loaded("General")
+
+        metrics = lazy.get_group_by_name("Metrics")
+        assert metrics == load_metamodel(metamodel_file).get_group_by_name("Metrics")
+        assert lazy.is_loaded("Metrics") and not lazy.is_loaded("General")
+        assert lazy.get_group_by_name("Metrics") is metrics
+        assert lazy.get_attribute_by_path("Metrics/Score")[1].name == "Score"
+        assert lazy.get_group_by_name("Nope") is None
+
+    def test_required_attributes(self, metamodel_file, sample_metamodel):
+        """Test that the required attributes match without validating the groups."""
+        lazy = load_metamodel(metamodel_file, lazy=True)
+
+        assert lazy.get_required_attributes() == sample_metamodel.get_required_attributes()
+        assert not lazy.is_loaded("General") and not lazy.is_loaded("Metrics")
+
+    def test_materialize_reuses_groups(self, metamodel_file):
+        """Test that the complete metamodel shares the groups already validated."""
+        lazy = load_metamodel(metamodel_file, lazy=True)
+        general = lazy.get_group_by_name("General")
+
+        metamodel = lazy.materialize()
+
+        assert isinstance(metamodel, FrozenMetamodel)
+        assert metamodel.groups[0] is general
+        assert metamodel.model_dump() == load_metamodel(metamodel_file).model_dump()
+        assert lazy.materialize() is metamodel
+
+    def test_cached_per_mode(self, metamodel_file):
+        """Test that lazy and eager loads are cached and invalidated separately."""
+        lazy = load_metamodel(metamodel_file, lazy=True)
+
+        assert load_metamodel(metamodel_file, lazy=True) is lazy
+        assert isinstance(load_metamodel(metamodel_file), FrozenMetamodel)
+        assert get_core_metamodel(lazy=True).group_names == [g.name for g in get_core_metamodel().groups]
+
+        invalidate_metamodel_cache(metamodel_file)
+        assert load_metamodel(metamodel_file, lazy=True) is not lazy
+
+    def test_invalid_group_fails_on_access(self, tmp_path, sample_metamodel):
+        """Test that an invalid group is reported when accessed, and a bad header when loaded."""
+        data = sample_metamodel.model_dump()
+        data["groups"][1]["attributes"] = []
+        path = tmp_path / "invalid.json"
+        path.write_text(json.dumps(data))
+
+        lazy = Metamodel.from_json_file(str(path), lazy=True)
+        assert lazy.get_group_by_name("General").name == "General"
+        with pytest.raises(ValidationError):
+            lazy.get_group_by_name("Metrics")
+
+        data["version"] = "one"
+        path.write_text(json.dumps(data))
+        with pytest.raises(ValidationError):
+            Metamodel.from_json_file(str(path), lazy=True)
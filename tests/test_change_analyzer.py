@@ -6,7 +6,7 @@ from copy import deepcopy
 
 from metamodel_core.models import get_core_metamodel
 from metamodel_core.models.metamodel import MetamodelAttribute, MetamodelGroup, ChangeType
-from metamodel_core.models.validators import ChangeAnalyzer
+from metamodel_core.models.validators import ChangeAnalyzer, MigrationPlanner
 
 
 class TestChangeAnalyzer:
@@ -218,4 +218,147 @@ class TestChangeAnalyzer:
         assert req_changes[0].target_path == f"{target_group.name}/{target_attr.name}", \
             "Target path should be 'group_name/attribute_name'"
         assert req_changes[0].old_value is False, "Old value should be False"
-        assert req_changes[0].new_value is True, "New value should be True"
\ No newline at end of file
+        assert req_changes[0].new_value is True, "New value should be True"
+
+    def test_identical_versions_have_no_changes(self):
+        """Test that identical versions short-circuit to no changes."""
+        metamodel = get_core_metamodel()
+        analyzer = ChangeAnalyzer()
+        
+        assert analyzer.detect_changes(metamodel, metamodel) == []
+        assert analyzer.detect_changes(metamodel, deepcopy(metamodel)) == []
+        
+        # Only the version differs, so every group is skipped by its hash
+        new_metamodel = deepcopy(metamodel)
+        new_metamodel.version = "1.1"
+        assert analyzer.detect_changes(metamodel, new_metamodel) == []
+    
+    def test_detects_in_place_enum_edit(self):
+        """Test that appending to an attribute's enum list is detected after hashing."""
+        old_metamodel = deepcopy(get_core_metamodel())
+        attr = old_metamodel.groups[0].attributes[0]
+        old_metamodel.groups[0].attributes[0] = MetamodelAttribute(
+            name=attr.name, description=attr.description, type=attr.type, required=attr.required, enum=["A", "B"]
+        )
+        new_metamodel = deepcopy(old_metamodel)
+        analyzer = ChangeAnalyzer()
+        assert analyzer.detect_changes(old_metamodel, new_metamodel) == []
+        
+        new_metamodel.groups[0].attributes[0].enum.append("NEWVALUE")
+        changes = analyzer.detect_changes(old_metamodel, new_metamodel)
+        
+        assert [(c.change_type, c.new_value["enum"]) for c in changes] == [
+            (ChangeType.MODIFY_ATTRIBUTE, ["A", "B", "NEWVALUE"])
+        ]
+    
+    def test_skips_unchanged_subtrees(self, mocker):
+        """Test that only attributes in changed groups are compared field by field."""
+        old_metamodel = get_core_metamodel()
+        new_metamodel = deepcopy(old_metamodel)
+        new_metamodel.groups[0].attributes[0].description = "Changed"
+        
+        analyzer = ChangeAnalyzer()
+        content_hash = mocker.spy(MetamodelAttribute, "content_hash")
+        changes = analyzer.detect_changes(old_metamodel, new_metamodel)
+        
+        assert [c.target_path for c in changes] == [
+            f"{old_metamodel.groups[0].name}/{old_metamodel.groups[0].attributes[0].name}"
+        ]
+        # Attribute hashes of the new version are computed once, then only
+        # the changed group's attributes are compared pairwise
+        changed_group_size = len(old_metamodel.groups[0].attributes)
+        total_attributes = sum(len(g.attributes) for g in old_metamodel.groups)
+        assert content_hash.call_count <= total_attributes + 2 * changed_group_size
+    
+    def test_detect_move_attribute(self):
+        """Test that an attribute moved between groups is reported as one move."""
+        old_metamodel = get_core_metamodel()
+        new_metamodel = deepcopy(old_metamodel)
+        sla = new_metamodel.get_group_by_name("SLA Metrics")
+        latency = next(a for a in sla.attributes if a.name == "Latency")
+        sla.attributes.remove(latency)
+        new_metamodel.get_group_by_name("Quality").attributes.append(latency)
+        
+        changes = ChangeAnalyzer().detect_changes(old_metamodel, new_metamodel)
+        
+        assert [(c.change_type, c.target_path) for c in changes] == [
+            (ChangeType.MOVE_ATTRIBUTE, "SLA Metrics/Latency")
+        ]
+        assert changes[0].old_value["group"] == "SLA Metrics"
+        assert changes[0].new_value["group"] == "Quality"
+        assert changes[0].new_value["name"] == "Latency"
+        
+        plan = MigrationPlanner().generate_migration_plan(changes)
+        assert plan["high_impact"] == [] and plan["low_impact"] == []
+        assert plan["medium_impact"][0]["action"] == "Move attribute to another group"
+    
+    def test_detect_rename_attribute(self):
+        """Test that similar removed and added attributes are paired as renames."""
+        old_metamodel = get_core_metamodel()
+        new_metamodel = deepcopy(old_metamodel)
+        kpi = new_metamodel.get_group_by_name("KPI")
+        kpi.attributes = [a for a in kpi.attributes if a.name not in ("Cost Savings", "Roadmap")]
+        kpi.attributes.append(MetamodelAttribute(
+            name="Cost Savings Amount",
+            description="Financial KPI for cost savings",
+            type="number",
+            required=False
+        ))
+        # Same type but unrelated, so it stays an addition
+        kpi.attributes.append(MetamodelAttribute(
+            name="Region", description="Hosting region", type="string", required=False
+        ))
+        
+        changes = ChangeAnalyzer().detect_changes(old_metamodel, new_metamodel)
+        
+        assert sorted((c.change_type, c.target_path) for c in changes) == [
+            (ChangeType.ADD_ATTRIBUTE, "KPI/Region"),
+            (ChangeType.RENAME_ATTRIBUTE, "KPI/Cost Savings"),
+        ]
+        rename = next(c for c in changes if c.change_type == ChangeType.RENAME_ATTRIBUTE)
+        assert rename.new_value["name"] == "Cost Savings Amount"
+        assert rename.new_value["group"] == "KPI"
+    
+    def test_rename_requires_same_type(self):
+        """Test that a type change prevents pairing, and that detection can be disabled."""
+        old_metamodel = get_core_metamodel()
+        new_metamodel = deepcopy(old_metamodel)
+        kpi = new_metamodel.get_group_by_name("KPI")
+        roi = next(a for a in kpi.attributes if a.name == "ROI")
+        kpi.attributes.remove(roi)
+        kpi.attributes.append(MetamodelAttribute(
+            name="ROI Percent", description=roi.description, type="string", required=False
+        ))
+        
+        changes = ChangeAnalyzer().detect_changes(old_metamodel, new_metamodel)
+        assert sorted(c.change_type for c in changes) == [ChangeType.ADD_ATTRIBUTE, ChangeType.REMOVE_ATTRIBUTE]
+        
+        kpi.attributes[-1] = MetamodelAttribute(
+            name="ROI Percent", description=roi.description, type="number", required=False
+        )
+        assert [c.change_type for c in ChangeAnalyzer().detect_changes(old_metamodel, new_metamodel)] == [
+            ChangeType.RENAME_ATTRIBUTE
+        ]
+        changes = ChangeAnalyzer(detect_moves=False).detect_changes(old_metamodel, new_metamodel)
+        assert sorted(c.change_type for c in changes) == [ChangeType.ADD_ATTRIBUTE, ChangeType.REMOVE_ATTRIBUTE]
+    
+    def test_move_requires_same_type_and_requirement(self):
+        """Test that attributes are not paired across a change of type or requirement."""
+        old_metamodel = get_core_metamodel()
+        new_metamodel = deepcopy(old_metamodel)
+        sla = new_metamodel.get_group_by_name("SLA Metrics")
+        latency = next(a for a in sla.attributes if a.name == "Latency")
+        sla.attributes.remove(latency)
+        quality = new_metamodel.get_group_by_name("Quality")
+        quality.attributes.append(MetamodelAttribute(
+            name="Latency", description=latency.description, type="number", required=latency.required
+        ))
+        
+        changes = ChangeAnalyzer().detect_changes(old_metamodel, new_metamodel)
+        assert sorted(c.change_type for c in changes) == [ChangeType.ADD_ATTRIBUTE, ChangeType.REMOVE_ATTRIBUTE]
+        
+        quality.attributes[-1] = MetamodelAttribute(
+            name="Latency", description=latency.description, type=latency.type, required=not latency.required
+        )
+        changes = ChangeAnalyzer().detect_changes(old_metamodel, new_metamodel)
+        assert sorted(c.change_type for c in changes) == [ChangeType.ADD_ATTRIBUTE, ChangeType.REMOVE_ATTRIBUTE]
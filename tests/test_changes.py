@@ -0,0 +1,143 @@
+"""
+Test suite for applying changes to produce new metamodel versions.
+"""
+from copy import deepcopy
+
+import pytest
+
+from metamodel_core.models import get_core_metamodel
+from metamodel_core.models.changes import ChangeApplier
+from metamodel_core.models.metamodel import (
+    ChangeType,
+    FrozenMetamodel,
+    MetamodelAttribute,
+    MetamodelChange,
+    MetamodelGroup,
+)
+from metamodel_core.models.validators import ChangeAnalyzer
+
+
+def _change(change_type, target_path, new_value=None):
+    return MetamodelChange(
+        change_type=change_type,
+        target_path=target_path,
+        new_value=new_value,
+        description=f"{change_type.value} {target_path}"
+    )
+
+
+class TestChangeApplier:
+    """Tests for the ChangeApplier class."""
+
+    def test_unchanged_groups_are_shared(self):
+        """Test that only the touched group is copied."""
+        old = get_core_metamodel()
+
+        new = ChangeApplier().apply_change(
+            old, _change(ChangeType.CHANGE_REQUIREMENT, "KPI/ROI", True)
+        )
+
+        assert isinstance(new, FrozenMetamodel)
+        assert new.get_attribute_by_path("KPI/ROI")[1].required is True
+        assert old.get_attribute_by_path("KPI/ROI")[1].required is False
+        kpi_old = old.get_group_by_name("KPI")
+        kpi_new = new.get_group_by_name("KPI")
+        assert kpi_new is not kpi_old
+        for old_attr, new_attr in zip(kpi_old.attributes, kpi_new.attributes):
+            assert (new_attr is old_attr) == (old_attr.name != "ROI")
+        for old_group, new_group in zip(old.groups, new.groups):
+            if old_group.name != "KPI":
+                assert new_group is old_group
+
+    def test_round_trip_with_detect_changes(self):
+        """Test that applying detected changes reproduces the new version."""
+        old = get_core_metamodel()
+        new = deepcopy(old)
+        new.groups[0].description = "Changed description"
+        new.groups[1].attributes[0].type = "string"
+        new.groups[1].attributes[1].required = False
+        new.groups[2].attributes = new.groups[2].attributes[:-1]
+        new.groups[3].attributes.append(MetamodelAttribute(
+            name="Region", description="Hosting region", type="string", required=False, enum=["EU", "US"]
+        ))
+        new.groups = [g for g in new.groups if g.name != "Standards"] + [MetamodelGroup(
+            name="Lineage",
+            description="Lineage information",
+            attributes=[MetamodelAttribute(name="Upstream", description="Upstream", type="array", required=True)]
+        )]
+        analyzer = ChangeAnalyzer()
+        changes = analyzer.detect_changes(old, new)
+
+        applied = ChangeApplier().apply_changes(old, changes, version="1.1")
+
+        assert applied.version == "1.1"
+        assert analyzer.detect_changes(new, applied) == []
+        assert sorted((c.change_type, c.target_path) for c in analyzer.detect_changes(old, applied)) == \
+            sorted((c.change_type, c.target_path) for c in changes)
+
+    def test_added_attributes_keep_their_order(self):
+        """Test that attributes and groups added at the end are applied in the new version's order."""
+        old = get_core_metamodel()
+        new = deepcopy(old)
+        for i in range(8):
+            new.groups[0].attributes.append(MetamodelAttribute(
+                name=f"Added {i}", description=f"Added attribute {i}", type="string", required=False
+            ))
+        for i in range(4):
+            new.groups.append(MetamodelGroup(
+                name=f"Group {i}", description=f"Added group {i}",
+                attributes=[MetamodelAttribute(name="Value", description="Value", type="string", required=False)]
+            ))
+
+        applied = ChangeApplier().apply_changes(old, ChangeAnalyzer().detect_changes(old, new))
+
+        assert [a.name for a in applied.groups[0].attributes] == [a.name for a in new.groups[0].attributes]
+        assert [g.name for g in applied.groups] == [g.name for g in new.groups]
+        assert applied.content_hash() == new.content_hash()
+
+    def test_editable_input_gives_editable_output(self, sample_metamodel):
+        """Test that editable metamodels produce editable versions with working indexes."""
+        change = _change(
+            ChangeType.ADD_ATTRIBUTE,
+            "General/Owner",
+            {"description": "Owner", "type": "string", "required": True}
+        )
+
+        new = ChangeApplier().apply_change(sample_metamodel, change)
+
+        assert not isinstance(new, FrozenMetamodel)
+        assert new.get_attribute_by_name("Owner").required is True
+        assert sample_metamodel.get_attribute_by_name("Owner") is None
+        new.groups[0].attributes.pop()
+        assert new.get_attribute_by_name("Owner") is None
+
+    @pytest.mark.parametrize("change,message", [
+        (_change(ChangeType.REMOVE_GROUP, "Nope"), "Group 'Nope' does not exist"),
+        (_change(ChangeType.ADD_ATTRIBUTE, "KPI/ROI", {"description": "d", "type": "number", "required": False}),
+         "Attribute 'ROI' already exists in group 'KPI'"),
+        (_change(ChangeType.REMOVE_ATTRIBUTE, "KPI/Nope"), "Attribute 'Nope' does not exist in group 'KPI'"),
+        (_change(ChangeType.REMOVE_ATTRIBUTE, "bad-path"), "must be in format 'group_name/attribute_name'"),
+        (_change(ChangeType.MODIFY_GROUP, "KPI", {"description": " "}), "Group description cannot be empty"),
+    ])
+    def test_invalid_changes_raise(self, change, message):
+        """Test that changes that do not fit the metamodel are rejected."""
+        with pytest.raises(ValueError, match=message):
+            ChangeApplier().apply_change(get_core_metamodel(), change)
+
+    def test_apply_detected_moves_and_renames(self):
+        """Test that detected moves and renames reproduce the new version."""
+        old = get_core_metamodel()
+        new = deepcopy(old)
+        sla = new.get_group_by_name("SLA Metrics")
+        latency = sla.attributes.pop(2)
+        new.get_group_by_name("Quality").attributes.append(latency)
+        new.get_group_by_name("KPI").attributes[-1].name = "Count of New Features Added"
+        analyzer = ChangeAnalyzer()
+        changes = analyzer.detect_changes(old, new)
+        assert sorted(c.change_type for c in changes) == [ChangeType.MOVE_ATTRIBUTE, ChangeType.RENAME_ATTRIBUTE]
+
+        applied = ChangeApplier().apply_changes(old, changes)
+
+        assert analyzer.detect_changes(new, applied) == []
+        assert applied.get_attribute_by_path("Quality/Latency") is not None
+        assert applied.get_attribute_by_path("SLA Metrics/Latency") is None
@@ -0,0 +1,134 @@
+"""
+Test suite for the dbt schema.yml backend and sync check.
+"""
+import os
+from copy import deepcopy
+
+import pytest
+import yaml
+
+from metamodel_core.models.metamodel import MetamodelAttribute
+from metamodel_core.schema import dbt as dbt_module
+from metamodel_core.schema.cache import GenerationCache
+from metamodel_core.schema.dbt import DbtBackend, check_dbt_sync
+from metamodel_core.schema.generator import SchemaGenerator
+from metamodel_core.schema.ir import compile_metamodel
+
+
+@pytest.fixture
+def sample_yaml(sample_metamodel, output_dir):
+    sample_metamodel.groups[0].attributes[1].enum = ["Active", "Won't Fix"]
+    paths = SchemaGenerator([DbtBackend()], output_dir).generate(sample_metamodel, "sample")
+    return paths["dbt"]
+
+
+def _load(path):
+    with open(path) as f:
+        return yaml.safe_load(f)
+
+
+def _save(path, document):
+    with open(path, "w") as f:
+        yaml.safe_dump(document, f, sort_keys=False)
+
+
+class TestDbtBackend:
+    """Tests for rendering dbt models."""
+
+    def test_model(self, sample_metamodel, sample_yaml):
+        """Test the columns and tests of the rendered model."""
+        document = _load(sample_yaml)
+
+        assert sample_yaml.endswith("sample.yml")
+        assert document["version"] == 2
+        model, = document["models"]
+        assert model["name"] == "sample"
+        columns = {column["name"]: column for column in model["columns"]}
+        assert list(columns)[:3] == ["title", "status", "active"]
+        assert columns["title"] == {"name": "title", "description": "Title of the data product",
+                                    "tests": ["not_null"]}
+        assert columns["status"]["tests"] == ["not_null", {"accepted_values": {"values": ["Active", "Won't Fix"]}}]
+        assert columns["active"]["tests"] == [{"accepted_values": {"values": ["true", "false"]}}]
+        assert "tests" not in columns["tags"]
+
+    def test_duplicate_column_names(self, sample_metamodel):
+        """Test that an attribute name used by an earlier group is prefixed with the group."""
+        sample_metamodel.groups[1].attributes.append(MetamodelAttribute(
+            name="Title", description="Title of the metrics", type="string", required=False
+        ))
+
+        document = yaml.safe_load(DbtBackend().render(compile_metamodel(sample_metamodel), "sample"))
+
+        names = [column["name"] for column in document["models"][0]["columns"]]
+        assert names.count("title") == 1 and "metrics_title" in names
+
+    def test_groups_are_rendered_once(self, sample_metamodel, mocker):
+        """Test that unchanged groups reuse their rendered columns."""
+        backend = DbtBackend()
+        render_group = mocker.spy(backend, "_render_group")
+        other = deepcopy(sample_metamodel)
+        other.groups[1].description = "Changed"
+
+        backend.render(compile_metamodel(sample_metamodel), "sample")
+        backend.render(compile_metamodel(other), "other")
+
+        assert [call.args[0].name for call in render_group.call_args_list] == ["General", "Metrics", "Metrics"]
+
+
+class TestCheckDbtSync:
+    """Tests for checking dbt files against metamodels."""
+
+    def test_generated_file_is_in_sync(self, sample_metamodel, sample_yaml):
+        """Test that a generated file has no drift."""
+        assert check_dbt_sync(sample_metamodel, sample_yaml) == []
+
+    def test_drift(self, sample_metamodel, sample_yaml):
+        """Test that changed, missing and extra columns are reported, and other tests ignored."""
+        document = _load(sample_yaml)
+        columns = document["models"][0]["columns"]
+        columns[0]["description"] = "Old title"
+        columns[0]["tests"].append("unique")
+        columns[1]["tests"] = ["not_null"]
+        columns[2]["data_tests"] = ["not_null", {"accepted_values": {"values": [True, False]}}]
+        del columns[2]["tests"]
+        del columns[3]
+        columns.append({"name": "legacy_flag"})
+        _save(sample_yaml, document)
+
+        drifts = check_dbt_sync(sample_metamodel, sample_yaml, model_name="sample")
+
+        assert [(drift.column, drift.kind) for drift in drifts] == [
+            ("title", "description"),
+            ("status", "accepted_values"),
+            ("active", "not_null"),
+            ("tags", "missing_column"),
+            ("legacy_flag", "extra_column"),
+        ]
+        assert str(drifts[2]) == "sample.active: not_null is true, expected false"
+
+    def test_unknown_model(self, sample_metamodel, sample_yaml):
+        """Test that a model that is not in the file is reported."""
+        with pytest.raises(ValueError, match="no model named"):
+            check_dbt_sync(sample_metamodel, sample_yaml, model_name="orders")
+
+    def test_cached_result(self, sample_metamodel, sample_yaml, tmp_path, mocker):
+        """Test that a file found in sync is not parsed again until it changes."""
+        cache = GenerationCache(str(tmp_path / "cache"))
+        assert check_dbt_sync(sample_metamodel, sample_yaml, cache=cache) == []
+        parse = mocker.spy(dbt_module.yaml, "load")
+
+        assert check_dbt_sync(sample_metamodel, sample_yaml, cache=GenerationCache(cache.directory)) == []
+        parse.assert_not_called()
+
+        with open(sample_yaml, "a") as f:
+            f.write("      - name: extra\n")
+        assert [drift.column for drift in check_dbt_sync(sample_metamodel, sample_yaml, cache=cache)] == ["extra"]
+
+    def test_bundled_yaml(self, core_metamodel):
+        """Test that the hand-maintained data/metamodel.yaml can be checked against the core metamodel."""
+        path = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                            "src", "metamodel_core", "data", "metamodel.yaml")
+
+        drifts = check_dbt_sync(core_metamodel, path)
+
+        assert all(drift.model == "data_product" for drift in drifts)
@@ -0,0 +1,226 @@
+"""
+Test suite for stable Protocol Buffer field numbers.
+"""
+import shutil
+from copy import deepcopy
+
+import pytest
+
+from metamodel_core.models.metamodel import ChangeType, MetamodelAttribute, MetamodelChange, MetamodelGroup
+from metamodel_core.schema.field_numbers import FieldNumberRegistry
+from metamodel_core.schema.protobuf_codec import ProtobufCodec
+from metamodel_core.schema.protobuf_generator import ProtobufGenerator
+
+
+def _attribute_numbers(registry, group_name):
+    return {name: numbers.number for name, numbers in registry.group(group_name).attributes.items()}
+
+
+class TestFieldNumberRegistry:
+    """Tests for the FieldNumberRegistry class."""
+
+    def test_first_version_is_numbered_by_position(self, sample_metamodel):
+        """Test that the first version gets the same numbers as positional numbering."""
+        registry = FieldNumberRegistry()
+        registry.update(sample_metamodel)
+
+        assert registry.group("General").number == 1
+        assert registry.group("Metrics").number == 2
+        assert _attribute_numbers(registry, "General") == {"Title": 1, "Status": 2, "Active": 3, "Tags": 4}
+
+    def test_insert_and_remove_keep_numbers(self, sample_metamodel):
+        """Test that existing fields keep their numbers and removed numbers are reserved."""
+        registry = FieldNumberRegistry()
+        registry.update(sample_metamodel)
+
+        updated = deepcopy(sample_metamodel)
+        general = updated.groups[0]
+        general.attributes.insert(0, MetamodelAttribute(
+            name="Owner", description="Team accountable for it", type="integer", required=False
+        ))
+        del general.attributes[2]  # Status
+        registry.update(updated)
+
+        assert _attribute_numbers(registry, "General") == {"Title": 1, "Active": 3, "Tags": 4, "Owner": 5}
+        assert registry.group("General").reserved_numbers == [2]
+        assert registry.group("General").reserved_names == ["status"]
+
+        # A field added later never gets a reserved number
+        general.attributes.append(MetamodelAttribute(
+            name="Status", description="Reintroduced status", type="string", required=False
+        ))
+        registry.update(updated)
+        assert registry.group("General").attributes["Status"].number == 6
+        assert registry.group("General").reserved_numbers == [2]
+        assert registry.group("General").reserved_names == []
+
+    def test_removed_group_is_reserved(self, sample_metamodel):
+        """Test that removed groups reserve their number and field name."""
+        registry = FieldNumberRegistry()
+        registry.update(sample_metamodel)
+
+        updated = deepcopy(sample_metamodel)
+        del updated.groups[0]
+        updated.groups.append(MetamodelGroup(name="Extra", description="Extra information", attributes=[
+            MetamodelAttribute(name="Note", description="A note", type="string", required=False)
+        ]))
+        registry.update(updated)
+
+        assert registry.group("Metrics").number == 2
+        assert registry.group("Extra").number == 3
+        assert registry.reserved_group_numbers == [1]
+        assert registry.reserved_group_names == ["general"]
+
+    def test_rename_keeps_number(self, sample_metamodel):
+        """Test that a renamed attribute keeps its number and reserves the old name."""
+        registry = FieldNumberRegistry()
+        registry.update(sample_metamodel)
+
+        updated = deepcopy(sample_metamodel)
+        updated.groups[1].attributes[0] = MetamodelAttribute(
+            name="Users Count", description="Number of users", type="integer", required=True
+        )
+        registry.update(updated)
+
+        metrics = registry.group("Metrics")
+        assert metrics.attributes["Users Count"].number == 1
+        assert "User Count" not in metrics.attributes
+        assert metrics.reserved_numbers == []
+        assert metrics.reserved_names == ["user_count"]
+
+    def test_type_change_gets_new_number(self, sample_metamodel):
+        """Test that changing the wire type of a field retires its number."""
+        registry = FieldNumberRegistry()
+        registry.update(sample_metamodel)
+
+        updated = deepcopy(sample_metamodel)
+        updated.groups[1].attributes[1] = MetamodelAttribute(
+            name="Score", description="Satisfaction score", type="string", required=False
+        )
+        registry.update(updated)
+
+        metrics = registry.group("Metrics")
+        assert metrics.attributes["Score"].number == 5
+        assert metrics.reserved_numbers == [2]
+        assert metrics.reserved_names == []
+
+    def test_rename_with_type_change_gets_new_number(self, sample_metamodel, mocker):
+        """Test that a rename reported across a change of wire type does not keep the number."""
+        registry = FieldNumberRegistry()
+        registry.update(sample_metamodel)
+
+        updated = deepcopy(sample_metamodel)
+        updated.groups[1].attributes[1] = MetamodelAttribute(
+            name="Rating", description="Satisfaction score", type="string", required=False
+        )
+        mocker.patch.object(registry.analyzer, "detect_changes", return_value=[MetamodelChange(
+            change_type=ChangeType.RENAME_ATTRIBUTE,
+            target_path="Metrics/Score",
+            old_value={"group": "Metrics", "name": "Score", "type": "number"},
+            new_value={"group": "Metrics", "name": "Rating", "type": "string"},
+            description="Renamed attribute 'Score' in group 'Metrics' to 'Rating'",
+        )])
+        registry.update(updated)
+
+        metrics = registry.group("Metrics")
+        assert metrics.attributes["Rating"].number == 5
+        assert metrics.reserved_numbers == [2]
+
+    def test_enum_values_are_stable(self, sample_metamodel):
+        """Test that enum values keep their numbers and removed values are reserved."""
+        sample_metamodel.groups[0].attributes[1].enum = ["Draft", "Active", "Retired"]
+        registry = FieldNumberRegistry()
+        registry.update(sample_metamodel)
+
+        updated = deepcopy(sample_metamodel)
+        updated.groups[0].attributes[1].enum = ["Proposed", "Active", "Retired"]
+        registry.update(updated)
+
+        status = registry.group("General").attributes["Status"]
+        assert status.number == 2
+        assert status.enum_values == {"Active": 2, "Retired": 3, "Proposed": 4}
+        assert status.reserved_enum_values == [1]
+
+    def test_save_and_load(self, sample_metamodel, tmp_path):
+        """Test that a saved registry continues numbering where it left off."""
+        path = str(tmp_path / "field_numbers.json")
+        assert FieldNumberRegistry.load(path).groups == {}
+
+        registry = FieldNumberRegistry()
+        registry.update(sample_metamodel)
+        updated = deepcopy(sample_metamodel)
+        del updated.groups[0].attributes[0]
+        registry.update(updated)
+        registry.save(path)
+
+        loaded = FieldNumberRegistry.load(path)
+        assert loaded.fingerprint() == registry.fingerprint()
+        assert loaded.update(updated) == []
+
+        updated.groups[0].attributes.append(MetamodelAttribute(
+            name="Owner", description="Team accountable for it", type="integer", required=False
+        ))
+        loaded.update(updated)
+        assert loaded.group("General").attributes["Owner"].number == 5
+
+
+class TestStableSchema:
+    """Tests for generating schemas with a field number registry."""
+
+    def _evolve(self, metamodel):
+        updated = deepcopy(metamodel)
+        general = updated.groups[0]
+        general.attributes[1].enum = ["Active", "Retired"]
+        del general.attributes[0]  # Title
+        general.attributes.insert(0, MetamodelAttribute(
+            name="Owner", description="Team accountable for it", type="integer", required=False
+        ))
+        return updated
+
+    def test_render_schema_reserves_removed_fields(self, sample_metamodel):
+        """Test that the rendered schema keeps numbers and emits reserved statements."""
+        sample_metamodel.groups[0].attributes[1].enum = ["Draft", "Active"]
+        generator = ProtobufGenerator(field_numbers=FieldNumberRegistry())
+        generator.render_schema(sample_metamodel, "sample")
+
+        content = generator.render_schema(self._evolve(sample_metamodel), "sample")
+
+        assert '  reserved 1;\n  reserved "title";\n' in content
+        assert "  int32 owner = 5;" in content
+        assert "  StatusEnum status = 2;" in content
+        assert "    reserved 1;\n    STATUS_ENUM_UNSPECIFIED = 0;" in content
+        assert "    STATUS_ENUM_ACTIVE = 2;" in content
+        assert "    STATUS_ENUM_RETIRED = 3;" in content
+
+    def test_without_registry_numbers_by_position(self, sample_metamodel):
+        """Test that the default numbering is unchanged and has no reserved statements."""
+        content = ProtobufGenerator().render_schema(self._evolve(sample_metamodel), "sample")
+
+        assert "reserved" not in content
+        assert "  int32 owner = 1;" in content
+
+    def test_old_records_stay_readable(self, sample_metamodel):
+        """Test that records encoded with an older version decode with the newer one."""
+        registry = FieldNumberRegistry()
+        old_codec = ProtobufCodec(sample_metamodel, field_numbers=registry)
+        data = old_codec.encode({"General": {"Title": "Sales", "Active": True, "Tags": ["a"]}})
+
+        new_codec = ProtobufCodec(self._evolve(sample_metamodel), field_numbers=registry)
+
+        assert new_codec.decode(data) == {"General": {"Active": True, "Tags": ["a"]}}
+
+    @pytest.mark.skipif(shutil.which("protoc") is None, reason="protoc is not installed")
+    def test_matches_protoc(self, sample_metamodel, tmp_path):
+        """Test that descriptor sets with reserved fields are byte-identical to protoc's."""
+        sample_metamodel.groups[0].attributes[1].enum = ["Draft", "Active"]
+        generator = ProtobufGenerator(str(tmp_path), field_numbers=FieldNumberRegistry())
+        generator.render_schema(sample_metamodel, "sample")
+        updated = self._evolve(sample_metamodel)
+        del updated.groups[1]
+
+        proto_file = generator.generate_schema(updated, "sample")
+        protoc_file = generator.generate_descriptor_set(proto_file, str(tmp_path / "protoc.pb"))
+        built_file = generator.generate_metamodel_descriptor_set(updated, "sample")
+
+        with open(built_file, "rb") as built, open(protoc_file, "rb") as expected:
+            assert built.read() == expected.read()
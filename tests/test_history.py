@@ -0,0 +1,105 @@
+"""
+Test suite for the metamodel version history.
+"""
+from copy import deepcopy
+
+import pytest
+
+from metamodel_core.models import get_core_metamodel
+from metamodel_core.models.history import MetamodelHistory
+from metamodel_core.models.metamodel import ChangeType, MetamodelAttribute
+from metamodel_core.models.validators import ChangeAnalyzer
+
+
+def _versions():
+    """Build a series of editable versions, each derived from the previous one."""
+    current = deepcopy(get_core_metamodel())
+    current.version = "1.0"
+    versions = [deepcopy(current)]
+    for minor in range(1, 13):
+        current.version = f"1.{minor}"
+        kpi = current.get_group_by_name("KPI")
+        if minor % 4 == 1:
+            kpi.attributes.append(MetamodelAttribute(
+                name=f"Metric {minor}", description=f"Metric number {minor}", type="number", required=False
+            ))
+        elif minor % 4 == 2:
+            kpi.attributes[0].required = not kpi.attributes[0].required
+        elif minor % 4 == 3:
+            current.groups[minor % len(current.groups)].description = f"Description {minor}"
+        else:
+            # Reordering cannot be expressed as a delta
+            kpi.attributes.reverse()
+        versions.append(deepcopy(current))
+    return versions
+
+
+def _paths(changes):
+    return sorted((c.change_type, c.target_path) for c in changes)
+
+
+class TestMetamodelHistory:
+    """Tests for the MetamodelHistory class."""
+
+    def test_checkout_reproduces_every_version(self):
+        """Test that every committed version can be checked out exactly, in any order."""
+        versions = _versions()
+        history = MetamodelHistory(snapshot_interval=5)
+        for version in versions:
+            history.commit(version)
+
+        assert history.versions == [v.version for v in versions]
+        for version in versions[::-1] + versions[::3]:
+            checked_out = history.checkout(version.version)
+            assert checked_out.model_dump() == version.model_dump()
+
+    def test_deltas(self):
+        """Test that versions are stored as the changes from their predecessor."""
+        versions = _versions()
+        history = MetamodelHistory()
+        changes = [history.commit(version) for version in versions]
+
+        assert changes[0] == []
+        assert _paths(changes[1]) == [(ChangeType.ADD_ATTRIBUTE, "KPI/Metric 1")]
+        assert history.changes("1.2") == changes[2]
+        assert _paths(changes[2]) == [(ChangeType.CHANGE_REQUIREMENT, "KPI/Use Cases Satisfied")]
+
+    def test_diff_matches_full_comparison(self):
+        """Test that diffs between any two versions match comparing the full models."""
+        versions = _versions()
+        history = MetamodelHistory(snapshot_interval=4)
+        for version in versions:
+            history.commit(version)
+        analyzer = ChangeAnalyzer()
+
+        for old, new in [(0, 12), (12, 0), (3, 7), (5, 6), (2, 2)]:
+            expected = analyzer.detect_changes(versions[old], versions[new])
+            assert _paths(history.diff(versions[old].version, versions[new].version)) == _paths(expected)
+
+    def test_save_and_load(self, tmp_path):
+        """Test that a saved history loads with the same versions and deltas."""
+        versions = _versions()
+        history = MetamodelHistory(snapshot_interval=3)
+        for version in versions[:-1]:
+            history.commit(version)
+        path = str(tmp_path / "history.json")
+
+        history.save(path)
+        loaded = MetamodelHistory.load(path)
+        loaded.commit(versions[-1])
+
+        assert loaded.versions == history.versions + [versions[-1].version]
+        for version in versions:
+            assert loaded.checkout(version.version).model_dump() == version.model_dump()
+        assert _paths(loaded.changes("1.5")) == _paths(history.changes("1.5"))
+
+    def test_unknown_and_duplicate_versions(self, sample_metamodel):
+        """Test the errors for unknown and repeated versions."""
+        history = MetamodelHistory()
+        history.commit(sample_metamodel)
+
+        assert "1.0.0" in history and len(history) == 1
+        with pytest.raises(ValueError, match="Version '1.0.0' already exists"):
+            history.commit(sample_metamodel)
+        with pytest.raises(ValueError, match="Version '2.0' does not exist"):
+            history.checkout("2.0")
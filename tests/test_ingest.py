@@ -0,0 +1,132 @@
+"""
+Test suite for importing spreadsheet-style field catalogs.
+"""
+import io
+import json
+import os
+
+import pytest
+
+from metamodel_core.models.ingest import (
+    MetamodelImporter,
+    diff_against_core,
+    import_ingest,
+    import_ingest_file,
+    iter_json_array,
+)
+from metamodel_core.models.metamodel import AttributeType, ChangeType
+
+INGEST_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "src", "metamodel_core", "data", "ingest.json"
+)
+
+
+def _row(field, **columns):
+    row = {"Field": field, "Type": "String", "Definition": f"Definition of {field}", "Groupings": "Context"}
+    row.update(columns)
+    return row
+
+
+class TestIterJsonArray:
+    """Tests for the streaming JSON array parser."""
+
+    def test_small_reads(self):
+        """Test that items split across reads are parsed, including trailing numbers."""
+        items = [{"a": "x" * 50}, 12345, [1, {"b": None}], "text", 6789]
+        text = " [\n" + ",\n ".join(json.dumps(item) for item in items) + "\n] "
+
+        assert list(iter_json_array(io.StringIO(text), read_size=7)) == items
+        assert list(iter_json_array(io.StringIO(" [ ] "))) == []
+
+    def test_numbers_split_at_every_point(self):
+        """Test that a number split across reads at any character is parsed whole."""
+        number = "-12.75e+3"
+        for padding in range(len(number) + 1):
+            text = f'["{"x" * padding}", {number}, {number}]'
+            items = list(iter_json_array(io.StringIO(text), read_size=len(number)))
+            assert items == ["x" * padding, -12750.0, -12750.0]
+        assert list(iter_json_array(io.StringIO('["", 12.75]'), 8)) == ["", 12.75]
+
+    def test_malformed(self):
+        """Test that non-arrays and broken arrays are rejected."""
+        with pytest.raises(ValueError, match="JSON array"):
+            list(iter_json_array(io.StringIO('{"Field": "x"}')))
+        with pytest.raises(ValueError):
+            list(iter_json_array(io.StringIO('[{"Field": "x"} {"Field": "y"}]')))
+        with pytest.raises(ValueError):
+            list(iter_json_array(io.StringIO('[{"Field": ')))
+
+
+class TestMetamodelImporter:
+    """Tests for the MetamodelImporter class."""
+
+    def test_normalization(self):
+        """Test the mapping of groupings, types, lists of values and gate requirements."""
+        importer = MetamodelImporter(group_descriptions={"Context": "Where the data comes from"})
+        importer.add_row(_row("  Data  Asset Name ", **{"Gate Requirement": "Y"}))
+        importer.add_row(_row("Domain", **{"Type Detail": "LOV", "Value Limits": "Research, Development, Research"}))
+        importer.add_row(_row("Files", Type="Int", Groupings="Data Spec", **{"Gate Requirement": "N"}))
+        importer.add_row(_row("File Type", Groupings="Data Spec",
+                              **{"Type Detail": "multiple-choice", "Value Limits": "csv, txt"}))
+        importer.add_row(_row("Version Date", Type="DateTime", Groupings=""))
+
+        metamodel = importer.build()
+
+        assert [group.name for group in metamodel.groups] == ["Context", "Data Spec", "Ungrouped"]
+        assert metamodel.groups[0].description == "Where the data comes from"
+        name, domain = metamodel.groups[0].attributes
+        assert (name.name, name.required, name.enum) == ("Data Asset Name", True, None)
+        assert domain.enum == ["Research", "Development"]
+        files, file_type = metamodel.groups[1].attributes
+        assert (files.type, files.required) == (AttributeType.INTEGER, False)
+        assert file_type.type == AttributeType.ARRAY and "csv, txt" in file_type.description
+        assert metamodel.groups[2].attributes[0].type == AttributeType.DATETIME
+        assert importer.issues == []
+
+    def test_issues(self):
+        """Test that rows that cannot be mapped exactly are reported."""
+        importer = MetamodelImporter()
+        importer.add_row(_row("Owner"))
+        importer.add_row(_row("Owner"))
+        importer.add_row({"Type": "String"})
+        importer.add_row(_row("Process ID", **{"Type Detail": "LOV", "Value Limits": "from Portfolio team"}))
+        importer.add_row(_row("Identifier", Type="Guid", Definition=" "))
+
+        metamodel = importer.build()
+
+        assert [(issue.row, issue.field) for issue in importer.issues] == [
+            (2, "Owner"), (3, ""), (4, "Process ID"), (5, "Identifier"), (5, "Identifier")
+        ]
+        identifier = metamodel.get_attribute_by_path("Context/Identifier")[1]
+        assert (identifier.type, identifier.description) == (AttributeType.STRING, "Identifier")
+
+    def test_no_rows(self):
+        """Test that an empty catalog is rejected."""
+        with pytest.raises(ValueError, match="No catalog rows"):
+            import_ingest(io.StringIO("[]"))
+
+
+class TestImportIngestFile:
+    """Tests for importing the bundled ingest catalog."""
+
+    def test_bundled_catalog(self):
+        """Test that every row of data/ingest.json is imported."""
+        with open(INGEST_PATH, "r") as f:
+            rows = json.load(f)
+
+        result = import_ingest_file(INGEST_PATH)
+
+        assert result.rows == len(rows)
+        assert sum(len(group.attributes) for group in result.metamodel.groups) == len(rows)
+        security = result.metamodel.get_attribute_by_path("Gov Process/Data Asset Security Status")[1]
+        assert security.required and security.enum == ["Secret", "Confidential", "Internal", "Public"]
+
+    def test_diff_against_core(self, core_metamodel):
+        """Test that the import is compared with the core metamodel."""
+        result = import_ingest_file(INGEST_PATH)
+
+        changes = diff_against_core(result.metamodel)
+
+        added = {change.target_path for change in changes if change.change_type == ChangeType.ADD_GROUP}
+        assert added == {"Context", "People", "Gov Process", "Data Spec", "Tech"}
+        assert diff_against_core(core_metamodel, base=core_metamodel) == []
@@ -0,0 +1,156 @@
+"""
+Test suite for validating metadata records with compiled JSON Schema validators.
+"""
+import threading
+from copy import deepcopy
+
+import pytest
+
+from metamodel_core.models.records import RecordErrorCode, RecordValidator
+from metamodel_core.schema.json_schema import JsonSchemaRecordValidator, ValidatorCache
+
+
+@pytest.fixture
+def metamodel(sample_metamodel):
+    sample_metamodel.groups[0].attributes[1].enum = ["Active", "On Hold"]
+    return sample_metamodel
+
+
+def _valid_record():
+    return {
+        "General": {"Title": "Orders", "Status": "Active", "Active": True, "Tags": ["a"]},
+        "Metrics": {"User Count": 3, "Score": 0.5, "Last Refreshed": "2025-05-01T12:00:00Z", "Details": {}},
+    }
+
+
+class TestValidatorCache:
+    """Tests for the ValidatorCache class."""
+
+    def test_compiles_each_version_once(self, metamodel):
+        """Test that a metamodel version is compiled once and equal copies share it."""
+        cache = ValidatorCache()
+
+        validator = cache.get(metamodel)
+        assert cache.get(deepcopy(metamodel)) is validator
+        assert cache.compiles == 1
+
+        newer = deepcopy(metamodel)
+        newer.version = "1.1.0"
+        assert cache.get(newer) is not validator
+        assert cache.get(metamodel, allow_unknown=True) is not validator
+        assert cache.compiles == 3
+
+    def test_least_recently_used_is_evicted(self, metamodel):
+        """Test that the cache keeps at most maxsize validators."""
+        cache = ValidatorCache(maxsize=2)
+        versions = []
+        for minor in range(3):
+            version = deepcopy(metamodel)
+            version.version = f"1.{minor}"
+            versions.append(version)
+
+        cache.get(versions[0])
+        cache.get(versions[1])
+        cache.get(versions[0])
+        cache.get(versions[2])
+
+        assert len(cache) == 2
+        cache.get(versions[0])
+        assert cache.compiles == 3
+        cache.get(versions[1])
+        assert cache.compiles == 4
+
+    def test_concurrent_requests_compile_once(self, metamodel):
+        """Test that threads asking for the same version at once share one compilation."""
+        cache = ValidatorCache()
+        barrier = threading.Barrier(8)
+        validators = []
+
+        def worker():
+            barrier.wait()
+            validators.append(cache.get(metamodel))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert cache.compiles == 1
+        assert all(validator is validators[0] for validator in validators)
+
+
+    def test_failed_compilation_is_released(self, metamodel, mocker):
+        """Test that a compilation error leaves no entry behind and is retried."""
+        cache = ValidatorCache()
+        mocker.patch("metamodel_core.schema.json_schema.compile_metamodel", side_effect=RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError):
+            cache.get(metamodel)
+        assert cache._compiling == {}
+
+        mocker.stopall()
+        assert cache.get(metamodel) is not None
+        assert cache.compiles == 1
+
+
+class TestJsonSchemaRecordValidator:
+    """Tests for the JsonSchemaRecordValidator class."""
+
+    @pytest.mark.parametrize("group,attr,value", [
+        ("General", "Status", "Closed"),
+        ("General", "Status", 5),
+        ("General", "Title", None),
+        ("General", "Title", 3),
+        ("General", "Active", "yes"),
+        ("Metrics", "User Count", 1.5),
+        ("Metrics", "User Count", 1.0),
+        ("Metrics", "Score", True),
+        ("Metrics", "Last Refreshed", "yesterday"),
+        ("Metrics", "Details", []),
+        ("General", "Nope", 1),
+    ])
+    def test_same_errors_as_record_validator(self, metamodel, group, attr, value):
+        """Test that errors match RecordValidator's."""
+        record = _valid_record()
+        record[group][attr] = value
+
+        expected = RecordValidator(metamodel).validate(record)
+        actual = JsonSchemaRecordValidator(metamodel, cache=ValidatorCache()).validate(record)
+
+        assert actual == expected
+        assert not actual[0]
+
+    def test_several_missing_attributes(self, metamodel):
+        """Test that every missing required attribute of a group is reported once."""
+        record = _valid_record()
+        del record["General"]["Title"]
+        del record["General"]["Status"]
+
+        expected = RecordValidator(metamodel).validate(record)
+        actual = JsonSchemaRecordValidator(metamodel, cache=ValidatorCache()).validate(record)
+
+        assert actual == expected
+        assert [e.path for e in actual[1]] == ["General/Title", "General/Status"]
+
+    def test_valid_records(self, metamodel):
+        """Test that valid records, including ISO dates and nulls, have no errors."""
+        validator = JsonSchemaRecordValidator(metamodel, cache=ValidatorCache())
+        record = _valid_record()
+        record["General"]["Active"] = None
+        record["Metrics"]["Last Refreshed"] = "2025-05-01"
+
+        assert validator.validate(record) == (True, [])
+
+    def test_missing_group_and_unknown_group(self, metamodel):
+        """Test the errors for missing and unknown groups."""
+        validator = JsonSchemaRecordValidator(metamodel, cache=ValidatorCache())
+
+        is_valid, errors = validator.validate({"General": _valid_record()["General"], "Nope": {}})
+
+        assert not is_valid
+        assert sorted((e.path, e.code) for e in errors) == [
+            ("Metrics", RecordErrorCode.MISSING_REQUIRED),
+            ("Nope", RecordErrorCode.UNKNOWN_GROUP),
+        ]
+        assert validator.validate([])[1][0].code == RecordErrorCode.NOT_AN_OBJECT
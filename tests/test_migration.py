@@ -0,0 +1,255 @@
+"""
+Test suite for migrating stored records to a new metamodel version.
+"""
+import json
+from copy import deepcopy
+
+import pytest
+
+from metamodel_core.models import migration as migration_module
+from metamodel_core.models.metamodel import ChangeType, MetamodelAttribute, MetamodelChange
+from metamodel_core.models.migration import (
+    RecordMigration,
+    RecordMigrationError,
+    iter_delimited,
+    migrate_ndjson,
+    migrate_protobuf,
+)
+from metamodel_core.models.records import RecordErrorCode, RecordValidator
+from metamodel_core.models.validators import ChangeAnalyzer
+
+DEFAULTS = {"General/Owner": "unknown", "General/Active": False}
+ENUM_MAPS = {"General/Status": {"Live": "Active", "Closed": "Retired"}}
+
+
+def _evolve(metamodel):
+    new = deepcopy(metamodel)
+    general, metrics = new.groups
+    general.attributes[1].enum = ["Active", "Retired"]
+    general.attributes[2].required = True
+    general.attributes.append(MetamodelAttribute(
+        name="Owner", description="Team accountable for it", type="string", required=True
+    ))
+    metrics.attributes[1].type = "string"
+    metrics.attributes[2] = MetamodelAttribute(
+        name="Last Refresh Time", description="Time of the last refresh", type="datetime", required=False
+    )
+    del metrics.attributes[3]
+    new.version = "2.0.0"
+    return new
+
+
+@pytest.fixture
+def versions(sample_metamodel):
+    return sample_metamodel, _evolve(sample_metamodel)
+
+
+@pytest.fixture
+def migration(versions):
+    changes = ChangeAnalyzer().detect_changes(*versions)
+    return RecordMigration(changes, defaults=DEFAULTS, enum_maps=ENUM_MAPS)
+
+
+def _record(i, status="Live"):
+    return {
+        "General": {"Title": f"Product {i}", "Status": status, "Tags": ["a"]},
+        "Metrics": {"User Count": i, "Score": 0.5, "Last Refreshed": "2025-05-01T12:00:00Z", "Details": {"a": 1}},
+    }
+
+
+def _interrupt(migration, mocker, after):
+    """Make the migration fail on record number ``after`` + 1, as if the process died."""
+    apply = migration.apply
+    calls = 0
+
+    def failing_apply(record):
+        nonlocal calls
+        calls += 1
+        if calls > after:
+            raise RuntimeError("worker lost")
+        return apply(record)
+
+    return mocker.patch.object(migration, "apply", failing_apply)
+
+
+def _write_ndjson(path, records):
+    with open(path, "w") as f:
+        for record in records:
+            f.write((record if isinstance(record, str) else json.dumps(record)) + "\n")
+
+
+class TestRecordMigration:
+    """Tests for the RecordMigration class."""
+
+    def test_apply(self, versions, migration):
+        """Test that every kind of change is applied and the result is valid."""
+        changes = {change.change_type for change in migration.changes}
+        assert ChangeType.RENAME_ATTRIBUTE in changes and ChangeType.MODIFY_ATTRIBUTE in changes
+
+        record = migration.apply(_record(1))
+
+        assert record == {
+            "General": {"Title": "Product 1", "Status": "Active", "Tags": ["a"], "Active": False, "Owner": "unknown"},
+            "Metrics": {"User Count": 1, "Score": "0.5", "Last Refresh Time": "2025-05-01T12:00:00Z"},
+        }
+        assert RecordValidator(versions[1]).validate(record) == (True, [])
+
+    def test_existing_values_are_kept(self, migration):
+        """Test that defaults only fill missing values and valid values are unchanged."""
+        record = _record(2, status="Retired")
+        record["General"]["Active"] = True
+        record["Metrics"]["Score"] = "high"
+
+        migrated = migration.apply(record)
+
+        assert migrated["General"]["Active"] is True
+        assert migrated["General"]["Status"] == "Retired"
+        assert migrated["Metrics"]["Score"] == "high"
+
+    def test_unmapped_enum_value(self, migration):
+        """Test that enum values without a mapping are reported."""
+        with pytest.raises(RecordMigrationError) as info:
+            migration.apply(_record(3, status="Draft"))
+
+        assert info.value.error.code == RecordErrorCode.INVALID_ENUM
+        assert info.value.error.path == "General/Status"
+
+    @pytest.mark.parametrize("record,path,code", [
+        ({"General": ["Product"]}, "General", RecordErrorCode.NOT_AN_OBJECT),
+        ({"General": "Product", "Metrics": {}}, "General", RecordErrorCode.NOT_AN_OBJECT),
+        ({"General": {"Title": "Product", "Status": ["Live"]}}, "General/Status", RecordErrorCode.INVALID_ENUM),
+        ({"General": {"Title": "Product", "Status": {"Live": 1}}}, "General/Status", RecordErrorCode.INVALID_ENUM),
+    ])
+    def test_malformed_groups_and_values(self, migration, record, path, code):
+        """Test that groups that are not objects and unhashable enum values are reported."""
+        with pytest.raises(RecordMigrationError) as info:
+            migration.apply(record)
+
+        assert (info.value.error.path, info.value.error.code) == (path, code)
+
+    def test_move_into_malformed_group(self):
+        """Test that moving a value into a group that is not an object is reported."""
+        migration = RecordMigration([MetamodelChange(
+            change_type=ChangeType.MOVE_ATTRIBUTE,
+            target_path="General/Score",
+            old_value={"group": "General", "name": "Score", "type": "number"},
+            new_value={"group": "Metrics", "name": "Score", "type": "number"},
+            description="Move Score to Metrics",
+        )])
+
+        with pytest.raises(RecordMigrationError) as info:
+            migration.apply({"General": {"Score": 1}, "Metrics": "none"})
+
+        assert (info.value.error.path, info.value.error.code) == ("Metrics", RecordErrorCode.NOT_AN_OBJECT)
+
+    def test_unexpected_failure_is_reported(self, migration, mocker):
+        """Test that an operation failing unexpectedly rejects the record instead of raising."""
+        mocker.patch.object(migration, "_operations", [lambda record: record["General"].missing()])
+
+        with pytest.raises(RecordMigrationError) as info:
+            migration.apply(_record(1))
+
+        assert info.value.error.code == RecordErrorCode.MIGRATION_FAILED
+        assert "AttributeError" in info.value.error.message
+
+    def test_coercion(self, sample_metamodel):
+        """Test type conversions and conversion errors."""
+        new = deepcopy(sample_metamodel)
+        new.groups[0].attributes[0].type = "integer"
+        new.groups[0].attributes[2].type = "string"
+        migration = RecordMigration(ChangeAnalyzer().detect_changes(sample_metamodel, new))
+
+        assert migration.apply({"General": {"Title": " 42 ", "Active": True}}) == {
+            "General": {"Title": 42, "Active": "true"}
+        }
+        with pytest.raises(RecordMigrationError) as info:
+            migration.apply({"General": {"Title": "forty-two"}})
+        assert info.value.error.code == RecordErrorCode.INVALID_TYPE
+
+    def test_required_attributes_need_defaults(self, versions):
+        """Test that compiling fails when a required attribute has no default."""
+        changes = ChangeAnalyzer().detect_changes(*versions)
+
+        with pytest.raises(ValueError, match="General/Owner, General/Active|General/Active, General/Owner"):
+            RecordMigration(changes, enum_maps=ENUM_MAPS)
+
+
+class TestMigrateNdjson:
+    """Tests for streaming NDJSON migration."""
+
+    def test_migrate(self, tmp_path, versions, migration):
+        """Test that records are migrated, and failed ones reported by line."""
+        source, output, rejects = tmp_path / "in.ndjson", tmp_path / "out.ndjson", tmp_path / "rejects.ndjson"
+        _write_ndjson(source, [_record(1), "", _record(2, status="Draft"), "{broken", _record(3)])
+
+        stats = migrate_ndjson(str(source), str(output), migration, reject_path=str(rejects),
+                               validator=RecordValidator(versions[1]))
+
+        assert (stats.records, stats.migrated, stats.rejected, stats.malformed) == (4, 2, 2, 1)
+        migrated = [json.loads(line) for line in output.read_text().splitlines()]
+        assert [r["General"]["Title"] for r in migrated] == ["Product 1", "Product 3"]
+        reports = [json.loads(line) for line in rejects.read_text().splitlines()]
+        assert [(r["line"], r["errors"][0]["code"]) for r in reports] == [(3, "invalid_enum"), (4, "invalid_json")]
+
+    def test_resume_after_failure(self, tmp_path, migration, mocker):
+        """Test that an interrupted run resumes from its checkpoint with the same result."""
+        source = tmp_path / "in.ndjson"
+        _write_ndjson(source, [_record(i, status="Draft" if i % 7 == 0 else "Live") for i in range(1, 51)])
+        expected_output, expected_rejects = tmp_path / "expected.ndjson", tmp_path / "expected_rejects.ndjson"
+        expected = migrate_ndjson(str(source), str(expected_output), migration, reject_path=str(expected_rejects))
+
+        output, rejects, checkpoint = tmp_path / "out.ndjson", tmp_path / "rejects.ndjson", tmp_path / "checkpoint"
+
+        interrupted = _interrupt(migration, mocker, after=22)
+        with pytest.raises(RuntimeError):
+            migrate_ndjson(str(source), str(output), migration, reject_path=str(rejects),
+                           checkpoint_path=str(checkpoint), checkpoint_every=10)
+        assert json.loads(checkpoint.read_text())["stats"]["records"] == 20
+
+        mocker.stop(interrupted)
+        stats = migrate_ndjson(str(source), str(output), migration, reject_path=str(rejects),
+                               checkpoint_path=str(checkpoint), checkpoint_every=10)
+
+        assert stats.resumed_records == 20
+        assert (stats.records, stats.migrated, stats.rejected) == (50, expected.migrated, expected.rejected)
+        assert output.read_bytes() == expected_output.read_bytes()
+        assert rejects.read_bytes() == expected_rejects.read_bytes()
+        assert not checkpoint.exists()
+
+    def test_checkpoint_of_other_migration(self, tmp_path, migration, mocker):
+        """Test that a checkpoint is not resumed with a different migration."""
+        source, checkpoint = tmp_path / "in.ndjson", tmp_path / "checkpoint"
+        _write_ndjson(source, [_record(i) for i in range(5)])
+        _interrupt(migration, mocker, after=3)
+        with pytest.raises(RuntimeError):
+            migrate_ndjson(str(source), str(tmp_path / "out"), migration, checkpoint_path=str(checkpoint), checkpoint_every=1)
+
+        other = RecordMigration([])
+        with pytest.raises(ValueError, match="different migration"):
+            migrate_ndjson(str(source), str(tmp_path / "out"), other, checkpoint_path=str(checkpoint))
+
+
+class TestMigrateProtobuf:
+    """Tests for migrating length-delimited Protocol Buffer records."""
+
+    def test_migrate(self, tmp_path, versions, migration):
+        """Test that records are decoded with the old schema and encoded with the new one."""
+        from metamodel_core.schema.protobuf_codec import ProtobufCodec
+
+        old_codec, new_codec = ProtobufCodec(versions[0]), ProtobufCodec(versions[1])
+        source, output = tmp_path / "in.bin", tmp_path / "out.bin"
+        with open(source, "wb") as f:
+            for i in range(1, 4):
+                data = old_codec.encode(_record(i))
+                f.write(migration_module.encode_varint(len(data)) + data)
+
+        stats = migrate_protobuf(str(source), str(output), migration, old_codec, new_codec,
+                                 checkpoint_path=str(tmp_path / "checkpoint"), checkpoint_every=1)
+
+        assert stats.migrated == 3
+        with open(output, "rb") as f:
+            records = [new_codec.decode(data) for data in iter_delimited(f)]
+        assert records[2]["General"] == {
+            "Title": "Product 3", "Status": "Active", "Tags": ["a"], "Active": False, "Owner": "unknown"
+        }
+        assert records[2]["Metrics"]["Last Refresh Time"] == "2025-05-01T12:00:00Z"
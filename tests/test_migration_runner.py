@@ -0,0 +1,165 @@
+"""
+Test suite for the parallel, chunked migration runner.
+"""
+import json
+import pickle
+from copy import deepcopy
+
+import pytest
+
+from metamodel_core.models import migration_runner as runner_module
+from metamodel_core.models.metamodel import MetamodelAttribute
+from metamodel_core.models.migration import RecordMigration, migrate_ndjson
+from metamodel_core.models.migration_runner import MigrationRunner
+from metamodel_core.models.records import RecordValidator
+from metamodel_core.models.validators import ChangeAnalyzer
+
+DEFAULTS = {"General/Owner": "unknown"}
+ENUM_MAPS = {"General/Status": {"Live": "Active"}}
+
+
+@pytest.fixture
+def versions(sample_metamodel):
+    new = deepcopy(sample_metamodel)
+    general = new.groups[0]
+    general.attributes[1].enum = ["Active", "Retired"]
+    general.attributes.append(MetamodelAttribute(
+        name="Owner", description="Team accountable for it", type="string", required=True
+    ))
+    new.version = "2.0.0"
+    return sample_metamodel, new
+
+
+@pytest.fixture
+def migration(versions):
+    return RecordMigration(ChangeAnalyzer().detect_changes(*versions), defaults=DEFAULTS, enum_maps=ENUM_MAPS)
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "in.ndjson"
+    with open(path, "w") as f:
+        for i in range(1, 61):
+            status = "Draft" if i % 10 == 0 else ("Retired" if i % 4 == 0 else "Live")
+            f.write(json.dumps({"General": {"Title": f"Product {i}", "Status": status}}) + "\n")
+            if i == 30:
+                f.write("{broken\n")
+    return path
+
+
+class TestMigrationRunner:
+    """Tests for the MigrationRunner class."""
+
+    def test_run_matches_streaming_migration(self, tmp_path, source, versions, migration):
+        """Test that the merged parts and rejects equal those of migrate_ndjson."""
+        validator = RecordValidator(versions[1])
+        expected = migrate_ndjson(str(source), str(tmp_path / "expected.ndjson"), migration,
+                                  reject_path=str(tmp_path / "expected_rejects.ndjson"), validator=validator)
+
+        runner = MigrationRunner(migration, validator=validator, workers=1, chunk_bytes=512)
+        stats = runner.run(str(source), str(tmp_path / "parts"), output_path=str(tmp_path / "out.ndjson"),
+                           reject_path=str(tmp_path / "rejects.ndjson"))
+
+        assert len(list((tmp_path / "parts").glob("part-*.json"))) > 1
+        assert (stats.records, stats.migrated, stats.rejected, stats.malformed) == (
+            expected.records, expected.migrated, expected.rejected, expected.malformed
+        )
+        assert (tmp_path / "out.ndjson").read_bytes() == (tmp_path / "expected.ndjson").read_bytes()
+        assert (tmp_path / "rejects.ndjson").read_bytes() == (tmp_path / "expected_rejects.ndjson").read_bytes()
+
+    def test_rerun_skips_complete_chunks(self, tmp_path, source, migration, mocker):
+        """Test that a failed run is resumed with the chunks that did not complete."""
+        output_dir = tmp_path / "parts"
+        migrate_chunk = runner_module._migrate_chunk
+
+        def failing_chunk(input_path, start, end, output_dir, index):
+            if index == 2:
+                raise RuntimeError("worker lost")
+            return migrate_chunk(input_path, start, end, output_dir, index)
+
+        runner = MigrationRunner(migration, workers=1, chunk_bytes=512)
+        patched = mocker.patch.object(runner_module, "_migrate_chunk", failing_chunk)
+        with pytest.raises(RuntimeError):
+            runner.run(str(source), str(output_dir))
+        mocker.stop(patched)
+
+        spy = mocker.spy(runner_module, "_migrate_chunk")
+        stats = runner.run(str(source), str(output_dir), output_path=str(tmp_path / "out.ndjson"))
+
+        chunks = len(json.loads((output_dir / "manifest.json").read_text())["chunks"])
+        assert spy.call_count == chunks - 2
+        assert stats.resumed_records > 0 and stats.records == 61
+        assert len((tmp_path / "out.ndjson").read_text().splitlines()) == stats.migrated
+
+    def test_output_of_other_migration(self, tmp_path, source, migration):
+        """Test that parts of a different migration are not reused."""
+        MigrationRunner(migration, workers=1).run(str(source), str(tmp_path / "parts"))
+
+        with pytest.raises(ValueError, match="different migration"):
+            MigrationRunner(RecordMigration([]), workers=1).run(str(source), str(tmp_path / "parts"))
+
+    def test_process_pool(self, tmp_path, source, migration):
+        """Test that chunks migrated by worker processes give the same result."""
+        inline = MigrationRunner(migration, workers=1, chunk_bytes=512).run(
+            str(source), str(tmp_path / "inline"), output_path=str(tmp_path / "inline.ndjson")
+        )
+        pooled = MigrationRunner(migration, workers=2, chunk_bytes=512).run(
+            str(source), str(tmp_path / "pooled"), output_path=str(tmp_path / "pooled.ndjson")
+        )
+
+        assert (pooled.records, pooled.migrated, pooled.rejected) == (inline.records, inline.migrated, inline.rejected)
+        assert (tmp_path / "pooled.ndjson").read_bytes() == (tmp_path / "inline.ndjson").read_bytes()
+
+    def test_malformed_group_is_rejected(self, tmp_path, source, migration):
+        """Test that a record whose group is not an object is rejected without stopping the run."""
+        with open(source, "a") as f:
+            f.write(json.dumps({"General": ["Product"]}) + "\n")
+            f.write(json.dumps({"General": {"Title": "Product", "Status": ["Live"]}}) + "\n")
+        expected = migrate_ndjson(str(source), str(tmp_path / "expected.ndjson"), migration)
+
+        stats = MigrationRunner(migration, workers=2, chunk_bytes=512).run(
+            str(source), str(tmp_path / "parts"), output_path=str(tmp_path / "out.ndjson"),
+            reject_path=str(tmp_path / "rejects.ndjson"),
+        )
+
+        assert (stats.records, stats.migrated, stats.rejected) == (expected.records, expected.migrated,
+                                                                    expected.rejected)
+        rejects = [json.loads(line) for line in (tmp_path / "rejects.ndjson").read_text().splitlines()]
+        assert [reject["errors"][0]["code"] for reject in rejects[-2:]] == ["not_an_object", "invalid_enum"]
+
+        # Sampling the malformed records does not stop a dry run either
+        estimate = MigrationRunner(migration, workers=1).dry_run(str(source), sample_size=100)
+        assert sum(impact.sampled_rejected for impact in estimate.impact.values()) > 0
+
+    def test_migration_pickles(self, migration):
+        """Test that a migration sent to a worker process applies the same changes."""
+        copy = pickle.loads(pickle.dumps(migration))
+        record = {"General": {"Title": "Product", "Status": "Live"}}
+
+        assert copy.fingerprint == migration.fingerprint
+        assert copy.apply(deepcopy(record)) == migration.apply(deepcopy(record))
+
+
+class TestDryRun:
+    """Tests for migration dry runs."""
+
+    def test_estimate(self, source, migration):
+        """Test that records are counted and affected records attributed to impact categories."""
+        estimate = MigrationRunner(migration, workers=2).dry_run(str(source), sample_size=1000)
+
+        assert estimate.sampled_records == 61
+        assert estimate.estimated_records == 61
+        assert estimate.estimated_seconds > 0
+        # The new required attribute is filled in every record
+        assert estimate.impact["high_impact"].estimated_affected == 60
+        # The enum change maps "Live" and rejects "Draft"
+        medium = estimate.impact["medium_impact"]
+        assert (medium.sampled_affected, medium.sampled_rejected) == (42, 6)
+        assert "high_impact" in estimate.summary()
+
+    def test_sample_extrapolation(self, source, migration):
+        """Test that a sample of the file is extrapolated to the whole file."""
+        estimate = MigrationRunner(migration, workers=1).dry_run(str(source), sample_size=10)
+
+        assert estimate.sampled_records == 10
+        assert 40 <= estimate.estimated_records <= 80
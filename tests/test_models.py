@@ -0,0 +1,164 @@
+"""
+Test suite for the metamodel models.
+"""
+import pickle
+from copy import deepcopy
+
+from metamodel_core.models import get_core_metamodel
+from metamodel_core.models import metamodel as metamodel_module
+from metamodel_core.models.changes import ChangeApplier
+from metamodel_core.models.metamodel import AttributeType, MetamodelAttribute, MetamodelGroup
+
+
+class TestMetamodelIndexes:
+    """Tests for the indexed lookups on Metamodel."""
+
+    def test_lookups(self, sample_metamodel):
+        """Test lookups by group name, attribute name, path and type."""
+        metamodel = sample_metamodel
+
+        assert metamodel.get_group_by_name("Metrics") is metamodel.groups[1]
+        assert metamodel.get_group_by_name("Missing") is None
+
+        group, attr = metamodel.get_attribute_by_path("Metrics/User Count")
+        assert group is metamodel.groups[1]
+        assert attr is metamodel.groups[1].attributes[0]
+        assert metamodel.get_attribute_by_path("General/User Count") is None
+
+        assert metamodel.get_attribute_by_name("Score") is metamodel.groups[1].attributes[1]
+        assert metamodel.get_attribute_groups("Score") == [metamodel.groups[1]]
+        assert [a.name for _, a in metamodel.get_attributes_by_type(AttributeType.INTEGER)] == ["User Count"]
+        assert metamodel.get_required_attributes() == [
+            {"name": "Title", "type": AttributeType.STRING, "group": "General"},
+            {"name": "Status", "type": AttributeType.STRING, "group": "General"},
+            {"name": "User Count", "type": AttributeType.INTEGER, "group": "Metrics"},
+        ]
+
+    def test_index_follows_list_mutation(self, sample_metamodel):
+        """Test that appending and removing attributes updates lookups."""
+        metamodel = sample_metamodel
+        assert metamodel.get_attribute_by_name("Owner") is None
+
+        owner = MetamodelAttribute(name="Owner", description="Owner", type="string", required=True)
+        metamodel.groups[0].attributes.append(owner)
+        assert metamodel.get_attribute_by_name("Owner") is owner
+        assert metamodel.get_attribute_by_path("General/Owner") == (metamodel.groups[0], owner)
+        assert "Owner" in [a["name"] for a in metamodel.get_required_attributes()]
+
+        del metamodel.groups[0].attributes[-1]
+        assert metamodel.get_attribute_by_name("Owner") is None
+
+    def test_index_follows_assignment(self, sample_metamodel):
+        """Test that assigning fields on nested objects updates lookups."""
+        metamodel = sample_metamodel
+        metamodel.get_required_attributes()
+
+        metamodel.groups[1].attributes[1].required = True
+        metamodel.groups[1].name = "Usage"
+        metamodel.groups = metamodel.groups + [MetamodelGroup(
+            name="Extra",
+            description="Extra group",
+            attributes=[MetamodelAttribute(name="Note", description="A note", type="string", required=False)]
+        )]
+
+        assert metamodel.get_group_by_name("Metrics") is None
+        assert metamodel.get_attribute_by_path("Usage/Score") is not None
+        assert {"name": "Score", "type": AttributeType.NUMBER, "group": "Usage"} in \
+            metamodel.get_required_attributes()
+        metamodel.groups.pop()
+        assert metamodel.get_group_by_name("Extra") is None
+
+    def test_required_attributes_are_copies(self, sample_metamodel):
+        """Test that callers cannot corrupt the cached required list."""
+        sample_metamodel.get_required_attributes()[0]["name"] = "Changed"
+
+        assert sample_metamodel.get_required_attributes()[0]["name"] == "Title"
+
+    def test_deepcopy_gets_own_index(self):
+        """Test that a copy's lookups return the copy's objects."""
+        metamodel = get_core_metamodel()
+        metamodel.get_attribute_by_name("ROI")
+
+        copied = deepcopy(metamodel)
+
+        assert copied.get_attribute_by_name("ROI") is not metamodel.get_attribute_by_name("ROI")
+        assert copied.get_attribute_by_path("KPI/ROI")[0] in copied.groups
+
+
+    def test_editing_one_metamodel_keeps_other_indexes(self, sample_metamodel, mocker):
+        """Test that modifying a metamodel does not invalidate the caches of other metamodels."""
+        other = deepcopy(sample_metamodel)
+        other.get_attribute_by_name("Title")
+        other_hash = other.content_hash()
+        index = mocker.spy(metamodel_module, "_MetamodelIndex")
+        digest = mocker.spy(metamodel_module, "_digest")
+
+        sample_metamodel.groups[0].attributes[0].required = False
+        sample_metamodel.groups[1].attributes.pop()
+
+        assert other.get_attribute_by_name("Title").required is True
+        assert other.content_hash() == other_hash
+        assert index.call_count == 0 and digest.call_count == 0
+        assert sample_metamodel.get_attribute_by_name("Details") is None
+
+    def test_shared_groups_invalidate_every_holder(self, sample_metamodel):
+        """Test that modifying a group shared by two metamodels updates both."""
+        derived = ChangeApplier().apply_changes(sample_metamodel, [], version="2.0.0")
+        assert derived.groups[0] is sample_metamodel.groups[0]
+        hashes = [sample_metamodel.content_hash(), derived.content_hash()]
+        assert derived.get_attribute_by_name("Title") is sample_metamodel.get_attribute_by_name("Title")
+
+        sample_metamodel.groups[0].attributes[0].name = "Name"
+
+        assert derived.get_attribute_by_name("Name") is sample_metamodel.get_attribute_by_name("Name")
+        assert sample_metamodel.content_hash() != hashes[0] and derived.content_hash() != hashes[1]
+
+    def test_copies_track_their_own_modifications(self, sample_metamodel):
+        """Test that copied and unpickled metamodels invalidate their own caches."""
+        sample_metamodel.content_hash()
+        for copied in (deepcopy(sample_metamodel), pickle.loads(pickle.dumps(sample_metamodel))):
+            original = copied.content_hash()
+            copied.get_attribute_by_name("Title")
+
+            copied.groups[0].attributes[0].description = "Changed"
+
+            assert copied.content_hash() != original
+            assert copied.get_attribute_by_name("Title").description == "Changed"
+            assert sample_metamodel.content_hash() == original
+
+class TestContentHash:
+    """Tests for Merkle-style content hashes."""
+
+    def test_equal_content_has_equal_hash(self, sample_metamodel):
+        """Test that hashes depend only on content."""
+        copied = deepcopy(sample_metamodel)
+
+        assert copied.content_hash() == sample_metamodel.content_hash()
+        assert copied.freeze().content_hash() == sample_metamodel.content_hash()
+        assert copied.groups[0].content_hash() == sample_metamodel.groups[0].content_hash()
+        assert copied.groups[0].content_hash() != copied.groups[1].content_hash()
+
+    def test_hash_follows_modification(self, sample_metamodel):
+        """Test that modifying a nested attribute changes every enclosing hash."""
+        metamodel_hash = sample_metamodel.content_hash()
+        group_hashes = [g.content_hash() for g in sample_metamodel.groups]
+
+        sample_metamodel.groups[1].attributes[0].required = False
+
+        assert sample_metamodel.content_hash() != metamodel_hash
+        assert sample_metamodel.groups[0].content_hash() == group_hashes[0]
+        assert sample_metamodel.groups[1].content_hash() != group_hashes[1]
+
+        sample_metamodel.groups[1].attributes[0].required = True
+        assert sample_metamodel.content_hash() == metamodel_hash
+
+    def test_hash_covers_header_and_order(self, sample_metamodel):
+        """Test that version and group order are part of the metamodel hash."""
+        original = sample_metamodel.content_hash()
+
+        sample_metamodel.version = "2.0.0"
+        assert sample_metamodel.content_hash() != original
+
+        sample_metamodel.version = "1.0.0"
+        sample_metamodel.groups.reverse()
+        assert sample_metamodel.content_hash() != original
@@ -0,0 +1,74 @@
+"""
+Test suite for encoding metadata records as Protocol Buffer messages.
+"""
+import pytest
+
+from metamodel_core.schema.protobuf_codec import ProtobufCodec
+
+
+@pytest.fixture
+def codec(sample_metamodel):
+    sample_metamodel.groups[0].attributes[1].enum = ["Active", "On Hold"]
+    return ProtobufCodec(sample_metamodel, package="sample")
+
+
+class TestProtobufCodec:
+    """Tests for the ProtobufCodec class."""
+    
+    def test_round_trip(self, codec):
+        """Test that records survive encoding, including enums, timestamps and objects."""
+        record = {
+            "General": {"Title": "Orders", "Status": "On Hold", "Active": True, "Tags": ["a", "b"]},
+            "Metrics": {
+                "User Count": 42,
+                "Score": 0.5,
+                "Last Refreshed": "2025-05-01T12:00:00+02:00",
+                "Details": {"owner": "ops", "sla": [1, 2]},
+            },
+        }
+        
+        decoded = codec.decode(codec.encode(record))
+        
+        assert decoded["General"] == record["General"]
+        assert decoded["Metrics"]["Last Refreshed"] == "2025-05-01T10:00:00Z"
+        assert decoded["Metrics"]["Details"] == {"owner": "ops", "sla": [1, 2]}
+        assert decoded["Metrics"]["User Count"] == 42
+    
+    def test_message_fields(self, codec):
+        """Test the generated message classes and how values are stored in them."""
+        message = codec.to_message({
+            "General": {"Status": "Active"},
+            "Metrics": {"Last Refreshed": "2025-05-01T12:00:00Z"},
+        })
+        
+        assert message.DESCRIPTOR.full_name == "sample.Metadata"
+        assert message.general.status == 1
+        assert message.metrics.last_refreshed.DESCRIPTOR.full_name == "google.protobuf.Timestamp"
+        assert message.metrics.last_refreshed.seconds == 1746100800
+    
+    def test_default_values_are_kept_apart_from_missing_ones(self, codec):
+        """Test that explicit false, zero and empty values are decoded."""
+        record = {"General": {"Title": "", "Active": False}, "Metrics": {"User Count": 0}}
+        
+        assert codec.decode(codec.encode(record)) == record
+        assert codec.decode(codec.encode({"General": {}})) == {"General": {}}
+        assert codec.decode(b"") == {}
+    
+    @pytest.mark.parametrize("record,error,message", [
+        ({"Nope": {}}, ValueError, "Unknown group 'Nope'"),
+        ({"General": {"Nope": 1}}, ValueError, "Unknown attribute 'Nope' in group 'General'"),
+        ({"General": {"Status": "Closed"}}, ValueError, "Invalid value 'Closed' for attribute 'Status'"),
+        ({"Metrics": {"User Count": "many"}}, TypeError, None),
+    ])
+    def test_invalid_records(self, codec, record, error, message):
+        """Test that records that do not fit the metamodel are rejected."""
+        with pytest.raises(error, match=message):
+            codec.encode(record)
+    
+    def test_unknown_enum_number(self, codec):
+        """Test that an enum number the metamodel does not define is reported when decoding."""
+        message = codec.message_class()
+        message.general.status = 7
+        
+        with pytest.raises(ValueError, match="Unknown enum number 7 for attribute 'Status' in group 'General'"):
+            codec.decode(message.SerializeToString())
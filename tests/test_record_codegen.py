@@ -0,0 +1,127 @@
+"""
+Test suite for record validators generated as Python code.
+"""
+import pickle
+from datetime import datetime
+
+import pytest
+
+from metamodel_core.models import record_codegen
+from metamodel_core.models.record_codegen import CompiledRecordValidator, generate_validator_source
+from metamodel_core.models.records import RecordValidator
+
+
+@pytest.fixture
+def metamodel(sample_metamodel):
+    sample_metamodel.groups[0].attributes[1].enum = ["Active", "On Hold"]
+    return sample_metamodel
+
+
+def _valid_record():
+    return {
+        "General": {"Title": "Orders", "Status": "Active", "Active": True, "Tags": ["a"]},
+        "Metrics": {"User Count": 3, "Score": 0.5, "Last Refreshed": "2025-05-01T12:00:00Z", "Details": {}},
+    }
+
+
+# Replacement values for attributes, valid and invalid ones
+VALUES = {
+    ("General", "Title"): ["x", "", None, 1, b"x"],
+    ("General", "Status"): ["On Hold", "Closed", None, 1],
+    ("General", "Active"): [False, None, 0, "true"],
+    ("General", "Tags"): [[], None, ("a",), "a"],
+    ("Metrics", "User Count"): [0, -1, True, 1.0, "1", None],
+    ("Metrics", "Score"): [1, 1.5, None, True, "1.5"],
+    ("Metrics", "Last Refreshed"): ["2025-05-01", datetime(2025, 5, 1), "2025-13-01", 20250501, None],
+    ("Metrics", "Details"): [{"a": 1}, None, [], "{}"],
+    ("General", "Unknown"): [1, None],
+}
+
+
+def _records():
+    yield _valid_record()
+    for (group, attr), values in VALUES.items():
+        for value in values:
+            record = _valid_record()
+            record[group][attr] = value
+            yield record
+    yield {"General": _valid_record()["General"]}
+    yield {"General": _valid_record()["General"], "Metrics": None}
+    yield {"General": _valid_record()["General"], "Metrics": []}
+    yield {**_valid_record(), "Unknown": {}}
+    yield {}
+    yield []
+    yield "record"
+
+
+class TestCompiledRecordValidator:
+    """Tests for the CompiledRecordValidator class."""
+
+    @pytest.mark.parametrize("allow_unknown", [False, True])
+    def test_same_results_as_record_validator(self, metamodel, allow_unknown):
+        """Test that every record gets exactly RecordValidator's result."""
+        expected = RecordValidator(metamodel, allow_unknown)
+        compiled = CompiledRecordValidator(metamodel, allow_unknown)
+
+        for record in _records():
+            assert compiled.validate(record) == expected.validate(record), record
+
+    def test_enum_on_array_and_object(self, metamodel):
+        """Test that array and object attributes with an enum get RecordValidator's result."""
+        metamodel.groups[0].attributes[3].enum = ["a", "b"]
+        metamodel.groups[1].attributes[3].enum = ["a", "b"]
+        expected = RecordValidator(metamodel)
+        compiled = CompiledRecordValidator(metamodel)
+
+        for record in _records():
+            assert compiled.validate(record) == expected.validate(record), record
+
+    def test_validate_many(self, metamodel):
+        """Test that only invalid records are yielded, with their errors."""
+        records = list(_records())
+        expected = list(RecordValidator(metamodel).validate_many(records))
+
+        assert list(CompiledRecordValidator(metamodel).validate_many(records)) == expected
+        assert 0 < len(expected) < len(records)
+
+    def test_generated_source(self, metamodel):
+        """Test that the source has a straight-line function per group with enum sets."""
+        source = generate_validator_source(metamodel)
+
+        assert "def _group_0(values):" in source
+        assert "def _group_1(values):" in source
+        assert "_ENUM_0_1 = frozenset(('Active', 'On Hold'))" in source
+        assert "for " not in source
+
+    def test_bytecode_is_cached_on_disk(self, metamodel, tmp_path, mocker):
+        """Test that a later process loads the compiled validator instead of generating it."""
+        cache_dir = str(tmp_path / "validators")
+        CompiledRecordValidator(metamodel, cache_dir=cache_dir)
+        mocker.patch.dict(record_codegen._code_cache, clear=True)
+        generate = mocker.spy(record_codegen, "generate_validator_source")
+
+        validator = CompiledRecordValidator(metamodel, cache_dir=cache_dir)
+
+        assert generate.call_count == 0
+        assert validator.is_valid(_valid_record())
+        assert not validator.is_valid({})
+
+    def test_corrupt_cache_file_is_regenerated(self, metamodel, tmp_path, mocker):
+        """Test that an unreadable cache file is replaced."""
+        cache_dir = tmp_path / "validators"
+        CompiledRecordValidator(metamodel, cache_dir=str(cache_dir))
+        (path,) = cache_dir.iterdir()
+        path.write_bytes(b"\x00garbage")
+        mocker.patch.dict(record_codegen._code_cache, clear=True)
+
+        validator = CompiledRecordValidator(metamodel, cache_dir=str(cache_dir))
+
+        assert validator.is_valid(_valid_record())
+        assert path.read_bytes() != b"\x00garbage"
+
+    def test_pickle(self, metamodel):
+        """Test that validators can be sent to worker processes."""
+        validator = pickle.loads(pickle.dumps(CompiledRecordValidator(metamodel, allow_unknown=True)))
+
+        assert validator.allow_unknown
+        assert validator.validate({**_valid_record(), "Unknown": {}}) == (True, [])
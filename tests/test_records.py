@@ -0,0 +1,160 @@
+"""
+Test suite for record validation against a compiled metamodel.
+"""
+import pytest
+
+from metamodel_core.models.records import RecordErrorCode, RecordValidator
+
+
+def _valid_record():
+    return {
+        "General": {"Title": "Claims", "Status": "Draft", "Active": True, "Tags": ["a"]},
+        "Metrics": {
+            "User Count": 3,
+            "Score": 4.5,
+            "Last Refreshed": "2025-05-01T12:00:00Z",
+            "Details": {"k": "v"},
+        },
+    }
+
+
+class TestRecordValidator:
+    """Tests for the RecordValidator class."""
+
+    def test_valid_record(self, sample_metamodel):
+        """Test that a conforming record has no errors."""
+        validator = RecordValidator(sample_metamodel)
+
+        is_valid, errors = validator.validate(_valid_record())
+
+        assert is_valid, f"Record should be valid, but got errors: {errors}"
+        assert errors == []
+
+    def test_missing_required(self, sample_metamodel):
+        """Test that missing and null required attributes are reported."""
+        validator = RecordValidator(sample_metamodel)
+        record = _valid_record()
+        del record["General"]["Title"]
+        record["Metrics"]["User Count"] = None
+
+        is_valid, errors = validator.validate(record)
+
+        assert not is_valid
+        assert {(e.path, e.code) for e in errors} == {
+            ("General/Title", RecordErrorCode.MISSING_REQUIRED),
+            ("Metrics/User Count", RecordErrorCode.MISSING_REQUIRED),
+        }
+
+    def test_missing_group_reports_required_attributes(self, sample_metamodel):
+        """Test that an absent group reports each of its required attributes."""
+        validator = RecordValidator(sample_metamodel)
+        record = _valid_record()
+        del record["General"]
+
+        _, errors = validator.validate(record)
+
+        assert sorted(e.path for e in errors) == ["General/Status", "General/Title"]
+
+    @pytest.mark.parametrize("group,attr,value", [
+        ("General", "Title", 1),
+        ("General", "Active", "yes"),
+        ("General", "Tags", "a"),
+        ("Metrics", "User Count", True),
+        ("Metrics", "User Count", 1.5),
+        ("Metrics", "Score", "high"),
+        ("Metrics", "Last Refreshed", "yesterday"),
+        ("Metrics", "Details", []),
+    ])
+    def test_invalid_type(self, sample_metamodel, group, attr, value):
+        """Test that values of the wrong type are reported."""
+        validator = RecordValidator(sample_metamodel)
+        record = _valid_record()
+        record[group][attr] = value
+
+        is_valid, errors = validator.validate(record)
+
+        assert not is_valid
+        assert [(e.path, e.code) for e in errors] == [
+            (f"{group}/{attr}", RecordErrorCode.INVALID_TYPE)
+        ]
+
+    def test_invalid_enum(self, sample_metamodel):
+        """Test that values outside an attribute's enum are reported."""
+        sample_metamodel.groups[0].attributes[1].enum = ["Draft", "Published"]
+        validator = RecordValidator(sample_metamodel)
+        record = _valid_record()
+        record["General"]["Status"] = "Retired"
+
+        is_valid, errors = validator.validate(record)
+
+        assert not is_valid
+        assert errors[0].code == RecordErrorCode.INVALID_ENUM
+        assert errors[0].path == "General/Status"
+
+    @pytest.mark.parametrize("group,attr,value", [
+        ("General", "Tags", ["a"]),
+        ("Metrics", "Details", {"k": "v"}),
+    ])
+    def test_enum_on_array_and_object(self, sample_metamodel, group, attr, value):
+        """Test that array and object values of an attribute with an enum are reported, not raised."""
+        for attribute in sample_metamodel.get_group_by_name(group).attributes:
+            if attribute.name == attr:
+                attribute.enum = ["a", "b"]
+        validator = RecordValidator(sample_metamodel)
+        record = _valid_record()
+        record[group][attr] = value
+
+        is_valid, errors = validator.validate(record)
+
+        assert not is_valid
+        assert [(e.path, e.code) for e in errors] == [(f"{group}/{attr}", RecordErrorCode.INVALID_ENUM)]
+
+    def test_unknown_groups_and_attributes(self, sample_metamodel):
+        """Test that undefined groups and attributes are reported unless allowed."""
+        record = _valid_record()
+        record["General"]["Colour"] = "blue"
+        record["Extra"] = {}
+
+        _, errors = RecordValidator(sample_metamodel).validate(record)
+        assert {(e.path, e.code) for e in errors} == {
+            ("General/Colour", RecordErrorCode.UNKNOWN_ATTRIBUTE),
+            ("Extra", RecordErrorCode.UNKNOWN_GROUP),
+        }
+
+        is_valid, _ = RecordValidator(sample_metamodel, allow_unknown=True).validate(record)
+        assert is_valid
+
+    def test_non_object_record(self, sample_metamodel):
+        """Test that records and groups must be objects."""
+        validator = RecordValidator(sample_metamodel)
+
+        is_valid, errors = validator.validate(["not", "a", "record"])
+        assert not is_valid
+        assert errors[0].code == RecordErrorCode.NOT_AN_OBJECT
+
+        record = _valid_record()
+        record["Metrics"] = "none"
+        _, errors = validator.validate(record)
+        assert [(e.path, e.code) for e in errors] == [("Metrics", RecordErrorCode.NOT_AN_OBJECT)]
+
+    def test_validate_many_yields_invalid_records(self, sample_metamodel):
+        """Test that validate_many yields the index and errors of invalid records."""
+        validator = RecordValidator(sample_metamodel)
+        invalid = _valid_record()
+        invalid["General"]["Title"] = None
+
+        results = list(validator.validate_many([_valid_record(), invalid, _valid_record()]))
+
+        assert len(results) == 1
+        assert results[0][0] == 1
+        assert results[0][1][0].code == RecordErrorCode.MISSING_REQUIRED
+
+    def test_core_metamodel_compiles(self, core_metamodel):
+        """Test that every attribute of the core metamodel is compiled."""
+        validator = RecordValidator(core_metamodel)
+
+        is_valid, errors = validator.validate({})
+
+        required = core_metamodel.get_required_attributes()
+        assert not is_valid
+        assert len(errors) == len(required)
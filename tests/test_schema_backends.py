@@ -0,0 +1,192 @@
+"""
+Test suite for the intermediate representation and the JSON Schema, Avro and Arrow backends.
+"""
+import io
+import json
+import os
+from copy import deepcopy
+
+import jsonschema
+import pytest
+
+from metamodel_core.models.metamodel import AttributeType
+from metamodel_core.models.records import RecordValidator
+from metamodel_core.schema import generator as schema_generator
+from metamodel_core.schema.avro import AvroBackend
+from metamodel_core.schema.generator import SchemaGenerator
+from metamodel_core.schema.ir import compile_metamodel
+from metamodel_core.schema.json_schema import JsonSchemaBackend
+
+
+@pytest.fixture
+def sample_ir(sample_metamodel):
+    sample_metamodel.groups[0].attributes[1].enum = ["Active", "On Hold"]
+    return compile_metamodel(sample_metamodel)
+
+
+class TestCompileMetamodel:
+    """Tests for compiling metamodels into the intermediate representation."""
+
+    def test_names_types_and_enums(self, sample_ir):
+        """Test that names, types and enums are normalized."""
+        general, metrics = sample_ir.groups
+
+        assert (general.name, general.field_name, general.type_name) == ("General", "general", "GeneralGroup")
+        status = general.fields[1]
+        assert status.enum == ("Active", "On Hold")
+        assert status.enum_symbols == ("ACTIVE", "ON_HOLD")
+        assert status.enum_type_name == "StatusEnum"
+        assert metrics.fields[2].field_name == "last_refreshed"
+        assert metrics.fields[2].type is AttributeType.DATETIME
+        assert general.required and metrics.required
+
+    def test_compiled_once_per_content(self, sample_metamodel, sample_ir):
+        """Test that equal metamodels and shared groups reuse their compiled form."""
+        copy = deepcopy(sample_metamodel)
+        assert compile_metamodel(copy) is sample_ir
+
+        copy.version = "2.0"
+        copy.groups[1].description = "Changed"
+        changed = compile_metamodel(copy)
+        assert changed is not sample_ir
+        assert changed.groups[0] is sample_ir.groups[0]
+        assert changed.groups[1] is not sample_ir.groups[1]
+
+
+class TestJsonSchemaBackend:
+    """Tests for the JSON Schema backend."""
+
+    @pytest.mark.parametrize("record", [
+        {"General": {"Title": "Orders", "Status": "On Hold"}, "Metrics": {"User Count": 3}},
+        {"General": {"Title": "Orders", "Status": "Active", "Active": None, "Tags": ["a"]},
+         "Metrics": {"User Count": 3, "Score": 1, "Last Refreshed": "2025-05-01T12:00:00Z", "Details": {}}},
+        {"General": {"Title": "Orders", "Status": "Closed"}, "Metrics": {"User Count": 3}},
+        {"General": {"Title": "Orders", "Status": "Active"}, "Metrics": {"User Count": "3"}},
+        {"General": {"Title": None, "Status": "Active"}, "Metrics": {"User Count": 3}},
+        {"General": {"Title": "Orders", "Status": "Active"}},
+        {"General": {"Title": "Orders", "Status": "Active", "Nope": 1}, "Metrics": {"User Count": 3}},
+        {"General": {"Title": "Orders", "Status": "Active"}, "Metrics": {"User Count": 3}, "Nope": {}},
+        {"General": {"Title": "Orders", "Status": "Active", "Active": 1}, "Metrics": {"User Count": 3}},
+    ])
+    def test_agrees_with_record_validator(self, sample_metamodel, sample_ir, record):
+        """Test that the schema accepts exactly the records RecordValidator accepts."""
+        schema = JsonSchemaBackend().schema(sample_ir)
+        jsonschema.Draft202012Validator.check_schema(schema)
+
+        is_valid, _ = RecordValidator(sample_metamodel).validate(record)
+        assert jsonschema.Draft202012Validator(schema).is_valid(record) == is_valid
+
+    def test_allow_unknown(self, sample_ir):
+        """Test that unknown groups and attributes can be allowed."""
+        schema = JsonSchemaBackend(allow_unknown=True).schema(sample_ir)
+        record = {"General": {"Title": "Orders", "Status": "Active", "Nope": 1}, "Metrics": {"User Count": 3},
+                  "Nope": {}}
+
+        assert jsonschema.Draft202012Validator(schema).is_valid(record)
+
+
+class TestAvroBackend:
+    """Tests for the Avro backend."""
+
+    def test_schema(self, sample_ir):
+        """Test the records, unions and enums of the Avro schema."""
+        schema = json.loads(AvroBackend().render(sample_ir, "sample"))
+
+        assert (schema["name"], schema["namespace"]) == ("Metadata", "sample")
+        general = schema["fields"][0]
+        assert general["type"]["name"] == "GeneralGroup"
+        title, status, active = general["type"]["fields"][:3]
+        assert title == {"name": "title", "doc": "Title of the data product", "type": "string"}
+        assert status["type"] == {
+            "type": "enum", "name": "GeneralGroupStatusEnum", "symbols": ["ACTIVE", "ON_HOLD"]
+        }
+        assert active == {
+            "name": "active", "doc": "Whether the data product is active", "type": ["null", "boolean"], "default": None
+        }
+        refreshed = schema["fields"][1]["type"]["fields"][2]
+        assert refreshed["type"] == ["null", {"type": "long", "logicalType": "timestamp-micros"}]
+
+    def test_parses_with_fastavro(self, sample_ir):
+        """Test that fastavro accepts the schema and round-trips a record."""
+        fastavro = pytest.importorskip("fastavro")
+
+        schema = fastavro.parse_schema(json.loads(AvroBackend().render(sample_ir, "sample")))
+        record = {
+            "general": {"title": "Orders", "status": "ON_HOLD", "active": None, "tags": ["a"]},
+            "metrics": {"user_count": 3, "score": None, "last_refreshed": None, "details": None},
+        }
+        buffer = io.BytesIO()
+        fastavro.schemaless_writer(buffer, schema, record)
+        buffer.seek(0)
+
+        assert fastavro.schemaless_reader(buffer, schema) == record
+
+
+class TestArrowBackend:
+    """Tests for the Arrow backend."""
+
+    def test_schema(self, sample_ir):
+        """Test the struct columns, nullability and enum encoding of the Arrow schema."""
+        pyarrow = pytest.importorskip("pyarrow")
+        from metamodel_core.schema.arrow import ArrowBackend
+
+        data = ArrowBackend().render(sample_ir, "sample")
+        schema = pyarrow.ipc.read_schema(pyarrow.py_buffer(data))
+
+        assert schema.names == ["general", "metrics"]
+        assert schema.metadata[b"version"] == b"1.0.0"
+        general = schema.field("general").type
+        assert not general.field("title").nullable
+        assert general.field("active").nullable
+        assert general.field("status").type == pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+        assert general.field("tags").type == pyarrow.list_(pyarrow.string())
+        assert schema.field("metrics").type.field("last_refreshed").type == pyarrow.timestamp("us", tz="UTC")
+
+
+class TestSchemaGenerator:
+    """Tests for generating several formats at once."""
+
+    def test_generate(self, sample_metamodel, output_dir):
+        """Test that each backend writes its file."""
+        generator = SchemaGenerator([JsonSchemaBackend(), AvroBackend()], output_dir)
+
+        paths = generator.generate(sample_metamodel, "sample")
+
+        assert paths == {
+            "json_schema": os.path.join(output_dir, "sample.schema.json"),
+            "avro": os.path.join(output_dir, "sample.avsc"),
+        }
+        with open(paths["avro"]) as f:
+            assert json.load(f)["name"] == "Metadata"
+
+    def test_shared_groups_are_rendered_once(self, sample_metamodel, output_dir, mocker):
+        """Test that metamodels sharing groups render each group once per backend."""
+        backend = JsonSchemaBackend()
+        render_group = mocker.spy(backend, "_render_group")
+        generator = SchemaGenerator([backend], output_dir)
+        other = deepcopy(sample_metamodel)
+        other.name = "Other"
+        other.groups[1].description = "Changed"
+
+        generator.generate_all({"sample": sample_metamodel, "other": other})
+
+        assert [call.args[0].name for call in render_group.call_args_list] == ["General", "Metrics", "Metrics"]
+
+    def test_cached_schemas_are_not_compiled(self, sample_metamodel, output_dir, mocker):
+        """Test that a metamodel is not compiled again when all its schemas are cached."""
+        generator = SchemaGenerator([JsonSchemaBackend(), AvroBackend()], output_dir)
+        generator.generate(sample_metamodel, "sample")
+        compile_spy = mocker.patch.object(schema_generator, "compile_metamodel")
+
+        generator.generate(sample_metamodel, "sample")
+
+        compile_spy.assert_not_called()
+
+    def test_spliced_output_matches_json_dumps(self, core_metamodel):
+        """Test that rendering from cached group fragments gives the plain json.dumps output."""
+        ir = compile_metamodel(core_metamodel)
+        avro = AvroBackend()
+        json_schema = JsonSchemaBackend()
+
+        assert avro.render(ir, "core") == (json.dumps(avro.schema(ir, "core"), indent=2) + "\n").encode("utf-8")
+        assert json_schema.render(ir, "core") == (json.dumps(json_schema.schema(ir), indent=2) + "\n").encode("utf-8")
@@ -3,9 +3,13 @@ Test suite for the Protocol Buffer schema generator.
 """
 import os
 import re
+import shutil
 import pytest
+from google.protobuf import descriptor_pb2, descriptor_pool
 
 from metamodel_core.models import get_core_metamodel
+from metamodel_core.schema.cache import GenerationCache
+from metamodel_core.schema import protobuf_generator
 from metamodel_core.schema.protobuf_generator import ProtobufGenerator
 
 
@@ -175,4 +179,234 @@ class TestProtobufGenerator:
         assert "STATUS_ENUM_PENDING = 3;" in content
         
         # Check that the field uses the enum type
-        assert "  StatusEnum status = 1;" in content
\ No newline at end of file
+        assert "  StatusEnum status = 1;" in content
+
+class TestGenerationCache:
+    """Tests for cached schema and descriptor set generation."""
+    
+    def test_unchanged_metamodel_is_not_rendered_or_rewritten(self, sample_metamodel, output_dir, mocker):
+        """Test that regenerating an unchanged metamodel reuses the cached schema and file."""
+        generator = ProtobufGenerator(output_dir)
+        render = mocker.spy(generator, "render_schema")
+        
+        output_path = generator.generate_schema(sample_metamodel, "cached")
+        os.utime(output_path, ns=(0, 0))
+        assert generator.generate_schema(sample_metamodel, "cached") == output_path
+        
+        assert render.call_count == 1
+        assert os.stat(output_path).st_mtime_ns == 0
+        
+        # A different filename or a modified metamodel is rendered again
+        generator.generate_schema(sample_metamodel, "other")
+        sample_metamodel.groups[0].description = "Changed"
+        generator.generate_schema(sample_metamodel, "cached")
+        assert render.call_count == 3
+        with open(output_path) as f:
+            assert "// Changed" in f.read()
+    
+    def test_disk_cache_is_shared(self, sample_metamodel, output_dir, tmp_path, mocker):
+        """Test that a cache directory is reused by later generators."""
+        cache_dir = str(tmp_path / "cache")
+        first = ProtobufGenerator(output_dir, cache=GenerationCache(cache_dir))
+        output_path = first.generate_schema(sample_metamodel, "shared")
+        with open(output_path) as f:
+            expected = f.read()
+        os.remove(output_path)
+        
+        second = ProtobufGenerator(output_dir, cache=GenerationCache(cache_dir))
+        render = mocker.spy(second, "render_schema")
+        second.generate_schema(sample_metamodel, "shared")
+        
+        assert render.call_count == 0
+        with open(output_path) as f:
+            assert f.read() == expected
+    
+    def test_generated_files_follow_umask(self, sample_metamodel, output_dir):
+        """Test that atomically written files get the permissions the umask allows."""
+        previous = os.umask(0o027)
+        try:
+            output_path = ProtobufGenerator(output_dir).generate_schema(sample_metamodel, "umask")
+        finally:
+            os.umask(previous)
+        
+        assert os.stat(output_path).st_mode & 0o777 == 0o640
+    
+    def test_descriptor_set_is_reused(self, sample_metamodel, output_dir, mocker):
+        """Test that protoc only runs when the schema changed."""
+        generator = ProtobufGenerator(output_dir)
+        proto_file = generator.generate_schema(sample_metamodel, "descriptor")
+        run = mocker.patch("subprocess.run", side_effect=self._fake_protoc)
+        
+        descriptor_file = generator.generate_descriptor_set(proto_file)
+        os.remove(descriptor_file)
+        assert generator.generate_descriptor_set(proto_file) == descriptor_file
+        
+        assert run.call_count == 1
+        with open(descriptor_file, "rb") as f:
+            assert f.read() == b"descriptor"
+
+    def test_descriptor_set_tracks_imports(self, output_dir, mocker):
+        """Test that protoc runs again when only an imported file changed."""
+        os.makedirs(output_dir, exist_ok=True)
+        proto_file = os.path.join(output_dir, "main.proto")
+        imported_file = os.path.join(output_dir, "imported.proto")
+        with open(proto_file, "w") as f:
+            f.write('syntax = "proto3";\n\nimport "imported.proto";\n')
+        with open(imported_file, "w") as f:
+            f.write('syntax = "proto3";\n\nmessage Imported { string value = 1; }\n')
+        generator = ProtobufGenerator(output_dir)
+        run = mocker.patch("subprocess.run", side_effect=self._fake_protoc)
+
+        generator.generate_descriptor_set(proto_file)
+        generator.generate_descriptor_set(proto_file)
+        with open(imported_file, "w") as f:
+            f.write('syntax = "proto3";\n\nmessage Imported { int32 value = 1; }\n')
+        generator.generate_descriptor_set(proto_file)
+
+        assert run.call_count == 2
+    
+    @staticmethod
+    def _fake_protoc(cmd, **kwargs):
+        output_file = next(arg for arg in cmd if arg.startswith("--descriptor_set_out=")).split("=", 1)[1]
+        with open(output_file, "wb") as f:
+            f.write(b"descriptor")
+
+
+class TestDescriptorSetBuilder:
+    """Tests for building descriptor sets without protoc."""
+    
+    def test_descriptor_set_is_loadable(self, sample_metamodel, output_dir):
+        """Test that the built descriptors load into a pool with the expected fields and enums."""
+        sample_metamodel.groups[0].attributes[1].enum = ["Active", "On Hold"]
+        generator = ProtobufGenerator(output_dir)
+        
+        output_file = generator.generate_metamodel_descriptor_set(sample_metamodel, "sample")
+        with open(output_file, "rb") as f:
+            descriptor_set = descriptor_pb2.FileDescriptorSet.FromString(f.read())
+        
+        assert output_file == os.path.join(output_dir, "sample.pb")
+        assert [f.name for f in descriptor_set.file] == ["google/protobuf/timestamp.proto", "sample.proto"]
+        pool = descriptor_pool.DescriptorPool()
+        for file_proto in descriptor_set.file:
+            pool.Add(file_proto)
+        general = pool.FindMessageTypeByName("sample.GeneralGroup")
+        assert [f.name for f in general.fields] == ["title", "status", "active", "tags"]
+        tags = descriptor_set.file[1].message_type[1].field[3]
+        assert (tags.name, tags.label) == ("tags", descriptor_pb2.FieldDescriptorProto.LABEL_REPEATED)
+        assert [v.name for v in general.fields_by_name["status"].enum_type.values] == [
+            "STATUS_ENUM_UNSPECIFIED", "STATUS_ENUM_ACTIVE", "STATUS_ENUM_ON_HOLD"
+        ]
+        metrics = pool.FindMessageTypeByName("sample.MetricsGroup")
+        assert metrics.fields_by_name["last_refreshed"].message_type.full_name == "google.protobuf.Timestamp"
+    
+    @pytest.mark.skipif(shutil.which("protoc") is None, reason="protoc is not installed")
+    def test_matches_protoc(self, core_metamodel, tmp_path):
+        """Test that the built descriptor set is byte-identical to protoc's."""
+        generator = ProtobufGenerator(str(tmp_path))
+        proto_file = generator.generate_schema(core_metamodel, "core")
+        protoc_file = generator.generate_descriptor_set(proto_file, str(tmp_path / "protoc.pb"))
+        
+        built_file = generator.generate_metamodel_descriptor_set(core_metamodel, "core")
+        
+        with open(built_file, "rb") as built, open(protoc_file, "rb") as expected:
+            assert built.read() == expected.read()
+
+
+class TestGroupSchemas:
+    """Tests for generating one schema file per group."""
+    
+    def test_files_per_group(self, sample_metamodel, output_dir):
+        """Test that each group gets a file imported by the aggregating file."""
+        generator = ProtobufGenerator(output_dir)
+        paths = generator.generate_group_schemas(sample_metamodel, "split")
+        
+        assert [os.path.basename(p) for p in paths] == ["split.proto", "split_general.proto", "split_metrics.proto"]
+        with open(paths[0]) as f:
+            content = f.read()
+        assert 'import "split_general.proto";\nimport "split_metrics.proto";\n' in content
+        assert "  MetricsGroup metrics = 2;" in content
+        assert "message GeneralGroup" not in content
+        with open(paths[2]) as f:
+            content = f.read()
+        assert 'package split;\n\nimport "google/protobuf/timestamp.proto";\n' in content
+        assert "message MetricsGroup {" in content
+    
+    def test_only_changed_groups_are_rendered(self, sample_metamodel, output_dir, mocker):
+        """Test that regenerating renders and rewrites only the groups that changed."""
+        generator = ProtobufGenerator(output_dir)
+        render = mocker.spy(generator, "render_group_schema")
+        paths = generator.generate_group_schemas(sample_metamodel, "split", workers=1)
+        for path in paths:
+            os.utime(path, ns=(0, 0))
+        
+        sample_metamodel.groups[1].attributes[0].description = "Number of active users"
+        generator.generate_group_schemas(sample_metamodel, "split", workers=1)
+        
+        assert render.call_count == 3
+        assert render.call_args.args[0].name == "Metrics"
+        assert [os.stat(path).st_mtime_ns == 0 for path in paths] == [True, True, False]
+    
+    def test_removed_group_file_is_deleted(self, sample_metamodel, output_dir):
+        """Test that files of groups removed from the metamodel are deleted."""
+        generator = ProtobufGenerator(output_dir)
+        paths = generator.generate_group_schemas(sample_metamodel, "split")
+        
+        del sample_metamodel.groups[0]
+        assert generator.generate_group_schemas(sample_metamodel, "split") == [paths[0], paths[2]]
+        
+        assert not os.path.exists(paths[1])
+        assert os.path.exists(paths[2])
+    
+    def test_parallel_rendering(self, core_metamodel, tmp_path, monkeypatch):
+        """Test that groups rendered by worker processes match those rendered in-process."""
+        serial = ProtobufGenerator(str(tmp_path / "serial")).generate_group_schemas(core_metamodel, "core", workers=1)
+        monkeypatch.setattr(protobuf_generator, "PARALLEL_MIN_GROUPS", 2)
+        parallel = ProtobufGenerator(str(tmp_path / "parallel")).generate_group_schemas(
+            core_metamodel, "core", workers=2
+        )
+        
+        for serial_path, parallel_path in zip(serial, parallel):
+            with open(serial_path) as expected, open(parallel_path) as f:
+                assert f.read() == expected.read()
+    
+    @pytest.mark.skipif(shutil.which("protoc") is None, reason="protoc is not installed")
+    def test_same_messages_as_single_file(self, core_metamodel, tmp_path):
+        """Test that protoc compiles the group files to the same messages as the single file."""
+        generator = ProtobufGenerator(str(tmp_path))
+        single = generator.generate_descriptor_set(
+            generator.generate_schema(core_metamodel, "core"), str(tmp_path / "single.pb")
+        )
+        split_dir = tmp_path / "split"
+        split_generator = ProtobufGenerator(str(split_dir))
+        split = split_generator.generate_descriptor_set(
+            split_generator.generate_group_schemas(core_metamodel, "core")[0], str(tmp_path / "split.pb")
+        )
+        
+        def messages(path):
+            with open(path, "rb") as f:
+                descriptor_set = descriptor_pb2.FileDescriptorSet.FromString(f.read())
+            return {
+                message.name: message
+                for file_proto in descriptor_set.file if file_proto.package == "core"
+                for message in file_proto.message_type
+            }
+        
+        assert messages(split) == messages(single)
+
+    @pytest.mark.skipif(shutil.which("protoc") is None, reason="protoc is not installed")
+    def test_descriptor_set_follows_group_changes(self, sample_metamodel, tmp_path):
+        """Test that a change confined to one group file reaches the descriptor set."""
+        generator = ProtobufGenerator(str(tmp_path))
+        proto_file = generator.generate_group_schemas(sample_metamodel, "split")[0]
+        generator.generate_descriptor_set(proto_file)
+
+        sample_metamodel.groups[0].attributes[0].type = "integer"
+        generator.generate_group_schemas(sample_metamodel, "split")
+        with open(generator.generate_descriptor_set(proto_file), "rb") as f:
+            descriptor_set = descriptor_pb2.FileDescriptorSet.FromString(f.read())
+
+        general = next(f for f in descriptor_set.file if f.name == "split_general.proto")
+        title = general.message_type[0].field[0]
+        assert (title.name, title.type) == (
+            "title", descriptor_pb2.FieldDescriptorProto.TYPE_INT32
+        )
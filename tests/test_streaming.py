@@ -0,0 +1,172 @@
+"""
+Test suite for streaming NDJSON record validation.
+"""
+import io
+import json
+import os
+import subprocess
+import sys
+
+from metamodel_core.models.records import RecordValidator
+from metamodel_core.models.streaming import (
+    chunk_offsets,
+    iter_ndjson,
+    validate_ndjson,
+    validate_ndjson_parallel,
+)
+
+SCRIPT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "scripts", "validate_metamodel.py"
+)
+
+
+def _record(title="Claims", user_count=3):
+    return {"General": {"Title": title, "Status": "Draft"}, "Metrics": {"User Count": user_count}}
+
+
+def _ndjson(*lines):
+    return io.StringIO("".join(line + "\n" for line in lines))
+
+
+class TestStreamingValidation:
+    """Tests for validate_ndjson and its helpers."""
+
+    def test_iter_ndjson_keeps_line_numbers(self):
+        """Test that blank lines are skipped without shifting line numbers."""
+        parsed = list(iter_ndjson(_ndjson('{"a": 1}', "", "{oops", '{"b": 2}')))
+
+        assert [(n, r) for n, r, _ in parsed] == [(1, {"a": 1}), (3, None), (4, {"b": 2})]
+        assert parsed[1][2] is not None, "Malformed line should carry a parse error"
+
+    def test_report_contains_only_invalid_records(self, sample_metamodel):
+        """Test that the report has one line per invalid or malformed record."""
+        stream = _ndjson(
+            json.dumps(_record()),
+            json.dumps(_record(title=None)),
+            "not json",
+            json.dumps(_record(user_count="many")),
+        )
+        report = io.StringIO()
+
+        stats = validate_ndjson(stream, report, RecordValidator(sample_metamodel))
+
+        lines = [json.loads(line) for line in report.getvalue().splitlines()]
+        assert [line["line"] for line in lines] == [2, 3, 4]
+        assert lines[0]["errors"][0] == {
+            "path": "General/Title",
+            "code": "missing_required",
+            "message": "Attribute 'Title' in group 'General' is required",
+        }
+        assert lines[1]["errors"][0]["code"] == "invalid_json"
+        assert lines[2]["errors"][0]["code"] == "invalid_type"
+
+        assert stats.records == 4
+        assert stats.invalid_records == 2
+        assert stats.malformed_lines == 1
+
+    def test_stats_summary(self, sample_metamodel):
+        """Test that throughput and peak memory are reported."""
+        stream = _ndjson(*(json.dumps(_record()) for _ in range(100)))
+
+        stats = validate_ndjson(stream, io.StringIO(), RecordValidator(sample_metamodel))
+
+        assert stats.records == 100
+        assert stats.invalid_records == 0
+        assert stats.seconds > 0
+        assert stats.records_per_second > 0
+        assert "Validated 100 records" in stats.summary()
+
+    def test_chunk_offsets_align_to_lines(self, tmp_path):
+        """Test that chunks cover the file and start on line boundaries."""
+        path = tmp_path / "records.ndjson"
+        path.write_bytes(b"".join(b'{"n": %d}\n' % i for i in range(100)))
+
+        offsets = chunk_offsets(str(path), chunk_bytes=50)
+
+        data = path.read_bytes()
+        assert offsets[0][0] == 0
+        assert offsets[-1][1] == len(data)
+        for (_, end), (start, _) in zip(offsets, offsets[1:]):
+            assert end == start
+            assert data[start - 1:start] == b"\n"
+
+    def test_parallel_report_matches_sequential(self, sample_metamodel, tmp_path):
+        """Test that the process pool produces the same report in input order."""
+        path = tmp_path / "records.ndjson"
+        lines = []
+        for i in range(300):
+            if i % 7 == 0:
+                lines.append(json.dumps(_record(title=None)))
+            elif i % 50 == 0:
+                lines.append("{broken")
+            elif i % 40 == 0:
+                lines.append("")
+            else:
+                lines.append(json.dumps(_record(title=f"Product {i}")))
+        path.write_text("\n".join(lines) + "\n")
+        validator = RecordValidator(sample_metamodel)
+
+        sequential = io.StringIO()
+        with open(path) as f:
+            expected = validate_ndjson(f, sequential, validator)
+        parallel = io.StringIO()
+        stats = validate_ndjson_parallel(
+            str(path), parallel, validator, workers=2, chunk_bytes=1024
+        )
+
+        assert parallel.getvalue() == sequential.getvalue()
+        assert (stats.records, stats.invalid_records, stats.malformed_lines) == \
+            (expected.records, expected.invalid_records, expected.malformed_lines)
+
+    def test_parallel_and_binary_sequential_agree_on_odd_lines(self, sample_metamodel, tmp_path):
+        """Test that both paths split and decode lines the same way."""
+        path = tmp_path / "records.ndjson"
+        valid = json.dumps(_record()).encode("utf-8")
+        path.write_bytes(b"\n".join([
+            valid,
+            valid + b"\r",  # CRLF line ending
+            valid + b"\r" + valid,  # lone CR inside a line
+            json.dumps(_record(title="A\u2028B"), ensure_ascii=False).encode("utf-8"),  # U+2028 in a string
+            b"\xe2\x80\xa8",  # U+2028 only
+            b"\x0c",  # form feed only
+            b" \t\r",  # JSON whitespace only
+            b'{"General": {"Title": "\xff"}}',  # invalid UTF-8
+            valid,
+        ]) + b"\n")
+        validator = RecordValidator(sample_metamodel)
+
+        sequential = io.StringIO()
+        with open(path, "rb") as f:
+            expected = validate_ndjson(f, sequential, validator)
+        parallel = io.StringIO()
+        stats = validate_ndjson_parallel(str(path), parallel, validator, workers=2, chunk_bytes=64)
+
+        assert parallel.getvalue() == sequential.getvalue()
+        assert (stats.records, stats.invalid_records, stats.malformed_lines) == \
+            (expected.records, expected.invalid_records, expected.malformed_lines)
+        assert [json.loads(line)["line"] for line in sequential.getvalue().splitlines()] == [3, 5, 6, 8]
+
+    def test_cli_reads_records_as_bytes(self, sample_metamodel, tmp_path):
+        """Test that the records command splits and decodes lines the same way with and without workers."""
+        metamodel_file = tmp_path / "metamodel.json"
+        metamodel_file.write_text(sample_metamodel.model_dump_json())
+        records_file = tmp_path / "records.ndjson"
+        valid = json.dumps(_record()).encode("utf-8")
+        records_file.write_bytes(b"\n".join([
+            valid,
+            valid + b"\r" + valid,  # lone CR inside a line
+            b'{"General": {"Title": "\xff"}}',  # invalid UTF-8
+            valid,
+        ]) + b"\n")
+        command = [sys.executable, SCRIPT_PATH, "records", "--metamodel", str(metamodel_file)]
+
+        def run(*args, **kwargs):
+            result = subprocess.run(command + list(args), capture_output=True, **kwargs)
+            return result.returncode, result.stdout
+
+        with open(records_file, "rb") as f:
+            from_stdin = run("-", stdin=f)
+        assert run(str(records_file)) == from_stdin
+        assert run(str(records_file), "--workers", "2") == from_stdin
+        assert from_stdin[0] == 1
+        assert [json.loads(line)["line"] for line in from_stdin[1].splitlines()] == [2, 3]
@@ -0,0 +1,145 @@
+"""
+Test suite for constructing metamodels and changes from trusted data.
+"""
+import hashlib
+import json
+import pickle
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from metamodel_core.models.history import MetamodelHistory
+from metamodel_core.models.metamodel import FrozenMetamodel, Metamodel, MetamodelChange
+from metamodel_core.models.trusted import (
+    check_metamodel_data,
+    construct_change,
+    construct_metamodel,
+    load_trusted_metamodel,
+)
+
+# The instance state construct() sets; pydantic releases that change it must fail the tests
+PYDANTIC_SLOTS = ("__dict__", "__pydantic_fields_set__", "__pydantic_extra__", "__pydantic_private__")
+
+
+def _state(instance):
+    """The pydantic instance state, with the types of the field and private values."""
+    state = [getattr(instance, slot) for slot in PYDANTIC_SLOTS if slot != "__pydantic_private__"]
+    private = instance.__pydantic_private__
+    return state + [
+        [type(value) for value in instance.__dict__.values()],
+        None if private is None else {name: type(value) for name, value in private.items()},
+    ]
+from metamodel_core.models.validators import ChangeAnalyzer
+
+
+class TestConstructMetamodel:
+    """Tests for construct_metamodel and load_trusted_metamodel."""
+
+    def test_same_as_validated(self, core_metamodel):
+        """Test that constructed metamodels behave like validated ones."""
+        data = json.loads(json.dumps(core_metamodel.model_dump()))
+
+        metamodel = construct_metamodel(data)
+
+        assert isinstance(metamodel, FrozenMetamodel)
+        assert metamodel.model_dump() == core_metamodel.model_dump()
+        assert metamodel.content_hash() == core_metamodel.content_hash()
+        assert metamodel.get_required_attributes() == core_metamodel.get_required_attributes()
+        assert pickle.loads(pickle.dumps(metamodel)).model_dump() == core_metamodel.model_dump()
+        with pytest.raises(ValidationError):
+            metamodel.groups[0].name = "changed"
+        with pytest.raises(TypeError):
+            metamodel.groups[0].attributes.append(metamodel.groups[0].attributes[0])
+
+    @pytest.mark.parametrize("frozen", [True, False])
+    def test_same_instance_state_as_validated(self, sample_metamodel, frozen):
+        """Test that construction sets exactly the state pydantic's validation sets."""
+        sample_metamodel.groups[0].attributes[1].enum = ["Active", "Retired"]
+        data = sample_metamodel.model_dump()
+        validated = (FrozenMetamodel if frozen else Metamodel).model_validate(data)
+
+        metamodel = construct_metamodel(data, frozen=frozen)
+
+        assert BaseModel.__slots__ == PYDANTIC_SLOTS
+        assert all(slot in dir(metamodel) for slot in PYDANTIC_SLOTS)
+        assert _state(metamodel) == _state(validated)
+        for group, validated_group in zip(metamodel.groups, validated.groups):
+            assert _state(group) == _state(validated_group)
+            for attr, validated_attr in zip(group.attributes, validated_group.attributes):
+                assert _state(attr) == _state(validated_attr)
+
+    def test_editable(self, sample_metamodel):
+        """Test that editable metamodels track modifications like validated ones."""
+        metamodel = construct_metamodel(sample_metamodel.model_dump(), frozen=False)
+        assert not isinstance(metamodel, FrozenMetamodel)
+        assert metamodel.get_group_by_name("General").name == "General"
+
+        metamodel.groups[0].name = "Renamed"
+        metamodel.groups[1].attributes.pop()
+
+        assert metamodel.get_group_by_name("Renamed") is metamodel.groups[0]
+        assert metamodel.get_attribute_by_path("Metrics/Details") is None
+
+    def test_malformed_data(self, sample_metamodel):
+        """Test that structural problems are reported together."""
+        data = sample_metamodel.model_dump()
+        data["version"] = "one"
+        data["groups"][0]["attributes"][1]["type"] = "text"
+        data["groups"][1]["attributes"][0]["enum"] = ["a", 1]
+
+        assert len(check_metamodel_data(data)) == 3
+        with pytest.raises(ValueError, match="version 'one'.*attribute 1 of group 'General'"):
+            construct_metamodel(data)
+
+    def test_load_checks_digest(self, sample_metamodel, tmp_path):
+        """Test that files are only loaded if their digest matches the registry's."""
+        content = json.dumps(sample_metamodel.model_dump()).encode("utf-8")
+        path = tmp_path / "metamodel.json"
+        path.write_bytes(content)
+
+        metamodel = load_trusted_metamodel(str(path), sha256=hashlib.sha256(content).hexdigest())
+        assert metamodel.model_dump() == sample_metamodel.model_dump()
+
+        with pytest.raises(ValueError, match="does not match"):
+            load_trusted_metamodel(str(path), sha256=hashlib.sha256(b"other").hexdigest())
+
+
+class TestConstructChange:
+    """Tests for construct_change and trusted history loading."""
+
+    def test_same_as_validated(self, sample_metamodel):
+        """Test that changes round-trip through their JSON form."""
+        updated = Metamodel.from_dict(sample_metamodel.model_dump())
+        updated.groups[0].attributes[0].required = False
+        del updated.groups[1].attributes[3]
+
+        changes = ChangeAnalyzer().detect_changes(sample_metamodel, updated)
+
+        assert len({change.timestamp for change in changes}) == 1
+        for change in changes:
+            data = change.model_dump(mode="json")
+            assert construct_change(data) == MetamodelChange.model_validate(data) == change
+            assert _state(construct_change(data)) == _state(MetamodelChange.model_validate(data))
+
+    def test_malformed_change(self):
+        """Test that unknown change types are rejected."""
+        with pytest.raises(ValueError, match="Malformed change"):
+            construct_change({"change_type": "explode", "target_path": "G", "description": "x",
+                              "timestamp": "2025-05-01T00:00:00"})
+
+    def test_trusted_history_load(self, sample_metamodel, tmp_path):
+        """Test that a trusted load reproduces every version of a saved history."""
+        history = MetamodelHistory(snapshot_interval=2)
+        current = Metamodel.from_dict(sample_metamodel.model_dump())
+        for minor in range(5):
+            current.version = f"1.{minor}"
+            current.groups[minor % 2].description = f"Description {minor}"
+            history.commit(current)
+        path = str(tmp_path / "history.json")
+        history.save(path)
+
+        loaded = MetamodelHistory.load(path, trusted=True)
+
+        for version in history.versions:
+            assert loaded.checkout(version).model_dump() == history.checkout(version).model_dump()
+            assert loaded.changes(version) == MetamodelHistory.load(path).changes(version)
@@ -0,0 +1,123 @@
+"""
+Test suite for the field-usage index of stored records.
+"""
+import io
+import json
+from copy import deepcopy
+
+import pytest
+
+from metamodel_core.models import usage as usage_module
+from metamodel_core.models.metamodel import MetamodelAttribute, MetamodelGroup
+from metamodel_core.models.usage import FieldUsageIndex
+from metamodel_core.models.validators import ChangeAnalyzer, MigrationPlanner
+
+
+def _record(i):
+    general = {"Title": f"Product {i}", "Status": "Live" if i % 3 else "Retired"}
+    if i % 2:
+        general["Active"] = True
+    elif i % 4 == 0:
+        general["Active"] = None
+    record = {"General": general}
+    if i % 5 == 0:
+        record["Metrics"] = {"User Count": str(i) if i % 10 == 0 else i}
+    return record
+
+
+@pytest.fixture
+def index():
+    index = FieldUsageIndex()
+    index.add_many((_record(i) for i in range(1, 21)), version="1.0.0")
+    index.add_many((_record(i) for i in range(21, 31)), version="1.1.0")
+    return index
+
+
+class TestFieldUsageIndex:
+    """Tests for the FieldUsageIndex class."""
+
+    def test_counts(self, index):
+        """Test populated, null and missing counts per version."""
+        usage = index.usage("General/Active")
+
+        assert (usage.records, usage.populated, usage.null, usage.unpopulated) == (30, 15, 7, 15)
+        assert usage.versions["1.0.0"].populated == 10 and usage.versions["1.1.0"].unpopulated == 5
+        assert index.unpopulated_by_version("General/Active") == {"1.0.0": 10, "1.1.0": 5}
+        assert index.unpopulated_by_version("General/Title") == {}
+        assert index.group_records("Metrics") == 6
+        assert index.usage("General/Status").values == {"Live": 20, "Retired": 10}
+        assert index.usage("Metrics/User Count").types == {"integer": 3, "string": 3}
+        assert index.usage("General/Unknown").unpopulated == 30
+
+    def test_remove_and_merge(self, index):
+        """Test that records are uncounted, and that merged parts equal one index."""
+        index.remove(_record(5), version="1.0.0")
+        assert index.records("1.0.0") == 19
+        assert index.group_records("Metrics") == 5
+
+        first, second = FieldUsageIndex(), FieldUsageIndex()
+        first.add_many((_record(i) for i in range(1, 21) if i != 5), version="1.0.0")
+        second.add_many((_record(i) for i in range(21, 31)), version="1.1.0")
+        first.merge(second)
+        assert first.to_dict() == index.to_dict()
+
+    def test_distinct_values_are_capped(self, mocker):
+        """Test that string values beyond the limit are not tracked."""
+        mocker.patch.object(usage_module, "MAX_DISTINCT_VALUES", 3)
+        index = FieldUsageIndex()
+        index.add_many({"General": {"Title": f"Product {i % 5}"}} for i in range(10))
+
+        usage = index.usage("General/Title")
+        assert len(usage.values) == 3 and usage.values_truncated
+        assert usage.populated == 10
+
+    def test_save_and_load(self, tmp_path, index):
+        """Test that a saved index is restored with the same counts."""
+        path = str(tmp_path / "usage.json")
+        index.save(path)
+
+        assert FieldUsageIndex.load(path).to_dict() == index.to_dict()
+
+    def test_add_ndjson(self):
+        """Test that NDJSON lines that are not objects are skipped."""
+        stream = io.StringIO(json.dumps(_record(1)) + "\n{broken\n[1]\n\n" + json.dumps(_record(2)) + "\n")
+        index = FieldUsageIndex()
+
+        assert index.add_ndjson(stream, version="1.0.0") == 2
+        assert index.records() == 2
+
+
+class TestAffectedRecords:
+    """Tests for counting the records affected by changes."""
+
+    def test_changes(self, sample_metamodel, index):
+        """Test the affected-record count of each kind of change."""
+        new = deepcopy(sample_metamodel)
+        general, metrics = new.groups
+        general.attributes[1].enum = ["Live"]
+        general.attributes[2].required = True
+        metrics.attributes[0].type = "number"
+        new.groups.append(MetamodelGroup(name="Quality", description="Quality checks", attributes=[
+            MetamodelAttribute(name="Score", description="Quality score", type="number", required=True)
+        ]))
+        changes = ChangeAnalyzer().detect_changes(sample_metamodel, new)
+
+        affected = {(change.change_type.value, change.target_path): index.affected_records(change)
+                    for change in changes}
+        assert affected == {
+            ("add_group", "Quality"): 30,
+            ("modify_attribute", "General/Status"): 10,
+            ("change_requirement", "General/Active"): 15,
+            ("modify_attribute", "Metrics/User Count"): 3,
+        }
+
+    def test_planner_annotates_steps(self, sample_metamodel, index):
+        """Test that planned steps carry the affected-record counts."""
+        new = deepcopy(sample_metamodel)
+        del new.groups[1]
+        changes = ChangeAnalyzer().detect_changes(sample_metamodel, new)
+
+        plan = MigrationPlanner(usage=index).generate_migration_plan(changes)
+
+        assert [step["affected_records"] for step in plan["high_impact"]] == [6]
+        assert "affected_records" not in MigrationPlanner().generate_migration_plan(changes)["high_impact"][0]
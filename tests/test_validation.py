@@ -7,7 +7,7 @@ import pytest
 from copy import deepcopy
 
 from metamodel_core.models import get_core_metamodel, Metamodel
-from metamodel_core.models.metamodel import MetamodelAttribute, MetamodelGroup
+from metamodel_core.models.metamodel import ChangeType, MetamodelAttribute, MetamodelChange, MetamodelGroup
 from metamodel_core.models.validators import MetamodelValidator, ChangeAnalyzer
 
 
@@ -220,4 +220,125 @@ class TestMetamodelValidator:
         assert not is_valid, "Metamodel with duplicate attribute names should be invalid"
         assert errors, "There should be validation errors"
         assert any(f"Attribute '{first_attr.name}' is duplicated" in error for error in errors), \
-            "Error should mention duplicated attribute"
\ No newline at end of file
+            "Error should mention duplicated attribute"
+
+def _change(change_type, target_path, new_value=None, old_value=None):
+    return MetamodelChange(
+        change_type=change_type,
+        target_path=target_path,
+        new_value=new_value,
+        old_value=old_value,
+        description=f"{change_type.value} {target_path}"
+    )
+
+
+class TestChangeSetValidation:
+    """Tests for validating single changes and ordered change sets."""
+    
+    def test_validate_change_single(self):
+        """Test validate_change against the core metamodel."""
+        metamodel = get_core_metamodel()
+        validator = MetamodelValidator()
+        
+        is_valid, errors = validator.validate_change(
+            metamodel, _change(ChangeType.ADD_ATTRIBUTE, "KPI/Owner", {"required": False})
+        )
+        assert not is_valid
+        assert errors == ["Attribute 'Owner' already exists in group 'Key Actors'"]
+        
+        is_valid, errors = validator.validate_change(
+            metamodel, _change(ChangeType.REMOVE_ATTRIBUTE, "Access/Access Roles")
+        )
+        assert errors == ["Cannot remove required attribute 'Access Roles' from group 'Access'"]
+        
+        is_valid, errors = validator.validate_change(
+            metamodel, _change(ChangeType.CHANGE_REQUIREMENT, "KPI/ROI", True)
+        )
+        assert is_valid, errors
+    
+    def test_add_then_remove_same_attribute(self):
+        """Test that later changes see the effect of earlier ones."""
+        metamodel = get_core_metamodel()
+        validator = MetamodelValidator()
+        changes = [
+            _change(ChangeType.ADD_ATTRIBUTE, "KPI/Churn", {"name": "Churn", "required": False}),
+            _change(ChangeType.ADD_ATTRIBUTE, "Usage/Churn", {"name": "Churn", "required": False}),
+            _change(ChangeType.REMOVE_ATTRIBUTE, "KPI/Churn"),
+            _change(ChangeType.REMOVE_ATTRIBUTE, "KPI/Churn"),
+            _change(ChangeType.ADD_ATTRIBUTE, "Usage/Churn", {"name": "Churn", "required": True}),
+            _change(ChangeType.REMOVE_ATTRIBUTE, "Usage/Churn"),
+        ]
+        
+        results = validator.validate_changes(metamodel, changes)
+        
+        assert [is_valid for is_valid, _ in results] == [True, False, True, False, True, False]
+        assert results[1][1] == ["Attribute 'Churn' already exists in group 'KPI'"]
+        assert results[3][1] == ["Attribute 'Churn' does not exist in group 'KPI'"]
+        assert results[5][1] == ["Cannot remove required attribute 'Churn' from group 'Usage'"]
+        assert metamodel.get_attribute_by_name("Churn") is None, "The metamodel must not be modified"
+    
+    def test_group_changes_and_requirements(self):
+        """Test group additions, removals and requirement changes in sequence."""
+        metamodel = get_core_metamodel()
+        validator = MetamodelValidator()
+        new_group = {
+            "name": "Lineage",
+            "description": "Lineage information",
+            "attributes": [{"name": "Upstream", "description": "Upstream", "type": "array", "required": True}],
+        }
+        changes = [
+            _change(ChangeType.ADD_GROUP, "Lineage", new_group),
+            _change(ChangeType.ADD_ATTRIBUTE, "Standards/Upstream", {"required": False}),
+            _change(ChangeType.REMOVE_GROUP, "Lineage"),
+            _change(ChangeType.CHANGE_REQUIREMENT, "Lineage/Upstream", False),
+            _change(ChangeType.REMOVE_GROUP, "Lineage"),
+            _change(ChangeType.ADD_ATTRIBUTE, "Lineage/Downstream", {"required": False}),
+            _change(ChangeType.ADD_ATTRIBUTE, "Standards/Upstream", {"required": False}),
+            _change(ChangeType.ADD_GROUP, "Lineage", new_group),
+        ]
+        
+        results = validator.validate_changes(metamodel, changes)
+        
+        assert [is_valid for is_valid, _ in results] == [True, False, False, True, True, False, True, True]
+        assert results[1][1] == ["Attribute 'Upstream' already exists in group 'Lineage'"]
+        assert results[2][1] == ["Cannot remove group 'Lineage' because it contains required attributes"]
+        assert results[5][1] == ["Group 'Lineage' does not exist"]
+    
+    def test_move_and_rename(self):
+        """Test validation of moves and renames against earlier changes."""
+        metamodel = get_core_metamodel()
+        validator = MetamodelValidator()
+        changes = [
+            _change(ChangeType.MOVE_ATTRIBUTE, "SLA Metrics/Latency", {"name": "Latency", "group": "Quality"}),
+            _change(ChangeType.MOVE_ATTRIBUTE, "SLA Metrics/Latency", {"name": "Latency", "group": "Usage"}),
+            _change(ChangeType.RENAME_ATTRIBUTE, "Quality/Latency", {"name": "Owner", "group": "Quality"}),
+            _change(ChangeType.RENAME_ATTRIBUTE, "Quality/Latency", {"name": "Delay", "group": "Nope"}),
+            _change(ChangeType.RENAME_ATTRIBUTE, "Quality/Latency", {"name": "Delay", "group": "Quality"}),
+            _change(ChangeType.ADD_ATTRIBUTE, "KPI/Latency", {"required": False}),
+        ]
+        
+        results = validator.validate_changes(metamodel, changes)
+        
+        assert [is_valid for is_valid, _ in results] == [True, False, False, False, True, True]
+        assert results[1][1] == [
+            "Attribute 'Latency' does not exist in group 'SLA Metrics'",
+            "Attribute 'Latency' already exists in group 'Quality'",
+        ]
+        assert results[2][1] == ["Attribute 'Owner' already exists in group 'Key Actors'"]
+        assert results[3][1] == ["Group 'Nope' does not exist"]
+    
+    def test_matches_validate_change_for_independent_changes(self):
+        """Test that a change set of unrelated changes matches one-by-one validation."""
+        metamodel = get_core_metamodel()
+        validator = MetamodelValidator()
+        changes = [
+            _change(ChangeType.REMOVE_GROUP, "Quality"),
+            _change(ChangeType.REMOVE_GROUP, "Nope"),
+            _change(ChangeType.CHANGE_REQUIREMENT, "Access/Access Roles", True),
+            _change(ChangeType.CHANGE_REQUIREMENT, "Access/Missing", "yes"),
+            _change(ChangeType.ADD_ATTRIBUTE, "bad-path"),
+        ]
+        
+        assert validator.validate_changes(metamodel, changes) == [
+            validator.validate_change(metamodel, change) for change in changes
+        ]